@@ -4,4 +4,4 @@
 # license information.
 #--------------------------------------------------------------------------
 
-VERSION = "1.1.23"
+VERSION = "1.1.24"
@@ -3,13 +3,38 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 #--------------------------------------------------------------------------
+import functools
+
 from . import KnownProfiles, ProfileDefinition
 
+# (profile tag, api version) -> (Serializer, Deserializer), shared by all the clients of a process
+_SERIALIZERS = {}
+
+
 class InvalidMultiApiClientError(Exception):
     """If the mixin is not used with a compatible class.
     """
     pass
 
+def cached_operation_group(func):
+    """Decorates the getter of an operation group property of a multi-api client,
+    so that the operation group is created once per client and API version.
+
+    The API version is still resolved on each access, so that changing the profile
+    of the client, or the default profile, applies to the next access.
+    """
+    operation_group_name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        api_version = self._get_api_version(operation_group_name)
+        cache = self.__dict__.setdefault('_operation_groups', {})
+        try:
+            return cache[(operation_group_name, api_version)]
+        except KeyError:
+            return cache.setdefault((operation_group_name, api_version), func(self))
+    return wrapper
+
 class MultiApiClientMixin(object):
     """Mixin that contains multi-api version profile management.
 
@@ -89,3 +114,20 @@ class MultiApiClientMixin(object):
             return local_profile[None]
         except KeyError:
             raise ValueError("This profile definition does not contain a default API version")
+
+    @classmethod
+    def _get_serializers(cls, api_version):
+        """Returns the Serializer and Deserializer of the models of this API version.
+
+        They are built once per process from the _models_dict(api_version) class
+        method of the client, and shared by all its clients.
+        """
+        key = (cls._PROFILE_TAG, api_version)
+        try:
+            return _SERIALIZERS[key]
+        except KeyError:
+            pass
+        # azure-common does not depend on msrest, only the clients using this mixin do
+        from msrest import Serializer, Deserializer
+        client_models = cls._models_dict(api_version)
+        return _SERIALIZERS.setdefault(key, (Serializer(client_models), Deserializer(client_models)))
@@ -4,7 +4,7 @@
 # license information.
 #--------------------------------------------------------------------------
 from azure.profiles import ProfileDefinition, KnownProfiles
-from azure.profiles.multiapiclient import MultiApiClientMixin
+from azure.profiles.multiapiclient import MultiApiClientMixin, cached_operation_group
 
 import pytest
 
@@ -123,3 +123,59 @@ def test_multiapi_client_legacy():
     # TypeError: object.__init__() takes no parameters
     # is enough to show the legacy work
     TestClient()
+
+def test_multiapi_client_cached_operation_group():
+
+    class TestClient(MultiApiClientMixin):
+        DEFAULT_API_VERSION = "2216-08-09"
+        _PROFILE_TAG = "azure.mgmt.compute.ComputeManagementClient"
+        LATEST_PROFILE = ProfileDefinition({
+            _PROFILE_TAG: {
+                None: DEFAULT_API_VERSION
+            }},
+            _PROFILE_TAG + " latest"
+        )
+        created = []
+
+        @property
+        @cached_operation_group
+        def operations(self):
+            api_version = self._get_api_version("operations")
+            self.created.append(api_version)
+            return object()
+
+    client = TestClient(profile=KnownProfiles.latest)
+    assert client.operations is client.operations
+    assert TestClient.created == ["2216-08-09"]
+
+    # a new API version gets its own operation group, and the previous one is kept
+    client.profile = ProfileDefinition({TestClient._PROFILE_TAG: {None: "2016-03-30"}}, "test")
+    operations = client.operations
+    assert client.operations is operations
+    assert TestClient.created == ["2216-08-09", "2016-03-30"]
+
+    # each client has its own operation groups
+    assert TestClient(profile=KnownProfiles.latest).operations is not client.operations
+
+def test_multiapi_client_shared_serializers():
+    pytest.importorskip("msrest")
+
+    class Model(object):
+        _attribute_map = {}
+
+    class TestClient(MultiApiClientMixin):
+        _PROFILE_TAG = "azure.mgmt.test.SerializersTestClient"
+        LATEST_PROFILE = ProfileDefinition({_PROFILE_TAG: {None: "2019-01-01"}}, _PROFILE_TAG + " latest")
+        models_dict_calls = []
+
+        @classmethod
+        def _models_dict(cls, api_version):
+            cls.models_dict_calls.append(api_version)
+            return {'Model': Model}
+
+    serializers = TestClient._get_serializers("2019-01-01")
+    assert TestClient()._get_serializers("2019-01-01") is serializers
+    assert serializers[0].dependencies == {'Model': Model}
+    assert serializers[1].dependencies == {'Model': Model}
+    assert TestClient._get_serializers("2018-01-01") is not serializers
+    assert TestClient.models_dict_calls == ["2019-01-01", "2018-01-01"]
@@ -23,11 +23,77 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import asyncio
 from collections.abc import AsyncIterator
+import copy
 import logging
+import weakref
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class _AsyncPagePrefetcher:
+    """Requests the pages of a Paged in a task, holding at most `depth` pages not yet taken.
+
+    :param callable command: Coroutine function to retrieve a page
+    :param Deserializer deserializer: The deserializer of the Paged
+    :param Paged pages: A copy of the Paged, whose next_link is the link of the first page to request
+    :param int depth: The number of pages to request ahead
+    :param Paged owner: The Paged, the task is cancelled when it's garbage collected
+    """
+
+    def __init__(self, command, deserializer, pages, depth, owner):
+        self._queue = asyncio.Queue()  # type: asyncio.Queue
+        self._slots = asyncio.Semaphore(depth)
+        # the task doesn't reference the owner, so an abandoned Paged cancels it
+        self._owner = weakref.ref(owner, lambda _: self.close())
+        self._task = asyncio.ensure_future(self._run(command, deserializer, pages))
+
+    async def _run(self, command, deserializer, pages):
+        try:
+            while pages.next_link is not None:
+                await self._slots.acquire()
+                response = await command(pages.next_link)
+                deserializer(pages, response)
+                self._queue.put_nowait((response, pages.current_page, pages.next_link))
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            self._queue.put_nowait(ex)
+
+    async def next_page(self):
+        """Returns the next page's response, items and next link, waiting for it if necessary.
+
+        :raises: the exception requesting or deserializing the page raised
+        """
+        page = await self._queue.get()
+        if isinstance(page, Exception):
+            raise page
+        self._slots.release()
+        return page
+
+    def close(self):
+        """Cancels the task, including a request in progress."""
+        if not self._task.done():
+            try:
+                self._task.cancel()
+            except RuntimeError:
+                # the event loop was closed before the Paged was garbage collected
+                pass
+
+
+class AsyncPageIteratorMixin(AsyncIterator):
+    """Bring async to PageIterator."""
+
+    async def __anext__(self):
+        """Return the next non-empty page."""
+        page = self._paged._take_current_page()  # pylint: disable=protected-access
+        while not page:
+            await self._paged._async_advance_page()  # pylint: disable=protected-access
+            page = self._paged._take_current_page()  # pylint: disable=protected-access
+        return page
+
+
 class AsyncPagedMixin(AsyncIterator):
     """Bring async to Paging.
 
@@ -48,6 +114,19 @@ class AsyncPagedMixin(AsyncIterator):
             )
         if self.next_link is None:
             raise StopAsyncIteration("End of paging")
+        if self.prefetch_pages > 0:
+            if self._prefetcher is None:
+                self._prefetcher = _AsyncPagePrefetcher(
+                    self._async_get_next, self._deserializer, copy.copy(self), self.prefetch_pages, self
+                )
+            try:
+                self._response, self.current_page, self.next_link = await self._prefetcher.next_page()
+            except Exception:
+                # iterating again requests the failed page again
+                self.close()
+                raise
+            self._current_page_iter_index = 0
+            return self.current_page
         self._current_page_iter_index = 0
         self._response = await self._async_get_next(self.next_link)
         self._deserializer(self, self._response)
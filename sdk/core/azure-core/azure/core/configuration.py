@@ -101,6 +101,23 @@ class ConnectionConfiguration(object):
     :param str connection_cert: Client-side certificates. You can specify a local cert to use as client side
      certificate, as a single file (containing the private key and the certificate) or as a tuple of both files' paths.
     :param int connection_data_block_size: The block size of data sent over the connection. Defaults to 4096 bytes.
+    :param int connection_pool_size: The maximum number of connections kept open to each host, which is how many
+     requests to a host can be sent concurrently without opening a new connection for each. Defaults to the HTTP
+     library's default: 10 for requests, unlimited for aiohttp.
+    :param int connection_pool_limit: The maximum number of connections open to all hosts. Defaults to 100.
+     Only aiohttp supports this setting.
+    :param int connection_pool_hosts: The number of hosts whose connection pools are kept. Defaults to 10.
+     The connections to a host beyond it are closed when its pool is discarded, so a client sending requests
+     to more hosts, such as a shared transport used for many storage accounts, should raise it to at least
+     their number. Only requests supports this setting, aiohttp keeps the connections of any number of hosts.
+    :param float connection_keep_alive: How many seconds an idle connection is kept open for the next request.
+     Defaults to 15. Only aiohttp supports this setting, requests keeps idle connections until the server
+     closes them.
+    :param int connection_dns_cache_ttl: How many seconds resolved host addresses are cached. Defaults to 10,
+     None caches them for the lifetime of the transport. Only aiohttp supports this setting, requests resolves
+     the host of each new connection.
+    :param bool connection_tcp_nodelay: Whether to disable Nagle's algorithm, sending small requests without
+     delay. Enabled by default. aiohttp always enables it.
 
     Example:
         .. literalinclude:: ../examples/examples_config.py
@@ -116,3 +133,10 @@ class ConnectionConfiguration(object):
         self.verify = kwargs.pop('connection_verify', True)
         self.cert = kwargs.pop('connection_cert', None)
         self.data_block_size = kwargs.pop('connection_data_block_size', 4096)
+        # None uses the HTTP library's default
+        self.pool_size = kwargs.pop('connection_pool_size', None)
+        self.pool_limit = kwargs.pop('connection_pool_limit', None)
+        self.pool_hosts = kwargs.pop('connection_pool_hosts', None)
+        self.keep_alive = kwargs.pop('connection_keep_alive', None)
+        self.dns_cache_ttl = kwargs.pop('connection_dns_cache_ttl', 10)
+        self.tcp_nodelay = kwargs.pop('connection_tcp_nodelay', True)
@@ -90,6 +90,33 @@ class ServiceRequestError(AzureError):
     """
 
 
+class CircuitBreakerOpenError(ServiceRequestError):
+    """The request wasn't sent, because the circuit breaker of its host is open after repeated failures.
+
+    :param str host: The host of the request.
+    :param float retry_after: Seconds until the circuit breaker lets a request probe the host.
+    """
+
+    def __init__(self, message, host=None, retry_after=None, **kwargs):
+        self.host = host
+        self.retry_after = retry_after
+        super(CircuitBreakerOpenError, self).__init__(message, **kwargs)
+
+
+class RetryBudgetExhaustedError(ServiceRequestError):
+    """The retry of a failed request wasn't sent, because the retry budget of its host is exhausted.
+
+    :param str host: The host of the request.
+    :param response: The failed response which would have been retried, if the request got one.
+    :type response: ~azure.core.pipeline.transport.HttpResponse
+    """
+
+    def __init__(self, message, host=None, response=None, **kwargs):
+        self.host = host
+        self.response = response
+        super(RetryBudgetExhaustedError, self).__init__(message, **kwargs)
+
+
 class ServiceResponseError(AzureError):
     """The request was sent, but the client failed to understand the response.
     The connection may have timed out. These errors can be retried for idempotent or
@@ -23,7 +23,11 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+from collections import deque
+import copy
 import sys
+import threading
+import weakref
 try:
     from collections.abc import Iterator
     xrange = range
@@ -38,11 +42,101 @@ if TYPE_CHECKING:
 
 if sys.version_info >= (3, 5, 2):
     # Not executed on old Python, no syntax error
-    from .async_paging import AsyncPagedMixin  # type: ignore
+    from .async_paging import AsyncPagedMixin, AsyncPageIteratorMixin  # type: ignore
 else:
     class AsyncPagedMixin(object):  # type: ignore
         pass
 
+    class AsyncPageIteratorMixin(object):  # type: ignore
+        pass
+
+
+class _PagePrefetcher(object):
+    """Requests the pages of a Paged in a background thread, holding at most `depth` pages not yet taken.
+
+    :param callable command: Function to retrieve a page
+    :param Deserializer deserializer: The deserializer of the Paged
+    :param Paged pages: A copy of the Paged, whose next_link is the link of the first page to request
+    :param int depth: The number of pages to request ahead
+    :param Paged owner: The Paged, the requests stop when it's garbage collected
+    """
+
+    def __init__(self, command, deserializer, pages, depth, owner):
+        self._condition = threading.Condition()
+        self._pages = deque()  # type: deque
+        self._error = None  # type: Optional[Exception]
+        self._depth = depth
+        self._closed = False
+        # the thread doesn't reference the owner, so an abandoned Paged stops it
+        self._owner = weakref.ref(owner, lambda _: self.close())
+        thread = threading.Thread(target=self._run, args=(command, deserializer, pages))
+        thread.daemon = True
+        thread.start()
+
+    def _run(self, command, deserializer, pages):
+        try:
+            while pages.next_link is not None:
+                with self._condition:
+                    while len(self._pages) >= self._depth and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+                response = command(pages.next_link)
+                deserializer(pages, response)
+                with self._condition:
+                    self._pages.append((response, pages.current_page, pages.next_link))
+                    self._condition.notify_all()
+        except Exception as ex:  # pylint: disable=broad-except
+            with self._condition:
+                self._error = ex
+                self._condition.notify_all()
+
+    def next_page(self):
+        """Returns the next page's response, items and next link, waiting for it if necessary.
+
+        :raises: the exception requesting or deserializing the page raised
+        """
+        with self._condition:
+            while not self._pages and self._error is None:
+                self._condition.wait()
+            if self._pages:
+                page = self._pages.popleft()
+                self._condition.notify_all()
+                return page
+            raise self._error  # pylint: disable=raising-bad-type
+
+    def close(self):
+        """Stops requesting pages. A request in progress completes, its page is discarded."""
+        with self._condition:
+            self._closed = True
+            self._pages.clear()
+            self._condition.notify_all()
+
+
+class PageIterator(AsyncPageIteratorMixin, Iterator):
+    """Iterates the pages of a Paged as lists of items, synchronously or asynchronously.
+
+    Returned by :meth:`Paged.by_page`.
+    """
+
+    def __init__(self, paged):
+        # type: (Paged) -> None
+        self._paged = paged
+
+    def __iter__(self):
+        """Return 'self'."""
+        return self
+
+    def __next__(self):
+        """Return the next non-empty page."""
+        page = self._paged._take_current_page()  # pylint: disable=protected-access
+        while not page:
+            self._paged._advance_page()  # pylint: disable=protected-access
+            page = self._paged._take_current_page()  # pylint: disable=protected-access
+        return page
+
+    next = __next__  # Python 2 compatibility.
+
 class Paged(AsyncPagedMixin, Iterator):
     """A container for paged REST responses.
 
@@ -50,12 +144,17 @@ class Paged(AsyncPagedMixin, Iterator):
     :type response: ~azure.core.pipeline.transport.HttpResponse
     :param callable command: Function to retrieve the next page of items.
     :param Deserializer deserializer: a Deserializer instance to use
+    :keyword int prefetch_pages: The number of pages to request ahead of the one being iterated, in a
+     background thread or, for async iteration, a task. Defaults to 0, requesting each page when the
+     previous one has been iterated. It can also be set as the ``prefetch_pages`` attribute before iterating.
+     Call :meth:`close` to stop prefetching when not iterating every page.
     """
     _validation = {}  # type: Dict[str, Dict[str, Any]]
     _attribute_map = {}  # type: Dict[str, Dict[str, Any]]
 
     def __init__(self, command, deserializer, **kwargs):
         # type: (Callable[[str], HttpResponse], Deserializer, Any) -> None
+        self.prefetch_pages = kwargs.pop("prefetch_pages", 0)
         super(Paged, self).__init__(**kwargs)  # type: ignore
         # Sets next_link, current_page, and _current_page_iter_index.
         self.next_link = ""
@@ -64,6 +163,7 @@ class Paged(AsyncPagedMixin, Iterator):
         self._deserializer = deserializer
         self._get_next = command
         self._response = None  # type: Optional[HttpResponse]
+        self._prefetcher = None  # type: Any
 
     def __iter__(self):
         """Return 'self'."""
@@ -88,11 +188,51 @@ class Paged(AsyncPagedMixin, Iterator):
         """
         if self.next_link is None:
             raise StopIteration("End of paging")
+        if self.prefetch_pages > 0:
+            if self._prefetcher is None:
+                self._prefetcher = _PagePrefetcher(
+                    self._get_next, self._deserializer, copy.copy(self), self.prefetch_pages, self
+                )
+            try:
+                self._response, self.current_page, self.next_link = self._prefetcher.next_page()
+            except Exception:
+                # iterating again requests the failed page again
+                self.close()
+                raise
+            self._current_page_iter_index = 0
+            return self.current_page
         self._current_page_iter_index = 0
         self._response = self._get_next(self.next_link)
         self._deserializer(self, self._response)
         return self.current_page
 
+    def _take_current_page(self):
+        # type: () -> List[Model]
+        """Return the items of the current page not iterated yet, marking them iterated."""
+        page = self.current_page or []
+        if self._current_page_iter_index:
+            page = page[self._current_page_iter_index:]
+        self._current_page_iter_index = len(self.current_page or [])
+        return page
+
+    def by_page(self):
+        # type: () -> PageIterator
+        """Iterate the remaining items page by page, as lists, skipping empty pages.
+
+        The returned iterator supports both ``for`` and ``async for``. A page partially iterated
+        item by item is returned with its remaining items.
+
+        :rtype: ~azure.core.paging.PageIterator
+        """
+        return PageIterator(self)
+
+    def close(self):
+        # type: () -> None
+        """Stop requesting pages in the background. Iterating again resumes from the next page."""
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
     def __next__(self):
         """Iterate through responses."""
         # Storing the list iterator might work out better, but there's no
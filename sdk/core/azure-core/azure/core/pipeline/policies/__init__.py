@@ -26,6 +26,7 @@
 
 from .base import HTTPPolicy, SansIOHTTPPolicy
 from .authentication import BearerTokenCredentialPolicy
+from .circuit_breaker import CircuitBreakerPolicy, CircuitBreakerState, CircuitStats
 from .custom_hook import CustomHookPolicy
 from .redirect import RedirectPolicy
 from .retry import RetryPolicy
@@ -41,6 +42,9 @@ __all__ = [
     'HTTPPolicy',
     'SansIOHTTPPolicy',
     'BearerTokenCredentialPolicy',
+    'CircuitBreakerPolicy',
+    'CircuitBreakerState',
+    'CircuitStats',
     'HeadersPolicy',
     'UserAgentPolicy',
     'NetworkTraceLoggingPolicy',
@@ -56,11 +60,13 @@ __all__ = [
 try:
     from .base_async import AsyncHTTPPolicy
     from .authentication_async import AsyncBearerTokenCredentialPolicy
+    from .circuit_breaker_async import AsyncCircuitBreakerPolicy
     from .redirect_async import AsyncRedirectPolicy
     from .retry_async import AsyncRetryPolicy
     __all__.extend([
         'AsyncHTTPPolicy',
         'AsyncBearerTokenCredentialPolicy',
+        'AsyncCircuitBreakerPolicy',
         'AsyncRedirectPolicy',
         'AsyncRetryPolicy'
     ])
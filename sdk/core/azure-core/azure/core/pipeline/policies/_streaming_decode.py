@@ -0,0 +1,356 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+Incremental parsers decoding the items of a response body as it's downloaded.
+"""
+import codecs
+from collections import deque
+import json
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING  # pylint: disable=unused-import
+
+from azure.core.exceptions import DecodeError
+
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport.base import _HttpResponseBase  # pylint: disable=unused-import
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NEED_DATA = object()
+
+# States of _JsonItemsParser
+_START = 0
+_FIRST_KEY = 1
+_KEY = 2
+_COLON = 3
+_VALUE = 4
+_AFTER_MEMBER = 5
+_FIRST_ITEM = 6
+_ITEM = 7
+_AFTER_ITEM = 8
+_END = 9
+
+
+class _JsonItemsParser(object):
+    """Decodes the elements of an array in a JSON document, as chunks of the document are fed to it.
+
+    The array is the value of the top-level object's `item_name` member, or the document itself when it's an
+    array. Each element is decoded once its text is complete, so at most one element's text is buffered.
+
+    :param str item_name: The name of the member holding the items
+    :ivar remainder: Once the document is closed, the top-level object without the items member,
+     or None when the document is an array or empty.
+    """
+
+    def __init__(self, item_name):
+        # type: (str) -> None
+        self._item_name = item_name
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = u""
+        self._pos = 0
+        self._eof = False
+        self._state = _START
+        self._key = None  # type: Optional[str]
+        self._members = {}  # type: dict
+        self._top_level_array = False
+        self._empty = False
+        # don't try decoding a value again until this many characters are buffered
+        self._min_available = 0
+        self.remainder = None  # type: Any
+
+    def feed(self, data):
+        # type: (bytes) -> List[Any]
+        """Parses a chunk of the document, returning the items it completes."""
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(data)
+        self._pos = 0
+        return self._run()
+
+    def close(self):
+        # type: () -> List[Any]
+        """Parses the end of the document, returning the items it completes.
+
+        :raises ValueError: if the document is invalid or incomplete
+        """
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        items = self._run()
+        if not (self._top_level_array or self._empty):
+            self.remainder = self._members
+        return items
+
+    def _run(self):
+        # type: () -> List[Any]
+        items = []  # type: List[Any]
+        while self._step(items):
+            pass
+        return items
+
+    def _next_char(self):
+        # type: () -> Optional[str]
+        """Skips whitespace, returning the next character, "" at the end of the document or None without data"""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos < len(self._buffer):
+            return self._buffer[self._pos]
+        return "" if self._eof else None
+
+    def _decode(self):
+        # type: () -> Any
+        """Decodes the value starting at the current position, or returns _NEED_DATA"""
+        available = len(self._buffer) - self._pos
+        if not self._eof and available < self._min_available:
+            return _NEED_DATA
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except ValueError:
+            if self._eof:
+                raise
+            # the value is incomplete, decode it again when twice as much is buffered, not at every chunk
+            self._min_available = available * 2
+            return _NEED_DATA
+        if end == len(self._buffer) and not self._eof:
+            # a number could continue in the next chunk
+            self._min_available = available + 1
+            return _NEED_DATA
+        self._pos = end
+        self._min_available = 0
+        return value
+
+    def _expect(self, char, expected):
+        # type: (str, str) -> None
+        if not char or char not in expected:
+            raise ValueError("Expected one of '{}' at position {}, found {}".format(
+                expected, self._pos, repr(char) if char else "the end of the document"))
+
+    def _step(self, items):  # pylint: disable=too-many-branches
+        # type: (List[Any]) -> bool
+        """Parses one token, returning False when more data is needed or the document has ended"""
+        char = self._next_char()
+        if char is None:
+            return False
+        state = self._state
+
+        if state == _END:
+            if char:
+                raise ValueError("Extra data at position {}".format(self._pos))
+            return False
+
+        if state == _START:
+            if not char:
+                # like deserialize_from_text, an empty body has no content rather than being invalid
+                self._empty = True
+                self._state = _END
+                return False
+            if char == "{":
+                self._state = _FIRST_KEY
+            elif char == "[":
+                self._top_level_array = True
+                self._state = _FIRST_ITEM
+            else:
+                self._expect(char, "{[")
+            self._pos += 1
+        elif state in (_FIRST_KEY, _KEY):
+            if state == _FIRST_KEY and char == "}":
+                self._pos += 1
+                self._state = _END
+                return True
+            self._expect(char, '"')
+            key = self._decode()
+            if key is _NEED_DATA:
+                return False
+            self._key = key
+            self._state = _COLON
+        elif state == _COLON:
+            self._expect(char, ":")
+            self._pos += 1
+            self._state = _VALUE
+        elif state == _VALUE:
+            if self._key == self._item_name and char == "[":
+                self._pos += 1
+                self._state = _FIRST_ITEM
+                return True
+            value = self._decode()
+            if value is _NEED_DATA:
+                return False
+            self._members[self._key] = value
+            self._state = _AFTER_MEMBER
+        elif state == _AFTER_MEMBER:
+            self._expect(char, ",}")
+            self._pos += 1
+            self._state = _KEY if char == "," else _END
+        elif state in (_FIRST_ITEM, _ITEM):
+            if state == _FIRST_ITEM and char == "]":
+                self._pos += 1
+                self._state = _END if self._top_level_array else _AFTER_MEMBER
+                return True
+            if not char:
+                self._expect(char, "]")
+            item = self._decode()
+            if item is _NEED_DATA:
+                return False
+            items.append(item)
+            self._state = _AFTER_ITEM
+        elif state == _AFTER_ITEM:
+            self._expect(char, ",]")
+            self._pos += 1
+            if char == ",":
+                self._state = _ITEM
+            else:
+                self._state = _END if self._top_level_array else _AFTER_MEMBER
+        return True
+
+
+class _XmlItemsTarget(object):
+    """A parser target building the document's tree, except that it detaches the elements named `item_name`
+    from it as they're completed. Items nested in an item stay in it.
+    """
+
+    def __init__(self, item_name):
+        # type: (str) -> None
+        self._builder = ET.TreeBuilder()
+        self._item_name = item_name
+        self._open_elements = []  # type: List[ET.Element]
+        self._open_items = 0
+        self.items = []  # type: List[ET.Element]
+
+    def start(self, tag, attrib):
+        if tag == self._item_name:
+            self._open_items += 1
+        element = self._builder.start(tag, attrib)
+        self._open_elements.append(element)
+        return element
+
+    def end(self, tag):
+        element = self._builder.end(tag)
+        self._open_elements.pop()
+        if tag == self._item_name:
+            self._open_items -= 1
+            if not self._open_items and self._open_elements:
+                self._open_elements[-1].remove(element)
+                self.items.append(element)
+        return element
+
+    def data(self, data):
+        self._builder.data(data)
+
+    def close(self):
+        return self._builder.close()
+
+
+class _XmlItemsParser(object):
+    """Decodes the elements named `item_name` in an XML document, as chunks of the document are fed to it.
+
+    :param str item_name: The tag of the items
+    :ivar remainder: Once the document is closed, its root element without the items, or None when the
+     document is empty.
+    """
+
+    def __init__(self, item_name):
+        # type: (str) -> None
+        self._target = _XmlItemsTarget(item_name)
+        self._parser = ET.XMLParser(target=self._target)
+        self._empty = True
+        self.remainder = None  # type: Optional[ET.Element]
+
+    def _take_items(self):
+        # type: () -> List[ET.Element]
+        items, self._target.items = self._target.items, []
+        return items
+
+    def feed(self, data):
+        # type: (bytes) -> List[ET.Element]
+        """Parses a chunk of the document, returning the items it completes."""
+        self._empty = self._empty and not data
+        self._parser.feed(data)
+        return self._take_items()
+
+    def close(self):
+        # type: () -> List[ET.Element]
+        """Parses the end of the document, returning the items it completes.
+
+        :raises xml.etree.ElementTree.ParseError: if the document is invalid or incomplete
+        """
+        if self._empty:
+            return []
+        self.remainder = self._parser.close()
+        return self._take_items()
+
+
+class _StreamedItemsBase(object):
+    def __init__(self, response, chunks, parser):
+        # type: (_HttpResponseBase, Any, Any) -> None
+        self.response = response
+        self.remainder = None  # type: Any
+        self._chunks = chunks
+        self._parser = parser
+        self._items = deque()  # type: deque
+        self._done = False
+
+    def _parse(self, chunk):
+        # type: (Optional[bytes]) -> None
+        """Parses a chunk of the body, or its end when `chunk` is None"""
+        try:
+            if chunk is None:
+                self._items.extend(self._parser.close())
+                self.remainder = self._parser.remainder
+                self._done = True
+            else:
+                self._items.extend(self._parser.feed(chunk))
+        except (ValueError, ET.ParseError) as err:
+            self._done = True
+            raise DecodeError(message="Invalid streamed body: {}".format(err), response=self.response, error=err)
+
+
+class StreamedItems(_StreamedItemsBase, Iterator):
+    """Iterates the items of a response body, decoding each as soon as its part of the body is downloaded.
+
+    Returned by :meth:`ContentDecodePolicy.deserialize_items_from_stream`. JSON items are decoded as by
+    ``json.loads``, XML items are ``xml.etree.ElementTree.Element``.
+
+    :ivar response: The response whose body is decoded
+    :ivar remainder: Once every item has been iterated, the rest of the body: for JSON, the top-level object
+     without the items (None when the body is an array); for XML, the root element without the items.
+     This is where the link to the next page of a listing is.
+    """
+
+    def __init__(self, response, chunks, parser):
+        # type: (_HttpResponseBase, Iterator[bytes], Any) -> None
+        super(StreamedItems, self).__init__(response, chunks, parser)
+        self._chunks = iter(chunks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._items:
+            if self._done:
+                raise StopIteration()
+            self._parse(next(self._chunks, None))
+        return self._items.popleft()
+
+    next = __next__  # Python 2 compatibility.
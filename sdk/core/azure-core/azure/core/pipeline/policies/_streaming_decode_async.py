@@ -0,0 +1,54 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ._streaming_decode import _StreamedItemsBase
+
+
+class AsyncStreamedItems(_StreamedItemsBase, AsyncIterator):
+    """Asynchronously iterates the items of a response body, decoding each as soon as its part of the body
+    is downloaded.
+
+    Returned by :meth:`ContentDecodePolicy.deserialize_items_from_stream` for an asynchronous response.
+    JSON items are decoded as by ``json.loads``, XML items are ``xml.etree.ElementTree.Element``.
+
+    :ivar response: The response whose body is decoded
+    :ivar remainder: Once every item has been iterated, the rest of the body: for JSON, the top-level object
+     without the items (None when the body is an array); for XML, the root element without the items.
+     This is where the link to the next page of a listing is.
+    """
+
+    async def __anext__(self) -> Any:
+        while not self._items:
+            if self._done:
+                raise StopAsyncIteration()
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                chunk = None
+            self._parse(chunk)
+        return self._items.popleft()
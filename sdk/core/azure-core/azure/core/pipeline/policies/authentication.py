@@ -3,6 +3,8 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
+import logging
+import threading
 import time
 
 from . import HTTPPolicy
@@ -18,6 +20,13 @@ if TYPE_CHECKING:
     from azure.core.credentials import AccessToken, TokenCredential
     from azure.core.pipeline import PipelineRequest, PipelineResponse
 
+_LOGGER = logging.getLogger(__name__)
+
+# in background refresh mode, a token is used until it is this many seconds from expiring
+_EXPIRY_MARGIN = 30
+# seconds to wait before trying again when a background refresh fails
+_BACKGROUND_RETRY_DELAY = 30
+
 
 # pylint:disable=too-few-public-methods
 class _BearerTokenCredentialPolicyBase(object):
@@ -26,14 +35,20 @@ class _BearerTokenCredentialPolicyBase(object):
     :param credential: The credential.
     :type credential: ~azure.core.credentials.TokenCredential
     :param str scopes: Lets you specify the type of access needed.
+    :keyword bool background_refresh: Whether to get a new token in the background while requests keep
+     using the current one, rather than when a request needs it. Defaults to False.
+    :keyword int refresh_window: How many seconds before the token expires to get a new one. Defaults to 300.
     """
 
-    def __init__(self, credential, *scopes, **kwargs):  # pylint:disable=unused-argument
+    def __init__(self, credential, *scopes, **kwargs):
         # type: (TokenCredential, *str, Mapping[str, Any]) -> None
         super(_BearerTokenCredentialPolicyBase, self).__init__()
         self._scopes = scopes
         self._credential = credential
         self._token = None  # type: Optional[AccessToken]
+        self._background_refresh = kwargs.get("background_refresh", False)
+        self._refresh_window = kwargs.get("refresh_window", 300)
+        self._next_background_refresh = 0
 
     @staticmethod
     def _update_headers(headers, token):
@@ -48,7 +63,26 @@ class _BearerTokenCredentialPolicyBase(object):
     @property
     def _need_new_token(self):
         # type: () -> bool
-        return not self._token or self._token.expires_on - time.time() < 300
+        """Whether a request must wait for a new token before it is sent"""
+        if not self._token:
+            return True
+        margin = _EXPIRY_MARGIN if self._background_refresh else self._refresh_window
+        return self._token.expires_on - time.time() < margin
+
+    @property
+    def _should_refresh_in_background(self):
+        # type: () -> bool
+        """Whether the token is still usable but should be replaced in the background"""
+        if not (self._background_refresh and self._token):
+            return False
+        now = time.time()
+        return self._token.expires_on - now < self._refresh_window and now >= self._next_background_refresh
+
+    def _on_background_refresh_error(self, error):
+        # type: (Exception) -> None
+        # requests keep using the current token, and the refresh is tried again later
+        _LOGGER.warning("Failed to refresh the access token in the background: %r", error)
+        self._next_background_refresh = time.time() + _BACKGROUND_RETRY_DELAY
 
 
 class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy):
@@ -57,8 +91,50 @@ class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy):
     :param credential: The credential.
     :type credential: ~azure.core.TokenCredential
     :param str scopes: Lets you specify the type of access needed.
+    :keyword bool background_refresh: Whether to get a new token in a background thread while requests keep
+     using the current one, rather than when a request needs it. Defaults to False.
+    :keyword int refresh_window: How many seconds before the token expires to get a new one. Defaults to 300.
     """
 
+    def __init__(self, credential, *scopes, **kwargs):
+        # type: (TokenCredential, *str, Mapping[str, Any]) -> None
+        super(BearerTokenCredentialPolicy, self).__init__(credential, *scopes, **kwargs)
+        # held by the thread getting a new token, so that only one thread calls the credential at a time
+        self._lock = threading.Lock()
+
+    def _refresh_token(self):
+        # type: () -> None
+        with self._lock:
+            # another thread may have got a new token while this one was waiting
+            if self._need_new_token:
+                self._token = self._credential.get_token(*self._scopes)
+
+    def _start_background_refresh(self):
+        # type: () -> None
+        if not self._lock.acquire(False):
+            return  # a new token is already on its way
+        started = False
+        try:
+            # check again now that no other thread can replace the token
+            if self._should_refresh_in_background:
+                thread = threading.Thread(target=self._refresh_token_in_background, name="BearerTokenRefresh")
+                thread.daemon = True
+                thread.start()
+                started = True
+        finally:
+            if not started:
+                self._lock.release()
+
+    def _refresh_token_in_background(self):
+        # type: () -> None
+        # the lock was acquired by _start_background_refresh
+        try:
+            self._token = self._credential.get_token(*self._scopes)
+        except Exception as ex:  # pylint:disable=broad-except
+            self._on_background_refresh_error(ex)
+        finally:
+            self._lock.release()
+
     def send(self, request):
         # type: (PipelineRequest) -> PipelineResponse
         """Adds a bearer token Authorization header to request and sends request to next policy.
@@ -69,6 +145,8 @@ class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy):
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
         if self._need_new_token:
-            self._token = self._credential.get_token(*self._scopes)
+            self._refresh_token()
+        elif self._should_refresh_in_background:
+            self._start_background_refresh()
         self._update_headers(request.http_request.headers, self._token.token)  # type: ignore
         return self.next.send(request)
@@ -3,7 +3,7 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
-import threading
+import asyncio
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from azure.core.pipeline.policies import AsyncHTTPPolicy
@@ -17,11 +17,40 @@ class AsyncBearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, AsyncHT
     :param credential: The credential.
     :type credential: ~azure.core.credentials.TokenCredential
     :param str scopes: Lets you specify the type of access needed.
+    :keyword bool background_refresh: Whether to get a new token in a background task while requests keep
+     using the current one, rather than when a request needs it. Defaults to False.
+    :keyword int refresh_window: How many seconds before the token expires to get a new one. Defaults to 300.
     """
 
     def __init__(self, credential, *scopes, **kwargs):
         super().__init__(credential, *scopes, **kwargs)
-        self._lock = threading.Lock()
+        # created on first use, so that it belongs to the running event loop
+        self._lock = None  # type: asyncio.Lock
+        self._refresh_task = None  # type: asyncio.Future
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _refresh_token(self) -> None:
+        async with self._get_lock():
+            # another task may have got a new token while this one was waiting
+            if self._need_new_token:
+                self._token = await self._credential.get_token(*self._scopes)  # type: ignore
+
+    async def _refresh_token_in_background(self) -> None:
+        try:
+            async with self._get_lock():
+                if self._should_refresh_in_background:
+                    self._token = await self._credential.get_token(*self._scopes)  # type: ignore
+        except Exception as ex:  # pylint:disable=broad-except
+            self._on_background_refresh_error(ex)
+
+    def _start_background_refresh(self) -> None:
+        if self._get_lock().locked() or (self._refresh_task and not self._refresh_task.done()):
+            return  # a new token is already on its way
+        self._refresh_task = asyncio.ensure_future(self._refresh_token_in_background())
 
     async def send(self, request: PipelineRequest) -> PipelineResponse:
         """Adds a bearer token Authorization header to request and sends request to next policy.
@@ -31,8 +60,9 @@ class AsyncBearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, AsyncHT
         :return: The pipeline response object
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
-        with self._lock:
-            if self._need_new_token:
-                self._token = await self._credential.get_token(*self._scopes)  # type: ignore
+        if self._need_new_token:
+            await self._refresh_token()
+        elif self._should_refresh_in_background:
+            self._start_background_refresh()
         self._update_headers(request.http_request.headers, self._token.token)  # type: ignore
         return await self.next.send(request)  # type: ignore
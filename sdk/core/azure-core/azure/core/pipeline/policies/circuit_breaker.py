@@ -0,0 +1,320 @@
+#pylint: disable=no-self-use
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+A circuit breaker and retry budget per host, failing requests fast while a host is failing.
+"""
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple  # pylint: disable=unused-import
+try:
+    from urlparse import urlparse  # type: ignore
+except ImportError:
+    from urllib.parse import urlparse
+
+from azure.core.exceptions import (
+    CircuitBreakerOpenError,
+    RetryBudgetExhaustedError,
+    ServiceRequestError,
+    ServiceResponseError
+)
+
+from .base import HTTPPolicy
+
+if TYPE_CHECKING:
+    from azure.core.pipeline import PipelineRequest, PipelineResponse  # pylint: disable=unused-import
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Context key of the last failure of a request, whose next attempt is a retry
+_LAST_FAILURE = "circuit_breaker_last_failure"
+
+
+class CircuitStats(object):
+    """A snapshot of the circuit breaker and retry budget of a host.
+
+    :ivar str host: The host
+    :ivar str state: "closed" when requests are sent, "open" when they fail fast, "half_open" when probe
+     requests are sent to find whether the host has recovered
+    :ivar int consecutive_failures: The number of failed requests since the last successful one
+    :ivar float retry_tokens: The retry budget left: a retry costs one token
+    :ivar int rejected_requests: The number of requests failed fast because the circuit was open
+    :ivar int rejected_retries: The number of retries not sent because the budget was exhausted
+    """
+
+    def __init__(self, host, state, consecutive_failures, retry_tokens, rejected_requests, rejected_retries):
+        # type: (str, str, int, float, int, int) -> None
+        self.host = host
+        self.state = state
+        self.consecutive_failures = consecutive_failures
+        self.retry_tokens = retry_tokens
+        self.rejected_requests = rejected_requests
+        self.rejected_retries = rejected_retries
+
+    def __repr__(self):
+        return (
+            "CircuitStats(host={!r}, state={!r}, consecutive_failures={}, retry_tokens={:.1f}, "
+            "rejected_requests={}, rejected_retries={})".format(
+                self.host,
+                self.state,
+                self.consecutive_failures,
+                self.retry_tokens,
+                self.rejected_requests,
+                self.rejected_retries,
+            )
+        )
+
+
+class _Circuit(object):
+    """The state of a host. Its methods are called with the CircuitBreakerState's lock held."""
+
+    def __init__(self, retry_tokens):
+        # type: (float) -> None
+        self.state = CircuitBreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.retry_tokens = retry_tokens
+        self.rejected_requests = 0
+        self.rejected_retries = 0
+
+    def open(self, now):
+        # type: (float) -> None
+        self.state = CircuitBreakerState.OPEN
+        self.opened_at = now
+
+
+class CircuitBreakerState(object):
+    """The circuit breakers and retry budgets of hosts, which any number of policies and pipelines can share,
+    synchronous or asynchronous.
+
+    The circuit of a host opens after `failure_threshold` consecutive failed requests: requests then fail fast
+    with :class:`~azure.core.exceptions.CircuitBreakerOpenError`. After `open_seconds`, the circuit is
+    half-open: up to `half_open_probes` requests are sent at a time, the others fail fast. A successful probe
+    closes the circuit, a failed one opens it again.
+
+    Retries draw on a token bucket per host holding up to `retry_budget` tokens. Each request which isn't a
+    retry adds `retry_ratio` tokens, each retry takes one. When the bucket is empty, retries fail fast with
+    :class:`~azure.core.exceptions.RetryBudgetExhaustedError`, so that retries add at most `retry_ratio`
+    times the load of a failing host, plus the budget.
+
+    A request fails when the transport raises, or when its response status is one of `failure_status_codes`.
+    The attempt following a failed one is a retry.
+
+    :param int failure_threshold: Consecutive failures opening the circuit. Defaults to 5.
+    :param float open_seconds: How long the circuit stays open before probing the host. Defaults to 30.
+    :param int half_open_probes: How many probe requests may be sent at a time while half-open. Defaults to 1.
+    :param float retry_budget: The maximum number of retry tokens, which a host starts with. Defaults to 10.
+    :param float retry_ratio: The retry tokens each request adds. Defaults to 0.1.
+    :param list[int] failure_status_codes: Status codes of failed requests. Defaults to 500, 502, 503 and 504.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        self.failure_threshold = kwargs.pop("failure_threshold", 5)
+        self.open_seconds = kwargs.pop("open_seconds", 30)
+        self.half_open_probes = kwargs.pop("half_open_probes", 1)
+        self.retry_budget = kwargs.pop("retry_budget", 10)
+        self.retry_ratio = kwargs.pop("retry_ratio", 0.1)
+        self.failure_status_codes = frozenset(kwargs.pop("failure_status_codes", (500, 502, 503, 504)))
+        self._circuits = {}  # type: Dict[str, _Circuit]
+        # a threading lock also serves async policies: it's never held across an await
+        self._lock = threading.Lock()
+
+    def get_stats(self, host=None):
+        # type: (Optional[str]) -> Dict[str, CircuitStats]
+        """A snapshot of the state of each host requested, or of `host` only.
+
+        :param str host: The host, for example "myaccount.blob.core.windows.net"
+        :rtype: dict[str, ~azure.core.pipeline.policies.CircuitStats]
+        """
+        with self._lock:
+            hosts = [host] if host else list(self._circuits)
+            stats = {}
+            for name in hosts:
+                circuit = self._circuits.get(name)
+                if circuit:
+                    stats[name] = CircuitStats(
+                        name,
+                        circuit.state,
+                        circuit.consecutive_failures,
+                        circuit.retry_tokens,
+                        circuit.rejected_requests,
+                        circuit.rejected_retries,
+                    )
+            return stats
+
+    def reset(self, host=None):
+        # type: (Optional[str]) -> None
+        """Closes the circuit and refills the retry budget of every host, or of `host` only."""
+        with self._lock:
+            if host:
+                self._circuits.pop(host, None)
+            else:
+                self._circuits.clear()
+
+    def _admit(self, request):
+        # type: (PipelineRequest) -> Tuple[str, bool]
+        """Admits an attempt to send the request, returning its host and whether it's a probe.
+
+        :raises ~azure.core.exceptions.CircuitBreakerOpenError: if the circuit is open
+        :raises ~azure.core.exceptions.RetryBudgetExhaustedError: if the attempt is a retry without budget
+        """
+        host = urlparse(request.http_request.url).netloc.lower()
+        last_failure = request.context.get(_LAST_FAILURE)
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                circuit = self._circuits[host] = _Circuit(self.retry_budget)
+
+            probe = False
+            if circuit.state == self.OPEN and now - circuit.opened_at >= self.open_seconds:
+                circuit.state = self.HALF_OPEN
+                _LOGGER.info("Circuit of host '%s' is half-open, probing it", host)
+            if circuit.state == self.HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                probe = True
+            elif circuit.state != self.CLOSED:
+                circuit.rejected_requests += 1
+                retry_after = max(circuit.opened_at + self.open_seconds - now, 0)
+                raise CircuitBreakerOpenError(
+                    "The circuit breaker of host '{}' is open after repeated failures".format(host),
+                    host=host,
+                    retry_after=retry_after,
+                )
+
+            if last_failure is None:
+                circuit.retry_tokens = min(circuit.retry_tokens + self.retry_ratio, self.retry_budget)
+            elif circuit.retry_tokens >= 1:
+                circuit.retry_tokens -= 1
+            else:
+                circuit.rejected_retries += 1
+                if probe:
+                    circuit.probes -= 1
+                response, error = last_failure
+                raise RetryBudgetExhaustedError(
+                    "The retry budget of host '{}' is exhausted".format(host),
+                    host=host,
+                    response=response,
+                    error=error,
+                )
+        return host, probe
+
+    def _record(self, request, host, probe, response=None, error=None):
+        # type: (PipelineRequest, str, bool, Optional[PipelineResponse], Optional[Exception]) -> None
+        """Records the outcome of an attempt: a response, an error, or neither when the attempt
+        raised an error saying nothing of the host's health."""
+        if error is not None:
+            failed = True  # type: Optional[bool]
+        elif response is not None:
+            failed = response.http_response.status_code in self.failure_status_codes
+        else:
+            failed = None
+
+        if failed:
+            request.context[_LAST_FAILURE] = (response.http_response if response else None, error)
+        else:
+            request.context.pop(_LAST_FAILURE, None)
+
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                # reset while the request was sent
+                return
+            if probe:
+                circuit.probes -= 1
+            if failed is None:
+                return
+            if not failed:
+                circuit.consecutive_failures = 0
+                if probe and circuit.state == self.HALF_OPEN:
+                    circuit.state = self.CLOSED
+                    _LOGGER.info("Circuit of host '%s' is closed, the host has recovered", host)
+                return
+            circuit.consecutive_failures += 1
+            if probe and circuit.state == self.HALF_OPEN:
+                circuit.open(now)
+                _LOGGER.warning("Circuit of host '%s' is open again, a probe request failed", host)
+            elif circuit.state == self.CLOSED and circuit.consecutive_failures >= self.failure_threshold:
+                circuit.open(now)
+                _LOGGER.warning(
+                    "Circuit of host '%s' is open after %d consecutive failures", host, circuit.consecutive_failures
+                )
+
+
+class CircuitBreakerPolicy(HTTPPolicy):
+    """A policy failing requests fast while their host is failing, and limiting retries to a budget per host.
+
+    Add it after the retry policy, so that it sees every attempt. Give the same
+    :class:`~azure.core.pipeline.policies.CircuitBreakerState` to the policies of every client which should
+    share their view of the hosts' health. Keyword arguments configure a new state when none is given.
+
+    :param state: The circuit breakers and retry budgets to use.
+    :type state: ~azure.core.pipeline.policies.CircuitBreakerState
+
+    Example:
+        .. code-block:: python
+
+            state = CircuitBreakerState(failure_threshold=10, open_seconds=15)
+            policies = [RetryPolicy(), CircuitBreakerPolicy(state), ...]
+            ...
+            print(state.get_stats())
+    """
+
+    def __init__(self, state=None, **kwargs):
+        # type: (Optional[CircuitBreakerState], Any) -> None
+        super(CircuitBreakerPolicy, self).__init__()
+        self.state = state or CircuitBreakerState(**kwargs)
+
+    def send(self, request):
+        # type: (PipelineRequest) -> PipelineResponse
+        """Sends the request, unless its host's circuit is open or it's a retry beyond the budget.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        :raises: ~azure.core.exceptions.CircuitBreakerOpenError if the host's circuit is open
+        :raises: ~azure.core.exceptions.RetryBudgetExhaustedError if the host's retry budget is exhausted
+        """
+        host, probe = self.state._admit(request)  # pylint: disable=protected-access
+        try:
+            response = self.next.send(request)
+        except (ServiceRequestError, ServiceResponseError) as err:
+            self.state._record(request, host, probe, error=err)  # pylint: disable=protected-access
+            raise
+        except BaseException:
+            self.state._record(request, host, probe)  # pylint: disable=protected-access
+            raise
+        self.state._record(request, host, probe, response=response)  # pylint: disable=protected-access
+        return response
@@ -0,0 +1,72 @@
+#pylint: disable=no-self-use
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+from typing import Any, Optional
+
+from azure.core.exceptions import ServiceRequestError, ServiceResponseError
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+
+from .base_async import AsyncHTTPPolicy
+from .circuit_breaker import CircuitBreakerState
+
+
+class AsyncCircuitBreakerPolicy(AsyncHTTPPolicy):
+    """An async policy failing requests fast while their host is failing, and limiting retries to a budget
+    per host.
+
+    Add it after the retry policy, so that it sees every attempt. Give the same
+    :class:`~azure.core.pipeline.policies.CircuitBreakerState` to the policies of every client which should
+    share their view of the hosts' health, synchronous or asynchronous. Keyword arguments configure a new
+    state when none is given.
+
+    :param state: The circuit breakers and retry budgets to use.
+    :type state: ~azure.core.pipeline.policies.CircuitBreakerState
+    """
+
+    def __init__(self, state: Optional[CircuitBreakerState] = None, **kwargs: Any) -> None:
+        super(AsyncCircuitBreakerPolicy, self).__init__()
+        self.state = state or CircuitBreakerState(**kwargs)
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:  # type: ignore
+        """Sends the request, unless its host's circuit is open or it's a retry beyond the budget.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        :raises: ~azure.core.exceptions.CircuitBreakerOpenError if the host's circuit is open
+        :raises: ~azure.core.exceptions.RetryBudgetExhaustedError if the host's retry budget is exhausted
+        """
+        host, probe = self.state._admit(request)  # pylint: disable=protected-access
+        try:
+            response = await self.next.send(request)
+        except (ServiceRequestError, ServiceResponseError) as err:
+            self.state._record(request, host, probe, error=err)  # pylint: disable=protected-access
+            raise
+        except BaseException:
+            self.state._record(request, host, probe)  # pylint: disable=protected-access
+            raise
+        self.state._record(request, host, probe, response=response)  # pylint: disable=protected-access
+        return response
@@ -35,7 +35,9 @@ from typing import TYPE_CHECKING, List, Callable, Iterator, Any, Union, Dict, Op
 from azure.core.pipeline import PipelineResponse
 from azure.core.exceptions import (
     AzureError,
+    CircuitBreakerOpenError,
     ClientAuthenticationError,
+    RetryBudgetExhaustedError,
     ServiceResponseError,
     ServiceRequestError
 )
@@ -357,6 +359,9 @@ class RetryPolicy(HTTPPolicy):
                 # the authentication policy failed such that the client's request can't
                 # succeed--we'll never have a response to it, so propagate the exception
                 raise
+            except (CircuitBreakerOpenError, RetryBudgetExhaustedError):  # pylint:disable=try-except-raise
+                # a circuit breaker rejected the request to spare a failing host, retrying would defeat it
+                raise
             except AzureError as err:
                 if self._is_method_retryable(retry_settings, request.http_request):
                     retry_active = self.increment(retry_settings, response=request, error=err)
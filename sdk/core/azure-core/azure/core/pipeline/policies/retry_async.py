@@ -30,7 +30,12 @@ from __future__ import absolute_import  # we have a "requests" module that confl
 import logging
 from typing import TYPE_CHECKING, List, Callable, Iterator, Any, Union, Dict, Optional  # pylint: disable=unused-import
 
-from azure.core.exceptions import AzureError, ClientAuthenticationError
+from azure.core.exceptions import (
+    AzureError,
+    CircuitBreakerOpenError,
+    ClientAuthenticationError,
+    RetryBudgetExhaustedError
+)
 from .base import HTTPPolicy
 from .base_async import AsyncHTTPPolicy
 from .retry import RetryPolicy
@@ -145,6 +150,9 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):  # type: ignore
                 # the authentication policy failed such that the client's request can't
                 # succeed--we'll never have a response to it, so propagate the exception
                 raise
+            except (CircuitBreakerOpenError, RetryBudgetExhaustedError):  # pylint:disable=try-except-raise
+                # a circuit breaker rejected the request to spare a failing host, retrying would defeat it
+                raise
             except AzureError as err:
                 if self._is_method_retryable(retry_settings, request.http_request):
                     retry_active = self.increment(retry_settings, response=request, error=err)
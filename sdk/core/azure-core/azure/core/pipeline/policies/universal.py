@@ -45,6 +45,7 @@ from azure.core.exceptions import (
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from .base import SansIOHTTPPolicy
+from ._streaming_decode import StreamedItems, _JsonItemsParser, _XmlItemsParser
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -265,6 +266,14 @@ class NetworkTraceLoggingPolicy(SansIOHTTPPolicy):
 
 class ContentDecodePolicy(SansIOHTTPPolicy):
     """Policy for decoding unstreamed response content.
+
+    **Keyword argument:**
+
+    *stream_items (str)* - Decode the items of the response body while it's downloaded, rather than the
+    whole body once downloaded. The items are the elements of the JSON array which is the value of the
+    top-level member of this name, or the XML elements with this tag. The deserialized data in the context
+    is then a :class:`~azure.core.pipeline.policies._streaming_decode.StreamedItems` (or, for an async
+    response, ``AsyncStreamedItems``) iterating them.
     """
     JSON_MIMETYPES = [
         'application/json',
@@ -272,6 +281,8 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
     ]
     # Name used in context
     CONTEXT_NAME = "deserialized_data"
+    # Name of the items to stream, in context
+    STREAM_ITEMS_CONTEXT_NAME = "stream_items"
 
     @classmethod
     def deserialize_from_text(cls, response, content_type=None):
@@ -347,19 +358,66 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
         :param response: The HTTP response.
         :type response: ~azure.core.pipeline.transport.HttpResponse
         """
+        return cls.deserialize_from_text(response, cls._get_content_type(response))
+
+    @classmethod
+    def deserialize_items_from_stream(cls, response, item_name, content_type=None):
+        # type: (Type[ContentDecodePolicyType], Any, str, Optional[str]) -> Any
+        """Decode the items of a streamed response as its body is downloaded.
+
+        Only the items not iterated yet and the part of the body being parsed are held in memory.
+        Iterating the result reads the body, so the response must not be read otherwise.
+
+        :param response: The HTTP response, requested with stream=True.
+        :type response: ~azure.core.pipeline.transport.HttpResponse
+        :param str item_name: For JSON, the name of the top-level member whose value is the array of items.
+         The items of a top-level array are its elements. For XML, the tag of the item elements.
+        :param str content_type: The content type. Defaults to the response's, or JSON.
+        :return: An iterator of the items, asynchronous for an async response.
+        :rtype: ~azure.core.pipeline.policies._streaming_decode.StreamedItems
+        :raises ~azure.core.exceptions.DecodeError: If the content-type can't be streamed. Invalid content
+         raises it while iterating.
+        """
+        content_type = content_type or cls._get_content_type(response)
+        if content_type in cls.JSON_MIMETYPES:
+            parser = _JsonItemsParser(item_name)
+        elif "xml" in content_type:
+            parser = _XmlItemsParser(item_name)
+        else:
+            raise DecodeError("Cannot stream the items of content-type: {}".format(content_type))
+
+        # A SansIO policy has no pipeline to resume an interrupted download with,
+        # so errors reading the body are raised while iterating
+        chunks = response.stream_download(None)
+        if hasattr(chunks, "__anext__"):
+            from ._streaming_decode_async import AsyncStreamedItems
+            return AsyncStreamedItems(response, chunks, parser)
+        return StreamedItems(response, chunks, parser)
+
+    @staticmethod
+    def _get_content_type(response):
+        # type: (Any) -> str
         # Try to use content-type from headers if available
-        content_type = None
         if response.content_type: # type: ignore
-            content_type = response.content_type[0].strip().lower() # type: ignore
+            return response.content_type[0].strip().lower() # type: ignore
 
         # Ouch, this server did not declare what it sent...
         # Let's guess it's JSON...
         # Also, since Autorest was considering that an empty body was a valid JSON,
         # need that test as well....
-        else:
-            content_type = "application/json"
+        return "application/json"
 
-        return cls.deserialize_from_text(response, content_type)
+    def on_request(self, request, **kwargs):
+        # type: (PipelineRequest, Any) -> None
+        """Streams the response when its items should be decoded as they're downloaded.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        """
+        item_name = request.context.options.pop(self.STREAM_ITEMS_CONTEXT_NAME, None)
+        if item_name:
+            request.context[self.STREAM_ITEMS_CONTEXT_NAME] = item_name
+            request.context.options["stream"] = True
 
     def on_response(self, request, response, **kwargs):
         # type: (PipelineRequest, PipelineResponse, Any) -> None
@@ -378,6 +436,13 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
         :raises UnicodeDecodeError: If bytes is not UTF8
         :raises xml.etree.ElementTree.ParseError: If bytes is not valid XML
         """
+        item_name = response.context.get(self.STREAM_ITEMS_CONTEXT_NAME)
+        if item_name:
+            response.context[self.CONTEXT_NAME] = self.deserialize_items_from_stream(
+                response.http_response, item_name
+            )
+            return
+
         # If response was asked as stream, do NOT read anything and quit now
         if response.context.options.get("stream", True): # type: ignore
             return
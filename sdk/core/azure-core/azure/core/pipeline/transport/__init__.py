@@ -24,15 +24,18 @@
 #
 # --------------------------------------------------------------------------
 
-from .base import HttpTransport, HttpRequest, HttpResponse
+from .base import HttpTransport, HttpRequest, HttpResponse, ConnectionPoolStats
 from .requests_basic import RequestsTransport, RequestsTransportResponse
+from .shared import SharedTransport
 
 __all__ = [
     'HttpTransport',
     'HttpRequest',
     'HttpResponse',
+    'ConnectionPoolStats',
     'RequestsTransport',
     'RequestsTransportResponse',
+    'SharedTransport',
 ]
 
 #pylint: disable=unused-import
@@ -40,11 +43,13 @@ __all__ = [
 try:
     from .base_async import AsyncHttpTransport, AsyncHttpResponse
     from .requests_asyncio import AsyncioRequestsTransport, AsyncioRequestsTransportResponse
+    from .shared_async import AsyncSharedTransport
     __all__.extend([
         'AsyncHttpTransport',
         'AsyncHttpResponse',
         'AsyncioRequestsTransport',
-        'AsyncioRequestsTransportResponse'
+        'AsyncioRequestsTransportResponse',
+        'AsyncSharedTransport'
     ])
 
     try:
@@ -38,7 +38,7 @@ from requests.exceptions import (
     ChunkedEncodingError,
     StreamConsumedError)
 
-from .base import HttpRequest
+from .base import ConnectionPoolStats, HttpRequest
 from .base_async import (
     AsyncHttpTransport,
     AsyncHttpResponse,
@@ -73,6 +73,7 @@ class AioHttpTransport(AsyncHttpTransport):
         self._session_owner = session_owner
         self.session = session
         self.config = configuration or Configuration()
+        self._pool_counters = {'requests_sent': 0, 'connections_created': 0}
 
     async def __aenter__(self):
         await self.open()
@@ -85,7 +86,11 @@ class AioHttpTransport(AsyncHttpTransport):
         """Opens the connection.
         """
         if not self.session and self._session_owner:
-            self.session = aiohttp.ClientSession(loop=self._loop)
+            self.session = aiohttp.ClientSession(
+                loop=self._loop,
+                connector=self._build_connector(),
+                trace_configs=[self._build_trace_config()]
+            )
         if self.session is not None:
             await self.session.__aenter__()
 
@@ -97,6 +102,45 @@ class AioHttpTransport(AsyncHttpTransport):
             self._session_owner = False
             self.session = None
 
+    def _build_connector(self):
+        connection = self.config.connection
+        connector_kwargs = {'ttl_dns_cache': connection.dns_cache_ttl}
+        if connection.pool_size is not None:
+            connector_kwargs['limit_per_host'] = connection.pool_size
+        if connection.pool_limit is not None:
+            connector_kwargs['limit'] = connection.pool_limit
+        if connection.keep_alive is not None:
+            connector_kwargs['keepalive_timeout'] = connection.keep_alive
+        return aiohttp.TCPConnector(loop=self._loop, **connector_kwargs)
+
+    def _build_trace_config(self):
+        async def on_request_start(_session, _context, _params):
+            self._pool_counters['requests_sent'] += 1
+
+        async def on_connection_create_end(_session, _context, _params):
+            self._pool_counters['connections_created'] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return trace_config
+
+    @property
+    def connection_pool_stats(self) -> ConnectionPoolStats:
+        """A snapshot of the counters of the session's connection pool.
+
+        Requests and connections are counted only when the transport created the session.
+
+        :rtype: ~azure.core.pipeline.transport.ConnectionPoolStats
+        """
+        stats = ConnectionPoolStats(**self._pool_counters)
+        connector = self.session.connector if self.session else None
+        if connector is not None:
+            # aiohttp has no public API for the state of its pool
+            stats.connections_in_use = len(getattr(connector, '_acquired', ()))
+            stats.connections_idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+        return stats
+
     def _build_ssl_config(self, **config):
         verify = config.get('connection_verify', self.config.connection.verify)
         cert = config.get('connection_cert', self.config.connection.cert)
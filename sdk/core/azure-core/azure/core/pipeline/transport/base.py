@@ -103,6 +103,46 @@ class HttpTransport(AbstractContextManager, ABC, Generic[HTTPRequestType, HTTPRe
         time.sleep(duration)
 
 
+class ConnectionPoolStats(object):
+    """A snapshot of a transport's connection pool counters.
+
+    Compare `connections_in_use` with the configured ``connection_pool_size`` to tell whether requests wait
+    for, or open, connections beyond the pool. A low `connection_reuse_rate` means most requests paid for
+    a new connection and TLS handshake.
+
+    :ivar int requests_sent: The number of requests sent through the pool
+    :ivar int connections_created: The number of connections opened
+    :ivar int connections_in_use: The number of connections sending a request or receiving a response
+    :ivar int connections_idle: The number of open connections waiting in the pool for a request
+    """
+
+    def __init__(self, requests_sent=0, connections_created=0, connections_in_use=0, connections_idle=0):
+        # type: (int, int, int, int) -> None
+        self.requests_sent = requests_sent
+        self.connections_created = connections_created
+        self.connections_in_use = connections_in_use
+        self.connections_idle = connections_idle
+
+    def __repr__(self):
+        return (
+            "ConnectionPoolStats(requests_sent={}, connections_created={}, connections_in_use={}, "
+            "connections_idle={})".format(
+                self.requests_sent, self.connections_created, self.connections_in_use, self.connections_idle
+            )
+        )
+
+    @property
+    def connection_reuse_rate(self):
+        # type: () -> float
+        """The fraction of requests sent on a connection opened for an earlier request.
+
+        :rtype: float
+        """
+        if not self.requests_sent:
+            return 0.0
+        return max(self.requests_sent - self.connections_created, 0) / float(self.requests_sent)
+
+
 class HttpRequest(object):
     """Represents a HTTP request.
 
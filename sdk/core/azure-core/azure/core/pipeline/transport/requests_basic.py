@@ -40,6 +40,7 @@ from azure.core.pipeline import Pipeline
 from . import HttpRequest # pylint: disable=unused-import
 
 from .base import (
+    ConnectionPoolStats,
     HttpTransport,
     HttpResponse,
     _HttpResponseBase
@@ -153,6 +154,41 @@ class RequestsTransportResponse(HttpResponse, _RequestsTransportResponseBase):
         return StreamDownloadGenerator(pipeline, self.request, self.internal_response, self.block_size)
 
 
+class _HTTPAdapter(requests.adapters.HTTPAdapter):
+    """An HTTPAdapter opening connections with the given socket options, rather than urllib3's defaults.
+
+    :param list socket_options: Options as tuples of arguments to socket.setsockopt. None uses urllib3's.
+    """
+    def __init__(self, socket_options=None, **kwargs):
+        # set before the base class inits the pool manager
+        self._socket_options = socket_options
+        super(_HTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **pool_kwargs):  # pylint: disable=arguments-differ
+        if self._socket_options is not None:
+            pool_kwargs["socket_options"] = self._socket_options
+        super(_HTTPAdapter, self).init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if self._socket_options is not None:
+            proxy_kwargs["socket_options"] = self._socket_options
+        return super(_HTTPAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def _add_pool_stats(stats, pool):
+    # type: (ConnectionPoolStats, urllib3.HTTPConnectionPool) -> None
+    stats.requests_sent += pool.num_requests
+    stats.connections_created += pool.num_connections
+    queue = pool.pool
+    if queue is None:
+        # the pool is closed
+        return
+    with queue.mutex:
+        # the queue holds each connection not in use, or None for one not opened yet
+        stats.connections_idle += sum(1 for connection in queue.queue if connection is not None)
+        stats.connections_in_use += queue.maxsize - len(queue.queue)
+
+
 class RequestsTransport(HttpTransport):
     """Implements a basic requests HTTP sender.
 
@@ -204,10 +240,43 @@ class RequestsTransport(HttpTransport):
         if self.config.proxy_policy:
             session.trust_env = self.config.proxy_policy.use_env_settings
         disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
-        adapter = requests.adapters.HTTPAdapter(max_retries=disable_retries)
+        adapter_kwargs = {'max_retries': disable_retries}
+        if self.config.connection.pool_size is not None:
+            adapter_kwargs['pool_maxsize'] = self.config.connection.pool_size
+        if self.config.connection.pool_hosts is not None:
+            adapter_kwargs['pool_connections'] = self.config.connection.pool_hosts
+        # urllib3 enables TCP_NODELAY by default, and sets no other option
+        socket_options = None if self.config.connection.tcp_nodelay else []
+        adapter = _HTTPAdapter(socket_options=socket_options, **adapter_kwargs)
         for p in self._protocols:
             session.mount(p, adapter)
 
+    @property
+    def connection_pool_stats(self):
+        # type: () -> ConnectionPoolStats
+        """A snapshot of the counters of the session's connection pools, one per host.
+
+        A connection opened when every connection of its pool is in use is closed after its request,
+        and isn't counted in use.
+
+        :rtype: ~azure.core.pipeline.transport.ConnectionPoolStats
+        """
+        stats = ConnectionPoolStats()
+        if not self.session:
+            return stats
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            managers = [getattr(adapter, 'poolmanager', None)]
+            managers.extend(getattr(adapter, 'proxy_manager', {}).values())
+            for manager in managers:
+                if manager is None:
+                    continue
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    if pool is not None:
+                        _add_pool_stats(stats, pool)
+        return stats
+
     def open(self):
         if not self.session and self._session_owner:
             self.session = requests.Session()
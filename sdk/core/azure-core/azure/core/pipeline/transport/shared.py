@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import threading
+from typing import Any, Optional, TYPE_CHECKING  # pylint: disable=unused-import
+
+from .base import HttpTransport
+
+if TYPE_CHECKING:
+    from .base import HttpRequest, HttpResponse, ConnectionPoolStats  # pylint: disable=unused-import
+
+
+class SharedTransport(HttpTransport):
+    """A transport any number of clients can share, so that they share its connection pool.
+
+    Give the same instance as the ``transport`` keyword argument of every client. Each client entered as a
+    context manager holds a reference to the transport, which it releases when it exits. The creator holds
+    one too, released by :meth:`close`. The wrapped transport is closed when the last reference is released,
+    so closing one client doesn't close the connections the others use.
+
+    Connection settings of the wrapped transport, such as ``connection_pool_size``, apply to all the clients
+    together: per host, the clients share at most that many connections. When they send requests to more than
+    10 hosts, set ``connection_pool_hosts`` to their number so that the pools of the hosts aren't discarded.
+
+    :param transport: The transport to share, for example a
+     :class:`~azure.core.pipeline.transport.RequestsTransport`.
+    :type transport: ~azure.core.pipeline.transport.HttpTransport
+
+    Example:
+        .. code-block:: python
+
+            transport = SharedTransport(RequestsTransport(Configuration(connection_pool_size=32,
+                                                                        connection_pool_hosts=40)))
+            blob_service_client = BlobServiceClient(account_url, credential, transport=transport)
+            secret_client = SecretClient(vault_url, credential, transport=transport)
+            ...
+            transport.close()
+    """
+
+    def __init__(self, transport):
+        # type: (HttpTransport) -> None
+        self._transport = transport
+        self._lock = threading.Lock()
+        # the creator's reference
+        self._references = 1
+        self._creator_released = False
+        self._opened = False
+        self._closed = False
+
+    @property
+    def transport(self):
+        # type: () -> HttpTransport
+        """The wrapped transport."""
+        return self._transport
+
+    @property
+    def references(self):
+        # type: () -> int
+        """The number of references held to the transport, 0 once it's closed."""
+        return self._references
+
+    @property
+    def connection_pool_stats(self):
+        # type: () -> ConnectionPoolStats
+        """The wrapped transport's connection pool counters.
+
+        :rtype: ~azure.core.pipeline.transport.ConnectionPoolStats
+        """
+        return self._transport.connection_pool_stats  # type: ignore
+
+    def __enter__(self):
+        # type: () -> SharedTransport
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):  # pylint: disable=arguments-differ
+        self.release()
+
+    def acquire(self):
+        # type: () -> None
+        """Holds a reference to the transport, opening it if necessary.
+
+        :raises ValueError: if the transport has been closed
+        """
+        with self._lock:
+            self._check_not_closed()
+            self._references += 1
+            self._open()
+
+    def release(self):
+        # type: () -> None
+        """Releases a reference to the transport, closing it if it was the last."""
+        with self._lock:
+            if self._references <= 0:
+                return
+            self._references -= 1
+            if not self._references:
+                self._closed = True
+                self._transport.close()
+
+    def open(self):
+        # type: () -> None
+        with self._lock:
+            self._check_not_closed()
+            self._open()
+
+    def close(self):
+        # type: () -> None
+        """Releases the creator's reference. Calling it again has no effect."""
+        with self._lock:
+            if self._creator_released:
+                return
+            self._creator_released = True
+        self.release()
+
+    def send(self, request, **kwargs):  # type: ignore
+        # type: (HttpRequest, Any) -> HttpResponse
+        """Send the request with the wrapped transport.
+
+        :raises ValueError: if the transport has been closed
+        """
+        self._check_not_closed()
+        if not self._opened:
+            # opened once, rather than by each thread finding it not opened
+            self.open()
+        return self._transport.send(request, **kwargs)
+
+    def sleep(self, duration):
+        self._transport.sleep(duration)
+
+    def _check_not_closed(self):
+        if self._closed:
+            raise ValueError("The shared transport is closed: every reference to it has been released.")
+
+    def _open(self):
+        """Opens the wrapped transport, once. Call with the lock held."""
+        if not self._opened:
+            self._transport.open()
+            self._opened = True
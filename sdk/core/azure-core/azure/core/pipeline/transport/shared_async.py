@@ -0,0 +1,132 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from typing import Any
+
+from .base import HttpRequest, ConnectionPoolStats
+from .base_async import AsyncHttpTransport, AsyncHttpResponse
+
+
+class AsyncSharedTransport(AsyncHttpTransport):
+    """An async transport any number of clients can share, so that they share its connection pool.
+
+    Give the same instance as the ``transport`` keyword argument of every client. Each client entered as an
+    async context manager holds a reference to the transport, which it releases when it exits. The creator
+    holds one too, released by :meth:`close`. The wrapped transport is closed when the last reference is
+    released, so closing one client doesn't close the connections the others use.
+
+    Connection settings of the wrapped transport, such as ``connection_pool_size``, apply to all the clients
+    together. The clients must run in the same event loop.
+
+    :param transport: The transport to share, for example a
+     :class:`~azure.core.pipeline.transport.AioHttpTransport`.
+    :type transport: ~azure.core.pipeline.transport.AsyncHttpTransport
+    """
+
+    def __init__(self, transport: AsyncHttpTransport) -> None:
+        self._transport = transport
+        # the creator's reference
+        self._references = 1
+        self._creator_released = False
+        self._opened = False
+        self._closed = False
+
+    @property
+    def transport(self) -> AsyncHttpTransport:
+        """The wrapped transport."""
+        return self._transport
+
+    @property
+    def references(self) -> int:
+        """The number of references held to the transport, 0 once it's closed."""
+        return self._references
+
+    @property
+    def connection_pool_stats(self) -> ConnectionPoolStats:
+        """The wrapped transport's connection pool counters.
+
+        :rtype: ~azure.core.pipeline.transport.ConnectionPoolStats
+        """
+        return self._transport.connection_pool_stats  # type: ignore
+
+    async def __aenter__(self) -> "AsyncSharedTransport":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args):  # pylint: disable=arguments-differ
+        await self.release()
+
+    async def acquire(self) -> None:
+        """Holds a reference to the transport, opening it if necessary.
+
+        :raises ValueError: if the transport has been closed
+        """
+        self._check_not_closed()
+        self._references += 1
+        await self.open()
+
+    async def release(self) -> None:
+        """Releases a reference to the transport, closing it if it was the last."""
+        if self._references <= 0:
+            return
+        self._references -= 1
+        if not self._references:
+            self._closed = True
+            await self._transport.close()
+
+    async def open(self) -> None:
+        self._check_not_closed()
+        if not self._opened:
+            # set first, so that a request sent while the transport opens doesn't open it again
+            self._opened = True
+            try:
+                await self._transport.open()
+            except Exception:
+                self._opened = False
+                raise
+
+    async def close(self) -> None:
+        """Releases the creator's reference. Calling it again has no effect."""
+        if self._creator_released:
+            return
+        self._creator_released = True
+        await self.release()
+
+    async def send(self, request: HttpRequest, **kwargs: Any) -> AsyncHttpResponse:  # type: ignore
+        """Send the request with the wrapped transport.
+
+        :raises ValueError: if the transport has been closed
+        """
+        self._check_not_closed()
+        if not self._opened:
+            await self.open()
+        return await self._transport.send(request, **kwargs)
+
+    async def sleep(self, duration):
+        await self._transport.sleep(duration)
+
+    def _check_not_closed(self):
+        if self._closed:
+            raise ValueError("The shared transport is closed: every reference to it has been released.")
@@ -82,7 +82,9 @@ def example_connection_config():
         connection_timeout=100,
         connection_verify=True,
         connection_cert=None,
-        connection_data_block_size=4096
+        connection_data_block_size=4096,
+        connection_pool_size=32,
+        connection_pool_hosts=10
     )
 
     # Or parameters can be tweaked later:
@@ -90,4 +92,6 @@ def example_connection_config():
     config.connection.verify = True
     config.connection.cert = None
     config.connection.data_block_size = 4096
+    config.connection.pool_size = 32
+    config.connection.pool_hosts = 10
     # [END connection_configuration]
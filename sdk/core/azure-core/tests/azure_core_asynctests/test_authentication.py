@@ -86,3 +86,88 @@ async def test_bearer_policy_token_caching():
 
     await pipeline.run(HttpRequest("GET", "https://spam.eggs"))
     assert get_token_calls == 2  # token expired -> policy should call get_token
+
+
+@pytest.mark.asyncio
+async def test_bearer_policy_concurrent_refresh():
+    """Requests sent at the same time without a token should share a single call to get_token"""
+    get_token_calls = 0
+
+    async def get_token(_):
+        nonlocal get_token_calls
+        get_token_calls += 1
+        await asyncio.sleep(0.01)
+        return AccessToken("token", time.time() + 3600)
+
+    async def send(_):
+        return Mock()
+
+    policies = [AsyncBearerTokenCredentialPolicy(Mock(get_token=get_token), "scope"), Mock(send=send)]
+    pipeline = AsyncPipeline(transport=Mock(), policies=policies)
+
+    await asyncio.gather(*[pipeline.run(HttpRequest("GET", "https://spam.eggs")) for _ in range(4)])
+    assert get_token_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_bearer_policy_background_refresh():
+    """A token close to expiring should be replaced in the background while requests keep using it"""
+    tokens = [AccessToken("expiring", time.time() + 200), AccessToken("new", time.time() + 3600)]
+    get_token_calls = 0
+    release = asyncio.Event()
+
+    async def get_token(_):
+        nonlocal get_token_calls
+        get_token_calls += 1
+        if get_token_calls > 1:
+            await release.wait()
+        return tokens[get_token_calls - 1]
+
+    sent_tokens = []
+
+    async def send(request):
+        sent_tokens.append(request.http_request.headers["Authorization"])
+        return Mock()
+
+    policy = AsyncBearerTokenCredentialPolicy(Mock(get_token=get_token), "scope", background_refresh=True)
+    pipeline = AsyncPipeline(transport=Mock(), policies=[policy, Mock(send=send)])
+
+    for _ in range(3):
+        await pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+        await asyncio.sleep(0)
+    assert sent_tokens == ["Bearer expiring"] * 3
+    assert get_token_calls == 2  # a single refresh is started
+
+    release.set()
+    await policy._refresh_task
+    await pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    assert sent_tokens[-1] == "Bearer new"
+    assert get_token_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_bearer_policy_background_refresh_error():
+    """When a background refresh fails, requests should keep using the current token"""
+    get_token_calls = 0
+
+    async def get_token(_):
+        nonlocal get_token_calls
+        get_token_calls += 1
+        if get_token_calls > 1:
+            raise ValueError("refresh failed")
+        return AccessToken("expiring", time.time() + 200)
+
+    async def send(_):
+        return Mock()
+
+    policy = AsyncBearerTokenCredentialPolicy(Mock(get_token=get_token), "scope", background_refresh=True)
+    pipeline = AsyncPipeline(transport=Mock(), policies=[policy, Mock(send=send)])
+
+    await pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    await pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    await policy._refresh_task
+    assert get_token_calls == 2
+
+    # the failed refresh isn't tried again right away
+    await pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    assert get_token_calls == 2
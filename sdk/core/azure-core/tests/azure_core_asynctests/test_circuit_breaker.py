@@ -0,0 +1,131 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import asyncio
+
+from azure.core.exceptions import CircuitBreakerOpenError, RetryBudgetExhaustedError, ServiceResponseError
+from azure.core.pipeline import AsyncPipeline, Pipeline
+from azure.core.pipeline.policies import (
+    AsyncCircuitBreakerPolicy,
+    AsyncRetryPolicy,
+    CircuitBreakerPolicy,
+    CircuitBreakerState,
+)
+from azure.core.pipeline.transport import AsyncHttpTransport, HttpRequest, HttpResponse, HttpTransport
+
+import pytest
+
+
+class AsyncOutcomeTransport(AsyncHttpTransport):
+    """Answers each request with the next status code, or raises the next exception"""
+
+    def __init__(self, *outcomes, delay=0):
+        self.outcomes = list(outcomes)
+        self.delay = delay
+        self.sent = []
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def sleep(self, duration):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        await asyncio.sleep(self.delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = HttpResponse(request, None)
+        response.status_code = outcome
+        return response
+
+
+async def get(pipeline, url="https://myaccount.blob.core.windows.net/container"):
+    return (await pipeline.run(HttpRequest("GET", url))).http_response
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_breaker():
+    state = CircuitBreakerState(failure_threshold=2, open_seconds=0.1)
+    transport = AsyncOutcomeTransport(ServiceResponseError("connection reset"), 502, 200, delay=0.01)
+    pipeline = AsyncPipeline(transport, [AsyncCircuitBreakerPolicy(state)])
+
+    with pytest.raises(ServiceResponseError):
+        await get(pipeline)
+    assert (await get(pipeline)).status_code == 502
+    with pytest.raises(CircuitBreakerOpenError):
+        await get(pipeline)
+
+    # once half-open, only one of concurrent requests probes the host
+    await asyncio.sleep(0.15)
+    results = await asyncio.gather(*[get(pipeline) for _ in range(3)], return_exceptions=True)
+    assert [r.status_code for r in results if isinstance(r, HttpResponse)] == [200]
+    assert len([r for r in results if isinstance(r, CircuitBreakerOpenError)]) == 2
+    stats = state.get_stats()["myaccount.blob.core.windows.net"]
+    assert stats.state == "closed"
+    assert stats.rejected_requests == 3
+    assert len(transport.sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_retry_budget():
+    state = CircuitBreakerState(failure_threshold=100, retry_budget=1, retry_ratio=0)
+    transport = AsyncOutcomeTransport(500)
+    pipeline = AsyncPipeline(
+        transport, [AsyncRetryPolicy(retry_total=5, retry_backoff_factor=0), AsyncCircuitBreakerPolicy(state)]
+    )
+
+    with pytest.raises(RetryBudgetExhaustedError) as ex:
+        await get(pipeline)
+    assert ex.value.response.status_code == 500
+    assert len(transport.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_state_shared_by_sync_and_async_policies():
+    state = CircuitBreakerState(failure_threshold=1)
+    await get(AsyncPipeline(AsyncOutcomeTransport(503), [AsyncCircuitBreakerPolicy(state)]))
+
+    class UnusedTransport(HttpTransport):
+        def __exit__(self, *args):
+            pass
+        def open(self):
+            pass
+        def close(self):
+            pass
+        def send(self, request, **kwargs):
+            raise AssertionError("the request should fail fast")
+
+    with pytest.raises(CircuitBreakerOpenError):
+        Pipeline(UnusedTransport(), [CircuitBreakerPolicy(state)]).run(
+            HttpRequest("GET", "https://myaccount.blob.core.windows.net")
+        )
@@ -0,0 +1,72 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import asyncio
+
+from azure.core import Configuration
+from azure.core.pipeline.transport import AioHttpTransport, HttpRequest
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_pool_configuration():
+    config = Configuration(
+        connection_pool_size=32, connection_pool_limit=64, connection_keep_alive=30, connection_dns_cache_ttl=None
+    )
+    async with AioHttpTransport(config) as transport:
+        connector = transport.session.connector
+        assert connector.limit_per_host == 32
+        assert connector.limit == 64
+
+    # by default, aiohttp's are used
+    async with AioHttpTransport() as transport:
+        connector = transport.session.connector
+        assert connector.limit_per_host == 0
+        assert connector.limit == 100
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_pool_stats(local_server_url):
+    async with AioHttpTransport(Configuration(connection_pool_size=2)) as transport:
+        for _ in range(3):
+            await transport.send(HttpRequest("GET", local_server_url))
+        stats = transport.connection_pool_stats
+        assert stats.requests_sent == 3
+        assert stats.connections_created == 1
+        assert stats.connections_idle == 1
+        assert stats.connections_in_use == 0
+
+        response = await transport.send(HttpRequest("GET", local_server_url), stream=True)
+        assert transport.connection_pool_stats.connections_in_use == 1
+        await response.load_body()
+        assert transport.connection_pool_stats.connections_in_use == 0
+
+        # concurrent requests beyond the pool size wait for a connection
+        await asyncio.gather(*[transport.send(HttpRequest("GET", local_server_url + "/0.1")) for _ in range(4)])
+        stats = transport.connection_pool_stats
+        assert stats.requests_sent == 8
+        assert stats.connections_created == 2
+        assert stats.connections_idle == 2
@@ -0,0 +1,135 @@
+#--------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+#--------------------------------------------------------------------------
+import asyncio
+
+from azure.core.paging import Paged
+
+from msrest.serialization import Deserializer
+
+import pytest
+
+
+class FakePaged(Paged):
+    _attribute_map = {
+        'next_link': {'key': 'nextLink', 'type': 'str'},
+        'current_page': {'key': 'value', 'type': '[str]'}
+    }
+
+
+_test_deserializer = Deserializer({})
+
+
+def _sync_paging(next_link=None):
+    raise AssertionError("the async command should be used")
+
+
+@pytest.mark.asyncio
+async def test_by_page():
+    async def internal_paging(next_link=None):
+        pages = {
+            '': {'nextLink': 'page2', 'value': ['value1.0', 'value1.1']},
+            'page2': {'nextLink': 'page3', 'value': []},
+            'page3': {'nextLink': None, 'value': ['value3.0']},
+        }
+        return pages[next_link]
+
+    deserialized = FakePaged(_sync_paging, _test_deserializer, async_command=internal_paging)
+    assert await deserialized.__anext__() == 'value1.0'
+    assert [page async for page in deserialized.by_page()] == [['value1.1'], ['value3.0']]
+
+
+@pytest.mark.asyncio
+async def test_prefetch():
+    requested = []
+    iterated = []
+
+    async def internal_paging(next_link=None):
+        index = int(next_link or 0)
+        requested.append((index, len(iterated)))
+        return {
+            'nextLink': str(index + 1) if index < 4 else None,
+            'value': ['value{}.0'.format(index), 'value{}.1'.format(index)]
+        }
+
+    deserialized = FakePaged(_sync_paging, _test_deserializer, async_command=internal_paging, prefetch_pages=1)
+    async for page in deserialized.by_page():
+        # let the next page be requested before iterating this one
+        await asyncio.sleep(0.01)
+        iterated.append(page)
+
+    assert len(iterated) == 5
+    assert iterated[-1] == ['value4.0', 'value4.1']
+    # each page was requested while the one before it was iterated, never two pages ahead
+    assert requested == [(0, 0), (1, 0), (2, 1), (3, 2), (4, 3)]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_error():
+    failures = [ValueError("request failed")]
+
+    async def internal_paging(next_link=None):
+        if next_link == 'page2' and failures:
+            raise failures.pop()
+        if not next_link:
+            return {'nextLink': 'page2', 'value': ['value1.0', 'value1.1']}
+        return {'nextLink': None, 'value': ['value2.0']}
+
+    deserialized = FakePaged(_sync_paging, _test_deserializer, async_command=internal_paging, prefetch_pages=2)
+    assert await deserialized.__anext__() == 'value1.0'
+    assert await deserialized.__anext__() == 'value1.1'
+    # the error is raised when the failed page is reached
+    with pytest.raises(ValueError):
+        await deserialized.__anext__()
+
+    # iterating again requests the page again
+    assert [item async for item in deserialized] == ['value2.0']
+
+
+@pytest.mark.asyncio
+async def test_prefetch_close():
+    requested = []
+    cancelled = []
+
+    async def internal_paging(next_link=None):
+        index = int(next_link or 0)
+        requested.append(index)
+        if index > 0:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+        return {'nextLink': str(index + 1), 'value': ['value{}'.format(index)]}
+
+    deserialized = FakePaged(_sync_paging, _test_deserializer, async_command=internal_paging, prefetch_pages=2)
+    assert await deserialized.__anext__() == 'value0'
+    await asyncio.sleep(0.01)
+    assert requested == [0, 1]
+
+    # closing cancels the request in progress
+    deserialized.close()
+    await asyncio.sleep(0.01)
+    assert cancelled == [1]
@@ -27,8 +27,9 @@ import sys
 
 from azure.core.configuration import Configuration
 from azure.core.pipeline import AsyncPipeline
-from azure.core.pipeline.policies import SansIOHTTPPolicy, UserAgentPolicy, AsyncRedirectPolicy
+from azure.core.pipeline.policies import SansIOHTTPPolicy, UserAgentPolicy, AsyncRedirectPolicy, ContentDecodePolicy
 from azure.core.pipeline.transport import (
+    AsyncHttpResponse,
     AsyncHttpTransport,
     HttpRequest,
     AsyncioRequestsTransport,
@@ -149,4 +150,43 @@ def test_conf_async_trio_requests():
             return await pipeline.run(request)
 
     response = trio.run(do)
-    assert response.http_response.status_code == 200
\ No newline at end of file
+    assert response.http_response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_stream_items():
+    body = b'<Queues><Queue><Name>a</Name></Queue><Queue><Name>b</Name></Queue></Queues>'
+
+    class StreamedResponse(AsyncHttpResponse):
+        def __init__(self, request):
+            super(StreamedResponse, self).__init__(request, None)
+            self.status_code = 200
+            self.content_type = ["application/xml"]
+
+        async def _chunks(self):
+            for i in range(0, len(body), 5):
+                yield body[i:i + 5]
+
+        def stream_download(self, pipeline):
+            return self._chunks()
+
+    class MockTransport(AsyncHttpTransport):
+        async def send(self, request, **config):
+            assert config == {"stream": True}
+            return StreamedResponse(request)
+
+        async def open(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            pass
+
+    async with AsyncPipeline(MockTransport(), [ContentDecodePolicy()]) as pipeline:
+        response = await pipeline.run(HttpRequest("GET", "https://bing.com/"), stream_items="Queue")
+
+    items = response.context["deserialized_data"]
+    assert [item.find("Name").text async for item in items] == ["a", "b"]
+    assert items.remainder.tag == "Queues"
+    assert len(items.remainder) == 0
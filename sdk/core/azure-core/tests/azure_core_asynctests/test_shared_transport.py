@@ -0,0 +1,60 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import asyncio
+
+from azure.core import Configuration
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.transport import AioHttpTransport, AsyncSharedTransport, HttpRequest
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_async_shared_transport(local_server_url):
+    transport = AsyncSharedTransport(AioHttpTransport(Configuration(connection_pool_size=2)))
+    first, second = AsyncPipeline(transport), AsyncPipeline(transport)
+
+    async with first:
+        async with second:
+            assert transport.references == 3
+            await asyncio.gather(*[
+                pipeline.run(HttpRequest("GET", local_server_url + "/0.1"), stream=False)
+                for pipeline in (first, second, first, second)
+            ])
+        # closing a client doesn't close the transport
+        assert transport.transport.session is not None
+        await first.run(HttpRequest("GET", local_server_url), stream=False)
+
+    stats = transport.connection_pool_stats
+    assert stats.requests_sent == 5
+    # the clients' concurrent requests are limited to the pool size together
+    assert stats.connections_created == 2
+
+    await transport.close()
+    assert transport.references == 0
+    assert transport.transport.session is None
+    with pytest.raises(ValueError):
+        await first.run(HttpRequest("GET", local_server_url))
@@ -25,7 +25,19 @@
 # --------------------------------------------------------------------------
 import sys
 
+import pytest
+
+from local_server import start_local_server
+
 # Ignore collection of async tests for Python 2
 collect_ignore = []
 if sys.version_info < (3, 5):
     collect_ignore.append("azure_core_asynctests")
+
+
+@pytest.fixture
+def local_server_url():
+    server, url = start_local_server()
+    yield url
+    server.shutdown()
+    server.server_close()
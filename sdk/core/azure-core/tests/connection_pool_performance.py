@@ -0,0 +1,111 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Benchmark of request throughput against connection pool size, with a local HTTP server.
+
+Each of CONCURRENCY threads (for RequestsTransport) or tasks (for AioHttpTransport) sends requests which
+the server answers after 10ms. A pool smaller than the concurrency makes requests open a connection they
+can't keep (requests) or wait for one (aiohttp). A local connection has no TLS handshake, so the cost of
+opening connections is shown by the connection count more than by the throughput.
+
+    python tests/connection_pool_performance.py [CONCURRENCY] [REQUESTS]
+"""
+import sys
+import threading
+import time
+
+from azure.core import Configuration
+from azure.core.pipeline.transport import HttpRequest, RequestsTransport
+
+from local_server import start_local_server
+
+POOL_SIZES = (1, 4, 10, 32, 64)
+
+
+def requests_throughput(url, pool_size, concurrency, count):
+    transport = RequestsTransport(Configuration(connection_pool_size=pool_size))
+    per_thread = count // concurrency
+
+    def send():
+        for _ in range(per_thread):
+            transport.send(HttpRequest("GET", url)).body()
+
+    with transport:
+        threads = [threading.Thread(target=send) for _ in range(concurrency)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.time() - start
+        return per_thread * concurrency / elapsed, transport.connection_pool_stats
+
+
+def aiohttp_throughput(url, pool_size, concurrency, count):
+    import asyncio
+    from azure.core.pipeline.transport import AioHttpTransport
+
+    per_task = count // concurrency
+
+    async def run():
+        async with AioHttpTransport(Configuration(connection_pool_size=pool_size)) as transport:
+            async def send():
+                for _ in range(per_task):
+                    await transport.send(HttpRequest("GET", url))
+
+            start = time.time()
+            await asyncio.gather(*[send() for _ in range(concurrency)])
+            return per_task * concurrency / (time.time() - start), transport.connection_pool_stats
+
+    return asyncio.get_event_loop().run_until_complete(run())
+
+
+def main(concurrency, count):
+    server, url = start_local_server()
+    url += "/0.01"
+    try:
+        benchmarks = [("requests", requests_throughput)]
+        try:
+            import aiohttp  # pylint: disable=unused-import
+            benchmarks.append(("aiohttp", aiohttp_throughput))
+        except ImportError:
+            print("aiohttp isn't installed, only RequestsTransport is measured")
+        print("{} concurrent senders, {} requests".format(concurrency, count))
+        print("transport  pool size  requests/s  connections  reuse rate")
+        for name, benchmark in benchmarks:
+            for pool_size in POOL_SIZES:
+                throughput, stats = benchmark(url, pool_size, concurrency, count)
+                print("{:9}  {:9}  {:10.0f}  {:11}  {:10.2f}".format(
+                    name, pool_size, throughput, stats.connections_created, stats.connection_reuse_rate))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 32,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+    )
@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
+import threading
 import time
 
 from azure.core.credentials import AccessToken
@@ -69,3 +70,81 @@ def test_bearer_policy_token_caching():
 
     pipeline.run(HttpRequest("GET", "https://spam.eggs"))
     assert credential.get_token.call_count == 2  # token expired -> policy should call get_token
+
+
+def test_bearer_policy_concurrent_refresh():
+    """Requests sent at the same time without a token should share a single call to get_token"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_token(*_):
+        started.set()
+        release.wait(5)
+        return AccessToken("token", time.time() + 3600)
+
+    credential = Mock(get_token=Mock(side_effect=get_token))
+    pipeline = Pipeline(transport=Mock(), policies=[BearerTokenCredentialPolicy(credential, "scope")])
+
+    threads = [threading.Thread(target=pipeline.run, args=(HttpRequest("GET", "https://spam.eggs"),))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert credential.get_token.call_count == 1
+
+
+def test_bearer_policy_background_refresh():
+    """A token close to expiring should be replaced in the background while requests keep using it"""
+    expiring_token = AccessToken("expiring", time.time() + 200)
+    new_token = AccessToken("new", time.time() + 3600)
+    release = threading.Event()
+    refreshed = threading.Event()
+
+    def get_token(*_):
+        if credential.get_token.call_count == 1:
+            return expiring_token
+        release.wait(5)
+        refreshed.set()
+        return new_token
+
+    credential = Mock(get_token=Mock(side_effect=get_token))
+    sent_tokens = []
+    transport = Mock(send=lambda request, **_: sent_tokens.append(request.headers["Authorization"]))
+    policy = BearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    pipeline = Pipeline(transport=transport, policies=[policy])
+
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    assert sent_tokens == ["Bearer expiring"] * 3
+    assert credential.get_token.call_count == 2  # a single refresh is started
+
+    release.set()
+    refreshed.wait(5)
+    policy._lock.acquire()  # the background thread releases the lock once it has set the token
+    policy._lock.release()
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    assert sent_tokens[-1] == "Bearer new"
+    assert credential.get_token.call_count == 2
+
+
+def test_bearer_policy_background_refresh_error():
+    """When a background refresh fails, requests should keep using the current token"""
+    expiring_token = AccessToken("expiring", time.time() + 200)
+    credential = Mock(get_token=Mock(side_effect=[expiring_token, ValueError("refresh failed")]))
+    policy = BearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    pipeline = Pipeline(transport=Mock(), policies=[policy])
+
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    policy._lock.acquire()
+    policy._lock.release()
+    assert credential.get_token.call_count == 2
+
+    # the failed refresh isn't tried again right away
+    pipeline.run(HttpRequest("GET", "https://spam.eggs"))
+    assert credential.get_token.call_count == 2
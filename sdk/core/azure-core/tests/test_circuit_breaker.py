@@ -0,0 +1,212 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import pytest
+
+from azure.core.exceptions import CircuitBreakerOpenError, RetryBudgetExhaustedError, ServiceRequestError
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import CircuitBreakerPolicy, CircuitBreakerState, RetryPolicy
+from azure.core.pipeline.transport import HttpRequest, HttpResponse, HttpTransport
+
+
+class OutcomeTransport(HttpTransport):
+    """Answers each request with the next status code, or raises the next exception"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.sent = []
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sleep(self, duration):
+        pass
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = HttpResponse(request, None)
+        response.status_code = outcome
+        return response
+
+
+def get(pipeline, url="https://myaccount.blob.core.windows.net/container"):
+    return pipeline.run(HttpRequest("GET", url)).http_response
+
+
+def test_circuit_opens_after_consecutive_failures():
+    state = CircuitBreakerState(failure_threshold=3, open_seconds=30)
+    transport = OutcomeTransport(200, 500, 503, 500)
+    pipeline = Pipeline(transport, [CircuitBreakerPolicy(state)])
+
+    assert get(pipeline).status_code == 200
+    for _ in range(3):
+        assert get(pipeline).status_code >= 500
+    assert state.get_stats()["myaccount.blob.core.windows.net"].state == "open"
+
+    with pytest.raises(CircuitBreakerOpenError) as ex:
+        get(pipeline)
+    assert ex.value.host == "myaccount.blob.core.windows.net"
+    assert 29 < ex.value.retry_after <= 30
+    assert len(transport.sent) == 4
+
+    # other hosts aren't affected
+    transport.outcomes = [200]
+    assert get(pipeline, "https://otheraccount.blob.core.windows.net").status_code == 200
+    stats = state.get_stats("myaccount.blob.core.windows.net")["myaccount.blob.core.windows.net"]
+    assert stats.rejected_requests == 1
+    assert stats.consecutive_failures == 3
+
+
+def test_success_resets_failure_count():
+    state = CircuitBreakerState(failure_threshold=2)
+    transport = OutcomeTransport(500, 200, 500, 404)
+    pipeline = Pipeline(transport, [CircuitBreakerPolicy(state)])
+
+    for _ in range(4):
+        get(pipeline)
+    stats = state.get_stats()["myaccount.blob.core.windows.net"]
+    assert stats.state == "closed"
+    assert stats.consecutive_failures == 0
+
+
+def test_half_open_probe():
+    state = CircuitBreakerState(failure_threshold=1, open_seconds=10)
+    transport = OutcomeTransport(ServiceRequestError("connection refused"))
+    pipeline = Pipeline(transport, [CircuitBreakerPolicy(state)])
+    host = "myaccount.blob.core.windows.net"
+
+    with mock.patch("azure.core.pipeline.policies.circuit_breaker.time") as time:
+        time.time.return_value = 1000
+        with pytest.raises(ServiceRequestError):
+            get(pipeline)
+        assert state.get_stats()[host].state == "open"
+
+        # a failed probe opens the circuit again
+        time.time.return_value = 1010
+        with pytest.raises(ServiceRequestError) as ex:
+            get(pipeline)
+        assert not isinstance(ex.value, CircuitBreakerOpenError)
+        assert state.get_stats()[host].state == "open"
+        time.time.return_value = 1015
+        with pytest.raises(CircuitBreakerOpenError) as ex:
+            get(pipeline)
+        assert ex.value.retry_after == 5
+
+        # a successful probe closes it
+        time.time.return_value = 1020
+        transport.outcomes = [200]
+        assert get(pipeline).status_code == 200
+        assert state.get_stats()[host].state == "closed"
+        assert len(transport.sent) == 3
+
+
+def test_half_open_limits_concurrent_probes():
+    state = CircuitBreakerState(failure_threshold=1, open_seconds=0, half_open_probes=1)
+    host = "myaccount.blob.core.windows.net"
+    policy = CircuitBreakerPolicy(state)
+
+    class ProbeInFlight(HttpTransport):
+        def __exit__(self, *args):
+            pass
+        def open(self):
+            pass
+        def close(self):
+            pass
+        def send(self, request, **kwargs):
+            # while this probe is in flight, another request fails fast
+            with pytest.raises(CircuitBreakerOpenError):
+                get(Pipeline(OutcomeTransport(200), [CircuitBreakerPolicy(state)]))
+            response = HttpResponse(request, None)
+            response.status_code = 200
+            return response
+
+    get(Pipeline(OutcomeTransport(500), [policy]))
+    assert state.get_stats()[host].state == "open"
+    assert get(Pipeline(ProbeInFlight(), [policy])).status_code == 200
+    assert state.get_stats()[host].state == "closed"
+
+
+def test_retry_budget():
+    state = CircuitBreakerState(failure_threshold=100, retry_budget=2, retry_ratio=0.5)
+    transport = OutcomeTransport(503)
+    pipeline = Pipeline(
+        transport, [RetryPolicy(retry_total=5, retry_backoff_factor=0), CircuitBreakerPolicy(state)]
+    )
+
+    # the first request spends the budget on two retries, then the third fails fast with the last response
+    with pytest.raises(RetryBudgetExhaustedError) as ex:
+        get(pipeline)
+    assert ex.value.response.status_code == 503
+    assert len(transport.sent) == 3
+    stats = state.get_stats()["myaccount.blob.core.windows.net"]
+    assert stats.rejected_retries == 1
+    assert stats.retry_tokens == 0
+
+    # each request deposits part of a token, so retries stay a fraction of requests
+    for expected_attempts in (1, 2, 1, 2):
+        transport.sent = []
+        with pytest.raises(RetryBudgetExhaustedError):
+            get(pipeline)
+        assert len(transport.sent) == expected_attempts
+
+
+def test_retry_policy_does_not_retry_open_circuit():
+    state = CircuitBreakerState(failure_threshold=2, retry_budget=100)
+    transport = OutcomeTransport(ServiceRequestError("connection refused"))
+    pipeline = Pipeline(
+        transport, [RetryPolicy(retry_total=10, retry_backoff_factor=0), CircuitBreakerPolicy(state)]
+    )
+
+    with pytest.raises(CircuitBreakerOpenError):
+        get(pipeline)
+    assert len(transport.sent) == 2
+
+
+def test_state_reset():
+    state = CircuitBreakerState(failure_threshold=1)
+    pipeline = Pipeline(OutcomeTransport(500), [CircuitBreakerPolicy(state)])
+    get(pipeline)
+    assert state.get_stats()["myaccount.blob.core.windows.net"].state == "open"
+
+    state.reset("myaccount.blob.core.windows.net")
+    assert state.get_stats() == {}
+    get(pipeline)
+    assert state.get_stats()["myaccount.blob.core.windows.net"].state == "open"
+    state.reset()
+    assert state.get_stats() == {}
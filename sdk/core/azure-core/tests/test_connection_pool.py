@@ -0,0 +1,87 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import threading
+
+from azure.core import Configuration
+from azure.core.pipeline.transport import ConnectionPoolStats, HttpRequest, RequestsTransport
+
+
+def test_pool_configuration():
+    with RequestsTransport(Configuration(
+            connection_pool_size=32, connection_pool_hosts=40, connection_tcp_nodelay=False)) as transport:
+        adapter = transport.session.get_adapter("https://127.0.0.1")
+        pool = adapter.poolmanager.connection_from_url("https://127.0.0.1")
+        assert pool.pool.maxsize == 32
+        assert pool.conn_kw["socket_options"] == []
+        # the pools of 40 hosts are kept
+        pools = [adapter.poolmanager.connection_from_url("https://host{}".format(i)) for i in range(40)]
+        assert adapter.poolmanager.connection_from_url("https://host0") is pools[0]
+
+    # by default, urllib3's are used
+    with RequestsTransport() as transport:
+        pool = transport.session.get_adapter("https://127.0.0.1").poolmanager.connection_from_url("https://127.0.0.1")
+        assert pool.pool.maxsize == 10
+        assert "socket_options" not in pool.conn_kw
+        assert transport.session.get_adapter("https://127.0.0.1").poolmanager.pools._maxsize == 10
+
+
+def test_pool_stats(local_server_url):
+    transport = RequestsTransport(Configuration(connection_pool_size=4))
+    assert transport.connection_pool_stats.requests_sent == 0
+
+    with transport:
+        for _ in range(3):
+            transport.send(HttpRequest("GET", local_server_url)).body()
+        stats = transport.connection_pool_stats
+        assert stats.requests_sent == 3
+        assert stats.connections_created == 1
+        assert stats.connections_idle == 1
+        assert stats.connections_in_use == 0
+        assert stats.connection_reuse_rate == 2 / 3.0
+
+        # a streamed response holds its connection until it's read
+        response = transport.send(HttpRequest("GET", local_server_url), stream=True)
+        assert transport.connection_pool_stats.connections_in_use == 1
+        response.body()
+        assert transport.connection_pool_stats.connections_in_use == 0
+
+        threads = [
+            threading.Thread(target=lambda: transport.send(HttpRequest("GET", local_server_url + "/0.1")).body())
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = transport.connection_pool_stats
+        assert stats.requests_sent == 8
+        assert stats.connections_created == 4
+        assert stats.connections_idle == 4
+
+
+def test_pool_stats_reuse_rate():
+    assert ConnectionPoolStats().connection_reuse_rate == 0.0
+    assert ConnectionPoolStats(requests_sent=4, connections_created=1).connection_reuse_rate == 0.75
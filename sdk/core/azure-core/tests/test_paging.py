@@ -24,6 +24,8 @@
 #
 #--------------------------------------------------------------------------
 
+import threading
+import time
 import unittest
 
 from azure.core.paging import Paged
@@ -102,3 +104,86 @@ class TestPaging(unittest.TestCase):
         deserialized = FakePaged(internal_paging, _test_deserializer)
         result_iterated = list(deserialized)
         self.assertEqual(len(result_iterated), 0)
+
+    def test_by_page(self):
+        def internal_paging(next_link=None, raw=False):
+            pages = {
+                '': {'nextLink': 'page2', 'value': ['value1.0', 'value1.1']},
+                'page2': {'nextLink': 'page3', 'value': []},
+                'page3': {'nextLink': None, 'value': ['value3.0']},
+            }
+            return pages[next_link]
+
+        self.assertEqual([['value1.0', 'value1.1'], ['value3.0']], list(FakePaged(internal_paging, _test_deserializer).by_page()))
+
+        # a partially iterated page is returned with its remaining items
+        deserialized = FakePaged(internal_paging, _test_deserializer)
+        assert next(deserialized) == 'value1.0'
+        self.assertEqual([['value1.1'], ['value3.0']], list(deserialized.by_page()))
+
+    def test_prefetch(self):
+        requested = []
+        iterated = []
+
+        def internal_paging(next_link=None, raw=False):
+            index = int(next_link or 0)
+            requested.append((index, len(iterated)))
+            return {
+                'nextLink': str(index + 1) if index < 4 else None,
+                'value': ['value{}.0'.format(index), 'value{}.1'.format(index)]
+            }
+
+        deserialized = FakePaged(internal_paging, _test_deserializer, prefetch_pages=1)
+        for page in deserialized.by_page():
+            # let the next page be requested before iterating this one
+            time.sleep(0.05)
+            iterated.append(page)
+
+        self.assertEqual(5, len(iterated))
+        self.assertEqual('value4.1', iterated[-1][-1])
+        # each page was requested while the one before it was iterated, never two pages ahead
+        self.assertEqual([(0, 0), (1, 0), (2, 1), (3, 2), (4, 3)], requested)
+
+    def test_prefetch_error(self):
+        fail = threading.Event()
+        fail.set()
+
+        def internal_paging(next_link=None, raw=False):
+            if next_link == 'page2' and fail.is_set():
+                fail.clear()
+                raise ValueError("request failed")
+            if not next_link:
+                return {'nextLink': 'page2', 'value': ['value1.0', 'value1.1']}
+            return {'nextLink': None, 'value': ['value2.0']}
+
+        deserialized = FakePaged(internal_paging, _test_deserializer, prefetch_pages=2)
+        self.assertEqual('value1.0', next(deserialized))
+        self.assertEqual('value1.1', next(deserialized))
+        # the error is raised when the failed page is reached
+        with self.assertRaises(ValueError):
+            next(deserialized)
+
+        # iterating again requests the page again
+        self.assertEqual(['value2.0'], list(deserialized))
+
+    def test_prefetch_close(self):
+        requested = []
+
+        def internal_paging(next_link=None, raw=False):
+            index = int(next_link or 0)
+            requested.append(index)
+            return {'nextLink': str(index + 1), 'value': ['value{}'.format(index)]}
+
+        deserialized = FakePaged(internal_paging, _test_deserializer, prefetch_pages=2)
+        self.assertEqual('value0', next(deserialized))
+        deserialized.close()
+        time.sleep(0.05)
+        # no more than prefetch_pages pages were requested ahead, and none after closing
+        count = len(requested)
+        self.assertLessEqual(count, 3)
+        time.sleep(0.05)
+        self.assertEqual(count, len(requested))
+
+        # iterating again resumes from the next page
+        self.assertEqual('value1', next(deserialized))
+        deserialized.close()
@@ -0,0 +1,80 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import pytest
+
+from azure.core import Configuration
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.transport import HttpRequest, HttpTransport, RequestsTransport, SharedTransport
+
+
+def test_shared_transport_references():
+    inner = mock.Mock(spec=HttpTransport)
+    transport = SharedTransport(inner)
+    first, second = Pipeline(transport), Pipeline(transport)
+
+    with first:
+        with second:
+            assert transport.references == 3
+            inner.open.assert_called_once_with()
+        # closing a client doesn't close the transport
+        inner.close.assert_not_called()
+        transport.send(HttpRequest("GET", "https://bing.com"))
+        assert inner.send.call_count == 1
+
+    # nor does closing the last client, the creator still holds a reference
+    assert transport.references == 1
+    inner.close.assert_not_called()
+    with first:
+        transport.close()
+        transport.close()
+        assert transport.references == 1
+        inner.close.assert_not_called()
+
+    inner.close.assert_called_once_with()
+    assert transport.references == 0
+    with pytest.raises(ValueError):
+        with first:
+            pass
+    with pytest.raises(ValueError):
+        transport.send(HttpRequest("GET", "https://bing.com"))
+
+
+def test_shared_transport_pool(local_server_url):
+    transport = SharedTransport(RequestsTransport(Configuration(connection_pool_size=4)))
+    with Pipeline(transport) as first, Pipeline(transport) as second:
+        for pipeline in (first, second, first, second):
+            pipeline.run(HttpRequest("GET", local_server_url), stream=False)
+
+    stats = transport.connection_pool_stats
+    assert stats.requests_sent == 4
+    assert stats.connections_created == 1
+    transport.close()
+    assert transport.transport.session is None
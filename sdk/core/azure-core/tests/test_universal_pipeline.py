@@ -179,3 +179,101 @@ def test_raw_deserializer():
     raw_deserializer.on_response(None, response)
     result = response.context["deserialized_data"]
     assert result["success"] is True
+
+
+def _build_streamed_response(body, content_type, chunk_size=1):
+    class MockResponse(HttpResponse):
+        def __init__(self):
+            super(MockResponse, self).__init__(None, None)
+            self.content_type = content_type.split(";")
+
+        def stream_download(self, pipeline):
+            return iter([body[i:i + chunk_size] for i in range(0, len(body), chunk_size)])
+
+    return MockResponse()
+
+
+def test_stream_items_json():
+    body = b'\xef\xbb\xbf' + u'{"value": [{"id": 1, "name": "café \\" ] }"}, 23, [4.5e1], null] , "nextLink": "next"}'.encode("utf-8")
+    # one byte at a time splits the BOM, a multibyte character and numbers across chunks
+    for chunk_size in (1, 3, len(body)):
+        items = ContentDecodePolicy.deserialize_items_from_stream(
+            _build_streamed_response(body, "application/json", chunk_size), "value"
+        )
+        assert list(items) == [{"id": 1, "name": u"café \" ] }"}, 23, [45.0], None]
+        assert items.remainder == {"nextLink": "next"}
+
+    # a top-level array's elements are the items
+    items = ContentDecodePolicy.deserialize_items_from_stream(
+        _build_streamed_response(b'[1, 2] ', "application/json"), "value"
+    )
+    assert list(items) == [1, 2]
+    assert items.remainder is None
+
+    items = ContentDecodePolicy.deserialize_items_from_stream(
+        _build_streamed_response(b'{"value": [], "nextLink": null}', "application/json"), "value"
+    )
+    assert list(items) == []
+    assert items.remainder == {"nextLink": None}
+
+    # like deserialize_from_text, an empty body has no content, such as that of a 204 response
+    items = ContentDecodePolicy.deserialize_items_from_stream(_build_streamed_response(b'', "application/json"), "value")
+    assert list(items) == []
+    assert items.remainder is None
+
+    for invalid in (b'{"value": [1, 2', b'{"value": [1,]}', b'{"value": [1]} 2', b'"value"'):
+        items = ContentDecodePolicy.deserialize_items_from_stream(
+            _build_streamed_response(invalid, "application/json"), "value"
+        )
+        with pytest.raises(DecodeError):
+            list(items)
+
+
+def test_stream_items_xml():
+    body = (
+        b'<?xml version="1.0" encoding="utf-8"?><EnumerationResults><Blobs>'
+        b'<Blob><Name>a</Name></Blob><Blob><Name>b</Name><Snapshots><Blob><Name>c</Name></Blob></Snapshots></Blob>'
+        b'</Blobs><NextMarker>marker</NextMarker></EnumerationResults>'
+    )
+    items = ContentDecodePolicy.deserialize_items_from_stream(
+        _build_streamed_response(body, "application/xml", chunk_size=7), "Blob"
+    )
+    first = next(items)
+    assert first.find("Name").text == "a"
+    assert items.remainder is None
+
+    second = next(items)
+    assert second.find("Name").text == "b"
+    # nested items stay in the item containing them
+    assert second.find("Snapshots/Blob/Name").text == "c"
+    assert list(items) == []
+    assert items.remainder.find("NextMarker").text == "marker"
+    assert items.remainder.find("Blobs/Blob") is None
+
+    items = ContentDecodePolicy.deserialize_items_from_stream(
+        _build_streamed_response(b'<Blobs><Blob></Blobs>', "application/xml"), "Blob"
+    )
+    with pytest.raises(DecodeError):
+        list(items)
+
+    items = ContentDecodePolicy.deserialize_items_from_stream(_build_streamed_response(b'', "application/xml"), "Blob")
+    assert list(items) == []
+    assert items.remainder is None
+
+
+def test_stream_items_policy():
+    policy = ContentDecodePolicy()
+    request = PipelineRequest(HttpRequest('GET', 'http://127.0.0.1/'), PipelineContext(None, stream_items="value"))
+    policy.on_request(request)
+    # the option isn't passed to the transport, which streams the response
+    assert request.context.options == {"stream": True}
+
+    http_response = _build_streamed_response(b'{"value": [1, 2]}', "application/json; charset=utf-8", 4)
+    response = PipelineResponse(request.http_request, http_response, request.context)
+    policy.on_response(request, response)
+    items = response.context["deserialized_data"]
+    assert list(items) == [1, 2]
+    assert items.remainder == {}
+
+    with pytest.raises(DecodeError):
+        ContentDecodePolicy.deserialize_items_from_stream(_build_streamed_response(b'', "text/plain"), "value")
@@ -0,0 +1,216 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Asynchronous request in the Azure Cosmos database service.
+"""
+
+import json
+import ssl
+
+from six.moves.urllib.parse import urlparse, urlencode
+import aiohttp
+
+import azure.cosmos.errors as errors
+import azure.cosmos.http_constants as http_constants
+from azure.cosmos.synchronized_request import _RequestBodyFromData
+from azure.cosmos.aio import retry_utility
+
+def _CreateSSLContext(connection_policy):
+    """Creates the SSL context of the SSLConfiguration of a connection policy.
+
+    Loading the certificates is costly, so a client creates the context once for all its requests.
+
+    :param documents.ConnectionPolicy connection_policy:
+
+    :rtype:
+        ssl.SSLContext or None
+
+    """
+    if not connection_policy.SSLConfiguration:
+        return None
+    ssl_context = ssl.create_default_context(cafile=connection_policy.SSLConfiguration.SSLCaCerts)
+    if connection_policy.SSLConfiguration.SSLCertFile:
+        ssl_context.load_cert_chain(connection_policy.SSLConfiguration.SSLCertFile,
+                                    connection_policy.SSLConfiguration.SSLKeyFile)
+    return ssl_context
+
+def _GetSSL(connection_policy, parse_result, ssl_context):
+    """Gets the value of the aiohttp `ssl` request argument.
+
+    :param documents.ConnectionPolicy connection_policy:
+    :param urllib.parse.ParseResult parse_result:
+        The parsed resource url.
+    :param ssl.SSLContext ssl_context:
+        The context created by _CreateSSLContext for the connection policy.
+
+    :rtype:
+        ssl.SSLContext or boolean
+
+    """
+    if ssl_context is not None:
+        return ssl_context
+
+    # We are disabling the SSL verification for local emulator(localhost/127.0.0.1) or if the user
+    # has explicitly specified to disable SSL verification.
+    is_ssl_enabled = (parse_result.hostname != 'localhost' and parse_result.hostname != '127.0.0.1' and not connection_policy.DisableSSLVerification)
+    # None keeps aiohttp's default verification
+    return None if is_ssl_enabled else False
+
+
+def _GetProxy(connection_policy):
+    proxy_configuration = connection_policy.ProxyConfiguration
+    if proxy_configuration and proxy_configuration.Host:
+        host = proxy_configuration.Host
+        url = urlparse(host)
+        return host if url.port else host + ":" + str(proxy_configuration.Port)
+    return None
+
+
+async def _Request(global_endpoint_manager, request, connection_policy, aiohttp_session, path, request_options, request_body, ssl_context):
+    """Makes one http request using the aiohttp module.
+
+    :param azure.cosmos.aio.global_endpoint_manager._GlobalEndpointManager global_endpoint_manager:
+    :param dict request:
+        contains the resourceType, operationType, endpointOverride,
+        useWriteEndpoint, useAlternateWriteEndpoint information
+    :param documents.ConnectionPolicy connection_policy:
+    :param aiohttp.ClientSession aiohttp_session:
+        Session object in aiohttp module
+    :param str resource_url:
+        The url for the resource
+    :param dict request_options:
+    :param str request_body:
+        Unicode or None
+    :param ssl.SSLContext ssl_context:
+        The SSL context of the client, or None
+
+    :return:
+        tuple of (result, headers)
+    :rtype:
+        tuple of (dict, dict)
+
+    """
+    is_media = request_options['path'].find('media') > -1
+
+    connection_timeout = (connection_policy.MediaRequestTimeout
+                          if is_media
+                          else connection_policy.RequestTimeout)
+
+    # Every request tries to perform a refresh
+    await global_endpoint_manager.refresh_endpoint_list(None)
+
+    if (request.endpoint_override):
+        base_url = request.endpoint_override
+    else:
+        base_url = global_endpoint_manager.resolve_service_endpoint(request)
+
+    if path:
+        resource_url = base_url + path
+    else:
+        resource_url = base_url
+
+    parse_result = urlparse(resource_url)
+
+    # aiohttp expects header values to be strings, so casting all header values to strings.
+    request_options['headers'] = { header: str(value) for header, value in request_options['headers'].items() }
+
+    async with aiohttp_session.request(request_options['method'],
+                                       resource_url,
+                                       data = request_body,
+                                       headers = request_options['headers'],
+                                       timeout = aiohttp.ClientTimeout(total = connection_timeout / 1000.0),
+                                       ssl = _GetSSL(connection_policy, parse_result, ssl_context),
+                                       proxy = _GetProxy(connection_policy)) as response:
+        headers = dict(response.headers)
+        data = (await response.read()).decode('utf-8')
+
+    if response.status >= 400:
+        raise errors.HTTPFailure(response.status, data, headers)
+
+    result = None
+    if is_media:
+        result = data
+    else:
+        if len(data) > 0:
+            try:
+                result = json.loads(data)
+            except:
+                raise errors.JSONParseFailure(data)
+
+    return (result, headers)
+
+async def AsynchronousRequest(client,
+                              request,
+                              global_endpoint_manager,
+                              connection_policy,
+                              aiohttp_session,
+                              method,
+                              path,
+                              request_data,
+                              query_params,
+                              headers):
+    """Performs one asynchronous http request according to the parameters.
+
+    This is the asynchronous counterpart of
+    :func:`azure.cosmos.synchronized_request.SynchronizedRequest`.
+
+    :param object client:
+        Document client instance
+    :param dict request:
+    :param azure.cosmos.aio.global_endpoint_manager._GlobalEndpointManager global_endpoint_manager:
+    :param  documents.ConnectionPolicy connection_policy:
+    :param aiohttp.ClientSession aiohttp_session:
+        Session object in aiohttp module
+    :param str method:
+    :param str path:
+    :param (str, unicode, dict) request_data:
+    :param dict query_params:
+    :param dict headers:
+
+    :return:
+        tuple of (result, headers)
+    :rtype:
+        tuple of (dict dict)
+
+    """
+    request_body = None
+    if request_data:
+        request_body = _RequestBodyFromData(request_data)
+        if not request_body:
+           raise errors.UnexpectedDataType(
+               'parameter data must be a JSON object, string or' +
+               ' readable stream.')
+
+    request_options = {}
+    request_options['path'] = path
+    request_options['method'] = method
+    if query_params:
+        request_options['path'] += '?' + urlencode(query_params)
+
+    request_options['headers'] = headers
+    if request_body and isinstance(request_body, str):
+        request_options['headers'][http_constants.HttpHeaders.ContentLength] = (
+            len(request_body.encode('utf-8')))
+    elif request_body is None:
+        request_options['headers'][http_constants.HttpHeaders.ContentLength] = 0
+
+    # Pass _Request function with it's parameters to retry_utility's Execute method that wraps the call with retries
+    return await retry_utility._Execute(client, global_endpoint_manager, _Request, request, connection_policy, aiohttp_session, path, request_options, request_body, client._ssl_context)
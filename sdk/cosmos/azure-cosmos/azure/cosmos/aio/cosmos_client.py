@@ -0,0 +1,715 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Asynchronous document client class for the Azure Cosmos database service.
+"""
+
+import os
+
+import aiohttp
+
+import azure.cosmos.base as base
+import azure.cosmos.cosmos_client as cosmos_client
+import azure.cosmos.documents as documents
+import azure.cosmos.http_constants as http_constants
+import azure.cosmos.runtime_constants as runtime_constants
+import azure.cosmos.request_object as request_object
+import azure.cosmos.session as session
+import azure.cosmos.utils as utils
+from azure.cosmos.aio import asynchronous_request
+from azure.cosmos.aio import global_endpoint_manager
+from azure.cosmos.aio import query_iterable
+
+class CosmosClient(object):
+    """Represents an asynchronous document client.
+
+    Asynchronous counterpart of :class:`azure.cosmos.cosmos_client.CosmosClient` for the
+    item (document) operations, built on aiohttp. The endpoint discovery (LocationCache),
+    session tokens (SessionContainer) and retry policies are shared with the synchronous
+    client.
+
+    The client must be opened before use, either by awaiting :meth:`open` or by using
+    it as an asynchronous context manager:
+
+    >>> async with CosmosClient(url, {'masterKey': key}) as client:
+    >>>     item = await client.ReadItem(item_link)
+    """
+
+    # helpers which don't do any I/O are shared with the synchronous client
+    _GetContainerIdWithPathForItem = cosmos_client.CosmosClient._GetContainerIdWithPathForItem
+    _CheckAndUnifyQueryFormat = cosmos_client.CosmosClient._CosmosClient__CheckAndUnifyQueryFormat
+    _CreateDatabaseAccount = cosmos_client.CosmosClient._CreateDatabaseAccount
+    _ExtractPartitionKey = cosmos_client.CosmosClient._ExtractPartitionKey
+    _RetrievePartitionKey = cosmos_client.CosmosClient._RetrievePartitionKey
+    _UpdateSessionIfRequired = cosmos_client.CosmosClient._UpdateSessionIfRequired
+    GetPartitionResolver = cosmos_client.CosmosClient.GetPartitionResolver
+
+    def __init__(self,
+                 url_connection,
+                 auth,
+                 connection_policy=None,
+                 consistency_level=documents.ConsistencyLevel.Session,
+                 aiohttp_session=None):
+        """
+        :param str url_connection:
+            The URL for connecting to the DB server.
+        :param dict auth:
+            Contains 'masterKey' or 'resourceTokens', where
+            auth['masterKey'] is the default authorization key to use to
+            create the client, and auth['resourceTokens'] is the alternative
+            authorization key.
+        :param documents.ConnectionPolicy connection_policy:
+            The connection policy for the client.
+        :param documents.ConsistencyLevel consistency_level:
+            The default consistency policy for client operations.
+        :param aiohttp.ClientSession aiohttp_session:
+            An existing session to send the requests with. It is not closed by the client.
+            By default the client creates and owns its session.
+
+        if url_connection and auth are not provided,
+            COSMOS_ENDPOINT and COSMOS_KEY environment variables will be used.
+        """
+
+        self.url_connection = url_connection or os.environ.get('COSMOS_ENDPOINT')
+
+        self.master_key = None
+        self.resource_tokens = None
+        if auth is not None:
+            self.master_key = auth.get('masterKey')
+            self.resource_tokens = auth.get('resourceTokens')
+
+            if auth.get('permissionFeed'):
+                self.resource_tokens = {}
+                for permission_feed in auth['permissionFeed']:
+                    resource_parts = permission_feed['resource'].split('/')
+                    id = resource_parts[-1]
+                    self.resource_tokens[id] = permission_feed['_token']
+        else:
+            self.master_key = os.environ.get('COSMOS_KEY')
+
+        self.connection_policy = (connection_policy or
+                                  documents.ConnectionPolicy())
+
+        self.partition_resolvers = {}
+
+        self.partition_key_definition_cache = {}
+
+        self.default_headers = {
+            http_constants.HttpHeaders.CacheControl: 'no-cache',
+            http_constants.HttpHeaders.Version:
+                http_constants.Versions.CurrentVersion,
+            http_constants.HttpHeaders.UserAgent:
+                utils._get_user_agent(),
+            # For single partition query with aggregate functions we would try to accumulate the results on the SDK.
+            # We need to set continuation as not expected.
+            http_constants.HttpHeaders.IsContinuationExpected: False
+        }
+
+        if consistency_level != None:
+            self.default_headers[
+                http_constants.HttpHeaders.ConsistencyLevel] = consistency_level
+
+        # Keeps the latest response headers from server.
+        self.last_response_headers = None
+
+        if consistency_level == documents.ConsistencyLevel.Session:
+            self.session = session.Session(self.url_connection)
+        else:
+            self.session = None
+
+        self._useMultipleWriteLocations = False
+        self._global_endpoint_manager = global_endpoint_manager._GlobalEndpointManager(self)
+
+        self._aiohttp_session = aiohttp_session
+        self._aiohttp_session_owner = aiohttp_session is None
+        self._ssl_context = asynchronous_request._CreateSSLContext(self.connection_policy)
+
+        self._query_compatibility_mode = cosmos_client.CosmosClient._QueryCompatibilityMode.Default
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def open(self):
+        """Opens the connection session and reads the database account.
+        """
+        if self._aiohttp_session is None:
+            self._aiohttp_session = aiohttp.ClientSession()
+        database_account = await self._global_endpoint_manager._GetDatabaseAccount()
+        await self._global_endpoint_manager.force_refresh(database_account)
+
+    async def close(self):
+        """Closes the connection session if it is owned by the client.
+        """
+        if self._aiohttp_session_owner and self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    @property
+    def Session(self):
+        """ Gets the session object from the client """
+        return self.session
+
+    @Session.setter
+    def Session(self, session):
+        """ Sets a session object on the document client
+            This will override the existing session
+        """
+        self.session = session
+
+    @property
+    def WriteEndpoint(self):
+        """Gets the curent write endpoint for a geo-replicated database account.
+        """
+        return self._global_endpoint_manager.get_write_endpoint()
+
+    @property
+    def ReadEndpoint(self):
+        """Gets the curent read endpoint for a geo-replicated database account.
+        """
+        return self._global_endpoint_manager.get_read_endpoint()
+
+    async def ReadContainer(self, collection_link, options=None):
+        """Reads a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The read Collection.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(collection_link)
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        return await self.Read(path,
+                               'colls',
+                               collection_id,
+                               None,
+                               options)
+
+    def ReadItems(self, collection_link, feed_options=None):
+        """Reads all documents in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict feed_options:
+
+        :return:
+            Asynchronous Query Iterable of Documents.
+        :rtype:
+            azure.cosmos.aio.query_iterable.QueryIterable
+
+        """
+        if feed_options is None:
+            feed_options = {}
+
+        return self.QueryItems(collection_link, None, feed_options)
+
+    def QueryItems(self, collection_link, query, options=None, partition_key=None):
+        """Queries documents in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param str partition_key:
+            Partition key for the query(default value None)
+
+        :return:
+            Asynchronous Query Iterable of Documents.
+        :rtype:
+            azure.cosmos.aio.query_iterable.QueryIterable
+
+        """
+        collection_link = base.TrimBeginningAndEndingSlashes(collection_link)
+
+        if options is None:
+            options = {}
+
+        if partition_key is not None:
+            options['partitionKey'] = partition_key
+
+        path = base.GetPathFromLink(collection_link, 'docs')
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        async def fetch_fn(options):
+            return await self._QueryFeed(path,
+                                         'docs',
+                                         collection_id,
+                                         lambda r: r['Documents'],
+                                         lambda _, b: b,
+                                         query,
+                                         options), self.last_response_headers
+        return query_iterable.QueryIterable(self, query, options, fetch_fn, collection_link)
+
+    async def CreateItem(self, collection_link, document, options=None):
+        """Creates a document in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict document:
+            The Azure Cosmos document to create.
+        :param dict options:
+            The request options for the request.
+        :param bool options['disableAutomaticIdGeneration']:
+            Disables the automatic id generation. If id is missing in the body and this
+            option is true, an error will be returned.
+
+        :return:
+            The created Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        options = await self._AddPartitionKey(collection_link, document, options)
+
+        collection_id, document, path = self._GetContainerIdWithPathForItem(collection_link, document, options)
+        return await self.Create(document,
+                                 path,
+                                 'docs',
+                                 collection_id,
+                                 None,
+                                 options)
+
+    async def UpsertItem(self, collection_link, document, options=None):
+        """Upserts a document in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict document:
+            The Azure Cosmos document to upsert.
+        :param dict options:
+            The request options for the request.
+        :param bool options['disableAutomaticIdGeneration']:
+            Disables the automatic id generation. If id is missing in the body and this
+            option is true, an error will be returned.
+
+        :return:
+            The upserted Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        options = await self._AddPartitionKey(collection_link, document, options)
+
+        collection_id, document, path = self._GetContainerIdWithPathForItem(collection_link, document, options)
+        return await self.Upsert(document,
+                                 path,
+                                 'docs',
+                                 collection_id,
+                                 None,
+                                 options)
+
+    async def ReadItem(self, document_link, options=None):
+        """Reads a document.
+
+        :param str document_link:
+            The link to the document.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The read Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(document_link)
+        document_id = base.GetResourceIdOrFullNameFromLink(document_link)
+        return await self.Read(path,
+                               'docs',
+                               document_id,
+                               None,
+                               options)
+
+    async def ReplaceItem(self, document_link, new_document, options=None):
+        """Replaces a document and returns it.
+
+        :param str document_link:
+            The link to the document.
+        :param dict new_document:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The new Document.
+        :rtype:
+            dict
+
+        """
+        cosmos_client.CosmosClient._CosmosClient__ValidateResource(new_document)
+        path = base.GetPathFromLink(document_link)
+        document_id = base.GetResourceIdOrFullNameFromLink(document_link)
+
+        if options is None:
+            options = {}
+
+        # Extract the document collection link and add the partition key to options
+        collection_link = base.GetItemContainerLink(document_link)
+        options = await self._AddPartitionKey(collection_link, new_document, options)
+
+        return await self.Replace(new_document,
+                                  path,
+                                  'docs',
+                                  document_id,
+                                  None,
+                                  options)
+
+    async def DeleteItem(self, document_link, options=None):
+        """Deletes a document.
+
+        :param str document_link:
+            The link to the document.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The deleted Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(document_link)
+        document_id = base.GetResourceIdOrFullNameFromLink(document_link)
+        return await self.DeleteResource(path,
+                                         'docs',
+                                         document_id,
+                                         None,
+                                         options)
+
+    async def GetDatabaseAccount(self, url_connection=None):
+        """Gets database account info.
+
+        :return:
+            The Database Account.
+        :rtype:
+            documents.DatabaseAccount
+
+        """
+        if url_connection is None:
+            url_connection = self.url_connection
+
+        initial_headers = dict(self.default_headers)
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'get',
+                                  '',  # path
+                                  '',  # id
+                                  '',  # type
+                                  {})
+
+        request = request_object._RequestObject('databaseaccount', documents._OperationType.Read, url_connection)
+        result, self.last_response_headers = await self._Request('GET', '', request, None, headers)
+        return self._CreateDatabaseAccount(result, self.last_response_headers)
+
+    async def Create(self, body, path, type, id, initial_headers, options=None):
+        """Creates a Azure Cosmos resource and returns it.
+
+        :param dict body:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The created Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        return await self._Write('post', documents._OperationType.Create, body, path, type, id, initial_headers, options)
+
+    async def Upsert(self, body, path, type, id, initial_headers, options=None):
+        """Upserts a Azure Cosmos resource and returns it.
+
+        :param dict body:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The upserted Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        return await self._Write('post', documents._OperationType.Upsert, body, path, type, id, initial_headers, options)
+
+    async def Replace(self, resource, path, type, id, initial_headers, options=None):
+        """Replaces a Azure Cosmos resource and returns it.
+
+        :param dict resource:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The new Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        return await self._Write('put', documents._OperationType.Replace, resource, path, type, id, initial_headers, options)
+
+    async def DeleteResource(self, path, type, id, initial_headers, options=None):
+        """Deletes a Azure Cosmos resource and returns it.
+
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The deleted Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        return await self._Write('delete', documents._OperationType.Delete, None, path, type, id, initial_headers, options)
+
+    async def Read(self, path, type, id, initial_headers, options=None):
+        """Reads a Azure Cosmos resource and returns it.
+
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The read Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'get',
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+        # Read will use ReadEndpoint since it uses GET operation
+        request = request_object._RequestObject(type, documents._OperationType.Read)
+        result, self.last_response_headers = await self._Request('GET', path, request, None, headers)
+        return result
+
+    async def _Write(self, verb, operation_type, body, path, type, id, initial_headers, options):
+        """Sends a request which mutates data on server side and updates the session.
+
+        :param str verb:
+            'post', 'put' or 'delete'.
+        :param str operation_type:
+        :param dict body:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  verb,
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+        if operation_type == documents._OperationType.Upsert:
+            headers[http_constants.HttpHeaders.IsUpsert] = True
+
+        # Writes will use WriteEndpoint
+        request = request_object._RequestObject(type, operation_type)
+        result, self.last_response_headers = await self._Request(verb.upper(), path, request, body, headers)
+
+        # update session for request mutates data on server side
+        self._UpdateSessionIfRequired(headers, result, self.last_response_headers)
+        return result
+
+    async def _Request(self, method, path, request, body, headers):
+        """Azure Cosmos http request.
+
+        :params str method:
+        :params str path:
+        :params request_object._RequestObject request:
+        :params (str, unicode, dict) body:
+        :params dict headers:
+
+        :return:
+            Tuple of (result, headers).
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        if self._aiohttp_session is None:
+            raise RuntimeError("The client is not opened, await open() or use it in an 'async with' block.")
+
+        return await asynchronous_request.AsynchronousRequest(self,
+                                                              request,
+                                                              self._global_endpoint_manager,
+                                                              self.connection_policy,
+                                                              self._aiohttp_session,
+                                                              method,
+                                                              path,
+                                                              body,
+                                                              None,
+                                                              headers)
+
+    async def _QueryFeed(self,
+                         path,
+                         type,
+                         id,
+                         result_fn,
+                         create_fn,
+                         query,
+                         options=None,
+                         partition_key_range_id=None):
+        """Query for more than one Azure Cosmos resources.
+
+        :param str path:
+        :param str type:
+        :param str id:
+        :param function result_fn:
+        :param function create_fn:
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param str partition_key_range_id:
+            Specifies partition key range id.
+
+        :rtype:
+            list
+
+        """
+        if options is None:
+            options = {}
+
+        if query:
+            __GetBodiesFromQueryResult = result_fn
+        else:
+            def __GetBodiesFromQueryResult(result):
+                if result is not None:
+                    return [create_fn(self, body) for body in result_fn(result)]
+                else:
+                    return []
+
+        # Copy to make sure that default_headers won't be changed.
+        initial_headers = self.default_headers.copy()
+        if query is None:
+            # Query operations will use ReadEndpoint even though it uses GET(for feed requests)
+            request = request_object._RequestObject(type, documents._OperationType.ReadFeed)
+            headers = base.GetHeaders(self,
+                                      initial_headers,
+                                      'get',
+                                      path,
+                                      id,
+                                      type,
+                                      options,
+                                      partition_key_range_id)
+            result, self.last_response_headers = await self._Request('GET', path, request, None, headers)
+            return __GetBodiesFromQueryResult(result)
+        else:
+            query = self._CheckAndUnifyQueryFormat(query)
+
+            initial_headers[http_constants.HttpHeaders.IsQuery] = 'true'
+            initial_headers[http_constants.HttpHeaders.ContentType] = runtime_constants.MediaTypes.QueryJson
+
+            # Query operations will use ReadEndpoint even though it uses POST(for regular query operations)
+            request = request_object._RequestObject(type, documents._OperationType.SqlQuery)
+            headers = base.GetHeaders(self,
+                                      initial_headers,
+                                      'post',
+                                      path,
+                                      id,
+                                      type,
+                                      options,
+                                      partition_key_range_id)
+            result, self.last_response_headers = await self._Request('POST', path, request, query, headers)
+            return __GetBodiesFromQueryResult(result)
+
+    # Adds the partition key to options
+    async def _AddPartitionKey(self, collection_link, document, options):
+        collection_link = base.TrimBeginningAndEndingSlashes(collection_link)
+
+        # If the document collection link is present in the cache, then use the cached partitionkey definition
+        if collection_link in self.partition_key_definition_cache:
+            partitionKeyDefinition = self.partition_key_definition_cache.get(collection_link)
+        # Else read the collection from backend and add it to the cache
+        else:
+            collection = await self.ReadContainer(collection_link)
+            partitionKeyDefinition = collection.get('partitionKey')
+            self.partition_key_definition_cache[collection_link] = partitionKeyDefinition
+
+        # If the collection doesn't have a partition key definition, skip it as it's a legacy collection
+        if partitionKeyDefinition:
+            # If the user has passed in the partitionKey in options use that elase extract it from the document
+            if('partitionKey' not in options):
+                partitionKeyValue = self._ExtractPartitionKey(partitionKeyDefinition, document)
+                options['partitionKey'] = partitionKeyValue
+
+        return options
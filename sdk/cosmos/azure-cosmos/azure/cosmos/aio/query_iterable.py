@@ -0,0 +1,82 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Asynchronous iterable query results in the Azure Cosmos database service.
+"""
+from azure.cosmos.aio import execution_context
+
+class QueryIterable(object):
+    """Represents an asynchronous iterable object of the query results.
+    QueryIterable is a wrapper for query execution context.
+
+    Queries which the gateway cannot serve as a single feed (cross partition
+    queries with ORDER BY, TOP or aggregates) raise the service's
+    :class:`azure.cosmos.errors.HTTPFailure`; use the synchronous client for those.
+
+    Example:
+
+    >>> async for item in client.QueryItems(collection_link, query):
+    >>>     print(item['id'])
+    """
+
+    def __init__(self, client, query, options, fetch_function, collection_link = None):
+        """
+        :param azure.cosmos.aio.CosmosClient client:
+            Instance of document client.
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param method fetch_function:
+            Coroutine function which will be awaited for retrieving each page.
+        :param str collection_link:
+            If this is a Document query/feed collection_link is required.
+        """
+        self._client = client
+        self.retry_options = client.connection_policy.RetryOptions
+        self._query = query
+        self._options = options
+        self._fetch_function = fetch_function
+        self._collection_link = collection_link
+        self._ex_context = None
+
+    def _create_execution_context(self):
+        """instantiates the internal query execution context.
+        """
+        return execution_context._DefaultQueryExecutionContext(self._client, self._options, self._fetch_function)
+
+    def __aiter__(self):
+        """Makes this class asynchronously iterable.
+        """
+        return self._create_execution_context()
+
+    async def fetch_next_block(self):
+        """Returns a block of results with respecting retry policy.
+
+        :return:
+            List of results.
+        :rtype:
+            list
+        """
+        if self._ex_context is None:
+            # initiates execution context for the first time
+            self._ex_context = self._create_execution_context()
+
+        return await self._ex_context.fetch_next_block()
@@ -0,0 +1,258 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+"""Classes for writing many documents concurrently in the Azure Cosmos database service.
+"""
+
+from collections import deque
+import threading
+import time
+
+import azure.cosmos.errors as errors
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes
+from azure.cosmos.routing import effective_partition_key
+
+class BulkItemResult(object):
+    """The result of writing one document in a bulk operation.
+
+    :ivar int Index:
+        The position of the document in the documents written.
+    :ivar str Id:
+        The id of the document, None when the service generated it.
+    :ivar float RequestCharge:
+        The request units consumed by writing the document, over all attempts.
+    :ivar int ThrottleCount:
+        How many times writing the document was throttled and retried.
+    :ivar Exception Error:
+        The error which failed the write, usually an errors.HTTPFailure. None when the write succeeded.
+    """
+    __slots__ = ('Index', 'Id', 'RequestCharge', 'ThrottleCount', 'Error')
+
+    def __init__(self, index, id):
+        self.Index = index
+        self.Id = id
+        self.RequestCharge = 0.0
+        self.ThrottleCount = 0
+        self.Error = None
+
+    @property
+    def Succeeded(self):
+        return self.Error is None
+
+class BulkOperationResult(object):
+    """The result of a bulk operation.
+
+    :ivar list Results:
+        The BulkItemResult of each document, in the order of the documents written.
+    :ivar float TotalRequestCharge:
+        The request units consumed by the operation.
+    :ivar int SucceededCount:
+        The number of documents written.
+    :ivar int FailedCount:
+        The number of documents which failed to be written.
+    :ivar int ThrottleCount:
+        How many writes were throttled and retried.
+    :ivar float ElapsedSeconds:
+        How long the operation took.
+    """
+    def __init__(self, results, elapsed_seconds):
+        self.Results = results
+        self.TotalRequestCharge = sum(r.RequestCharge for r in results)
+        self.FailedCount = sum(1 for r in results if r.Error is not None)
+        self.SucceededCount = len(results) - self.FailedCount
+        self.ThrottleCount = sum(r.ThrottleCount for r in results)
+        self.ElapsedSeconds = elapsed_seconds
+
+class _PartitionWorkQueue(object):
+    """The documents waiting to be written to one partition key range, and how many may be written concurrently.
+
+    The concurrency grows by one for each round of successful writes and halves when a write is throttled,
+    at most once per round, as TCP's congestion window does. A throttled range isn't written to until the
+    time the service asked to wait has passed.
+    """
+    def __init__(self, max_concurrency):
+        self.items = deque()
+        self.in_flight = 0
+        self.max_concurrency = max_concurrency
+        self.concurrency = 1.0
+        self.paused_until = 0
+        self._decreased_at = 0
+
+    def can_send(self, now):
+        return bool(self.items) and self.in_flight < int(self.concurrency) and self.paused_until <= now
+
+    def on_success(self):
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1.0 / self.concurrency)
+
+    def on_throttled(self, sent_at, retry_after_seconds, now):
+        # the writes sent before the last decrease were throttled for the same reason
+        if sent_at >= self._decreased_at:
+            self.concurrency = max(1.0, self.concurrency / 2)
+            self._decreased_at = now
+        self.paused_until = max(self.paused_until, now + retry_after_seconds)
+
+class _BulkExecutor(object):
+    """Writes documents to a collection with a pool of worker threads, one work queue per partition key range.
+    """
+
+    DefaultMaxDegreeOfParallelism = 16
+    DefaultMaxBufferedItemCount = 10000
+    # how often the routing map is brought up to date, to route documents to the ranges of split partitions
+    RoutingMapRefreshIntervalInSeconds = 60
+    # how long to wait before retrying a throttled write when the service doesn't say
+    DefaultRetryAfterInMilliseconds = 100
+
+    def __init__(self, client, collection_link, options, is_upsert):
+        self._client = client
+        self._collection_link = collection_link
+        self._is_upsert = is_upsert
+
+        self._options = dict(options)
+        self._max_degree_of_parallelism = self._options.pop('maxDegreeOfParallelism', None)
+        if not self._max_degree_of_parallelism or self._max_degree_of_parallelism < 0:
+            self._max_degree_of_parallelism = _BulkExecutor.DefaultMaxDegreeOfParallelism
+        self._max_buffered_item_count = self._options.pop('maxBufferedItemCount', None) or _BulkExecutor.DefaultMaxBufferedItemCount
+
+        self._condition = threading.Condition()
+        self._queues = {}
+        # documents read and not written yet, queued or in flight
+        self._buffered_item_count = 0
+        self._input_done = False
+
+    def execute(self, documents):
+        """Writes the documents.
+
+        :param documents:
+            An iterable of the documents to write, read once.
+        :return:
+            The result of the operation.
+        :rtype: BulkOperationResult
+        """
+        start = time.time()
+        routing_provider = self._client._routing_map_provider
+        partition_key_definition = self._client._GetPartitionKeyDefinition(self._collection_link)
+        routing_map = routing_provider.get_routing_map(self._collection_link) if partition_key_definition else None
+        next_refresh = start + _BulkExecutor.RoutingMapRefreshIntervalInSeconds
+
+        workers = [threading.Thread(target=self._work) for _ in range(self._max_degree_of_parallelism)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+
+        results = []
+        try:
+            for index, document in enumerate(documents):
+                options = dict(self._options)
+                if partition_key_definition and 'partitionKey' not in options:
+                    options['partitionKey'] = self._client._ExtractPartitionKey(partition_key_definition, document)
+                if routing_map is not None and time.time() >= next_refresh:
+                    routing_map = routing_provider.refresh(self._collection_link)
+                    next_refresh = time.time() + _BulkExecutor.RoutingMapRefreshIntervalInSeconds
+                range_id = self._get_range_id(routing_map, partition_key_definition, options.get('partitionKey'))
+
+                result = BulkItemResult(index, document.get('id'))
+                results.append(result)
+                with self._condition:
+                    while self._buffered_item_count >= self._max_buffered_item_count:
+                        self._condition.wait()
+                    queue = self._queues.get(range_id)
+                    if queue is None:
+                        queue = self._queues[range_id] = _PartitionWorkQueue(self._max_degree_of_parallelism)
+                    queue.items.append((result, document, options))
+                    self._buffered_item_count += 1
+                    self._condition.notify_all()
+        finally:
+            with self._condition:
+                self._input_done = True
+                self._condition.notify_all()
+            for worker in workers:
+                worker.join()
+
+        return BulkOperationResult(results, time.time() - start)
+
+    @staticmethod
+    def _get_range_id(routing_map, partition_key_definition, partition_key):
+        """Returns the id of the partition key range of a partition key, or None when it can't be found,
+        in which case the document shares a work queue with the others whose range is unknown.
+        """
+        if routing_map is None:
+            return None
+        try:
+            epk = effective_partition_key._get_effective_partition_key_string(partition_key_definition, partition_key)
+        except TypeError:
+            # the service will reject the partition key
+            return None
+        if epk is None:
+            return None
+        return routing_map.get_range_by_effective_partition_key(epk)['id']
+
+    def _next_queue(self, now):
+        """Returns the queue to write a document from, the one with the fewest writes in flight. Call with the lock held."""
+        ready = [queue for queue in self._queues.values() if queue.can_send(now)]
+        if not ready:
+            return None
+        return min(ready, key=lambda queue: queue.in_flight)
+
+    def _wait_timeout(self, now):
+        """Returns how long to wait for the first throttled range to resume, None when none is paused"""
+        paused_until = [queue.paused_until for queue in self._queues.values() if queue.items and queue.paused_until > now]
+        return min(paused_until) - now if paused_until else None
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.time()
+                    queue = self._next_queue(now)
+                    if queue is not None:
+                        break
+                    if self._input_done and not self._buffered_item_count:
+                        return
+                    self._condition.wait(self._wait_timeout(now))
+                result, document, options = queue.items.popleft()
+                queue.in_flight += 1
+
+            sent_at = time.time()
+            resource, error = None, None
+            try:
+                resource, headers = self._client._WriteItem(self._collection_link, document, options, self._is_upsert)
+            except errors.HTTPFailure as e:
+                error, headers = e, e.headers or {}
+            except Exception as e: # pylint: disable=broad-except
+                error, headers = e, {}
+
+            with self._condition:
+                queue.in_flight -= 1
+                result.RequestCharge += float(headers.get(HttpHeaders.RequestCharge) or 0)
+                if isinstance(error, errors.HTTPFailure) and error.status_code == StatusCodes.TOO_MANY_REQUESTS:
+                    result.ThrottleCount += 1
+                    retry_after = int(headers.get(HttpHeaders.RetryAfterInMilliseconds) or _BulkExecutor.DefaultRetryAfterInMilliseconds)
+                    queue.on_throttled(sent_at, retry_after / 1000.0, time.time())
+                    queue.items.appendleft((result, document, options))
+                else:
+                    if error is None:
+                        queue.on_success()
+                        if result.Id is None and resource:
+                            result.Id = resource.get('id')
+                    result.Error = error
+                    self._buffered_item_count -= 1
+                self._condition.notify_all()
@@ -26,6 +26,7 @@ import requests
 
 import six
 import azure.cosmos.base as base
+import azure.cosmos.bulk_executor as bulk_executor
 import azure.cosmos.documents as documents
 import azure.cosmos.constants as constants
 import azure.cosmos.http_constants as http_constants
@@ -35,6 +36,7 @@ import azure.cosmos.request_object as request_object
 import azure.cosmos.synchronized_request as synchronized_request
 import azure.cosmos.global_endpoint_manager as global_endpoint_manager
 import azure.cosmos.routing.routing_map_provider as routing_map_provider
+import azure.cosmos.routing.routing_map_snapshot as routing_map_snapshot
 import azure.cosmos.session as session
 import azure.cosmos.utils as utils
 import os
@@ -154,7 +156,11 @@ class CosmosClient(object):
         self._query_compatibility_mode = CosmosClient._QueryCompatibilityMode.Default
 
         # Routing map provider
-        self._routing_map_provider = routing_map_provider._SmartRoutingMapProvider(self)
+        snapshot_store = None
+        if self.connection_policy.PartitionKeyRangeCacheDirectory:
+            snapshot_store = routing_map_snapshot._RoutingMapSnapshotStore(
+                self.connection_policy.PartitionKeyRangeCacheDirectory, self.url_connection)
+        self._routing_map_provider = routing_map_provider._SmartRoutingMapProvider(self, snapshot_store)
 
         database_account = self._global_endpoint_manager._GetDatabaseAccount()
         self._global_endpoint_manager.force_refresh(database_account)
@@ -942,12 +948,14 @@ class CosmosClient(object):
                                     partition_key_range_id), self.last_response_headers
         return query_iterable.QueryIterable(self, None, options, fetch_fn, collection_link)
 
-    def _ReadPartitionKeyRanges(self, collection_link, feed_options=None):
+    def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
         """Reads Partition Key Ranges.
 
         :param str collection_link:
             The link to the document collection.
         :param dict feed_options:
+        :param function response_hook:
+            Called with the headers and the result of the response of each page.
 
         :return:
             Query Iterable of PartitionKeyRanges.
@@ -958,9 +966,9 @@ class CosmosClient(object):
         if feed_options is None:
             feed_options = {}
 
-        return self._QueryPartitionKeyRanges(collection_link, None, feed_options)
+        return self._QueryPartitionKeyRanges(collection_link, None, feed_options, response_hook)
 
-    def _QueryPartitionKeyRanges(self, collection_link, query, options=None):
+    def _QueryPartitionKeyRanges(self, collection_link, query, options=None, response_hook=None):
         """Queries Partition Key Ranges in a collection.
 
         :param str collection_link:
@@ -968,6 +976,8 @@ class CosmosClient(object):
         :param (str or dict) query:
         :param dict options:
             The request options for the request.
+        :param function response_hook:
+            Called with the headers and the result of the response of each page.
 
         :return:
             Query Iterable of PartitionKeyRanges.
@@ -981,13 +991,20 @@ class CosmosClient(object):
         path = base.GetPathFromLink(collection_link, 'pkranges')
         collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
         def fetch_fn(options):
+            # the headers of this page, which last_response_headers may no longer hold
+            response_headers = {}
+            def on_response(headers, result):
+                response_headers.update(headers)
+                if response_hook:
+                    response_hook(headers, result)
             return self.__QueryFeed(path,
                                     'pkranges',
                                     collection_id,
                                     lambda r: r['PartitionKeyRanges'],
                                     lambda _, b: b,
                                     query,
-                                    options), self.last_response_headers
+                                    options,
+                                    response_hook=on_response), response_headers
         return query_iterable.QueryIterable(self, query, options, fetch_fn)
 
     def CreateItem(self, database_or_Container_link, document, options=None):
@@ -1066,6 +1083,98 @@ class CosmosClient(object):
                            None,
                            options)
 
+    def BulkCreateItems(self, collection_link, documents, options=None):
+        """Creates many documents in a collection concurrently.
+
+        The documents are grouped by the partition key range they belong to, and written by a pool of
+        worker threads. The number of concurrent writes to each range adapts to throttling: it grows while
+        writes succeed and halves when one is throttled, then the range isn't written to for the time the
+        service asked to wait. Throttled writes are retried until they succeed, other failures are reported
+        in the result without stopping the operation.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param documents:
+            An iterable of the Azure Cosmos documents to create, read once.
+        :param dict options:
+            The request options for each request.
+        :param int options['maxDegreeOfParallelism']:
+            The maximum number of concurrent writes. Defaults to 16.
+        :param int options['maxBufferedItemCount']:
+            The maximum number of documents read from documents and not written yet. Defaults to 10000.
+
+        :return:
+            The result of writing each document, and the total request charge.
+        :rtype:
+            bulk_executor.BulkOperationResult
+
+        """
+        if options is None:
+            options = {}
+
+        return bulk_executor._BulkExecutor(self, collection_link, options, False).execute(documents)
+
+    def BulkUpsertItems(self, collection_link, documents, options=None):
+        """Upserts many documents in a collection concurrently.
+
+        The documents are written as by BulkCreateItems.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param documents:
+            An iterable of the Azure Cosmos documents to upsert, read once.
+        :param dict options:
+            The request options for each request.
+        :param int options['maxDegreeOfParallelism']:
+            The maximum number of concurrent writes. Defaults to 16.
+        :param int options['maxBufferedItemCount']:
+            The maximum number of documents read from documents and not written yet. Defaults to 10000.
+
+        :return:
+            The result of writing each document, and the total request charge.
+        :rtype:
+            bulk_executor.BulkOperationResult
+
+        """
+        if options is None:
+            options = {}
+
+        return bulk_executor._BulkExecutor(self, collection_link, options, True).execute(documents)
+
+    def _WriteItem(self, collection_link, document, options, is_upsert):
+        """Creates or upserts a document, without retrying throttled requests.
+
+        :return:
+            Tuple of (result, headers), safe to use when other threads share the client.
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        options = self._AddPartitionKey(collection_link, document, options)
+        collection_id, document, path = self._GetContainerIdWithPathForItem(collection_link, document, options)
+        headers = base.GetHeaders(self,
+                                  self.default_headers,
+                                  'post',
+                                  path,
+                                  collection_id,
+                                  'docs',
+                                  options)
+        if is_upsert:
+            headers[http_constants.HttpHeaders.IsUpsert] = True
+            request = request_object._RequestObject('docs', documents._OperationType.Upsert)
+        else:
+            request = request_object._RequestObject('docs', documents._OperationType.Create)
+        # the bulk executor paces the writes to a throttled partition itself
+        request.retry_throttled_requests = False
+
+        result, response_headers = self.__Post(path,
+                                               request,
+                                               document,
+                                               headers)
+        self.last_response_headers = response_headers
+        self._UpdateSessionIfRequired(headers, result, response_headers)
+        return result, response_headers
+
     PartitionResolverErrorMessage = "Couldn't find any partition resolvers for the database link provided. Ensure that the link you used when registering the partition resolvers matches the link provided or you need to register both types of database link(self link as well as ID based link)."
 
     # Gets the collection id and path for the document
@@ -2389,18 +2498,32 @@ class CosmosClient(object):
         result, self.last_response_headers = self.__Get('',
                                                         request,
                                                         headers)
+        return self._CreateDatabaseAccount(result, self.last_response_headers)
+
+    def _CreateDatabaseAccount(self, result, response_headers):
+        """Creates the database account from the result of a database account read.
+
+        :param dict result:
+        :param dict response_headers:
+
+        :return:
+            The Database Account.
+        :rtype:
+            documents.DatabaseAccount
+
+        """
         database_account = documents.DatabaseAccount()
         database_account.DatabasesLink = '/dbs/'
         database_account.MediaLink = '/media/'
         if (http_constants.HttpHeaders.MaxMediaStorageUsageInMB in
-            self.last_response_headers):
+            response_headers):
             database_account.MaxMediaStorageUsageInMB = (
-                self.last_response_headers[
+                response_headers[
                     http_constants.HttpHeaders.MaxMediaStorageUsageInMB])
         if (http_constants.HttpHeaders.CurrentMediaStorageUsageInMB in
-            self.last_response_headers):
+            response_headers):
             database_account.CurrentMediaStorageUsageInMB = (
-                self.last_response_headers[
+                response_headers[
                     http_constants.HttpHeaders.CurrentMediaStorageUsageInMB])
         database_account.ConsistencyPolicy = result.get(constants._Constants.UserConsistencyPolicy)
 
@@ -2722,14 +2845,19 @@ class CosmosClient(object):
             tuple
 
         """
-        return self.__QueryFeed(path,
-                                'docs',
-                                collection_id,
-                                lambda r: r['Documents'],
-                                lambda _, b: b,
-                                query,
-                                options,
-                                partition_key_range_id), self.last_response_headers
+        # last_response_headers can be replaced by the request of another
+        # partition key range fetched in parallel
+        response_headers = {}
+        result = self.__QueryFeed(path,
+                                  'docs',
+                                  collection_id,
+                                  lambda r: r['Documents'],
+                                  lambda _, b: b,
+                                  query,
+                                  options,
+                                  partition_key_range_id,
+                                  response_hook=lambda headers, _: response_headers.update(headers))
+        return result, response_headers
     
     def __QueryFeed(self,
                     path,
@@ -2739,7 +2867,8 @@ class CosmosClient(object):
                     create_fn,
                     query,
                     options=None,
-                    partition_key_range_id=None):
+                    partition_key_range_id=None,
+                    response_hook=None):
         """Query for more than one Azure Cosmos resources.
 
         :param str path:
@@ -2752,6 +2881,8 @@ class CosmosClient(object):
             The request options for the request.
         :param str partition_key_range_id:
             Specifies partition key range id.
+        :param function response_hook:
+            Called with the headers and the result of the response.
 
         :rtype:
             list
@@ -2787,9 +2918,12 @@ class CosmosClient(object):
                                       type,
                                       options,
                                       partition_key_range_id)
-            result, self.last_response_headers = self.__Get(path,
-                                                            request,
-                                                            headers)
+            result, response_headers = self.__Get(path,
+                                                  request,
+                                                  headers)
+            self.last_response_headers = response_headers
+            if response_hook:
+                response_hook(response_headers, result)
             return __GetBodiesFromQueryResult(result)
         else:
             query = self.__CheckAndUnifyQueryFormat(query)
@@ -2813,10 +2947,13 @@ class CosmosClient(object):
                                       type,
                                       options,
                                       partition_key_range_id)
-            result, self.last_response_headers = self.__Post(path,
-                                                             request,
-                                                             query,
-                                                             headers)
+            result, response_headers = self.__Post(path,
+                                                   request,
+                                                   query,
+                                                   headers)
+            self.last_response_headers = response_headers
+            if response_hook:
+                response_hook(response_headers, result)
             return __GetBodiesFromQueryResult(result)
 
     def __CheckAndUnifyQueryFormat(self, query_body):
@@ -2865,14 +3002,7 @@ class CosmosClient(object):
         
         #TODO: Refresh the cache if partition is extracted automatically and we get a 400.1001
 
-        # If the document collection link is present in the cache, then use the cached partitionkey definition
-        if collection_link in self.partition_key_definition_cache:
-            partitionKeyDefinition = self.partition_key_definition_cache.get(collection_link)
-        # Else read the collection from backend and add it to the cache
-        else:
-            collection = self.ReadContainer(collection_link)
-            partitionKeyDefinition = collection.get('partitionKey')
-            self.partition_key_definition_cache[collection_link] = partitionKeyDefinition
+        partitionKeyDefinition = self._GetPartitionKeyDefinition(collection_link)
         
         # If the collection doesn't have a partition key definition, skip it as it's a legacy collection 
         if partitionKeyDefinition:
@@ -2883,6 +3013,20 @@ class CosmosClient(object):
         
         return options
 
+    # Gets the partition key definition of a collection, None for legacy collections
+    def _GetPartitionKeyDefinition(self, collection_link):
+        collection_link = base.TrimBeginningAndEndingSlashes(collection_link)
+
+        # If the document collection link is present in the cache, then use the cached partitionkey definition
+        if collection_link in self.partition_key_definition_cache:
+            return self.partition_key_definition_cache.get(collection_link)
+
+        # Else read the collection from backend and add it to the cache
+        collection = self.ReadContainer(collection_link)
+        partitionKeyDefinition = collection.get('partitionKey')
+        self.partition_key_definition_cache[collection_link] = partitionKeyDefinition
+        return partitionKeyDefinition
+
     # Extracts the partition key from the document using the partitionKey definition
     def _ExtractPartitionKey(self, partitionKeyDefinition, document):
 
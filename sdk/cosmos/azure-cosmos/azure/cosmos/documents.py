@@ -352,6 +352,11 @@ class ConnectionPolicy(object):
         This is intended to be used only when targeting emulator endpoint to avoid failing your requests with SSL related error.
     :ivar boolean UseMultipleWriteLocations:
         Flag to enable writes on any locations (regions) for geo-replicated database accounts in the azure Cosmos service.
+    :ivar str PartitionKeyRangeCacheDirectory:
+        Gets or sets a directory where the client saves the partition key ranges of collections, so that
+        clients in new processes route cross partition queries without reading every range again.
+        Any number of clients and accounts can share the directory.
+        Not set by default.
     """
 
     __defaultRequestTimeout = 60000  # milliseconds
@@ -371,6 +376,7 @@ class ConnectionPolicy(object):
         self.RetryOptions = retry_options.RetryOptions()
         self.DisableSSLVerification = False
         self.UseMultipleWriteLocations = False
+        self.PartitionKeyRangeCacheDirectory = None
 
 class Undefined(object):
     """Represents undefined value for partitionKey when it's mising.
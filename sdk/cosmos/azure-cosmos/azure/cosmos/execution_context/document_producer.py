@@ -49,6 +49,8 @@ class _DocumentProducer(object):
         self._is_finished = False
         self._has_started = False
         self._cur_item = None
+        # pending asynchronous fetch of the next page, see prefetch()
+        self._prefetch_result = None
         # initiate execution context
         
         path = base.GetPathFromLink(collection_link, 'docs')
@@ -70,6 +72,49 @@ class _DocumentProducer(object):
         """
         return self._partition_key_target_range
         
+    def get_buffered_item_count(self):
+        """Returns the number of items fetched from the service but not yet consumed.
+            :return:
+                Number of buffered items.
+            :rtype: int
+        """
+        return len(self._ex_context._buffer) + (1 if self._cur_item is not None else 0)
+
+    def should_prefetch(self):
+        """Returns whether the next page of this producer can be fetched ahead of time.
+
+        A page is only prefetched once all the previously fetched items, except for the
+        current (peeked) item, have been consumed and the service reported more pages.
+
+            :return:
+                True if prefetch() would fetch a new page.
+            :rtype: bool
+        """
+        return (self._prefetch_result is None
+                and not len(self._ex_context._buffer)
+                and self._ex_context._has_started
+                and bool(self._ex_context._has_more_pages()))
+
+    def prefetch(self, pool):
+        """Starts fetching the next page of results on the given thread pool.
+
+        The fetched page is handed over to the execution context the next time an
+        item is requested from this producer, so at most one fetch is in flight
+        per producer.
+
+        :param multiprocessing.pool.ThreadPool pool:
+            The pool to run the fetch on.
+        """
+        if self.should_prefetch():
+            self._prefetch_result = pool.apply_async(self._ex_context.fetch_next_block)
+
+    def _collect_prefetched(self):
+        if self._prefetch_result is not None:
+            prefetch_result = self._prefetch_result
+            self._prefetch_result = None
+            # re-raises any error which happened while fetching the page
+            self._ex_context._buffer.extend(prefetch_result.get())
+
     def __iter__(self):
         return self
 
@@ -84,7 +129,8 @@ class _DocumentProducer(object):
             res = self._cur_item
             self._cur_item = None
             return res
-        
+
+        self._collect_prefetched()
         return next(self._ex_context)
 
     def __next__(self):
@@ -100,6 +146,7 @@ class _DocumentProducer(object):
             
         """
         if self._cur_item is None:
+            self._collect_prefetched()
             self._cur_item = next(self._ex_context)
 
         return self._cur_item
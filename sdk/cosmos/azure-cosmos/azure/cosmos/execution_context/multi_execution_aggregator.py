@@ -23,6 +23,7 @@
 """
 
 import heapq
+from multiprocessing.pool import ThreadPool
 from azure.cosmos.execution_context.base_execution_context import _QueryExecutionContextBase
 from azure.cosmos.execution_context import document_producer
 from azure.cosmos.routing import routing_range
@@ -36,8 +37,13 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
     
     When handling an orderby query, _MultiExecutionContextAggregator instantiates one instance of 
     DocumentProducer per target partition key range and aggregates the result of each.
-    
-    TODO improvement: this class needs to be parallelized
+
+    The pages of the target partition key ranges are fetched serially unless the
+    'maxDegreeOfParallelism' feed option is set. In that case the first page of every
+    target partition key range is fetched concurrently, and the next page of a range is
+    prefetched in the background as soon as its buffered items are about to run out,
+    bounded by the 'maxBufferedItemCount' feed option. The order in which the results
+    are returned is the same in both modes.
     """
 
     class PriorityQueue:
@@ -85,6 +91,19 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
             # create and add the child execution context for the target range
             targetPartitionQueryExecutionContextList.append(self._createTargetPartitionQueryExecutionContext(partitionTargetRange))
 
+        self._document_producers = targetPartitionQueryExecutionContextList
+        self._max_buffered_item_count = options.get('maxBufferedItemCount')
+        self._pool = None
+        degree_of_parallelism = self._get_degree_of_parallelism(options, len(targetPartitionQueryExecutionContextList))
+        if degree_of_parallelism > 1:
+            self._pool = ThreadPool(degree_of_parallelism)
+            try:
+                # fetch the first page of every target range concurrently, peek() below then only reads the buffer
+                self._pool.map(_MultiExecutionContextAggregator._peek_or_none, targetPartitionQueryExecutionContextList)
+            except:
+                self._close_pool()
+                raise
+
         self._orderByPQ = _MultiExecutionContextAggregator.PriorityQueue()
 
         for targetQueryExContext in targetPartitionQueryExecutionContextList:
@@ -95,10 +114,14 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
                 # if there are matching results in the target ex range add it to the priority queue
 
                 self._orderByPQ.push(targetQueryExContext)
+                self._prefetch(targetQueryExContext)
 
             except StopIteration:
-                continue        
-    
+                continue
+
+        if not self._orderByPQ.size():
+            self._close_pool()
+
     def next(self):
         """returns the next result
         
@@ -117,13 +140,24 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
                 """TODO: we can also use more_itertools.peekable to be more python friendly"""
                 targetRangeExContext.peek()
                 self._orderByPQ.push(targetRangeExContext)
+                self._prefetch(targetRangeExContext)
 
             except StopIteration:
                 pass
-                
+            except:
+                self._close_pool()
+                raise
+
             return res
+
+        self._close_pool()
         raise StopIteration
 
+    def __del__(self):
+        # release the worker threads of a query which was not iterated to the end
+        if getattr(self, '_pool', None) is not None:
+            self._close_pool()
+
     def fetch_next_block(self):
         
         raise NotImplementedError("You should use pipeline's fetch_next_block.")
@@ -144,6 +178,51 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
 
         return document_producer._DocumentProducer(partition_key_target_range, self._client, self._resource_link, query, self._document_producer_comparator)
     
+    @staticmethod
+    def _get_degree_of_parallelism(options, target_range_count):
+        """Returns the number of target partition key ranges which are fetched concurrently.
+
+        :param dict options:
+            The request options for the request.
+        :param int target_range_count:
+            The number of target partition key ranges.
+
+        :return:
+            1 if the pages should be fetched serially, otherwise the worker pool size.
+        :rtype: int
+        """
+        max_degree_of_parallelism = options.get('maxDegreeOfParallelism')
+        if not max_degree_of_parallelism:
+            return 1
+        # a negative value lets the SDK pick the degree of parallelism, one worker per target range
+        if max_degree_of_parallelism < 0:
+            return target_range_count
+        return min(max_degree_of_parallelism, target_range_count)
+
+    @staticmethod
+    def _peek_or_none(document_producer):
+        try:
+            return document_producer.peek()
+        except StopIteration:
+            return None
+
+    def _prefetch(self, document_producer):
+        if self._pool is None or not document_producer.should_prefetch():
+            return
+
+        if self._max_buffered_item_count is not None:
+            buffered_item_count = sum(p.get_buffered_item_count() for p in self._document_producers)
+            if buffered_item_count >= self._max_buffered_item_count:
+                return
+
+        document_producer.prefetch(self._pool)
+
+    def _close_pool(self):
+        if self._pool is not None:
+            # outstanding prefetches of an abandoned query are not waited for
+            self._pool.terminate()
+            self._pool = None
+
     def _get_target_parition_key_range(self):
 
         query_ranges = self._partitioned_query_ex_info.get_query_ranges()
@@ -27,6 +27,8 @@ class _RequestObject(object):
         self.operation_type = operation_type
         self.endpoint_override = endpoint_override
         self.should_clear_session_token_on_session_read_failure = False
+        # False when the caller paces its requests by the throttling itself, as the bulk executor does
+        self.retry_throttled_requests = True
         self.use_preferred_locations = None
         self.location_index_to_route = None
         self.location_endpoint_to_route = None
@@ -73,6 +73,8 @@ def _Execute(client, global_endpoint_manager, function, *args, **kwargs):
                     and e.sub_status == SubStatusCodes.WRITE_FORBIDDEN):
                 retry_policy = endpointDiscovery_retry_policy
             elif e.status_code == StatusCodes.TOO_MANY_REQUESTS:
+                if args and not args[0].retry_throttled_requests:
+                    raise
                 retry_policy = resourceThrottle_retry_policy
             elif e.status_code == StatusCodes.NOT_FOUND and e.sub_status and e.sub_status == SubStatusCodes.READ_SESSION_NOTAVAILABLE:
                 retry_policy = sessionRetry_policy
@@ -35,7 +35,7 @@ class _CollectionRoutingMap(object):
     MinimumInclusiveEffectivePartitionKey = ""
     MaximumExclusiveEffectivePartitionKey = "FF"
 
-    def __init__(self, range_by_id, range_by_info, ordered_partition_key_ranges, ordered_partition_info, collection_unique_id):
+    def __init__(self, range_by_id, range_by_info, ordered_partition_key_ranges, ordered_partition_info, collection_unique_id, change_feed_next_if_none_match=None):
         self._rangeById = range_by_id
         self._rangeByInfo = range_by_info
         self._orderedPartitionKeyRanges = ordered_partition_key_ranges
@@ -43,9 +43,11 @@ class _CollectionRoutingMap(object):
         self._orderedRanges = [routing_range._Range(pkr[_PartitionKeyRange.MinInclusive], pkr[_PartitionKeyRange.MaxExclusive], True, False) for pkr in ordered_partition_key_ranges]
         self._orderedPartitionInfo = ordered_partition_info
         self._collectionUniqueId = collection_unique_id
+        # the ETag of the partition key ranges feed when the ranges were read, to read only later changes
+        self.change_feed_next_if_none_match = change_feed_next_if_none_match
 
     @classmethod
-    def CompleteRoutingMap(cls, partition_key_range_info_tupple_list, collection_unique_id):
+    def CompleteRoutingMap(cls, partition_key_range_info_tupple_list, collection_unique_id, change_feed_next_if_none_match=None):
         rangeById = {}
         rangeByInfo = {}
 
@@ -60,7 +62,33 @@ class _CollectionRoutingMap(object):
         orderedPartitionInfo = [r[1] for r in sortedRanges]
 
         if not _CollectionRoutingMap.is_complete_set_of_range(partitionKeyOrderedRange): return None
-        return cls(rangeById, rangeByInfo, partitionKeyOrderedRange, orderedPartitionInfo, collection_unique_id)
+        return cls(rangeById, rangeByInfo, partitionKeyOrderedRange, orderedPartitionInfo, collection_unique_id, change_feed_next_if_none_match)
+
+    def try_combine(self, partition_key_ranges, change_feed_next_if_none_match):
+        """Combines the ranges of this map with the ranges changed since it was read.
+
+        Ranges which were split are replaced by their children.
+
+        :param list partition_key_ranges:
+            The ranges changed since change_feed_next_if_none_match.
+        :param str change_feed_next_if_none_match:
+            The ETag of the partition key ranges feed after the changes.
+        :return:
+            The combined routing map, or None if the ranges don't make a complete set.
+        :rtype: _CollectionRoutingMap
+        :raises ValueError: If the combined ranges overlap
+        """
+        partition_key_ranges = list(partition_key_ranges)
+        parentIds = set()
+        for r in partition_key_ranges:
+            parentIds.update(r.get(_PartitionKeyRange.Parents) or ())
+
+        rangeById = dict((rangeId, t) for rangeId, t in self._rangeById.items() if rangeId not in parentIds)
+        for r in partition_key_ranges:
+            if r[_PartitionKeyRange.Id] not in parentIds:
+                rangeById[r[_PartitionKeyRange.Id]] = (r, True)
+
+        return _CollectionRoutingMap.CompleteRoutingMap(list(rangeById.values()), self._collectionUniqueId, change_feed_next_if_none_match)
 
     def get_ordered_partition_key_ranges(self):
         """Gets the ordered partition key ranges
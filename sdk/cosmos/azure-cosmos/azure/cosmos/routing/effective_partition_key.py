@@ -0,0 +1,143 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+"""Internal methods for computing effective partition keys in the Azure Cosmos database service.
+
+The effective partition key of a document is the value the partition key ranges of its collection
+partition, so it identifies the range a document belongs to.
+"""
+
+import struct
+
+import six
+
+from azure.cosmos import documents
+from azure.cosmos.murmur_hash import _MurmurHash
+
+class _PartitionKeyComponentType(object):
+    Undefined = 0x00
+    Null = 0x01
+    PFalse = 0x02
+    PTrue = 0x03
+    Number = 0x05
+    String = 0x08
+
+_MaxStringCharsToHash = 100
+_MaxStringBytesToAppend = 100
+_UInt64Mask = 0xFFFFFFFFFFFFFFFF
+
+def _get_effective_partition_key_string(partition_key_definition, partition_key_value):
+    """Gets the effective partition key of a partition key value.
+
+    :param dict partition_key_definition:
+        The partition key definition of the collection.
+    :param partition_key_value:
+        The partition key value: a string, number, boolean, None or documents.Undefined.
+    :return:
+        The effective partition key as an upper case hex string, or None when it can't be computed,
+        as for collections hashing partition keys with version 2 of the hash function.
+    :rtype: str
+    """
+    kind = partition_key_definition.get('kind', 'Hash')
+    if kind == 'Range':
+        return _to_hex_encoded_binary_string([partition_key_value])
+    if kind != 'Hash' or partition_key_definition.get('version', 1) != 1:
+        return None
+
+    if isinstance(partition_key_value, six.string_types):
+        partition_key_value = partition_key_value[:_MaxStringCharsToHash]
+    hash_value = _MurmurHash._ComputeHash(_write_for_hashing(partition_key_value))
+    return _to_hex_encoded_binary_string([float(hash_value), partition_key_value])
+
+def _write_for_hashing(value):
+    buffer = bytearray()
+    if value is documents.Undefined:
+        buffer.append(_PartitionKeyComponentType.Undefined)
+    elif value is None:
+        buffer.append(_PartitionKeyComponentType.Null)
+    elif value is True:
+        buffer.append(_PartitionKeyComponentType.PTrue)
+    elif value is False:
+        buffer.append(_PartitionKeyComponentType.PFalse)
+    elif isinstance(value, six.string_types):
+        buffer.append(_PartitionKeyComponentType.String)
+        buffer.extend(value.encode('utf-8'))
+        buffer.append(0)
+    elif isinstance(value, six.integer_types + (float,)):
+        buffer.append(_PartitionKeyComponentType.Number)
+        buffer.extend(struct.pack('<d', value))
+    else:
+        raise TypeError("Unsupported partition key value of type {}".format(type(value).__name__))
+    return buffer
+
+def _to_hex_encoded_binary_string(components):
+    buffer = bytearray()
+    for value in components:
+        if value is documents.Undefined:
+            buffer.append(_PartitionKeyComponentType.Undefined)
+        elif value is None:
+            buffer.append(_PartitionKeyComponentType.Null)
+        elif value is True:
+            buffer.append(_PartitionKeyComponentType.PTrue)
+        elif value is False:
+            buffer.append(_PartitionKeyComponentType.PFalse)
+        elif isinstance(value, six.string_types):
+            _write_string_for_binary_encoding(value, buffer)
+        elif isinstance(value, six.integer_types + (float,)):
+            _write_number_for_binary_encoding(value, buffer)
+        else:
+            raise TypeError("Unsupported partition key value of type {}".format(type(value).__name__))
+    return ''.join('{:02X}'.format(b) for b in buffer)
+
+def _write_string_for_binary_encoding(value, buffer):
+    buffer.append(_PartitionKeyComponentType.String)
+    utf8_value = bytearray(value.encode('utf-8'))
+    short_string = len(utf8_value) <= _MaxStringBytesToAppend
+    # each byte is shifted by one so that 0x00 can terminate the string
+    for byte in utf8_value[:_MaxStringBytesToAppend + 1]:
+        buffer.append(byte + 1 if byte < 0xFF else byte)
+    if short_string:
+        buffer.append(0x00)
+
+def _write_number_for_binary_encoding(value, buffer):
+    buffer.append(_PartitionKeyComponentType.Number)
+    payload = _encode_double_as_uint64(float(value))
+
+    # the first byte holds 8 bits of the payload, the following bytes 7 bits followed by a 1 bit,
+    # except the last byte whose last bit is 0
+    buffer.append(payload >> 56)
+    payload = (payload << 8) & _UInt64Mask
+    byte_to_write = None
+    while byte_to_write is None or payload != 0:
+        if byte_to_write is not None:
+            buffer.append(byte_to_write)
+        byte_to_write = (payload >> 56) | 0x01
+        payload = (payload << 7) & _UInt64Mask
+    buffer.append(byte_to_write & 0xFE)
+
+def _encode_double_as_uint64(value):
+    # maps doubles to integers sorting in the same order
+    value_in_uint64 = struct.unpack('<Q', struct.pack('<d', value))[0]
+    mask = 0x8000000000000000
+    if value_in_uint64 < mask:
+        return value_in_uint64 ^ mask
+    return (~value_in_uint64 + 1) & _UInt64Mask
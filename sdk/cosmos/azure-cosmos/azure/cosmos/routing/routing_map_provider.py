@@ -22,26 +22,38 @@
 """Internal class for partition key range cache implementation in the Azure Cosmos database service.
 """
 
+import logging
+import threading
+
 import azure.cosmos.base as base
+from azure.cosmos import http_constants
 from azure.cosmos.routing.collection_routing_map import _CollectionRoutingMap
 import azure.cosmos.routing.routing_range as routing_range
 from azure.cosmos.routing.routing_range import _PartitionKeyRange
 
+logger = logging.getLogger(__name__)
+
 class _PartitionKeyRangeCache(object):
     '''
     _PartitionKeyRangeCache provides list of effective partition key ranges for a collection.
     This implementation loads and caches the collection routing map per collection on demand.
 
+    Ranges are read from the change feed of partition key ranges, so that refreshing a routing map
+    reads only the ranges changed since. With a snapshot store, routing maps are also saved on disk
+    and a new cache starts from them.
+
     '''
-    def __init__(self, client):
+    def __init__(self, client, snapshot_store=None):
         '''
         Constructor
         '''
         
         self._documentClient = client
+        self._snapshot_store = snapshot_store
         
         # keeps the cached collection routing map by collection id
         self._collection_routing_map_by_item = {}
+        self._lock = threading.Lock()
         
     def get_overlapping_ranges(self, collection_link, partition_key_ranges):
         '''
@@ -57,20 +69,95 @@ class _PartitionKeyRangeCache(object):
             List of overlapping partition key ranges.
         :rtype: list
         '''
-        cl = self._documentClient
-        
+        return self.get_routing_map(collection_link).get_overlapping_ranges(partition_key_ranges)
+
+    def get_routing_map(self, collection_link):
+        '''
+        Gets the cached routing map of a collection, reading it on first use.
+
+        :param str collection_link:
+            The link to the collection.
+        :return:
+            The routing map.
+        :rtype: _CollectionRoutingMap
+        '''
         collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
         
         collection_routing_map = self._collection_routing_map_by_item.get(collection_id)
         if collection_routing_map is None:
-            collection_pk_ranges = list(cl._ReadPartitionKeyRanges(collection_link))
+            with self._lock:
+                collection_routing_map = self._collection_routing_map_by_item.get(collection_id)
+                if collection_routing_map is None:
+                    snapshot = self._snapshot_store.load(collection_id) if self._snapshot_store else None
+                    collection_routing_map = self._read_routing_map(collection_link, collection_id, snapshot)
+        return collection_routing_map
+
+    def refresh(self, collection_link):
+        '''
+        Brings the cached routing map of a collection up to date, for example after a partition split,
+        reading only the ranges changed since it was cached.
+
+        :param str collection_link:
+            The link to the collection.
+        :return:
+            The refreshed routing map.
+        :rtype: _CollectionRoutingMap
+        '''
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        with self._lock:
+            previous = self._collection_routing_map_by_item.get(collection_id)
+            return self._read_routing_map(collection_link, collection_id, previous)
+
+    def _read_routing_map(self, collection_link, collection_id, previous):
+        '''
+        Reads the routing map of a collection, only the changes to previous when possible, and caches it.
+        Call with the lock held.
+        '''
+        collection_routing_map = None
+        if previous is not None and previous.change_feed_next_if_none_match:
+            changed_pk_ranges, etag = self._read_partition_key_ranges(collection_link, previous.change_feed_next_if_none_match)
+            try:
+                collection_routing_map = previous.try_combine(changed_pk_ranges, etag)
+            except ValueError:
+                collection_routing_map = None
+            if collection_routing_map is None:
+                logger.info("Partition key ranges of '%s' changed inconsistently, reading all of them", collection_id)
+
+        if collection_routing_map is None:
+            collection_pk_ranges, etag = self._read_partition_key_ranges(collection_link)
             # for large collections, a split may complete between the read partition key ranges query page responses, 
             # causing the partitionKeyRanges to have both the children ranges and their parents. Therefore, we need 
             # to discard the parent ranges to have a valid routing map.
             collection_pk_ranges = _PartitionKeyRangeCache._discard_parent_ranges(collection_pk_ranges)
-            collection_routing_map = _CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in collection_pk_ranges], collection_id)
-            self._collection_routing_map_by_item[collection_id] = collection_routing_map
-        return collection_routing_map.get_overlapping_ranges(partition_key_ranges)
+            collection_routing_map = _CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in collection_pk_ranges], collection_id, etag)
+
+        self._collection_routing_map_by_item[collection_id] = collection_routing_map
+        if self._snapshot_store and collection_routing_map is not None and (
+                previous is None or previous.change_feed_next_if_none_match != collection_routing_map.change_feed_next_if_none_match):
+            self._snapshot_store.save(collection_id, collection_routing_map)
+        return collection_routing_map
+
+    def _read_partition_key_ranges(self, collection_link, if_none_match=None):
+        '''
+        Reads the partition key ranges changed since if_none_match, or all of them.
+
+        :return:
+            The ranges and the ETag of the feed after them.
+        :rtype: tuple
+        '''
+        cl = self._documentClient
+        feed_options = {'changeFeed': True}
+        if if_none_match:
+            feed_options['continuation'] = if_none_match
+        # the client's last_response_headers can belong to a concurrent request,
+        # so the ETag is taken from the responses of this read
+        etags = []
+        def on_response(headers, _):
+            etag = (headers or {}).get(http_constants.HttpHeaders.ETag)
+            if etag:
+                etags.append(etag)
+        pk_ranges = list(cl._ReadPartitionKeyRanges(collection_link, feed_options, response_hook=on_response))
+        return pk_ranges, etags[-1] if etags else if_none_match
 
     @staticmethod
     def _discard_parent_ranges(partitionKeyRanges):
@@ -85,8 +172,8 @@ class _SmartRoutingMapProvider(_PartitionKeyRangeCache):
     """
     Efficiently uses PartitionKeyRangeCach and minimizes the unnecessary invocation of _CollectionRoutingMap.get_overlapping_ranges()
     """
-    def __init__(self, client):
-        super(_SmartRoutingMapProvider, self).__init__(client)
+    def __init__(self, client, snapshot_store=None):
+        super(_SmartRoutingMapProvider, self).__init__(client, snapshot_store)
 
     
     def _second_range_is_after_first_range(self, range1, range2):
@@ -0,0 +1,110 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+"""Internal class for storing collection routing maps on disk in the Azure Cosmos database service.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from azure.cosmos.routing.collection_routing_map import _CollectionRoutingMap
+
+logger = logging.getLogger(__name__)
+
+class _RoutingMapSnapshotStore(object):
+    """Stores the partition key ranges of collections in a directory, one file per collection,
+    so that new processes can route requests without reading every range.
+
+    A snapshot is only a starting point: the ranges changed since it was written are read when it's loaded.
+    """
+
+    def __init__(self, directory, account_url):
+        self._directory = directory
+        self._account_url = account_url
+
+    def _path(self, collection_id):
+        key = u"{}|{}".format(self._account_url, collection_id).encode("utf-8")
+        return os.path.join(self._directory, hashlib.sha256(key).hexdigest() + ".json")
+
+    def load(self, collection_id):
+        """Loads the routing map of a collection
+
+        :param str collection_id:
+            The resource id or full name of the collection.
+        :return:
+            The routing map, or None if there is no usable snapshot.
+        :rtype: _CollectionRoutingMap
+        """
+        path = self._path(collection_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            if snapshot["collectionId"] != collection_id or not snapshot["changeFeedNextIfNoneMatch"]:
+                return None
+            return _CollectionRoutingMap.CompleteRoutingMap(
+                [(r, True) for r in snapshot["partitionKeyRanges"]],
+                collection_id,
+                snapshot["changeFeedNextIfNoneMatch"])
+        except (IOError, OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # the ranges can always be read again, so a corrupt snapshot is ignored
+            logger.warning("Ignoring partition key range snapshot '%s': %r", path, e)
+            return None
+
+    def save(self, collection_id, routing_map):
+        """Saves the routing map of a collection, replacing any previous snapshot
+
+        :param str collection_id:
+            The resource id or full name of the collection.
+        :param _CollectionRoutingMap routing_map:
+            The routing map.
+        """
+        if not routing_map.change_feed_next_if_none_match:
+            # without an ETag, the changes since the snapshot couldn't be read
+            return
+        snapshot = {
+            "collectionId": collection_id,
+            "changeFeedNextIfNoneMatch": routing_map.change_feed_next_if_none_match,
+            "partitionKeyRanges": routing_map.get_ordered_partition_key_ranges()
+        }
+        path = self._path(collection_id)
+        temp_path = "{}.{}.{}.tmp".format(path, os.getpid(), threading.current_thread().ident)
+        try:
+            if not os.path.isdir(self._directory):
+                os.makedirs(self._directory)
+            with open(temp_path, "w") as temp_file:
+                json.dump(snapshot, temp_file)
+            _replace(temp_path, path)
+        except (IOError, OSError) as e:
+            logger.warning("Failed to save partition key range snapshot '%s': %r", path, e)
+
+def _replace(source, destination):
+    try:
+        os.replace(source, destination)
+    except AttributeError: # Python 2
+        if os.name == "nt" and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
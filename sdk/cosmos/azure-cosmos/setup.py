@@ -13,6 +13,9 @@ setup(name='azure-cosmos',
       url="https://github.com/Azure/azure-documentdb-python",
       license='MIT',
       install_requires=['six >=1.6', 'requests>=2.18.4'],
+      extras_require={
+        'aio': ['aiohttp>=3.0; python_version>="3.5"'],
+      },
       classifiers=[
         'License :: OSI Approved :: MIT License',
         'Intended Audience :: Developers',
@@ -0,0 +1,169 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import json
+import ssl
+import unittest
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+import asyncio
+from aiohttp import web
+from unittest import mock
+import azure.cosmos.documents as documents
+import azure.cosmos.errors as errors
+from azure.cosmos.aio import CosmosClient
+from azure.cosmos.http_constants import HttpHeaders
+
+class MockedCosmosService(object):
+    """Minimal local http server serving the database account, one collection and its documents."""
+
+    def __init__(self, page_size=2):
+        self.page_size = page_size
+        self.documents = {}
+        self.throttle_next_request = False
+        self.request_count = 0
+        app = web.Application()
+        app.router.add_get('/', self.read_database_account)
+        app.router.add_get('/dbs/db/colls/coll/', self.read_collection)
+        app.router.add_post('/dbs/db/colls/coll/docs/', self.create_or_query_documents)
+        app.router.add_get('/dbs/db/colls/coll/docs/{id}/', self.read_document)
+        app.router.add_delete('/dbs/db/colls/coll/docs/{id}/', self.delete_document)
+        self.runner = web.AppRunner(app)
+
+    async def start(self):
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return 'http://127.0.0.1:{}'.format(port)
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def read_database_account(self, request):
+        return web.json_response({'writableLocations': [], 'readableLocations': []})
+
+    async def read_collection(self, request):
+        return web.json_response({'id': 'coll', 'partitionKey': {'paths': ['/pk'], 'kind': 'Hash'}})
+
+    async def create_or_query_documents(self, request):
+        self.request_count += 1
+        if self.throttle_next_request:
+            self.throttle_next_request = False
+            return web.json_response({'code': 'TooManyRequests'}, status=429, headers={HttpHeaders.RetryAfterInMilliseconds: '1'})
+        body = await request.json()
+        if request.headers.get(HttpHeaders.IsQuery) == 'true':
+            start = int(request.headers.get(HttpHeaders.Continuation) or 0)
+            documents = sorted(self.documents.values(), key=lambda d: d['id'])
+            headers = {}
+            if start + self.page_size < len(documents):
+                headers[HttpHeaders.Continuation] = str(start + self.page_size)
+            return web.json_response({'Documents': documents[start:start + self.page_size]}, headers=headers)
+        body['_pk_header'] = json.loads(request.headers[HttpHeaders.PartitionKey])
+        body['_self'] = 'dbs/AAAA==/colls/AAAAAA==/docs/{}/'.format(body['id'])
+        self.documents[body['id']] = body
+        return web.json_response(body, status=201)
+
+    async def read_document(self, request):
+        document = self.documents.get(request.match_info['id'])
+        if document is None:
+            return web.json_response({'code': 'NotFound'}, status=404)
+        return web.json_response(document)
+
+    async def delete_document(self, request):
+        self.documents.pop(request.match_info['id'])
+        return web.Response(status=204)
+
+
+class AioCosmosClientTests(unittest.TestCase):
+
+    def run_with_client(self, test, service=None, connection_policy=None):
+        service = service or MockedCosmosService()
+
+        async def run():
+            url = await service.start()
+            try:
+                async with CosmosClient(url, {'masterKey': 'a2V5'}, connection_policy) as client:
+                    await test(client, service)
+            finally:
+                await service.stop()
+
+        asyncio.get_event_loop().run_until_complete(run())
+
+    def test_item_operations(self):
+        async def test(client, service):
+            created = await client.CreateItem('dbs/db/colls/coll', {'id': 'item1', 'pk': 'a'})
+            self.assertEqual(created['_pk_header'], ['a'])
+
+            read = await client.ReadItem('dbs/db/colls/coll/docs/item1')
+            self.assertEqual(read['pk'], 'a')
+
+            await client.DeleteItem('dbs/db/colls/coll/docs/item1', {'partitionKey': 'a'})
+            with self.assertRaises(errors.HTTPFailure) as cm:
+                await client.ReadItem('dbs/db/colls/coll/docs/item1')
+            self.assertEqual(cm.exception.status_code, 404)
+
+        self.run_with_client(test)
+
+    def test_concurrent_creates_and_query(self):
+        async def test(client, service):
+            await asyncio.gather(*[client.CreateItem('dbs/db/colls/coll', {'id': 'item{}'.format(i), 'pk': str(i)})
+                                   for i in range(7)])
+            ids = [item['id'] async for item in client.QueryItems('dbs/db/colls/coll', 'SELECT * FROM c')]
+            self.assertEqual(ids, ['item{}'.format(i) for i in range(7)])
+
+            block = await client.QueryItems('dbs/db/colls/coll', 'SELECT * FROM c').fetch_next_block()
+            self.assertEqual(len(block), service.page_size)
+
+        self.run_with_client(test)
+
+    def test_throttled_request_is_retried(self):
+        async def test(client, service):
+            service.throttle_next_request = True
+            await client.UpsertItem('dbs/db/colls/coll', {'id': 'item1', 'pk': 'a'})
+            self.assertEqual(service.request_count, 2)
+            self.assertIn('item1', service.documents)
+
+        self.run_with_client(test)
+
+    def test_ssl_context_created_once(self):
+        connection_policy = documents.ConnectionPolicy()
+        connection_policy.SSLConfiguration = documents.SSLConfiguration()
+
+        async def test(client, service):
+            for i in range(3):
+                await client.CreateItem('dbs/db/colls/coll', {'id': 'item{}'.format(i), 'pk': 'a'})
+
+        with mock.patch.object(ssl, 'create_default_context', wraps=ssl.create_default_context) as create_context:
+            self.run_with_client(test, connection_policy=connection_policy)
+        self.assertEqual(create_context.call_count, 1)
+
+    def test_not_opened(self):
+        async def test():
+            client = CosmosClient('http://127.0.0.1:1/', {'masterKey': 'a2V5'})
+            with self.assertRaises(RuntimeError):
+                await client.ReadItem('dbs/db/colls/coll/docs/item1')
+
+        asyncio.get_event_loop().run_until_complete(test())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+import threading
+import time
+import unittest
+import pytest
+import azure.cosmos.errors as errors
+from azure.cosmos.bulk_executor import _BulkExecutor, _PartitionWorkQueue
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes
+from azure.cosmos.routing import effective_partition_key
+from azure.cosmos.routing.routing_map_provider import _PartitionKeyRangeCache
+
+pytestmark = pytest.mark.cosmosEmulator
+
+@pytest.mark.usefixtures("teardown")
+class BulkExecutorTests(unittest.TestCase):
+
+    partition_key_definition = {'paths': ['/pk'], 'kind': 'Hash'}
+    partition_key_ranges = [{'id': '0', 'minInclusive': '', 'maxExclusive': '05C1D8'},
+                            {'id': '1', 'minInclusive': '05C1D8', 'maxExclusive': 'FF'}]
+
+    class MockedPartitionKeyRangesClient(object):
+
+        def __init__(self, partition_key_ranges):
+            self.partition_key_ranges = partition_key_ranges
+
+        def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
+            return self.partition_key_ranges
+
+    class MockedCosmosClient(object):
+        """Writes documents, throttling the writes to a range beyond its capacity of concurrent writes."""
+
+        def __init__(self, capacity_per_range=None, failing_ids=()):
+            self.capacity_per_range = capacity_per_range
+            self.failing_ids = failing_ids
+            self._routing_map_provider = _PartitionKeyRangeCache(
+                BulkExecutorTests.MockedPartitionKeyRangesClient(BulkExecutorTests.partition_key_ranges))
+            self.routing_map = self._routing_map_provider.get_routing_map('dbs/db/colls/coll')
+            self.written = []
+            self.throttle_count = 0
+            self.in_flight = {}
+            self.max_in_flight = {}
+            self._lock = threading.Lock()
+
+        def _GetPartitionKeyDefinition(self, collection_link):
+            return BulkExecutorTests.partition_key_definition
+
+        def _ExtractPartitionKey(self, partition_key_definition, document):
+            return document['pk']
+
+        def _WriteItem(self, collection_link, document, options, is_upsert):
+            epk = effective_partition_key._get_effective_partition_key_string(self._GetPartitionKeyDefinition(collection_link), options['partitionKey'])
+            range_id = self.routing_map.get_range_by_effective_partition_key(epk)['id']
+            with self._lock:
+                in_flight = self.in_flight[range_id] = self.in_flight.get(range_id, 0) + 1
+                self.max_in_flight[range_id] = max(in_flight, self.max_in_flight.get(range_id, 0))
+            try:
+                time.sleep(0.002)
+                with self._lock:
+                    if self.capacity_per_range and in_flight > self.capacity_per_range:
+                        self.throttle_count += 1
+                        raise errors.HTTPFailure(StatusCodes.TOO_MANY_REQUESTS, 'throttled',
+                                                 {HttpHeaders.RetryAfterInMilliseconds: '5', HttpHeaders.RequestCharge: '0'})
+                    if document['id'] in self.failing_ids:
+                        raise errors.HTTPFailure(StatusCodes.CONFLICT, 'conflict', {HttpHeaders.RequestCharge: '1.5'})
+                    self.written.append((document['id'], range_id, is_upsert))
+                return dict(document), {HttpHeaders.RequestCharge: '5.5'}
+            finally:
+                with self._lock:
+                    self.in_flight[range_id] -= 1
+
+    def get_documents(self, count):
+        return [{'id': str(i), 'pk': 'pk' + str(i % 10)} for i in range(count)]
+
+    def test_results_and_request_charge(self):
+        client = BulkExecutorTests.MockedCosmosClient(failing_ids=('7',))
+        result = _BulkExecutor(client, 'dbs/db/colls/coll', {}, True).execute(iter(self.get_documents(50)))
+
+        self.assertEqual([str(i) for i in range(50)], [r.Id for r in result.Results])
+        self.assertEqual(list(range(50)), [r.Index for r in result.Results])
+        self.assertEqual(49, result.SucceededCount)
+        self.assertEqual(1, result.FailedCount)
+        self.assertEqual(StatusCodes.CONFLICT, result.Results[7].Error.status_code)
+        self.assertFalse(result.Results[7].Succeeded)
+        self.assertEqual(49 * 5.5 + 1.5, result.TotalRequestCharge)
+        self.assertEqual(49, len(client.written))
+        self.assertTrue(all(is_upsert for _, _, is_upsert in client.written))
+
+    def test_documents_grouped_by_range(self):
+        client = BulkExecutorTests.MockedCosmosClient()
+        executor = _BulkExecutor(client, 'dbs/db/colls/coll', {}, False)
+        executor.execute(self.get_documents(100))
+
+        written_ranges = set(range_id for _, range_id, _ in client.written)
+        self.assertEqual(set(['0', '1']), written_ranges)
+        self.assertEqual(written_ranges, set(executor._queues))
+
+    def test_throttled_writes_are_retried(self):
+        client = BulkExecutorTests.MockedCosmosClient(capacity_per_range=2)
+        result = _BulkExecutor(client, 'dbs/db/colls/coll', {'maxDegreeOfParallelism': 8}, False).execute(self.get_documents(200))
+
+        self.assertEqual(200, result.SucceededCount)
+        self.assertEqual(200, len(client.written))
+        self.assertGreater(client.throttle_count, 0)
+        self.assertEqual(client.throttle_count, result.ThrottleCount)
+
+    def test_max_buffered_item_count(self):
+        client = BulkExecutorTests.MockedCosmosClient()
+        read_ahead = []
+
+        def documents():
+            for document in self.get_documents(50):
+                read_ahead.append(int(document['id']) - len(client.written))
+                yield document
+
+        _BulkExecutor(client, 'dbs/db/colls/coll', {'maxBufferedItemCount': 5}, False).execute(documents())
+        self.assertLessEqual(max(read_ahead), 5)
+
+    def test_partition_work_queue_concurrency(self):
+        queue = _PartitionWorkQueue(max_concurrency=4)
+        queue.items.extend(range(10))
+        self.assertEqual(1, int(queue.concurrency))
+
+        # the concurrency grows by one for each round of successful writes, up to the maximum
+        for _ in range(20):
+            queue.on_success()
+        self.assertEqual(4, queue.concurrency)
+
+        # and halves once for the writes throttled in the same round
+        queue.on_throttled(sent_at=1, retry_after_seconds=0.5, now=2)
+        queue.on_throttled(sent_at=1, retry_after_seconds=0.5, now=2.1)
+        self.assertEqual(2, queue.concurrency)
+        self.assertFalse(queue.can_send(2.5))
+        self.assertTrue(queue.can_send(2.6))
+
+        queue.on_throttled(sent_at=2.6, retry_after_seconds=0.5, now=3)
+        self.assertEqual(1, queue.concurrency)
+
+if __name__ == '__main__':
+    unittest.main()
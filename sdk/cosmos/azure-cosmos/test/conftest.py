@@ -20,12 +20,18 @@
 # SOFTWARE
 
 # pytest fixture 'teardown' is called at the end of a test run to clean up resources
+import sys
 import pytest
 import azure.cosmos.cosmos_client as cosmos_client
 import test_config
 import azure.cosmos.errors as errors
 from azure.cosmos.http_constants import StatusCodes
 
+# azure.cosmos.aio uses async/await syntax
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.append("aio_cosmos_client_tests.py")
+
 @pytest.fixture(scope="session")
 def teardown(request):
 
@@ -0,0 +1,148 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import threading
+import unittest
+import pytest
+import azure.cosmos.cosmos_client as cosmos_client
+import azure.cosmos.documents as documents
+import azure.cosmos.errors as errors
+from azure.cosmos.execution_context.multi_execution_aggregator import _MultiExecutionContextAggregator
+from azure.cosmos.execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+from azure.cosmos.http_constants import HttpHeaders
+
+pytestmark = pytest.mark.cosmosEmulator
+
+@pytest.mark.usefixtures("teardown")
+class MultiExecutionContextAggregatorTests(unittest.TestCase):
+
+    class MockedRoutingMapProvider(object):
+
+        def __init__(self, partition_key_ranges):
+            self.partition_key_ranges = partition_key_ranges
+
+        def get_overlapping_ranges(self, collection_link, sorted_ranges):
+            return self.partition_key_ranges
+
+    class MockedCosmosClient(object):
+        """Serves the documents of each partition key range in pages of page_size items."""
+
+        def __init__(self, documents_per_range, page_size, failing_range_id=None):
+            self.documents_per_range = documents_per_range
+            self.page_size = page_size
+            self.failing_range_id = failing_range_id
+            self.connection_policy = documents.ConnectionPolicy()
+            self.connection_policy.RetryOptions._max_retry_attempt_count = 0
+            self._global_endpoint_manager = None
+            self.last_response_headers = {}
+            self.partition_key_ranges = [{'id': range_id, 'minInclusive': range_id, 'maxExclusive': range_id + 'FF'}
+                                         for range_id in sorted(documents_per_range)]
+            self._routing_map_provider = MultiExecutionContextAggregatorTests.MockedRoutingMapProvider(self.partition_key_ranges)
+            self.fetching_threads = set()
+            self._lock = threading.Lock()
+
+        def QueryFeed(self, path, collection_id, query, options, partition_key_range_id):
+            with self._lock:
+                self.fetching_threads.add(threading.current_thread().ident)
+            if partition_key_range_id == self.failing_range_id:
+                raise errors.HTTPFailure(500, 'internal server error')
+            start = int(options.get('continuation') or 0)
+            items = self.documents_per_range[partition_key_range_id]
+            page = items[start:start + self.page_size]
+            headers = {}
+            if start + self.page_size < len(items):
+                headers[HttpHeaders.Continuation] = str(start + self.page_size)
+            return page, headers
+
+    class SharedHeadersCosmosClient(cosmos_client.CosmosClient):
+        """Runs the QueryFeed of the client over a mocked request, after which a request of
+        another range replaces last_response_headers."""
+
+        def __init__(self, documents_per_range, page_size):
+            self.mock = MultiExecutionContextAggregatorTests.MockedCosmosClient(documents_per_range, page_size)
+            self.connection_policy = self.mock.connection_policy
+            self._global_endpoint_manager = None
+            self.last_response_headers = {}
+            self._routing_map_provider = self.mock._routing_map_provider
+
+        def _CosmosClient__QueryFeed(self, path, type, id, result_fn, create_fn, query, options=None,
+                                     partition_key_range_id=None, response_hook=None):
+            result, response_headers = self.mock.QueryFeed(path, id, query, options, partition_key_range_id)
+            self.last_response_headers = response_headers
+            if response_hook:
+                response_hook(response_headers, result)
+            # the last page of another range
+            self.last_response_headers = {}
+            return result
+
+    def setUp(self):
+        self.documents_per_range = {}
+        for i, range_id in enumerate(['0', '1', '2', '3', '4']):
+            self.documents_per_range[range_id] = [
+                {'orderByItems': [{'item': value}], 'payload': {'id': '{}-{}'.format(range_id, value)}}
+                for value in range(i, 60, 3)]
+        self.query_execution_info = _PartitionedQueryExecutionInfo({
+            'queryInfo': {'orderBy': ['Ascending'], 'rewrittenQuery': None},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]})
+
+    def _execute(self, client, options):
+        aggregator = _MultiExecutionContextAggregator(client, 'dbs/db/colls/coll', 'SELECT * FROM root r ORDER BY r.value',
+                                                      options, self.query_execution_info)
+        return [item['payload']['id'] for item in aggregator]
+
+    def test_parallel_order_by_matches_serial(self):
+        serial_client = MultiExecutionContextAggregatorTests.MockedCosmosClient(self.documents_per_range, 4)
+        serial_results = self._execute(serial_client, {})
+
+        parallel_client = MultiExecutionContextAggregatorTests.MockedCosmosClient(self.documents_per_range, 4)
+        parallel_results = self._execute(parallel_client, {'maxDegreeOfParallelism': 3})
+
+        self.assertEqual(len(serial_results), sum(len(docs) for docs in self.documents_per_range.values()))
+        self.assertEqual(serial_results, parallel_results)
+        self.assertEqual(len(serial_client.fetching_threads), 1)
+        self.assertNotIn(threading.current_thread().ident, parallel_client.fetching_threads)
+
+    def test_parallel_ranges_continue_from_own_headers(self):
+        client = MultiExecutionContextAggregatorTests.SharedHeadersCosmosClient(self.documents_per_range, 4)
+        results = self._execute(client, {'maxDegreeOfParallelism': 3})
+        serial_results = self._execute(MultiExecutionContextAggregatorTests.MockedCosmosClient(self.documents_per_range, 4), {})
+        self.assertEqual(results, serial_results)
+
+    def test_max_buffered_item_count(self):
+        client = MultiExecutionContextAggregatorTests.MockedCosmosClient(self.documents_per_range, 4)
+        results = self._execute(client, {'maxDegreeOfParallelism': -1, 'maxBufferedItemCount': 1})
+        serial_results = self._execute(MultiExecutionContextAggregatorTests.MockedCosmosClient(self.documents_per_range, 4), {})
+        self.assertEqual(results, serial_results)
+
+    def test_degree_of_parallelism(self):
+        self.assertEqual(_MultiExecutionContextAggregator._get_degree_of_parallelism({}, 10), 1)
+        self.assertEqual(_MultiExecutionContextAggregator._get_degree_of_parallelism({'maxDegreeOfParallelism': 0}, 10), 1)
+        self.assertEqual(_MultiExecutionContextAggregator._get_degree_of_parallelism({'maxDegreeOfParallelism': 4}, 10), 4)
+        self.assertEqual(_MultiExecutionContextAggregator._get_degree_of_parallelism({'maxDegreeOfParallelism': 40}, 10), 10)
+        self.assertEqual(_MultiExecutionContextAggregator._get_degree_of_parallelism({'maxDegreeOfParallelism': -1}, 10), 10)
+
+    def test_parallel_fetch_failure_is_raised(self):
+        client = MultiExecutionContextAggregatorTests.MockedCosmosClient(self.documents_per_range, 4, failing_range_id='3')
+        with self.assertRaises(errors.HTTPFailure):
+            self._execute(client, {'maxDegreeOfParallelism': 5})
+
+if __name__ == "__main__":
+    unittest.main()
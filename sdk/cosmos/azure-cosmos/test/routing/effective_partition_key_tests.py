@@ -0,0 +1,62 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+import unittest
+import pytest
+import azure.cosmos.documents as documents
+from azure.cosmos.routing.effective_partition_key import _get_effective_partition_key_string
+
+pytestmark = pytest.mark.cosmosEmulator
+
+@pytest.mark.usefixtures("teardown")
+class EffectivePartitionKeyTests(unittest.TestCase):
+
+    def test_hash_partitioning(self):
+        partition_key_definition = {'paths': ['/pk'], 'kind': 'Hash'}
+        expected = [
+            ('', '05C1CF33970FF80800'),
+            ('partitionKey', '05C1E1B3D9CD2608716273756A756A706F4C667A00'),
+            (None, '05C1ED45D7475601'),
+            (True, '05C1D7C5A903D803'),
+            (False, '05C1DB857D857C02'),
+            (documents.Undefined, '05C1D529E345DC00'),
+            (5, '05C1D9C1C5517C05C014'),
+        ]
+        for partition_key, effective_partition_key in expected:
+            self.assertEqual(effective_partition_key, _get_effective_partition_key_string(partition_key_definition, partition_key))
+
+    def test_long_string(self):
+        partition_key_definition = {'paths': ['/pk'], 'kind': 'Hash'}
+        # strings are hashed truncated to 100 characters
+        self.assertEqual(_get_effective_partition_key_string(partition_key_definition, 'a' * 100),
+                         _get_effective_partition_key_string(partition_key_definition, 'a' * 1024))
+        self.assertNotEqual(_get_effective_partition_key_string(partition_key_definition, 'a' * 99),
+                            _get_effective_partition_key_string(partition_key_definition, 'a' * 100))
+
+    def test_unsupported_partitioning(self):
+        partition_key_definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+        self.assertIsNone(_get_effective_partition_key_string(partition_key_definition, 'partitionKey'))
+        with self.assertRaises(TypeError):
+            _get_effective_partition_key_string({'paths': ['/pk'], 'kind': 'Hash'}, ['a list'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+import pytest
+from azure.cosmos.routing.routing_map_provider import _PartitionKeyRangeCache
+from azure.cosmos.routing.routing_map_snapshot import _RoutingMapSnapshotStore
+from azure.cosmos.routing import routing_range as routing_range
+
+pytestmark = pytest.mark.cosmosEmulator
+
+@pytest.mark.usefixtures("teardown")
+class PartitionKeyRangeCacheTests(unittest.TestCase):
+
+    class MockedCosmosClient(object):
+        """Serves a change feed of partition key ranges, whose ETag is the number of changes."""
+
+        def __init__(self, partition_key_ranges):
+            self.changes = list(partition_key_ranges)
+            self.requests = []
+            self.last_response_headers = {}
+            self.concurrent_headers = None
+
+        def split(self, parent_id, children):
+            for child in children:
+                child['parents'] = [parent_id]
+                self.changes.append(child)
+
+        def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
+            assert feed_options['changeFeed'] is True
+            if_none_match = feed_options.get('continuation')
+            self.requests.append(if_none_match)
+            changes = self.changes[int(if_none_match or 0):]
+            self.last_response_headers = {'etag': str(len(self.changes))}
+            if response_hook:
+                response_hook(self.last_response_headers, changes)
+            if self.concurrent_headers is not None:
+                # another request of the client completed after this one
+                self.last_response_headers = self.concurrent_headers
+            return changes
+
+    collection_link = 'dbs/db/colls/coll'
+    collection_id = 'dbs/db/colls/coll'
+
+    def setUp(self):
+        self.partition_key_ranges = [
+            {'id': '0', 'minInclusive': '', 'maxExclusive': '40'},
+            {'id': '1', 'minInclusive': '40', 'maxExclusive': '80'},
+            {'id': '2', 'minInclusive': '80', 'maxExclusive': 'FF'}]
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def get_range_ids(self, cache):
+        ranges = cache.get_overlapping_ranges(self.collection_link, routing_range._Range('', 'FF', True, False))
+        return [r['id'] for r in ranges]
+
+    def split_range_1(self, client):
+        client.split('1', [{'id': '3', 'minInclusive': '40', 'maxExclusive': '60'},
+                           {'id': '4', 'minInclusive': '60', 'maxExclusive': '80'}])
+
+    def test_incremental_refresh(self):
+        client = PartitionKeyRangeCacheTests.MockedCosmosClient(self.partition_key_ranges)
+        cache = _PartitionKeyRangeCache(client)
+        self.assertEqual(['0', '1', '2'], self.get_range_ids(cache))
+        self.assertEqual([None], client.requests)
+
+        # the routing map is cached until refreshed
+        self.split_range_1(client)
+        self.assertEqual(['0', '1', '2'], self.get_range_ids(cache))
+
+        # refreshing reads only the ranges changed since
+        routing_map = cache.refresh(self.collection_link)
+        self.assertEqual([None, '3'], client.requests)
+        self.assertEqual('5', routing_map.change_feed_next_if_none_match)
+        self.assertEqual(['0', '3', '4', '2'], self.get_range_ids(cache))
+
+        cache.refresh(self.collection_link)
+        self.assertEqual([None, '3', '5'], client.requests)
+        self.assertEqual(['0', '3', '4', '2'], self.get_range_ids(cache))
+
+    def test_etag_of_own_response(self):
+        client = PartitionKeyRangeCacheTests.MockedCosmosClient(self.partition_key_ranges)
+        client.concurrent_headers = {'etag': '"document etag"'}
+        cache = _PartitionKeyRangeCache(client)
+        self.get_range_ids(cache)
+
+        self.split_range_1(client)
+        routing_map = cache.refresh(self.collection_link)
+        self.assertEqual([None, '3'], client.requests)
+        self.assertEqual('5', routing_map.change_feed_next_if_none_match)
+        self.assertEqual(['0', '3', '4', '2'], self.get_range_ids(cache))
+
+    def test_inconsistent_changes_read_all_ranges(self):
+        client = PartitionKeyRangeCacheTests.MockedCosmosClient(self.partition_key_ranges)
+        cache = _PartitionKeyRangeCache(client)
+        self.get_range_ids(cache)
+
+        # a child overlapping a range it didn't replace can't be combined with the cached ranges
+        client.changes.append({'id': '3', 'minInclusive': '30', 'maxExclusive': '80', 'parents': ['1']})
+        client.changes[0] = {'id': '0', 'minInclusive': '', 'maxExclusive': '30'}
+        cache.refresh(self.collection_link)
+        self.assertEqual([None, '3', None], client.requests)
+        self.assertEqual(['0', '3', '2'], self.get_range_ids(cache))
+
+    def test_snapshot(self):
+        store = _RoutingMapSnapshotStore(self.directory, 'https://account.documents.azure.com')
+        client = PartitionKeyRangeCacheTests.MockedCosmosClient(self.partition_key_ranges)
+        self.get_range_ids(_PartitionKeyRangeCache(client, store))
+        self.assertEqual([None], client.requests)
+
+        # a new cache loads the snapshot, then reads only the ranges changed since it was saved
+        self.split_range_1(client)
+        new_client = PartitionKeyRangeCacheTests.MockedCosmosClient(client.changes)
+        self.assertEqual(['0', '3', '4', '2'], self.get_range_ids(_PartitionKeyRangeCache(new_client, store)))
+        self.assertEqual(['3'], new_client.requests)
+
+        # the snapshot was updated with the changes
+        new_client = PartitionKeyRangeCacheTests.MockedCosmosClient(client.changes)
+        self.assertEqual(['0', '3', '4', '2'], self.get_range_ids(_PartitionKeyRangeCache(new_client, store)))
+        self.assertEqual(['5'], new_client.requests)
+
+        # snapshots of other accounts aren't used
+        other_store = _RoutingMapSnapshotStore(self.directory, 'https://other-account.documents.azure.com')
+        self.assertIsNone(other_store.load(self.collection_id))
+
+    def test_corrupt_snapshot(self):
+        store = _RoutingMapSnapshotStore(self.directory, 'https://account.documents.azure.com')
+        client = PartitionKeyRangeCacheTests.MockedCosmosClient(self.partition_key_ranges)
+        self.get_range_ids(_PartitionKeyRangeCache(client, store))
+        for file_name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, file_name), 'w') as snapshot_file:
+                snapshot_file.write('not json')
+
+        self.assertIsNone(store.load(self.collection_id))
+        new_client = PartitionKeyRangeCacheTests.MockedCosmosClient(self.partition_key_ranges)
+        self.assertEqual(['0', '1', '2'], self.get_range_ids(_PartitionKeyRangeCache(new_client, store)))
+        self.assertEqual([None], new_client.requests)
+        self.assertIsNotNone(store.load(self.collection_id))
+
+if __name__ == '__main__':
+    unittest.main()
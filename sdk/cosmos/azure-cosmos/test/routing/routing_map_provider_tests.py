@@ -35,7 +35,7 @@ class RoutingMapProviderTests(unittest.TestCase):
         def __init__(self, partition_key_ranges):
             self.partition_key_ranges = partition_key_ranges
             
-        def _ReadPartitionKeyRanges(self, collection_link):
+        def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
             return self.partition_key_ranges
 
     def setUp(self):
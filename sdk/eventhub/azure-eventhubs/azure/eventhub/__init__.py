@@ -5,11 +5,12 @@
 
 __version__ = "5.0.0b1"
 
-from azure.eventhub.common import EventData, EventPosition
+from azure.eventhub.common import EventData, EventDataBatch, EventPosition
 from azure.eventhub.error import EventHubError, EventDataError, ConnectError, \
     AuthenticationError, EventDataSendError, ConnectionLostError
 from azure.eventhub.client import EventHubClient
 from azure.eventhub.producer import EventHubProducer
+from azure.eventhub.buffered_producer import EventHubBufferedProducer
 from azure.eventhub.consumer import EventHubConsumer
 from uamqp import constants
 from .common import EventHubSharedKeyCredential, EventHubSASTokenCredential
@@ -18,6 +19,7 @@ TransportType = constants.TransportType
 
 __all__ = [
     "EventData",
+    "EventDataBatch",
     "EventHubError",
     "ConnectError",
     "ConnectionLostError",
@@ -27,6 +29,7 @@ __all__ = [
     "EventPosition",
     "EventHubClient",
     "EventHubProducer",
+    "EventHubBufferedProducer",
     "EventHubConsumer",
     "TransportType",
     "EventHubSharedKeyCredential",
@@ -5,9 +5,11 @@
 from .client_async import EventHubClient
 from .consumer_async import EventHubConsumer
 from .producer_async import EventHubProducer
+from .buffered_producer_async import EventHubBufferedProducer
 
 __all__ = [
     "EventHubClient",
     "EventHubConsumer",
-    "EventHubProducer"
+    "EventHubProducer",
+    "EventHubBufferedProducer",
 ]
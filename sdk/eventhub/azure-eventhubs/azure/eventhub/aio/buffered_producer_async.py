@@ -0,0 +1,341 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+import asyncio
+import logging
+import time
+from typing import Union  # pylint: disable=unused-import
+
+from uamqp import constants
+
+from azure.eventhub.common import EventData  # pylint: disable=unused-import
+from azure.eventhub.error import EventHubError, EventDataError
+from azure.eventhub.buffered_producer import _PartitionBuffer
+
+log = logging.getLogger(__name__)
+
+
+async def _call_back(callback, *args):
+    if callback:
+        try:
+            result = callback(*args)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:  # pylint: disable=broad-except
+            log.warning("EventHubBufferedProducer callback raised an error (%r).", e)
+
+
+class EventHubBufferedProducer(object):
+    """
+    An async producer which buffers events in memory and sends them in the background.
+
+    `send` returns as soon as the event is buffered. The events are grouped by partition id, or by
+    partition key, and each group is sent in batches filled up to the maximum message size of the link
+    once it holds enough events to fill a batch, or once its oldest event has waited `max_wait_time`.
+    Up to `max_concurrent_sends` groups are sent at the same time, each on its own link.
+    When `max_buffer_length` events are buffered or being sent, `send` waits until some are sent.
+    The outcome of every event is reported to the `on_success` or `on_error` callback.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self, client, max_buffer_length=10000, max_wait_time=1, max_concurrent_sends=4,
+            on_success=None, on_error=None, send_timeout=None, loop=None):
+        """
+        Instantiate an async EventHubBufferedProducer. EventHubBufferedProducer should be instantiated by calling the
+         `create_buffered_producer` method in EventHubClient.
+
+        :param client: The parent EventHubClientAsync.
+        :type client: ~azure.eventhub.aio.EventHubClientAsync
+        :param max_buffer_length: The maximum number of events buffered or being sent. Default value is 10000.
+        :type max_buffer_length: int
+        :param max_wait_time: The maximum time in seconds an event waits in the buffer for a batch to fill up
+         before it is sent. Default value is 1 second.
+        :type max_wait_time: float
+        :param max_concurrent_sends: The maximum number of batches sent at the same time. Default value is 4.
+        :type max_concurrent_sends: int
+        :param on_success: Called with each event once the service has acknowledged it.
+         It can be a function or a coroutine function.
+        :type on_success: Callable[[~azure.eventhub.common.EventData], None]
+        :param on_error: Called with each event which could not be sent and the error.
+         It can be a function or a coroutine function.
+        :type on_error: Callable[[~azure.eventhub.common.EventData, Exception], None]
+        :param send_timeout: The timeout in seconds for each batch to be sent. Default value is the
+         `send_timeout` of the client.
+        :type send_timeout: float
+        :param loop: An event loop. If not specified the default event loop will be used.
+        """
+        if max_buffer_length < 1:
+            raise ValueError("max_buffer_length must be at least 1.")
+        if max_concurrent_sends < 1:
+            raise ValueError("max_concurrent_sends must be at least 1.")
+        self.loop = loop or asyncio.get_event_loop()
+        self.client = client
+        self.max_buffer_length = max_buffer_length
+        self.max_wait_time = max_wait_time
+        self.max_concurrent_sends = max_concurrent_sends
+        self.on_success = on_success
+        self.on_error = on_error
+        self.send_timeout = send_timeout
+        self._max_batch_size = constants.MAX_MESSAGE_LENGTH_BYTES
+        self._buffers = {}
+        self._buffered_count = 0
+        self._flush_requests = 0
+        # created on first use, so that they belong to the running event loop
+        self._condition = None
+        self._send_slots = None
+        self._producers = {}
+        self._idle_producers = []
+        self._worker = None
+        self._flush_tasks = set()
+        self._closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def buffered_count(self):
+        """
+        The number of events buffered or being sent.
+
+        :rtype: int
+        """
+        return self._buffered_count
+
+    async def _wait(self, timeout):
+        # called with the lock held, which is held again when it returns
+        try:
+            await asyncio.wait_for(self._condition.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self):
+        async with self._condition:
+            while True:
+                if self._closed:
+                    if not any(b.flushing for b in self._buffers.values()):
+                        break
+                    await self._condition.wait()
+                    continue
+                now = time.time()
+                next_wake_up = None
+                for key, buffer in list(self._buffers.items()):
+                    if buffer.flushing:
+                        continue
+                    if not buffer.events:
+                        # partition keys can be many, so idle buffers are dropped
+                        del self._buffers[key]
+                        continue
+                    if buffer.is_ready(now, self._max_batch_size, self.max_wait_time, self._flush_requests):
+                        buffer.flushing = True
+                        task = self.loop.create_task(self._flush_buffer(key, buffer))
+                        self._flush_tasks.add(task)
+                        task.add_done_callback(self._flush_tasks.discard)
+                    else:
+                        wake_up = buffer.events[0][2] + self.max_wait_time
+                        next_wake_up = wake_up if next_wake_up is None else min(next_wake_up, wake_up)
+                await self._wait(None if next_wake_up is None else max(next_wake_up - now, 0.001))
+
+    def _acquire_producer(self, partition_id):
+        if partition_id is not None:
+            producer = self._producers.pop(partition_id, None)
+        else:
+            producer = self._idle_producers.pop() if self._idle_producers else None
+        return producer or self.client.create_producer(
+            partition_id=partition_id, send_timeout=self.send_timeout, loop=self.loop)
+
+    async def _release_producer(self, partition_id, producer, failed):
+        if failed:
+            # a producer closes itself on most errors, so a new link is opened for the next batch
+            await producer.close()
+        elif partition_id is not None:
+            self._producers[partition_id] = producer
+        else:
+            self._idle_producers.append(producer)
+
+    async def _take_batch(self, producer, key, buffer):
+        batch = await producer.create_batch(partition_key=key[1])
+        events = []
+        too_large = None
+        async with self._condition:
+            self._max_batch_size = batch.max_size
+            while buffer.events:
+                event_data, size, _ = buffer.events[0]
+                if not batch.try_add(event_data):
+                    if not events:
+                        too_large = buffer.events.popleft()[0]
+                        buffer.size -= size
+                        self._buffered_count -= 1
+                        self._condition.notify_all()
+                    break
+                buffer.events.popleft()
+                buffer.size -= size
+                events.append(event_data)
+        if too_large is not None:
+            await _call_back(self.on_error, too_large, EventDataError(
+                "The event is larger than the maximum message size of {} bytes.".format(batch.max_size)))
+        return batch, events
+
+    async def _flush_buffer(self, key, buffer):
+        partition_id = key[0]
+        async with self._send_slots:
+            producer = self._acquire_producer(partition_id)
+            failed = False
+            try:
+                while True:
+                    try:
+                        batch, events = await self._take_batch(producer, key, buffer)
+                    except Exception as e:  # pylint: disable=broad-except
+                        failed = True
+                        await self._fail_buffer(buffer, e)
+                        break
+                    if events:
+                        try:
+                            await producer.send(batch)
+                        except Exception as e:  # pylint: disable=broad-except
+                            log.info("EventHubBufferedProducer failed to send %d events (%r).", len(events), e)
+                            failed = True
+                            for event_data in events:
+                                await _call_back(self.on_error, event_data, e)
+                        else:
+                            for event_data in events:
+                                await _call_back(self.on_success, event_data)
+                        async with self._condition:
+                            self._buffered_count -= len(events)
+                            self._condition.notify_all()
+                    async with self._condition:
+                        # keep the link busy while the buffer fills batches faster than they are sent
+                        if failed or self._closed or not buffer.is_ready(
+                                time.time(), self._max_batch_size, self.max_wait_time, self._flush_requests):
+                            break
+            finally:
+                await self._release_producer(partition_id, producer, failed)
+                async with self._condition:
+                    buffer.flushing = False
+                    self._condition.notify_all()
+
+    async def _fail_buffer(self, buffer, error):
+        async with self._condition:
+            events = [e[0] for e in buffer.events]
+            buffer.events.clear()
+            buffer.size = 0
+            self._buffered_count -= len(events)
+            self._condition.notify_all()
+        for event_data in events:
+            await _call_back(self.on_error, event_data, error)
+
+    async def send(self, event_data, partition_id=None, partition_key=None, timeout=None):
+        # type:(EventData, str, Union[str, bytes], float) -> None
+        """
+        Buffers an event to be sent in the background. Waits while the buffer is full.
+
+        :param event_data: The event to be sent.
+        :type event_data: ~azure.eventhub.common.EventData
+        :param partition_id: The specific partition ID to send to. Default is None, in which case the service
+         will assign to all partitions using round-robin.
+        :type partition_id: str
+        :param partition_key: With the given partition_key, event data will land to
+         a particular partition of the Event Hub decided by the service.
+        :type partition_key: str
+        :param timeout: The maximum time in seconds to wait for room in the buffer. Default is None,
+         which waits until there is room.
+        :type timeout: float
+        :raises: ~azure.eventhub.EventHubError if the producer is closed or the buffer is still full
+         after timeout seconds.
+        :return: None
+        :rtype: None
+        """
+        if partition_id is not None and partition_key is not None:
+            raise ValueError("partition_id and partition_key cannot be used together.")
+        if partition_key is not None:
+            event_data._set_partition_key(partition_key)  # pylint: disable=protected-access
+        size = event_data.message.get_message_encoded_size()
+        deadline = None if timeout is None else time.time() + timeout
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+            self._send_slots = asyncio.Semaphore(self.max_concurrent_sends)
+        async with self._condition:
+            while not self._closed and self._buffered_count >= self.max_buffer_length:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise EventHubError("The buffer is full. {} events are waiting to be sent.".format(
+                        self._buffered_count))
+                await self._wait(remaining)
+            if self._closed:
+                raise EventHubError("This producer has been closed. Please create a new producer to send event data.")
+            if self._worker is None:
+                self._worker = self.loop.create_task(self._run())
+            key = (partition_id, partition_key)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = _PartitionBuffer()
+            buffer.events.append((event_data, size, time.time()))
+            buffer.size += size
+            self._buffered_count += 1
+            if len(buffer.events) == 1 or buffer.size >= self._max_batch_size:
+                # wake up the background task to schedule the first event, or to send a full batch
+                self._condition.notify_all()
+
+    async def flush(self, timeout=None):
+        # type:(float) -> bool
+        """
+        Sends the buffered events without waiting for the batches to fill up,
+        and waits until they have been sent.
+
+        :param timeout: The maximum time in seconds to wait. Default is None, which waits until all the
+         buffered events are sent.
+        :type timeout: float
+        :return: Whether all the buffered events were sent within timeout.
+        :rtype: bool
+        """
+        if self._condition is None:
+            return True
+        deadline = None if timeout is None else time.time() + timeout
+        async with self._condition:
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                while self._buffered_count:
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    await self._wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    async def close(self, timeout=None):
+        # type:(float) -> None
+        """
+        Sends the buffered events, then closes the links of the producer.
+        Events which have not been sent within timeout are reported to `on_error`.
+
+        :param timeout: The maximum time in seconds to wait for the buffered events to be sent.
+         Default is None, which waits until they are all sent.
+        :type timeout: float
+        """
+        if self._closed:
+            return
+        if self._condition is None:
+            self._closed = True
+            return
+        await self.flush(timeout)
+        async with self._condition:
+            self._closed = True
+            buffers = list(self._buffers.values())
+            self._condition.notify_all()
+        for buffer in buffers:
+            await self._fail_buffer(buffer, EventHubError("The producer was closed before the event was sent."))
+        if self._worker is not None:
+            await self._worker
+        if self._flush_tasks:
+            await asyncio.wait(list(self._flush_tasks))
+        producers = list(self._producers.values()) + self._idle_producers
+        self._producers = {}
+        self._idle_producers = []
+        for producer in producers:
+            await producer.close()
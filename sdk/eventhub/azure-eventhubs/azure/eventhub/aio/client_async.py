@@ -6,7 +6,7 @@ import logging
 import datetime
 import functools
 import asyncio
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Callable
 
 from uamqp import authentication, constants
 from uamqp import (
@@ -21,6 +21,7 @@ from azure.eventhub.common import parse_sas_token, EventPosition, EventHubShared
 from ..client_abstract import EventHubClientAbstract
 
 from .producer_async import EventHubProducer
+from .buffered_producer_async import EventHubBufferedProducer
 from .consumer_async import EventHubConsumer
 
 
@@ -263,3 +264,47 @@ class EventHubClient(EventHubClientAbstract):
         handler = EventHubProducer(
             self, target, partition=partition_id, send_timeout=send_timeout, loop=loop)
         return handler
+
+    def create_buffered_producer(
+            self, max_buffer_length=10000, max_wait_time=1, max_concurrent_sends=4,
+            on_success=None, on_error=None, send_timeout=None, loop=None):
+        # type: (int, float, int, Callable, Callable, float, asyncio.AbstractEventLoop) -> EventHubBufferedProducer
+        """
+        Create an async producer which buffers EventData objects and sends them to an EventHub in the background,
+        in batches grouped by partition id or partition key.
+
+        :param max_buffer_length: The maximum number of events buffered or being sent. `send` waits while
+         the buffer is full. Default value is 10000.
+        :type max_buffer_length: int
+        :param max_wait_time: The maximum time in seconds an event waits in the buffer for a batch to fill up
+         before it is sent. Default value is 1 second.
+        :type max_wait_time: float
+        :param max_concurrent_sends: The maximum number of batches sent at the same time, each on its own link.
+         Default value is 4.
+        :type max_concurrent_sends: int
+        :param on_success: Called with each event once the service has acknowledged it.
+         It can be a function or a coroutine function.
+        :type on_success: Callable[[~azure.eventhub.common.EventData], None]
+        :param on_error: Called with each event which could not be sent and the error.
+         It can be a function or a coroutine function.
+        :type on_error: Callable[[~azure.eventhub.common.EventData, Exception], None]
+        :param send_timeout: The timeout in seconds for each batch to be sent. Default value is 60 seconds.
+         If set to 0, there will be no timeout.
+        :type send_timeout: float
+        :param loop: An event loop. If not specified the default event loop will be used.
+        :rtype ~azure.eventhub.aio.buffered_producer_async.EventHubBufferedProducer
+
+        Example:
+            .. literalinclude:: ../examples/async_examples/test_examples_eventhub_async.py
+                :start-after: [START create_eventhub_client_async_buffered_producer]
+                :end-before: [END create_eventhub_client_async_buffered_producer]
+                :language: python
+                :dedent: 4
+                :caption: Add an async buffered producer to the client to send EventData in the background.
+
+        """
+        send_timeout = self.config.send_timeout if send_timeout is None else send_timeout
+        return EventHubBufferedProducer(
+            self, max_buffer_length=max_buffer_length, max_wait_time=max_wait_time,
+            max_concurrent_sends=max_concurrent_sends, on_success=on_success, on_error=on_error,
+            send_timeout=send_timeout, loop=loop)
@@ -12,7 +12,7 @@ try:
     from urllib import unquote_plus, urlencode, quote_plus
 except ImportError:
     from urllib.parse import urlparse, unquote_plus, urlencode, quote_plus
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Callable
 
 import uamqp
 from uamqp import Message
@@ -22,6 +22,7 @@ from uamqp import errors
 from uamqp import compat
 
 from azure.eventhub.producer import EventHubProducer
+from azure.eventhub.buffered_producer import EventHubBufferedProducer
 from azure.eventhub.consumer import EventHubConsumer
 from azure.eventhub.common import parse_sas_token, EventPosition
 from azure.eventhub.error import ConnectError
@@ -268,3 +269,44 @@ class EventHubClient(EventHubClientAbstract):
         handler = EventHubProducer(
             self, target, partition=partition_id, send_timeout=send_timeout)
         return handler
+
+    def create_buffered_producer(
+            self, max_buffer_length=10000, max_wait_time=1, max_concurrent_sends=4,
+            on_success=None, on_error=None, send_timeout=None):
+        # type: (int, float, int, Callable, Callable, float) -> EventHubBufferedProducer
+        """
+        Create a producer which buffers EventData objects and sends them to an EventHub in the background,
+        in batches grouped by partition id or partition key.
+
+        :param max_buffer_length: The maximum number of events buffered or being sent. `send` blocks while
+         the buffer is full. Default value is 10000.
+        :type max_buffer_length: int
+        :param max_wait_time: The maximum time in seconds an event waits in the buffer for a batch to fill up
+         before it is sent. Default value is 1 second.
+        :type max_wait_time: float
+        :param max_concurrent_sends: The maximum number of batches sent at the same time, each on its own link.
+         Default value is 4.
+        :type max_concurrent_sends: int
+        :param on_success: Called with each event once the service has acknowledged it.
+        :type on_success: Callable[[~azure.eventhub.common.EventData], None]
+        :param on_error: Called with each event which could not be sent and the error.
+        :type on_error: Callable[[~azure.eventhub.common.EventData, Exception], None]
+        :param send_timeout: The timeout in seconds for each batch to be sent. Default value is 60 seconds.
+         If set to 0, there will be no timeout.
+        :type send_timeout: float
+        :rtype: ~azure.eventhub.buffered_producer.EventHubBufferedProducer
+
+        Example:
+            .. literalinclude:: ../examples/test_examples_eventhub.py
+                :start-after: [START create_eventhub_client_buffered_producer]
+                :end-before: [END create_eventhub_client_buffered_producer]
+                :language: python
+                :dedent: 4
+                :caption: Add a buffered producer to the client to send EventData in the background.
+
+        """
+        send_timeout = self.config.send_timeout if send_timeout is None else send_timeout
+        return EventHubBufferedProducer(
+            self, max_buffer_length=max_buffer_length, max_wait_time=max_wait_time,
+            max_concurrent_sends=max_concurrent_sends, on_success=on_success, on_error=on_error,
+            send_timeout=send_timeout)
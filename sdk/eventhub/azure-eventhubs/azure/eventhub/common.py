@@ -9,9 +9,16 @@ import calendar
 import json
 import six
 
-from uamqp import BatchMessage, Message, types
+from uamqp import BatchMessage, Message, types, constants
 from uamqp.message import MessageHeader, MessageProperties
 
+from azure.eventhub.error import EventDataError
+
+# Encoding overhead of each message appended to the data section of a batch message:
+# the described list type of the section plus the binary length prefix, which takes
+# one byte below 256 bytes and four bytes above.
+_BATCH_MESSAGE_OVERHEAD_COST = [5, 8]
+
 
 def parse_sas_token(sas_token):
     """Parse a SAS token into its components.
@@ -29,6 +36,12 @@ def parse_sas_token(sas_token):
     return sas_data
 
 
+def _to_bytes(value):
+    if isinstance(value, six.text_type):
+        return value.encode('utf-8')
+    return value
+
+
 class EventData(object):
     """
     The EventData class is a holder of event content.
@@ -261,6 +274,79 @@ class _BatchSendEventData(EventData):
             self.message.header = header
 
 
+class EventDataBatch(object):
+    """
+    A batch of events whose encoded size is tracked as they are added so that it never exceeds
+    the maximum message size of the link it will be sent on.
+
+    Use `create_batch` of the EventHubProducer to create an EventDataBatch object, which can be
+    filled with `try_add` until it returns False and then passed to `send`.
+    Do not instantiate an EventDataBatch object directly.
+    """
+
+    def __init__(self, max_size=None, partition_key=None):
+        self.max_size = max_size or constants.MAX_MESSAGE_LENGTH_BYTES
+        self._partition_key = partition_key
+        self.message = BatchMessage(data=[], multi_messages=False, properties=None)
+        self.message.max_message_length = self.max_size
+        self._set_partition_key(partition_key)
+        self._size = self.message.gather()[0].get_message_encoded_size()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def size(self):
+        """
+        The encoded size of the batch in bytes, as it will be sent to the service.
+
+        :rtype: int
+        """
+        return self._size
+
+    def _set_partition_key(self, value):
+        if value:
+            annotations = self.message.annotations
+            if annotations is None:
+                annotations = dict()
+            annotations[types.AMQPSymbol(EventData.PROP_PARTITION_KEY)] = value
+            header = MessageHeader()
+            header.durable = True
+            self.message.annotations = annotations
+            self.message.header = header
+
+    def try_add(self, event_data):
+        """
+        Adds an event to the batch if it fits.
+
+        :param event_data: The event to add to the batch.
+        :type event_data: ~azure.eventhub.common.EventData
+        :return: True if the event was added, False if adding it would exceed the maximum size of the batch.
+        :rtype: bool
+        :raises: ~azure.eventhub.EventDataError if the event has a partition key different from the batch.
+        """
+        if event_data is None:
+            raise ValueError("EventData cannot be None.")
+        event_partition_key = event_data.partition_key
+        if event_partition_key and self._partition_key and \
+                _to_bytes(event_partition_key) != _to_bytes(self._partition_key):
+            raise EventDataError("The partition_key of the event does not match the partition_key of the batch.")
+        if self._partition_key and not event_partition_key:
+            event_data._set_partition_key(self._partition_key)  # pylint: disable=protected-access
+
+        event_data_size = event_data.message.get_message_encoded_size()
+        size_after_add = self._size + event_data_size + \
+            _BATCH_MESSAGE_OVERHEAD_COST[0 if event_data_size < 256 else 1]
+        if size_after_add > self.max_size:
+            return False
+
+        self.message._body_gen.append(event_data)  # pylint: disable=protected-access
+        self._size = size_after_add
+        self._count += 1
+        return True
+
+
 class EventPosition(object):
     """
     The position(offset, sequence or timestamp) where a consumer starts. Examples:
@@ -13,7 +13,7 @@ from uamqp import constants, errors
 from uamqp import compat
 from uamqp import SendClient
 
-from azure.eventhub.common import EventData, _BatchSendEventData
+from azure.eventhub.common import EventData, EventDataBatch, _BatchSendEventData
 from azure.eventhub.error import EventHubError, ConnectError, \
     AuthenticationError, EventDataError, EventDataSendError, ConnectionLostError, _error_handler
 
@@ -78,6 +78,7 @@ class EventHubProducer(object):
             properties=self.client._create_properties(self.client.config.user_agent))  # pylint: disable=protected-access
         self._outcome = None
         self._condition = None
+        self._max_message_size_on_link = None
 
     def __enter__(self):
         return self
@@ -139,6 +140,8 @@ class EventHubProducer(object):
             self._handler.open()
             while not self._handler.client_ready():
                 time.sleep(0.05)
+            self._max_message_size_on_link = self._handler.message_handler._link.peer_max_message_size \
+                or constants.MAX_MESSAGE_LENGTH_BYTES
             return True
         except errors.AuthenticationException as shutdown:
             if is_reconnect:
@@ -298,14 +301,52 @@ class EventHubProducer(object):
         if outcome != constants.MessageSendResult.Ok:
             raise condition
 
+    def create_batch(self, max_size=None, partition_key=None):
+        # type:(int, Union[str, bytes]) -> EventDataBatch
+        """
+        Create an EventDataBatch object with the maximum size of all the events it can hold
+        no larger than the maximum message size allowed by the link of this producer.
+        Events are added to the batch with `try_add` until it is full, then the batch is sent with `send`.
+
+        :param max_size: The maximum size in bytes of the encoded batch. It defaults to, and cannot exceed,
+         the maximum message size negotiated with the service when the link was opened.
+        :type max_size: int
+        :param partition_key: With the given partition_key, the events of the batch will land to
+         a particular partition of the Event Hub decided by the service.
+        :type partition_key: str
+        :return: an EventDataBatch instance
+        :rtype: ~azure.eventhub.common.EventDataBatch
+        :raises: ValueError if max_size is larger than the maximum message size of the link.
+
+        Example:
+            .. literalinclude:: ../examples/test_examples_eventhub.py
+                :start-after: [START eventhub_client_sync_create_batch]
+                :end-before: [END eventhub_client_sync_create_batch]
+                :language: python
+                :dedent: 4
+                :caption: Create EventDataBatch object within limited size
+
+        """
+        self._check_closed()
+        if not self._max_message_size_on_link:
+            self._open()
+
+        if max_size and max_size > self._max_message_size_on_link:
+            raise ValueError('Max message size: {} is too large, acceptable max batch size is: {} bytes.'
+                             .format(max_size, self._max_message_size_on_link))
+
+        return EventDataBatch(max_size=(max_size or self._max_message_size_on_link), partition_key=partition_key)
+
     def send(self, event_data, partition_key=None):
-        # type:(Union[EventData, Union[List[EventData], Iterator[EventData], Generator[EventData]]], Union[str, bytes]) -> None
+        # type:(Union[EventData, EventDataBatch, Union[List[EventData], Iterator[EventData], Generator[EventData]]], Union[str, bytes]) -> None
         """
         Sends an event data and blocks until acknowledgement is
         received or operation times out.
 
-        :param event_data: The event to be sent. It can be an EventData object, or iterable of EventData objects
-        :type event_data: ~azure.eventhub.common.EventData, Iterator, Generator, list
+        :param event_data: The event to be sent. It can be an EventData object, an EventDataBatch object
+         created by `create_batch`, or iterable of EventData objects
+        :type event_data: ~azure.eventhub.common.EventData, ~azure.eventhub.common.EventDataBatch, Iterator,
+         Generator, list
         :param partition_key: With the given partition_key, event data will land to
          a particular partition of the Event Hub decided by the service.
         :type partition_key: str
@@ -325,7 +366,11 @@ class EventHubProducer(object):
 
         """
         self._check_closed()
-        if isinstance(event_data, EventData):
+        if isinstance(event_data, EventDataBatch):
+            if partition_key and partition_key != event_data._partition_key:  # pylint: disable=protected-access
+                raise EventDataError("The partition_key does not match the one of the EventDataBatch.")
+            wrapper_event_data = event_data
+        elif isinstance(event_data, EventData):
             if partition_key:
                 event_data._set_partition_key(partition_key)
             wrapper_event_data = event_data
@@ -120,6 +120,33 @@ def test_example_eventhub_producer_ops(live_eventhub_config, connection_str):
         producer.close()
     # [END eventhub_client_sender_close]
 
+    producer = client.create_producer(partition_id="0")
+    try:
+        # [START eventhub_client_sync_create_batch]
+        event_data_batch = producer.create_batch(max_size=10000)
+        while event_data_batch.try_add(EventData('Message inside EventBatchData')):
+            pass
+        producer.send(event_data_batch)
+        # [END eventhub_client_sync_create_batch]
+        assert len(event_data_batch) > 0
+        assert event_data_batch.size <= 10000
+    finally:
+        producer.close()
+
+    # [START create_eventhub_client_buffered_producer]
+    def on_error(event_data, error):
+        logger = logging.getLogger("azure.eventhub")
+        logger.error("Failed to send {}: {}".format(event_data.body_as_str(), error))
+
+    client = EventHubClient.from_connection_string(connection_str)
+    # Create a buffered producer which sends the events in the background.
+    with client.create_buffered_producer(max_wait_time=0.5, on_error=on_error) as buffered_producer:
+        for i in range(100):
+            buffered_producer.send(EventData("Event number {}".format(i)), partition_key="sensor-1")
+        # Returns once the buffered events have been sent.
+        buffered_producer.flush()
+    # [END create_eventhub_client_buffered_producer]
+
 
 def test_example_eventhub_consumer_ops(live_eventhub_config, connection_str):
     from azure.eventhub import EventHubClient
@@ -0,0 +1,188 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import asyncio
+import time
+
+import pytest
+
+from azure.eventhub.aio.buffered_producer_async import EventHubBufferedProducer
+from azure.eventhub.error import EventHubError
+
+
+class FakeMessage(object):
+    def __init__(self, size):
+        self.size = size
+
+    def get_message_encoded_size(self):
+        return self.size
+
+
+class FakeEventData(object):
+    def __init__(self, body, size=10):
+        self.body = body
+        self.message = FakeMessage(size)
+        self.partition_key = None
+
+    def _set_partition_key(self, value):
+        self.partition_key = value
+
+
+class FakeBatch(object):
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.events = []
+
+    def try_add(self, event_data):
+        size = event_data.message.get_message_encoded_size()
+        if self.size + size > self.max_size:
+            return False
+        self.size += size
+        self.events.append(event_data)
+        return True
+
+
+class FakeProducer(object):
+    """Records the batches it sends. Sending waits until `release` is set, and raises `error` if set."""
+
+    def __init__(self, client, partition_id):
+        self.client = client
+        self.partition_id = partition_id
+        self.closed = False
+
+    async def create_batch(self, partition_key=None):
+        return FakeBatch(self.client.max_batch_size)
+
+    async def send(self, batch):
+        await self.client.release.wait()
+        if self.client.error:
+            raise self.client.error
+        self.client.batches.append((self.partition_id, [e.body for e in batch.events]))
+        self.client.sent_at.append(time.time())
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeClient(object):
+    def __init__(self, max_batch_size=100):
+        self.max_batch_size = max_batch_size
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error = None
+        self.batches = []
+        self.sent_at = []
+        self.producers = []
+
+    def create_producer(self, partition_id=None, send_timeout=None, loop=None):
+        producer = FakeProducer(self, partition_id)
+        self.producers.append(producer)
+        return producer
+
+
+async def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_buffered_producer_fills_batches_up_to_size_limit_async():
+    client = FakeClient(max_batch_size=100)
+    succeeded = []
+    producer = EventHubBufferedProducer(client, max_wait_time=60, on_success=succeeded.append)
+
+    for i in range(10):
+        await producer.send(FakeEventData(i, size=30), partition_id="0")
+    assert await producer.flush(timeout=5)
+
+    # 3 events of 30 bytes fit in a batch of 100 bytes
+    assert client.batches == [("0", [0, 1, 2]), ("0", [3, 4, 5]), ("0", [6, 7, 8]), ("0", [9])]
+    assert [e.body for e in succeeded] == list(range(10))
+    assert producer.buffered_count == 0
+    await producer.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_producer_send_waits_while_buffer_full_async():
+    client = FakeClient()
+    client.release.clear()
+    producer = EventHubBufferedProducer(client, max_buffer_length=2, max_wait_time=0)
+
+    await producer.send(FakeEventData(0), partition_id="0")
+    await producer.send(FakeEventData(1), partition_id="0")
+    # the events are being sent, but still count against the buffer until the send completes
+    with pytest.raises(EventHubError):
+        await producer.send(FakeEventData(2), partition_id="0", timeout=0.1)
+
+    send = asyncio.ensure_future(producer.send(FakeEventData(3), partition_id="0"))
+    await asyncio.sleep(0.1)
+    assert not send.done()
+    client.release.set()
+    await asyncio.wait_for(send, 5)
+    await producer.close()
+    assert [body for _, bodies in client.batches for body in bodies] == [0, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_buffered_producer_flushes_on_interval_async():
+    client = FakeClient()
+    producer = EventHubBufferedProducer(client, max_wait_time=0.2)
+
+    start = time.time()
+    await producer.send(FakeEventData(0), partition_id="0")
+    await producer.send(FakeEventData(1), partition_id="0")
+    # the batch isn't full, so it's sent once the oldest event has waited max_wait_time
+    await asyncio.sleep(0.1)
+    assert not client.batches
+    await wait_for(lambda: client.batches)
+    assert client.batches == [("0", [0, 1])]
+    assert client.sent_at[0] - start >= 0.2
+    assert producer.buffered_count == 0
+    await producer.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_producer_close_flushes_pending_events_async():
+    client = FakeClient()
+    succeeded = []
+
+    async def on_success(event_data):
+        succeeded.append(event_data)
+
+    producer = EventHubBufferedProducer(client, max_wait_time=60, on_success=on_success)
+    async with producer:
+        for i in range(5):
+            await producer.send(FakeEventData(i), partition_id="0")
+        assert not client.batches
+
+    assert client.batches == [("0", [0, 1, 2, 3, 4])]
+    assert len(succeeded) == 5
+    assert all(p.closed for p in client.producers)
+    with pytest.raises(EventHubError):
+        await producer.send(FakeEventData(5), partition_id="0")
+
+
+@pytest.mark.asyncio
+async def test_buffered_producer_reports_errors_async():
+    client = FakeClient()
+    client.error = EventHubError("send failed")
+    failed = []
+    producer = EventHubBufferedProducer(
+        client, max_wait_time=60, on_error=lambda event_data, error: failed.append((event_data.body, error)))
+
+    await producer.send(FakeEventData(0), partition_id="0")
+    await producer.send(FakeEventData(1, size=200), partition_id="1")
+    await producer.close()
+
+    assert sorted(body for body, _ in failed) == [0, 1]
+    assert dict(failed)[0] is client.error
+    # the event larger than a batch isn't sent
+    assert "larger than the maximum message size" in str(dict(failed)[1])
+    # the link which failed is closed rather than reused
+    assert client.producers[0].closed
@@ -246,3 +246,59 @@ async def test_send_over_websocket_async(connstr_receivers):
 
     for r in receivers:
         r.close()
+
+
+@pytest.mark.liveTest
+@pytest.mark.asyncio
+async def test_send_event_data_batch_async(connstr_receivers):
+    connection_str, receivers = connstr_receivers
+    client = EventHubClient.from_connection_string(connection_str, network_tracing=False)
+    sender = client.create_producer()
+
+    async with sender:
+        with pytest.raises(ValueError):
+            await sender.create_batch(max_size=100000000)
+        event_data_batch = await sender.create_batch(max_size=100000)
+        while event_data_batch.try_add(EventData("A" * 1000)):
+            pass
+        assert 0 < event_data_batch.size <= 100000
+        await sender.send(event_data_batch)
+    batch_count = len(event_data_batch)
+
+    time.sleep(1)
+    received = []
+    for r in receivers:
+        received.extend(r.receive(timeout=3))
+
+    assert len(received) == batch_count
+    assert list(received[0].body)[0] == b"A" * 1000
+
+
+@pytest.mark.liveTest
+@pytest.mark.asyncio
+async def test_send_buffered_async(connstr_receivers):
+    connection_str, receivers = connstr_receivers
+    client = EventHubClient.from_connection_string(connection_str, network_tracing=False)
+    succeeded = []
+    failed = []
+    sender = client.create_buffered_producer(
+        max_buffer_length=50, max_wait_time=0.5, max_concurrent_sends=2,
+        on_success=succeeded.append, on_error=lambda event_data, error: failed.append(error))
+
+    async with sender:
+        for i in range(100):
+            await sender.send(EventData("Event number {}".format(i)), partition_id=str(i % 2))
+            assert sender.buffered_count <= 50
+        for i in range(20):
+            await sender.send(EventData("Keyed event number {}".format(i)), partition_key="key")
+        assert await sender.flush(timeout=30)
+        assert sender.buffered_count == 0
+
+    assert not failed
+    assert len(succeeded) == 120
+
+    time.sleep(1)
+    received = []
+    for r in receivers:
+        received.extend(r.receive(timeout=3))
+    assert len(received) == 120
@@ -0,0 +1,209 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import threading
+import time
+
+import pytest
+
+from azure.eventhub.buffered_producer import EventHubBufferedProducer
+from azure.eventhub.error import EventHubError
+
+
+class FakeMessage(object):
+    def __init__(self, size):
+        self.size = size
+
+    def get_message_encoded_size(self):
+        return self.size
+
+
+class FakeEventData(object):
+    def __init__(self, body, size=10):
+        self.body = body
+        self.message = FakeMessage(size)
+        self.partition_key = None
+
+    def _set_partition_key(self, value):
+        self.partition_key = value
+
+
+class FakeBatch(object):
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.events = []
+
+    def try_add(self, event_data):
+        size = event_data.message.get_message_encoded_size()
+        if self.size + size > self.max_size:
+            return False
+        self.size += size
+        self.events.append(event_data)
+        return True
+
+
+class FakeProducer(object):
+    """Records the batches it sends. Sending waits until `release` is set, and raises `error` if set."""
+
+    def __init__(self, client, partition_id):
+        self.client = client
+        self.partition_id = partition_id
+        self.closed = False
+
+    def create_batch(self, partition_key=None):
+        return FakeBatch(self.client.max_batch_size)
+
+    def send(self, batch):
+        self.client.release.wait()
+        if self.client.error:
+            raise self.client.error
+        with self.client.lock:
+            self.client.batches.append((self.partition_id, [e.body for e in batch.events]))
+            self.client.sent_at.append(time.time())
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient(object):
+    def __init__(self, max_batch_size=100):
+        self.max_batch_size = max_batch_size
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.release.set()
+        self.error = None
+        self.batches = []
+        self.sent_at = []
+        self.producers = []
+
+    def create_producer(self, partition_id=None, send_timeout=None):
+        producer = FakeProducer(self, partition_id)
+        self.producers.append(producer)
+        return producer
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_buffered_producer_fills_batches_up_to_size_limit():
+    client = FakeClient(max_batch_size=100)
+    succeeded = []
+    producer = EventHubBufferedProducer(client, max_wait_time=60, on_success=succeeded.append)
+
+    for i in range(10):
+        producer.send(FakeEventData(i, size=30), partition_id="0")
+    assert producer.flush(timeout=5)
+
+    # 3 events of 30 bytes fit in a batch of 100 bytes
+    assert client.batches == [("0", [0, 1, 2]), ("0", [3, 4, 5]), ("0", [6, 7, 8]), ("0", [9])]
+    assert [e.body for e in succeeded] == list(range(10))
+    assert producer.buffered_count == 0
+    producer.close()
+
+
+def test_buffered_producer_keeps_partitions_apart():
+    client = FakeClient()
+    producer = EventHubBufferedProducer(client, max_wait_time=60)
+
+    for i in range(4):
+        producer.send(FakeEventData(i), partition_id=str(i % 2))
+    keyed = FakeEventData(4)
+    producer.send(keyed, partition_key="key")
+    producer.close()
+
+    assert sorted(client.batches, key=lambda b: b[1]) == [("0", [0, 2]), ("1", [1, 3]), (None, [4])]
+    assert keyed.partition_key == "key"
+    with pytest.raises(ValueError):
+        EventHubBufferedProducer(client).send(FakeEventData(5), partition_id="0", partition_key="key")
+
+
+def test_buffered_producer_send_blocks_while_buffer_full():
+    client = FakeClient()
+    client.release.clear()
+    producer = EventHubBufferedProducer(client, max_buffer_length=2, max_wait_time=0)
+
+    producer.send(FakeEventData(0), partition_id="0")
+    producer.send(FakeEventData(1), partition_id="0")
+    # the events are being sent, but still count against the buffer until the send completes
+    with pytest.raises(EventHubError):
+        producer.send(FakeEventData(2), partition_id="0", timeout=0.1)
+
+    sent = threading.Event()
+
+    def send():
+        producer.send(FakeEventData(3), partition_id="0")
+        sent.set()
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    assert not sent.wait(0.1)
+    client.release.set()
+    assert sent.wait(5)
+    thread.join()
+    producer.close()
+    assert [body for _, bodies in client.batches for body in bodies] == [0, 1, 3]
+
+
+def test_buffered_producer_flushes_on_interval():
+    client = FakeClient()
+    producer = EventHubBufferedProducer(client, max_wait_time=0.2)
+
+    start = time.time()
+    producer.send(FakeEventData(0), partition_id="0")
+    producer.send(FakeEventData(1), partition_id="0")
+    # the batch isn't full, so it's sent once the oldest event has waited max_wait_time
+    time.sleep(0.1)
+    assert not client.batches
+    wait_for(lambda: client.batches)
+    assert client.batches == [("0", [0, 1])]
+    assert client.sent_at[0] - start >= 0.2
+    assert producer.buffered_count == 0
+
+    # the background thread keeps flushing later events
+    producer.send(FakeEventData(2), partition_id="0")
+    wait_for(lambda: len(client.batches) == 2)
+    producer.close()
+
+
+def test_buffered_producer_close_flushes_pending_events():
+    client = FakeClient()
+    succeeded = []
+    producer = EventHubBufferedProducer(client, max_wait_time=60, on_success=succeeded.append)
+
+    with producer:
+        for i in range(5):
+            producer.send(FakeEventData(i), partition_id="0")
+        assert not client.batches
+
+    assert client.batches == [("0", [0, 1, 2, 3, 4])]
+    assert len(succeeded) == 5
+    assert all(p.closed for p in client.producers)
+    with pytest.raises(EventHubError):
+        producer.send(FakeEventData(5), partition_id="0")
+
+
+def test_buffered_producer_reports_errors():
+    client = FakeClient()
+    client.error = EventHubError("send failed")
+    failed = []
+    producer = EventHubBufferedProducer(
+        client, max_wait_time=60, on_error=lambda event_data, error: failed.append((event_data.body, error)))
+
+    producer.send(FakeEventData(0), partition_id="0")
+    producer.send(FakeEventData(1, size=200), partition_id="1")
+    producer.close()
+
+    assert sorted(body for body, _ in failed) == [0, 1]
+    assert dict(failed)[0] is client.error
+    # the event larger than a batch isn't sent
+    assert "larger than the maximum message size" in str(dict(failed)[1])
+    # the link which failed is closed rather than reused
+    assert client.producers[0].closed
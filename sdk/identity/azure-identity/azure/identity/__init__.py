@@ -9,6 +9,7 @@ from .credentials import (
     EnvironmentCredential,
     ManagedIdentityCredential,
 )
+from ._token_cache import PersistentTokenCache
 
 
 class DefaultAzureCredential(ChainedTokenCredential):
@@ -35,4 +36,5 @@ __all__ = [
     "DefaultAzureCredential",
     "EnvironmentCredential",
     "ManagedIdentityCredential",
+    "PersistentTokenCache",
 ]
@@ -11,7 +11,8 @@ from azure.core.exceptions import ClientAuthenticationError
 from azure.core.pipeline import Pipeline
 from azure.core.pipeline.policies import ContentDecodePolicy, NetworkTraceLoggingPolicy, RetryPolicy
 from azure.core.pipeline.transport import HttpTransport, RequestsTransport
-from msal import TokenCache
+
+from ._token_cache import TokenIndex
 
 try:
     from typing import TYPE_CHECKING
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from typing import Any, Dict, Iterable, Mapping, Optional
     from azure.core.pipeline import PipelineResponse
     from azure.core.pipeline.policies import HTTPPolicy
+    from ._token_cache import PersistentTokenCache
 
 
 class AuthnClientBase(object):
@@ -33,17 +35,19 @@ class AuthnClientBase(object):
             raise ValueError("auth_url should be the URL of an OAuth endpoint")
         super(AuthnClientBase, self).__init__()
         self._auth_url = auth_url
-        self._cache = TokenCache()
+        token_cache = kwargs.get("token_cache")  # type: Optional[PersistentTokenCache]
+        if token_cache:
+            # tokens in a shared cache are kept apart by authority and client
+            partition = "{} {}".format(auth_url, kwargs.get("client_id") or "")
+            self._cache = token_cache.get_partition(partition)
+            self._shared_cache = True
+        else:
+            self._cache = TokenIndex()
+            self._shared_cache = False
 
     def get_cached_token(self, scopes):
         # type: (Iterable[str]) -> Optional[AccessToken]
-        tokens = self._cache.find(TokenCache.CredentialType.ACCESS_TOKEN, list(scopes))
-        for token in tokens:
-            if all((scope in token["target"] for scope in scopes)):
-                expires_on = int(token["expires_on"])
-                if expires_on - 300 > int(time.time()):
-                    return AccessToken(token["secret"], expires_on)
-        return None
+        return self._cache.find(scopes, expires_after=int(time.time()) + 300)
 
     def _deserialize_and_cache_token(self, response, scopes, request_time):
         # type: (PipelineResponse, Iterable[str], int) -> AccessToken
@@ -71,12 +75,9 @@ class AuthnClientBase(object):
                 # have a token but don't know when it expires -> treat it as single-use
                 expires_on = request_time
 
-        # now we have an int expires_on, ensure the cache entry gets it
-        payload["expires_on"] = expires_on
-
-        self._cache.add({"response": payload, "scope": scopes})
-
-        return AccessToken(token, expires_on)
+        access_token = AccessToken(token, expires_on)
+        self._cache.add(scopes, access_token)
+        return access_token
 
     @staticmethod
     def _parse_app_service_expires_on(expires_on):
@@ -126,6 +127,18 @@ class AuthnClient(AuthnClientBase):
         super(AuthnClient, self).__init__(auth_url, **kwargs)
 
     def request_token(self, scopes, method="POST", headers=None, form_data=None, params=None, **kwargs):
+        # type: (Iterable[str], Optional[str], Optional[Mapping[str, str]], Optional[Mapping[str, str]], Optional[Dict[str, str]], Any) -> AccessToken
+        if not self._shared_cache:
+            return self._request_token(scopes, method, headers, form_data, params, **kwargs)
+
+        # other processes wait while this one requests the token, then take it from the cache
+        with self._cache.lock():
+            token = self.get_cached_token(scopes)
+            if not token:
+                token = self._request_token(scopes, method, headers, form_data, params, **kwargs)
+            return token
+
+    def _request_token(self, scopes, method, headers, form_data, params, **kwargs):
         # type: (Iterable[str], Optional[str], Optional[Mapping[str, str]], Optional[Mapping[str, str]], Optional[Dict[str, str]], Any) -> AccessToken
         request = self._prepare_request(method, headers=headers, form_data=form_data, params=params)
         request_time = int(time.time())
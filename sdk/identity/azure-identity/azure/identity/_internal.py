@@ -2,7 +2,10 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import logging
 import os
+import threading
+import time
 
 try:
     from typing import TYPE_CHECKING
@@ -11,7 +14,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     # pylint:disable=unused-import
-    from typing import Any, Mapping, Optional, Type
+    from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple, Type
     from azure.core.credentials import AccessToken
 
 from azure.core import Configuration
@@ -21,16 +24,135 @@ from azure.core.pipeline.policies import ContentDecodePolicy, HeadersPolicy, Net
 from ._authn_client import AuthnClient
 from .constants import Endpoints, EnvironmentVariables
 
+_LOGGER = logging.getLogger(__name__)
+
+# the key of the endpoint availability probe in a request coalescer
+_PROBE = "probe"
+
+
+class _PendingRequest(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None  # type: Any
+        self.error = None  # type: Optional[Exception]
+
+
+class _RequestCoalescer(object):
+    """Sends one request at a time for each key. Callers asking for a key while its request is
+    pending wait for that request, and share its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # type: Dict[Hashable, _PendingRequest]
+
+    def run(self, key, request):
+        # type: (Hashable, Callable[[], Any]) -> Any
+        with self._lock:
+            pending = self._pending.get(key)
+            sender = pending is None
+            if sender:
+                pending = self._pending[key] = _PendingRequest()
+
+        if not sender:
+            pending.done.wait()
+            if pending.error:
+                raise pending.error  # pylint:disable=raising-bad-type
+            return pending.result
+
+        try:
+            pending.result = request()
+            return pending.result
+        except Exception as ex:
+            pending.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
+
+    def start(self, key, request):
+        # type: (Hashable, Callable[[], Any]) -> None
+        """Sends a request in a background thread, unless one is pending for the key"""
+        with self._lock:
+            if key in self._pending:
+                return
+        thread = threading.Thread(target=self._run_in_background, args=(key, request))
+        thread.daemon = True
+        thread.start()
+
+    def _run_in_background(self, key, request):
+        # type: (Hashable, Callable[[], Any]) -> None
+        try:
+            self.run(key, request)
+        except Exception as ex:  # pylint:disable=broad-except
+            _LOGGER.warning("Background token request failed: %r", ex)
+
 
 class _ManagedIdentityBase(object):
     """Sans I/O base for managed identity credentials"""
 
+    # a cached token is refreshed in the background once it expires within this many seconds...
+    _refresh_window = 600
+    # ...at most once in this many seconds, as the endpoint may return the same token until it's nearly expired
+    _refresh_interval = 30
+
+    # endpoint availability probe results by endpoint, shared by the credentials of the process
+    _probe_results = {}  # type: Dict[str, bool]
+
     def __init__(self, endpoint, client_cls, config=None, client_id=None, **kwargs):
         # type: (str, Type, Optional[Configuration], Optional[str], Any) -> None
         self._client_id = client_id
         config = config or self.create_config(**kwargs)
         policies = [ContentDecodePolicy(), config.headers_policy, config.retry_policy, config.logging_policy]
-        self._client = client_cls(endpoint, config, policies, **kwargs)
+        self._client = client_cls(endpoint, config, policies, client_id=client_id, **kwargs)
+        self._next_refresh = {}  # type: Dict[Tuple[str, ...], float]
+        if "transport" in kwargs:
+            # requests may not reach the endpoint through a given transport as they do by default
+            self._probe_results = {}
+        self._probe_key = endpoint
+
+    def _get_cached_token(self, scopes):
+        # type: (Tuple[str, ...]) -> Tuple[Optional[AccessToken], bool]
+        """Returns a cached token for `scopes`, if there is one, and whether to refresh it in the background"""
+        token = self._client.get_cached_token(scopes)
+        if not token:
+            return None, False
+        now = time.time()
+        if token.expires_on - now > self._refresh_window or now < self._next_refresh.get(scopes, 0):
+            return token, False
+        self._next_refresh[scopes] = now + self._refresh_interval
+        return token, True
+
+    def _get_probe_result(self):
+        # type: () -> Optional[bool]
+        """Whether the endpoint is available, or None when it hasn't been probed"""
+        return self._probe_results.get(self._probe_key)
+
+    def _set_probe_result(self, error):
+        # type: (Optional[Exception]) -> bool
+        """Records the outcome of an endpoint availability probe, which raised `error` or returned"""
+        # a response a pipeline policy choked on (HttpResponseError) or that couldn't be deserialized
+        # (ClientAuthenticationError) shows the endpoint is listening; anything else is taken to mean it isn't
+        available = error is None or isinstance(error, (ClientAuthenticationError, HttpResponseError))
+        self._probe_results[self._probe_key] = available
+        return available
+
+    @staticmethod
+    def _get_resource(scopes):
+        # type: (Tuple[str, ...]) -> str
+        if len(scopes) != 1:
+            raise ValueError("this credential supports one scope per request")
+        resource = scopes[0]
+        if resource.endswith("/.default"):
+            resource = resource[: -len("/.default")]
+        return resource
+
+    def _get_imds_params(self, scopes):
+        # type: (Tuple[str, ...]) -> Dict[str, str]
+        params = {"api-version": "2018-02-01", "resource": self._get_resource(scopes)}
+        if self._client_id:
+            params["client_id"] = self._client_id
+        return params
 
     @staticmethod
     def create_config(**kwargs):
@@ -77,48 +199,48 @@ class ImdsCredential(_ManagedIdentityBase):
     def __init__(self, config=None, **kwargs):
         # type: (Optional[Configuration], Any) -> None
         super(ImdsCredential, self).__init__(endpoint=Endpoints.IMDS, client_cls=AuthnClient, config=config, **kwargs)
-        self._endpoint_available = None  # type: Optional[bool]
+        self._coalescer = _RequestCoalescer()
 
     def get_token(self, *scopes):
         # type: (*str) -> AccessToken
         """
         Request an access token for `scopes`.
 
+        Concurrent calls for the same scopes share a single request to the endpoint.
+
         :param str scopes: desired scopes for the token
         :rtype: :class:`azure.core.credentials.AccessToken`
         :raises: :class:`azure.core.exceptions.ClientAuthenticationError`
         """
-        if self._endpoint_available is None:
-            # Lacking another way to determine whether the IMDS endpoint is listening,
-            # we send a request it would immediately reject (missing a required header),
-            # setting a short timeout.
-            try:
-                self._client.request_token(scopes, method="GET", connection_timeout=0.3, retry_total=0)
-                self._endpoint_available = True
-            except HttpResponseError:
-                # received a response, choked on it
-                self._endpoint_available = True
-            except Exception:  # pylint:disable=broad-except
-                # if anything else was raised, assume the endpoint is unavailable
-                self._endpoint_available = False
+        endpoint_available = self._get_probe_result()
+        if endpoint_available is None:
+            endpoint_available = self._coalescer.run(_PROBE, lambda: self._probe(scopes))
 
-        if not self._endpoint_available:
+        if not endpoint_available:
             raise ClientAuthenticationError(message="IMDS endpoint unavailable")
 
-        if len(scopes) != 1:
-            raise ValueError("this credential supports one scope per request")
-
-        token = self._client.get_cached_token(scopes)
+        token, refresh = self._get_cached_token(scopes)
         if not token:
-            resource = scopes[0]
-            if resource.endswith("/.default"):
-                resource = resource[: -len("/.default")]
-            params = {"api-version": "2018-02-01", "resource": resource}
-            if self._client_id:
-                params["client_id"] = self._client_id
-            token = self._client.request_token(scopes, method="GET", params=params)
+            token = self._coalescer.run(scopes, lambda: self._request_token(scopes))
+        elif refresh:
+            self._coalescer.start(scopes, lambda: self._request_token(scopes))
         return token
 
+    def _probe(self, scopes):
+        # type: (Tuple[str, ...]) -> bool
+        # Lacking another way to determine whether the IMDS endpoint is listening,
+        # we send a request it would immediately reject (missing a required header),
+        # setting a short timeout.
+        try:
+            self._client.request_token(scopes, method="GET", connection_timeout=0.3, retry_total=0)
+        except Exception as ex:  # pylint:disable=broad-except
+            return self._set_probe_result(ex)
+        return self._set_probe_result(None)
+
+    def _request_token(self, scopes):
+        # type: (Tuple[str, ...]) -> AccessToken
+        return self._client.request_token(scopes, method="GET", params=self._get_imds_params(scopes))
+
 
 class MsiCredential(_ManagedIdentityBase):
     """
@@ -136,12 +258,15 @@ class MsiCredential(_ManagedIdentityBase):
             super(MsiCredential, self).__init__(  # type: ignore
                 endpoint=endpoint, client_cls=AuthnClient, config=config, **kwargs
             )
+            self._coalescer = _RequestCoalescer()
 
     def get_token(self, *scopes):
         # type: (*str) -> AccessToken
         """
         Request an access token for `scopes`.
 
+        Concurrent calls for the same scopes share a single request to the endpoint.
+
         :param str scopes: desired scopes for the token
         :rtype: :class:`azure.core.credentials.AccessToken`
         :raises: :class:`azure.core.exceptions.ClientAuthenticationError`
@@ -150,23 +275,23 @@ class MsiCredential(_ManagedIdentityBase):
         if not self._endpoint_available:
             raise ClientAuthenticationError(message="MSI endpoint unavailable")
 
-        if len(scopes) != 1:
-            raise ValueError("this credential supports only one scope per request")
-
-        token = self._client.get_cached_token(scopes)
+        token, refresh = self._get_cached_token(scopes)
         if not token:
-            resource = scopes[0]
-            if resource.endswith("/.default"):
-                resource = resource[: -len("/.default")]
-            secret = os.environ.get(EnvironmentVariables.MSI_SECRET)
-            if secret:
-                # MSI_ENDPOINT and MSI_SECRET set -> App Service
-                token = self._request_app_service_token(scopes=scopes, resource=resource, secret=secret)
-            else:
-                # only MSI_ENDPOINT set -> legacy-style MSI (Cloud Shell)
-                token = self._request_legacy_token(scopes=scopes, resource=resource)
+            token = self._coalescer.run(scopes, lambda: self._request_token(scopes))
+        elif refresh:
+            self._coalescer.start(scopes, lambda: self._request_token(scopes))
         return token
 
+    def _request_token(self, scopes):
+        # type: (Tuple[str, ...]) -> AccessToken
+        resource = self._get_resource(scopes)
+        secret = os.environ.get(EnvironmentVariables.MSI_SECRET)
+        if secret:
+            # MSI_ENDPOINT and MSI_SECRET set -> App Service
+            return self._request_app_service_token(scopes=scopes, resource=resource, secret=secret)
+        # only MSI_ENDPOINT set -> legacy-style MSI (Cloud Shell)
+        return self._request_legacy_token(scopes=scopes, resource=resource)
+
     def _request_app_service_token(self, scopes, resource, secret):
         params = {"api-version": "2017-09-01", "resource": resource}
         if self._client_id:
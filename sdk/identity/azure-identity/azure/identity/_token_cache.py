@@ -0,0 +1,293 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import contextlib
+import errno
+import json
+import logging
+import os
+import threading
+import time
+
+from azure.core.credentials import AccessToken
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+    import msvcrt
+
+try:
+    from typing import TYPE_CHECKING
+except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from typing import Dict, FrozenSet, Iterable, Iterator, Optional, Set, Tuple
+
+try:
+    _STRING_TYPES = (str, unicode)  # type: ignore
+except NameError:  # Python 3
+    _STRING_TYPES = (str,)  # type: ignore
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".azure", "identity", "token_cache.json")
+
+# how long to wait for another process to release the cache file on Windows, in seconds
+_FILE_LOCK_TIMEOUT = 60
+
+
+def _scope_set(scopes):
+    # type: (Iterable[str]) -> FrozenSet[str]
+    if isinstance(scopes, _STRING_TYPES):
+        # a space-delimited OAuth scope string
+        return frozenset(scopes.split())  # type: ignore
+    return frozenset(scopes)
+
+
+class TokenIndex(object):
+    """Access tokens indexed by scope set.
+
+    A token for a set of scopes is also valid for any subset of them. Rather than scanning every token,
+    lookups try the exact scope set, then only the tokens sharing its least common scope.
+    """
+
+    def __init__(self):
+        self._tokens = {}  # type: Dict[FrozenSet[str], AccessToken]
+        self._by_scope = {}  # type: Dict[str, Set[FrozenSet[str]]]
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def items(self):
+        # type: () -> Iterator[Tuple[FrozenSet[str], AccessToken]]
+        return iter(list(self._tokens.items()))
+
+    def add(self, scopes, token):
+        # type: (Iterable[str], AccessToken) -> None
+        key = _scope_set(scopes)
+        self._tokens[key] = token
+        for scope in key:
+            self._by_scope.setdefault(scope, set()).add(key)
+
+    def find(self, scopes, expires_after):
+        # type: (Iterable[str], int) -> Optional[AccessToken]
+        """Returns a token valid for all of `scopes` which expires after `expires_after`, if there is one"""
+        key = _scope_set(scopes)
+        token = self._tokens.get(key)
+        if token and token.expires_on > expires_after:
+            return token
+        if not key:
+            return None
+        candidates = min((self._by_scope.get(scope, ()) for scope in key), key=len)
+        for candidate in candidates:
+            if key < candidate:
+                token = self._tokens[candidate]
+                if token.expires_on > expires_after:
+                    return token
+        return None
+
+    def remove_expired(self, now):
+        # type: (float) -> None
+        for key, token in self.items():
+            if token.expires_on <= now:
+                del self._tokens[key]
+                for scope in key:
+                    keys = self._by_scope[scope]
+                    keys.discard(key)
+                    if not keys:
+                        del self._by_scope[scope]
+
+
+class PersistentTokenCache(object):
+    """
+    An access token cache stored in a file, which credentials in any number of processes can share.
+
+    A credential uses it when given as its ``token_cache`` keyword argument, for example
+    ``ClientSecretCredential(client_id, secret, tenant_id, token_cache=cache)``. Each credential's tokens
+    are kept apart by authority and client ID. Synchronous credentials also hold an exclusive lock on the
+    cache while they request a token, so that processes starting together request it only once.
+
+    The file is readable only by its owner. Reads are cheap: the file is parsed again only when another
+    instance has written it.
+
+    :param str path: path of the cache file. Defaults to ``~/.azure/identity/token_cache.json``.
+    """
+
+    def __init__(self, path=None):
+        # type: (Optional[str]) -> None
+        self._path = path or DEFAULT_TOKEN_CACHE_PATH
+        self._lock_path = self._path + ".lock"
+        # held while reading or changing the tokens in memory
+        self._state_lock = threading.Lock()
+        # held by the thread holding the file lock, which can take it again
+        self._write_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
+        self._partitions = {}  # type: Dict[str, TokenIndex]
+        self._file_state = None  # type: Optional[Tuple[float, int, int]]
+
+    @property
+    def path(self):
+        # type: () -> str
+        return self._path
+
+    def get_partition(self, name):
+        # type: (str) -> TokenCachePartition
+        return TokenCachePartition(self, name)
+
+    def find(self, partition, scopes, expires_after):
+        # type: (str, Iterable[str], int) -> Optional[AccessToken]
+        with self._state_lock:
+            self._load()
+            index = self._partitions.get(partition)
+            return index.find(scopes, expires_after) if index else None
+
+    def add(self, partition, scopes, token):
+        # type: (str, Iterable[str], AccessToken) -> None
+        with self.lock(), self._state_lock:
+            # other processes may have added tokens since the file was read
+            self._load()
+            self._partitions.setdefault(partition, TokenIndex()).add(scopes, token)
+            self._save()
+
+    @contextlib.contextmanager
+    def lock(self):
+        """Excludes other threads and processes from writing to the cache. Reentrant."""
+        with self._write_lock:
+            if not self._lock_depth:
+                self._acquire_file_lock()
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if not self._lock_depth:
+                    self._release_file_lock()
+
+    def _acquire_file_lock(self):
+        _ensure_directory(self._lock_path)
+        lock_file = open(self._lock_path, "a+")
+        try:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                deadline = time.time() + _FILE_LOCK_TIMEOUT
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except (IOError, OSError) as ex:
+                        # LK_LOCK gives up after 10 seconds while another process holds the lock
+                        if ex.errno not in (errno.EDEADLOCK, errno.EACCES) or time.time() >= deadline:
+                            raise
+        except Exception:
+            lock_file.close()
+            raise
+        self._lock_file = lock_file
+
+    def _release_file_lock(self):
+        lock_file, self._lock_file = self._lock_file, None
+        try:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            lock_file.close()
+
+    def _load(self):
+        """Reads the file, if it has changed since it was last read"""
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            self._partitions = {}
+            self._file_state = None
+            return
+        # the file is replaced rather than written in place, so a new inode means new content
+        file_state = (stat.st_mtime, stat.st_size, stat.st_ino)
+        if file_state == self._file_state:
+            return
+
+        partitions = {}
+        try:
+            with open(self._path, "r") as cache_file:
+                content = json.load(cache_file)
+            for name, entries in content.get("tokens", {}).items():
+                index = partitions[name] = TokenIndex()
+                for entry in entries:
+                    index.add(entry["scopes"], AccessToken(entry["token"], int(entry["expires_on"])))
+        except (IOError, OSError, ValueError, KeyError, TypeError, AttributeError) as ex:
+            # the cache can always be rebuilt, so a corrupt file is treated as empty
+            _LOGGER.warning("Ignoring the content of token cache file '%s': %r", self._path, ex)
+            partitions = {}
+        self._partitions = partitions
+        self._file_state = file_state
+
+    def _save(self):
+        now = time.time()
+        tokens = {}
+        for name, index in self._partitions.items():
+            index.remove_expired(now)
+            if len(index):
+                tokens[name] = [
+                    {"scopes": sorted(scopes), "token": token.token, "expires_on": token.expires_on}
+                    for scopes, token in index.items()
+                ]
+
+        _ensure_directory(self._path)
+        temp_path = "{}.{}.tmp".format(self._path, os.getpid())
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as temp_file:
+            json.dump({"tokens": tokens}, temp_file)
+        _replace(temp_path, self._path)
+
+        stat = os.stat(self._path)
+        self._file_state = (stat.st_mtime, stat.st_size, stat.st_ino)
+
+
+class TokenCachePartition(object):
+    """The tokens of one credential in a :class:`PersistentTokenCache`"""
+
+    def __init__(self, cache, name):
+        # type: (PersistentTokenCache, str) -> None
+        self._cache = cache
+        self._name = name
+
+    def add(self, scopes, token):
+        # type: (Iterable[str], AccessToken) -> None
+        self._cache.add(self._name, scopes, token)
+
+    def find(self, scopes, expires_after):
+        # type: (Iterable[str], int) -> Optional[AccessToken]
+        return self._cache.find(self._name, scopes, expires_after)
+
+    def lock(self):
+        return self._cache.lock()
+
+
+def _ensure_directory(path):
+    # type: (str) -> None
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        try:
+            os.makedirs(directory, 0o700)
+        except OSError:
+            # another process may have created it
+            if not os.path.isdir(directory):
+                raise
+
+
+def _replace(source, destination):
+    # type: (str, str) -> None
+    try:
+        os.replace(source, destination)  # type: ignore
+    except AttributeError:  # Python 2
+        if os.name == "nt" and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
@@ -2,17 +2,58 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
+import functools
+import logging
 import os
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
 
 from azure.core import Configuration
 from azure.core.credentials import AccessToken
-from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
-from azure.core.pipeline.policies import ContentDecodePolicy, HeadersPolicy, NetworkTraceLoggingPolicy, AsyncRetryPolicy
+from azure.core.exceptions import ClientAuthenticationError
+from azure.core.pipeline.policies import AsyncRetryPolicy
 
 from ._authn_client import AsyncAuthnClient
 from ..constants import Endpoints, EnvironmentVariables
-from .._internal import _ManagedIdentityBase
+from .._internal import _ManagedIdentityBase, _PROBE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _AsyncRequestCoalescer:
+    """Sends one request at a time for each key. Callers asking for a key while its request is
+    pending await that request, and share its result."""
+
+    def __init__(self) -> None:
+        self._pending = {}  # type: Dict[Hashable, asyncio.Future]
+
+    async def run(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> Any:
+        # shielded, so that a caller being cancelled doesn't cancel the request the others are waiting for
+        return await asyncio.shield(self._send(key, request))
+
+    def start(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> None:
+        """Sends a request in a background task, unless one is pending for the key"""
+        if key not in self._pending:
+            self._send(key, request).add_done_callback(self._log_background_error)
+
+    def _send(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = asyncio.ensure_future(request())
+            future.add_done_callback(functools.partial(self._on_done, key))
+        return future
+
+    def _on_done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if not future.cancelled():
+            # retrieve the exception, so that asyncio doesn't complain when no caller is left to await it
+            future.exception()
+
+    @staticmethod
+    def _log_background_error(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception():
+            _LOGGER.warning("Background token request failed: %r", future.exception())
 
 
 class _AsyncManagedIdentityBase(_ManagedIdentityBase):
@@ -39,48 +80,45 @@ class ImdsCredential(_AsyncManagedIdentityBase):
 
     def __init__(self, config: Optional[Configuration] = None, **kwargs: Any) -> None:
         super().__init__(endpoint=Endpoints.IMDS, config=config, **kwargs)
-        self._endpoint_available = None  # type: Optional[bool]
+        self._coalescer = _AsyncRequestCoalescer()
 
     async def get_token(self, *scopes: str) -> AccessToken:
         """
         Asynchronously request an access token for `scopes`.
 
+        Concurrent calls for the same scopes share a single request to the endpoint.
+
         :param str scopes: desired scopes for the token
         :rtype: :class:`azure.core.credentials.AccessToken`
         :raises: :class:`azure.core.exceptions.ClientAuthenticationError`
         """
-        if self._endpoint_available is None:
-            # Lacking another way to determine whether the IMDS endpoint is listening,
-            # we send a request it would immediately reject (missing a required header),
-            # setting a short timeout.
-            try:
-                await self._client.request_token(scopes, method="GET", connection_timeout=0.3, retry_total=0)
-                self._endpoint_available = True
-            except (ClientAuthenticationError, HttpResponseError):
-                # received a response a pipeline policy choked on (HttpResponseError)
-                # or that couldn't be deserialized by AuthnClient (AuthenticationError)
-                self._endpoint_available = True
-            except Exception:  # pylint:disable=broad-except
-                # if anything else was raised, assume the endpoint is unavailable
-                self._endpoint_available = False
+        endpoint_available = self._get_probe_result()
+        if endpoint_available is None:
+            endpoint_available = await self._coalescer.run(_PROBE, lambda: self._probe(scopes))
 
-        if not self._endpoint_available:
+        if not endpoint_available:
             raise ClientAuthenticationError(message="IMDS endpoint unavailable")
 
-        if len(scopes) != 1:
-            raise ValueError("this credential supports one scope per request")
-
-        token = self._client.get_cached_token(scopes)
+        token, refresh = self._get_cached_token(scopes)
         if not token:
-            resource = scopes[0]
-            if resource.endswith("/.default"):
-                resource = resource[: -len("/.default")]
-            params = {"api-version": "2018-02-01", "resource": resource}
-            if self._client_id:
-                params["client_id"] = self._client_id
-            token = await self._client.request_token(scopes, method="GET", params=params)
+            token = await self._coalescer.run(scopes, lambda: self._request_token(scopes))
+        elif refresh:
+            self._coalescer.start(scopes, lambda: self._request_token(scopes))
         return token
 
+    async def _probe(self, scopes: Tuple[str, ...]) -> bool:
+        # Lacking another way to determine whether the IMDS endpoint is listening,
+        # we send a request it would immediately reject (missing a required header),
+        # setting a short timeout.
+        try:
+            await self._client.request_token(scopes, method="GET", connection_timeout=0.3, retry_total=0)
+        except Exception as ex:  # pylint:disable=broad-except
+            return self._set_probe_result(ex)
+        return self._set_probe_result(None)
+
+    async def _request_token(self, scopes: Tuple[str, ...]) -> AccessToken:
+        return await self._client.request_token(scopes, method="GET", params=self._get_imds_params(scopes))
+
 
 class MsiCredential(_AsyncManagedIdentityBase):
     """
@@ -95,11 +133,14 @@ class MsiCredential(_AsyncManagedIdentityBase):
         self._endpoint_available = endpoint is not None
         if self._endpoint_available:
             super().__init__(endpoint=endpoint, config=config, **kwargs)  # type: ignore
+            self._coalescer = _AsyncRequestCoalescer()
 
     async def get_token(self, *scopes: str) -> AccessToken:
         """
         Asynchronously request an access token for `scopes`.
 
+        Concurrent calls for the same scopes share a single request to the endpoint.
+
         :param str scopes: desired scopes for the token
         :rtype: :class:`azure.core.credentials.AccessToken`
         :raises: :class:`azure.core.exceptions.ClientAuthenticationError`
@@ -107,24 +148,22 @@ class MsiCredential(_AsyncManagedIdentityBase):
         if not self._endpoint_available:
             raise ClientAuthenticationError(message="MSI endpoint unavailable")
 
-        if len(scopes) != 1:
-            raise ValueError("this credential supports only one scope per request")
-
-        token = self._client.get_cached_token(scopes)
+        token, refresh = self._get_cached_token(scopes)
         if not token:
-            resource = scopes[0]
-            if resource.endswith("/.default"):
-                resource = resource[: -len("/.default")]
-
-            secret = os.environ.get(EnvironmentVariables.MSI_SECRET)
-            if secret:
-                # MSI_ENDPOINT and MSI_SECRET set -> App Service
-                token = await self._request_app_service_token(scopes=scopes, resource=resource, secret=secret)
-            else:
-                # only MSI_ENDPOINT set -> legacy-style MSI (Cloud Shell)
-                token = await self._request_legacy_token(scopes=scopes, resource=resource)
+            token = await self._coalescer.run(scopes, lambda: self._request_token(scopes))
+        elif refresh:
+            self._coalescer.start(scopes, lambda: self._request_token(scopes))
         return token
 
+    async def _request_token(self, scopes: Tuple[str, ...]) -> AccessToken:
+        resource = self._get_resource(scopes)
+        secret = os.environ.get(EnvironmentVariables.MSI_SECRET)
+        if secret:
+            # MSI_ENDPOINT and MSI_SECRET set -> App Service
+            return await self._request_app_service_token(scopes=scopes, resource=resource, secret=secret)
+        # only MSI_ENDPOINT set -> legacy-style MSI (Cloud Shell)
+        return await self._request_legacy_token(scopes=scopes, resource=resource)
+
     async def _request_app_service_token(self, scopes, resource, secret):
         params = {"api-version": "2017-09-01", "resource": resource}
         if self._client_id:
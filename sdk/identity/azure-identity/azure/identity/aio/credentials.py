@@ -31,6 +31,8 @@ class ClientSecretCredential(ClientSecretCredentialBase):
     :param str tenant_id: ID of the service principal's tenant. Also called its 'directory' ID.
     :param config: optional configuration for the underlying HTTP pipeline
     :type config: :class:`azure.core.configuration`
+    :param token_cache: optional cache to share tokens with other credentials and processes
+    :type token_cache: :class:`azure.identity.PersistentTokenCache`
     """
 
     def __init__(
@@ -42,7 +44,9 @@ class ClientSecretCredential(ClientSecretCredentialBase):
         **kwargs: Mapping[str, Any]
     ) -> None:
         super(ClientSecretCredential, self).__init__(client_id, secret, tenant_id, **kwargs)
-        self._client = AsyncAuthnClient(Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, **kwargs)
+        self._client = AsyncAuthnClient(
+            Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, client_id=client_id, **kwargs
+        )
 
     async def get_token(self, *scopes: str) -> AccessToken:
         """
@@ -68,6 +72,8 @@ class CertificateCredential(CertificateCredentialBase):
     :param str certificate_path: path to a PEM-encoded certificate file including the private key
     :param config: optional configuration for the underlying HTTP pipeline
     :type config: :class:`azure.core.configuration`
+    :param token_cache: optional cache to share tokens with other credentials and processes
+    :type token_cache: :class:`azure.identity.PersistentTokenCache`
     """
 
     def __init__(
@@ -79,7 +85,9 @@ class CertificateCredential(CertificateCredentialBase):
         **kwargs: Mapping[str, Any]
     ) -> None:
         super(CertificateCredential, self).__init__(client_id, tenant_id, certificate_path, **kwargs)
-        self._client = AsyncAuthnClient(Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, **kwargs)
+        self._client = AsyncAuthnClient(
+            Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, client_id=client_id, **kwargs
+        )
 
     async def get_token(self, *scopes: str) -> AccessToken:
         """
@@ -153,6 +161,8 @@ class ManagedIdentityCredential(object):
     :param str client_id: Optional client ID of a user-assigned identity. Leave unspecified to use a system-assigned identity.
     :param config: optional configuration for the underlying HTTP pipeline
     :type config: :class:`azure.core.configuration`
+    :param token_cache: optional cache to share tokens with other credentials and processes
+    :type token_cache: :class:`azure.identity.PersistentTokenCache`
     """
 
     def __new__(cls, *args, **kwargs):
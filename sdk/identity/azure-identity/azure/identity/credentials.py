@@ -39,12 +39,16 @@ class ClientSecretCredential(ClientSecretCredentialBase):
     :param str tenant_id: ID of the service principal's tenant. Also called its 'directory' ID.
     :param config: optional configuration for the underlying HTTP pipeline
     :type config: :class:`azure.core.configuration`
+    :param token_cache: optional cache to share tokens with other credentials and processes
+    :type token_cache: :class:`azure.identity.PersistentTokenCache`
     """
 
     def __init__(self, client_id, secret, tenant_id, config=None, **kwargs):
         # type: (str, str, str, Optional[Configuration], Mapping[str, Any]) -> None
         super(ClientSecretCredential, self).__init__(client_id, secret, tenant_id, **kwargs)
-        self._client = AuthnClient(Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, **kwargs)
+        self._client = AuthnClient(
+            Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, client_id=client_id, **kwargs
+        )
 
     def get_token(self, *scopes):
         # type (*str) -> AccessToken
@@ -71,11 +75,15 @@ class CertificateCredential(CertificateCredentialBase):
     :param str certificate_path: path to a PEM-encoded certificate file including the private key
     :param config: optional configuration for the underlying HTTP pipeline
     :type config: :class:`azure.core.configuration`
+    :param token_cache: optional cache to share tokens with other credentials and processes
+    :type token_cache: :class:`azure.identity.PersistentTokenCache`
     """
 
     def __init__(self, client_id, tenant_id, certificate_path, config=None, **kwargs):
         # type: (str, str, str, Optional[Configuration], Mapping[str, Any]) -> None
-        self._client = AuthnClient(Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, **kwargs)
+        self._client = AuthnClient(
+            Endpoints.AAD_OAUTH2_V2_FORMAT.format(tenant_id), config, client_id=client_id, **kwargs
+        )
         super(CertificateCredential, self).__init__(client_id, tenant_id, certificate_path, **kwargs)
 
     def get_token(self, *scopes):
@@ -153,6 +161,8 @@ class ManagedIdentityCredential(object):
     :param str client_id: Optional client ID of a user-assigned identity. Leave unspecified to use a system-assigned identity.
     :param config: optional configuration for the underlying HTTP pipeline
     :type config: :class:`azure.core.configuration`
+    :param token_cache: optional cache to share tokens with other credentials and processes
+    :type token_cache: :class:`azure.identity.PersistentTokenCache`
     """
 
     def __new__(cls, *args, **kwargs):
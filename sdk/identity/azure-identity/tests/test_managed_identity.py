@@ -2,6 +2,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import threading
 import time
 
 try:
@@ -9,8 +10,11 @@ try:
 except ImportError:  # python < 3.3
     import mock  # type: ignore
 
+import pytest
 from azure.core.credentials import AccessToken
+from azure.core.exceptions import ClientAuthenticationError
 from azure.identity import ManagedIdentityCredential
+from azure.identity._internal import ImdsCredential, _ManagedIdentityBase
 from azure.identity.constants import Endpoints, EnvironmentVariables
 
 
@@ -230,3 +234,85 @@ def test_imds_user_assigned_identity():
 
     token = ManagedIdentityCredential(client_id=client_id, transport=transport).get_token(scope)
     assert token == expected_token
+
+
+def imds_token_payload(access_token, expires_in):
+    return {
+        "access_token": access_token,
+        "expires_in": expires_in,
+        "expires_on": int(time.time()) + expires_in,
+        "resource": "scope",
+        "token_type": "Bearer",
+    }
+
+
+def test_imds_coalesces_requests():
+    """concurrent calls to get_token should share one probe and one token request"""
+    responses = [
+        mock_response(status_code=400, json_payload={"error": "this is an error message"}),
+        mock_response(json_payload=imds_token_payload("token", 3600)),
+    ]
+
+    def send(*_, **__):
+        time.sleep(0.05)
+        return responses.pop(0)
+
+    transport = mock.Mock(send=mock.Mock(side_effect=send))
+    credential = ImdsCredential(transport=transport)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(credential.get_token("scope"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert transport.send.call_count == 2
+    assert [token.token for token in tokens] == ["token"] * 8
+
+
+def test_imds_probe_result_shared():
+    """credentials using the default transport should share the outcome of the endpoint availability probe"""
+    transport = mock.Mock(
+        send=mock.Mock(return_value=mock_response(status_code=400, json_payload={"error": "this is an error"}))
+    )
+    with mock.patch.object(_ManagedIdentityBase, "_probe_results", {}):
+        with mock.patch("azure.identity._authn_client.RequestsTransport", return_value=transport):
+            for _ in range(3):
+                with pytest.raises(ClientAuthenticationError):
+                    # the probe succeeds, the token requests get error responses
+                    ImdsCredential().get_token("scope")
+        assert _ManagedIdentityBase._probe_results == {Endpoints.IMDS: True}
+
+    # a probe request, then one token request per credential
+    assert transport.send.call_count == 4
+
+
+def test_imds_refreshes_token_ahead_of_expiry():
+    """a token close to expiry should be refreshed in the background, while get_token returns it"""
+    refreshed = threading.Event()
+    responses = [
+        mock_response(status_code=400, json_payload={"error": "this is an error message"}),
+        mock_response(json_payload=imds_token_payload("expiring", 400)),
+        mock_response(json_payload=imds_token_payload("new", 3600)),
+    ]
+
+    def send(*_, **__):
+        response = responses.pop(0)
+        if not responses:
+            refreshed.set()
+        return response
+
+    transport = mock.Mock(send=mock.Mock(side_effect=send))
+    credential = ImdsCredential(transport=transport)
+    assert credential.get_token("scope").token == "expiring"
+
+    # the token expires within the refresh window -> get_token returns it and starts a refresh
+    assert credential.get_token("scope").token == "expiring"
+    assert refreshed.wait(5)
+    for _ in range(50):
+        token = credential.get_token("scope")
+        if token.token == "new":
+            break
+        time.sleep(0.01)
+    assert token.token == "new"
+    assert transport.send.call_count == 3
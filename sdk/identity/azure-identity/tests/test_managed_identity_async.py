@@ -2,11 +2,13 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
 import time
 from unittest import mock
 
 from azure.core.credentials import AccessToken
 from azure.identity.aio import ManagedIdentityCredential
+from azure.identity.aio._internal import ImdsCredential
 from azure.identity.constants import Endpoints, EnvironmentVariables
 import pytest
 
@@ -232,3 +234,82 @@ async def test_imds_user_assigned_identity():
 
     token = await ManagedIdentityCredential(client_id=client_id, transport=transport).get_token(scope)
     assert token == expected_token
+
+
+def imds_token_payload(access_token, expires_in):
+    return {
+        "access_token": access_token,
+        "expires_in": expires_in,
+        "expires_on": int(time.time()) + expires_in,
+        "resource": "scope",
+        "token_type": "Bearer",
+    }
+
+
+@pytest.mark.asyncio
+async def test_imds_coalesces_requests():
+    """concurrent calls to get_token should share one probe and one token request"""
+    responses = [
+        mock_response(status_code=400, json_payload={"error": "this is an error message"}),
+        mock_response(json_payload=imds_token_payload("token", 3600)),
+    ]
+    send_count = 0
+
+    async def send(*_, **__):
+        nonlocal send_count
+        send_count += 1
+        await asyncio.sleep(0.01)
+        return responses.pop(0)
+
+    credential = ImdsCredential(transport=mock.Mock(send=send))
+    tokens = await asyncio.gather(*[credential.get_token("scope") for _ in range(8)])
+
+    assert send_count == 2
+    assert [token.token for token in tokens] == ["token"] * 8
+
+
+@pytest.mark.asyncio
+async def test_imds_coalesced_request_survives_cancellation():
+    """cancelling one caller shouldn't cancel the request other callers are waiting for"""
+    responses = [
+        mock_response(status_code=400, json_payload={"error": "this is an error message"}),
+        mock_response(json_payload=imds_token_payload("token", 3600)),
+    ]
+
+    async def send(*_, **__):
+        await asyncio.sleep(0.01)
+        return responses.pop(0)
+
+    credential = ImdsCredential(transport=mock.Mock(send=send))
+    first = asyncio.ensure_future(credential.get_token("scope"))
+    second = asyncio.ensure_future(credential.get_token("scope"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    token = await second
+    assert token.token == "token"
+
+
+@pytest.mark.asyncio
+async def test_imds_refreshes_token_ahead_of_expiry():
+    """a token close to expiry should be refreshed in the background, while get_token returns it"""
+    responses = [
+        mock_response(status_code=400, json_payload={"error": "this is an error message"}),
+        mock_response(json_payload=imds_token_payload("expiring", 400)),
+        mock_response(json_payload=imds_token_payload("new", 3600)),
+    ]
+
+    async def send(*_, **__):
+        return responses.pop(0)
+
+    credential = ImdsCredential(transport=mock.Mock(send=send))
+    assert (await credential.get_token("scope")).token == "expiring"
+
+    # the token expires within the refresh window -> get_token returns it and starts a refresh
+    assert (await credential.get_token("scope")).token == "expiring"
+    for _ in range(50):
+        await asyncio.sleep(0)
+        if not responses:
+            break
+    assert (await credential.get_token("scope")).token == "new"
+    assert not responses
@@ -0,0 +1,190 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import errno
+import os
+import stat
+import threading
+import time
+
+try:
+    from unittest.mock import Mock, patch
+except ImportError:  # python < 3.3
+    from mock import Mock, patch  # type: ignore
+
+import pytest
+from azure.core.credentials import AccessToken
+from azure.identity import ClientSecretCredential, PersistentTokenCache
+from azure.identity import _token_cache
+from azure.identity._token_cache import TokenIndex
+
+from helpers import mock_response
+
+
+def test_token_index_scopes():
+    index = TokenIndex()
+    index.add(["a", "b"], AccessToken("ab", 100))
+    index.add(["c"], AccessToken("c", 100))
+
+    assert index.find(["a", "b"], 0).token == "ab"
+    assert index.find(["b", "a"], 0).token == "ab"
+    assert index.find(["a"], 0).token == "ab"
+    assert index.find("a b", 0).token == "ab"
+    assert index.find(["c"], 0).token == "c"
+    assert index.find(["a", "c"], 0) is None
+    assert index.find(["d"], 0) is None
+
+    # tokens expiring too soon aren't returned
+    assert index.find(["a"], 100) is None
+    index.add(["a"], AccessToken("a", 200))
+    assert index.find(["a"], 100).token == "a"
+
+    index.remove_expired(150)
+    assert len(index) == 1
+    assert index.find(["b"], 0) is None
+
+
+def test_persistent_cache_shared(tmpdir):
+    path = str(tmpdir.join("cache.json"))
+    expires_on = int(time.time()) + 3600
+    first = PersistentTokenCache(path)
+    second = PersistentTokenCache(path)
+
+    first.add("partition", ["scope"], AccessToken("token", expires_on))
+    assert second.find("partition", ["scope"], 0) == AccessToken("token", expires_on)
+    assert second.find("other partition", ["scope"], 0) is None
+
+    # each instance sees the tokens the other adds
+    second.add("partition", ["other scope"], AccessToken("other token", expires_on))
+    assert first.find("partition", ["scope"], 0).token == "token"
+    assert first.find("partition", ["other scope"], 0).token == "other token"
+
+    if os.name != "nt":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_persistent_cache_drops_expired_tokens(tmpdir):
+    path = str(tmpdir.join("cache.json"))
+    cache = PersistentTokenCache(path)
+    cache.add("partition", ["expired"], AccessToken("expired", int(time.time()) - 1))
+    cache.add("partition", ["scope"], AccessToken("token", int(time.time()) + 3600))
+
+    assert PersistentTokenCache(path).find("partition", ["expired"], 0) is None
+    assert PersistentTokenCache(path).find("partition", ["scope"], 0).token == "token"
+
+
+def test_persistent_cache_corrupt_file(tmpdir):
+    cache_file = tmpdir.join("cache.json")
+    cache_file.write("not json")
+    cache = PersistentTokenCache(str(cache_file))
+    assert cache.find("partition", ["scope"], 0) is None
+
+    cache.add("partition", ["scope"], AccessToken("token", int(time.time()) + 3600))
+    assert PersistentTokenCache(str(cache_file)).find("partition", ["scope"], 0).token == "token"
+
+
+def test_persistent_cache_lock(tmpdir):
+    """while one instance holds the lock, others can read but not write"""
+    path = str(tmpdir.join("cache.json"))
+    first = PersistentTokenCache(path)
+    second = PersistentTokenCache(path)
+    first.add("partition", ["a"], AccessToken("a", int(time.time()) + 3600))
+    added = threading.Event()
+
+    def add():
+        second.add("partition", ["b"], AccessToken("b", int(time.time()) + 3600))
+        added.set()
+
+    with first.lock():
+        thread = threading.Thread(target=add)
+        thread.start()
+        assert not added.wait(0.2)
+        assert second.find("partition", ["a"], 0).token == "a"
+        # the lock is reentrant
+        first.add("partition", ["c"], AccessToken("c", int(time.time()) + 3600))
+
+    thread.join(5)
+    assert added.is_set()
+    for scope in ("a", "b", "c"):
+        assert first.find("partition", [scope], 0).token == scope
+
+
+def test_persistent_cache_lock_windows(tmpdir):
+    """on Windows, locking retries while another process holds the lock, within a time limit"""
+    cache = PersistentTokenCache(str(tmpdir.join("cache.json")))
+    contended = OSError(errno.EDEADLOCK, "Resource deadlock avoided")
+    msvcrt = Mock(LK_LOCK=1, LK_UNLCK=0)
+
+    with patch.object(_token_cache, "fcntl", None), patch.object(_token_cache, "msvcrt", msvcrt, create=True):
+        msvcrt.locking.side_effect = [contended, OSError(errno.EACCES, "Permission denied"), None, None]
+        with cache.lock():
+            assert msvcrt.locking.call_count == 3
+        assert msvcrt.locking.call_args[0][1] == msvcrt.LK_UNLCK
+
+        # other errors aren't retried
+        msvcrt.locking.reset_mock()
+        msvcrt.locking.side_effect = OSError(errno.EBADF, "Bad file descriptor")
+        with pytest.raises(OSError) as ex:
+            with cache.lock():
+                pass
+        assert ex.value.errno == errno.EBADF
+        assert msvcrt.locking.call_count == 1
+
+        # nor is contention beyond the time limit
+        msvcrt.locking.reset_mock()
+        msvcrt.locking.side_effect = contended
+        with patch.object(_token_cache, "_FILE_LOCK_TIMEOUT", 0):
+            with pytest.raises(OSError) as ex:
+                with cache.lock():
+                    pass
+        assert ex.value is contended
+        assert msvcrt.locking.call_count == 1
+
+def test_credentials_share_cache(tmpdir):
+    cache = PersistentTokenCache(str(tmpdir.join("cache.json")))
+    payload = {"access_token": "token", "expires_in": 3600, "token_type": "Bearer"}
+    transport = Mock(send=Mock(return_value=mock_response(json_payload=payload)))
+
+    credential = ClientSecretCredential("client-id", "secret", "tenant-id", transport=transport, token_cache=cache)
+    assert credential.get_token("scope").token == "token"
+    assert transport.send.call_count == 1
+
+    # a new credential for the same client gets the token from the cache, even in another process
+    other_cache = PersistentTokenCache(cache.path)
+    credential = ClientSecretCredential(
+        "client-id", "secret", "tenant-id", transport=transport, token_cache=other_cache
+    )
+    assert credential.get_token("scope").token == "token"
+    assert transport.send.call_count == 1
+
+    # credentials for other clients or tenants don't share tokens
+    for client_id, tenant_id in (("other-client-id", "tenant-id"), ("client-id", "other-tenant-id")):
+        credential = ClientSecretCredential(client_id, "secret", tenant_id, transport=transport, token_cache=cache)
+        credential.get_token("scope")
+    assert transport.send.call_count == 3
+
+
+def test_concurrent_requests_share_token(tmpdir):
+    """credentials sharing a cache should request a token once, when they need it at the same time"""
+    path = str(tmpdir.join("cache.json"))
+    payload = {"access_token": "token", "expires_in": 3600, "token_type": "Bearer"}
+
+    def send(*_, **__):
+        time.sleep(0.05)
+        return mock_response(json_payload=payload)
+
+    transport = Mock(send=Mock(side_effect=send))
+    credentials = [
+        ClientSecretCredential(
+            "client-id", "secret", "tenant-id", transport=transport, token_cache=PersistentTokenCache(path)
+        )
+        for _ in range(4)
+    ]
+    threads = [threading.Thread(target=credential.get_token, args=("scope",)) for credential in credentials]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert transport.send.call_count == 1
@@ -7,7 +7,8 @@ from datetime import datetime
 
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 
-from ._internal import _KeyVaultClientBase
+from ._crypto import CryptographyClient
+from ._internal import _KeyVaultClientBase, _prefetch_pages
 from ._models import Key, KeyBase, DeletedKey, KeyOperationResult
 
 
@@ -339,7 +340,7 @@ class KeyClient(_KeyVaultClientBase):
         """
         max_page_size = kwargs.get("max_page_size", None)
         pages = self._client.get_deleted_keys(self._vault_url, maxresults=max_page_size, **kwargs)
-        return (DeletedKey._from_deleted_key_item(item) for item in pages)
+        return (DeletedKey._from_deleted_key_item(item) for item in _prefetch_pages(pages))
 
     def list_keys(self, **kwargs):
         # type: (Mapping[str, Any]) -> Generator[KeyBase]
@@ -366,7 +367,7 @@ class KeyClient(_KeyVaultClientBase):
         """
         max_page_size = kwargs.get("max_page_size", None)
         pages = self._client.get_keys(self._vault_url, maxresults=max_page_size, **kwargs)
-        return (KeyBase._from_key_item(item) for item in pages)
+        return (KeyBase._from_key_item(item) for item in _prefetch_pages(pages))
 
     def list_key_versions(self, name, **kwargs):
         # type: (str, Mapping[str, Any]) -> Generator[KeyBase]
@@ -391,7 +392,7 @@ class KeyClient(_KeyVaultClientBase):
         """
         max_page_size = kwargs.get("max_page_size", None)
         pages = self._client.get_key_versions(self._vault_url, name, maxresults=max_page_size, **kwargs)
-        return (KeyBase._from_key_item(item) for item in pages)
+        return (KeyBase._from_key_item(item) for item in _prefetch_pages(pages))
 
     def purge_deleted_key(self, name, **kwargs):
         # type: (str, Mapping[str, Any]) -> None
@@ -678,3 +679,14 @@ class KeyClient(_KeyVaultClientBase):
             self.vault_url, name, key_version=version, algorithm=algorithm, value=value, **kwargs
         )
         return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def get_cryptography_client(self, name, version=None):
+        # type: (str, Optional[str]) -> CryptographyClient
+        """Gets a client for cryptographic operations with a key. The client performs public-key operations
+        locally when possible.
+
+        :param str name: The name of the key
+        :param str version: (optional) The version of the key. Defaults to the latest version.
+        :rtype: ~azure.keyvault.keys.CryptographyClient
+        """
+        return CryptographyClient(self, name, version)
@@ -0,0 +1,282 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import binascii
+import calendar
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ._models import KeyOperationResult
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa, utils
+except ImportError:
+    # without cryptography, every operation is performed by Key Vault
+    default_backend = None  # type: ignore
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from typing import Any, Mapping, Optional
+    from ._client import KeyClient
+    from ._generated.v7_0 import models
+    from ._models import Key
+
+
+def _bytes_to_int(value):
+    # type: (bytes) -> int
+    return int(binascii.hexlify(value), 16)
+
+
+if default_backend:
+    _ENCRYPTION_PADDING = {
+        "RSA-OAEP": lambda: padding.OAEP(mgf=padding.MGF1(hashes.SHA1()), algorithm=hashes.SHA1(), label=None),
+        "RSA-OAEP-256": lambda: padding.OAEP(
+            mgf=padding.MGF1(hashes.SHA256()), algorithm=hashes.SHA256(), label=None
+        ),
+        "RSA1_5": padding.PKCS1v15,
+    }
+    _SIGNATURE_HASH = {
+        "PS256": hashes.SHA256,
+        "PS384": hashes.SHA384,
+        "PS512": hashes.SHA512,
+        "RS256": hashes.SHA256,
+        "RS384": hashes.SHA384,
+        "RS512": hashes.SHA512,
+        "ES256": hashes.SHA256,
+        "ES384": hashes.SHA384,
+        "ES512": hashes.SHA512,
+        "ES256K": hashes.SHA256,
+    }
+    _CURVES = {"P-256": ec.SECP256R1, "P-384": ec.SECP384R1, "P-521": ec.SECP521R1, "P-256K": ec.SECP256K1}
+
+
+class _LocalCryptoProvider(object):
+    """Performs the public-key operations of an RSA or EC key"""
+
+    def __init__(self, public_key, key_ops):
+        self._public_key = public_key
+        self._key_ops = frozenset(key_ops or ())
+
+    @classmethod
+    def from_jwk(cls, jwk):
+        # type: (models.JsonWebKey) -> Optional[_LocalCryptoProvider]
+        """Returns a provider for the key, or None when its public-key operations can't be performed locally"""
+        if not default_backend:
+            return None
+        kty = jwk.kty or ""
+        if kty.startswith("RSA") and jwk.n and jwk.e:
+            numbers = rsa.RSAPublicNumbers(_bytes_to_int(jwk.e), _bytes_to_int(jwk.n))
+            return cls(numbers.public_key(default_backend()), jwk.key_ops)
+        if kty.startswith("EC") and jwk.crv in _CURVES and jwk.x and jwk.y:
+            numbers = ec.EllipticCurvePublicNumbers(_bytes_to_int(jwk.x), _bytes_to_int(jwk.y), _CURVES[jwk.crv]())
+            return cls(numbers.public_key(default_backend()), jwk.key_ops)
+        return None
+
+    def supports(self, operation, algorithm):
+        # type: (str, str) -> bool
+        if operation not in self._key_ops:
+            # let Key Vault refuse the operation
+            return False
+        if operation in ("encrypt", "wrapKey"):
+            return isinstance(self._public_key, rsa.RSAPublicKey) and algorithm in _ENCRYPTION_PADDING
+        if operation == "verify":
+            if isinstance(self._public_key, rsa.RSAPublicKey):
+                return algorithm in _SIGNATURE_HASH and algorithm[0] in "PR"
+            return algorithm in _SIGNATURE_HASH and algorithm.startswith("ES")
+        return False
+
+    def encrypt(self, algorithm, plaintext):
+        # type: (str, bytes) -> bytes
+        return self._public_key.encrypt(plaintext, _ENCRYPTION_PADDING[algorithm]())
+
+    def verify(self, algorithm, digest, signature):
+        # type: (str, bytes, bytes) -> bool
+        hash_algorithm = _SIGNATURE_HASH[algorithm]()
+        prehashed = utils.Prehashed(hash_algorithm)
+        try:
+            if algorithm.startswith("ES"):
+                # Key Vault's signature is R and S concatenated, cryptography expects them DER-encoded
+                half = len(signature) // 2
+                signature = utils.encode_dss_signature(
+                    _bytes_to_int(signature[:half]), _bytes_to_int(signature[half:])
+                )
+                self._public_key.verify(signature, digest, ec.ECDSA(prehashed))
+            elif algorithm.startswith("PS"):
+                pss = padding.PSS(mgf=padding.MGF1(hash_algorithm), salt_length=hash_algorithm.digest_size)
+                self._public_key.verify(signature, digest, pss, prehashed)
+            else:
+                self._public_key.verify(signature, digest, padding.PKCS1v15(), prehashed)
+        except (InvalidSignature, ValueError):
+            return False
+        return True
+
+
+def _is_usable(key):
+    # type: (Key) -> bool
+    """Whether Key Vault would perform operations with the key now"""
+    if key.enabled is False:
+        return False
+    now = time.time()
+    if key.not_before and calendar.timegm(key.not_before.utctimetuple()) > now:
+        return False
+    if key.expires and calendar.timegm(key.expires.utctimetuple()) <= now:
+        return False
+    return True
+
+
+class CryptographyClient(object):
+    """Performs cryptographic operations with a Key Vault key.
+
+    The client gets the key from the vault once, then performs operations requiring only the public part of an
+    RSA or EC key locally: encrypting, wrapping keys and verifying signatures. Operations requiring the private
+    key, symmetric keys, and any operation when the `cryptography` package isn't installed, are performed by Key
+    Vault. Every operation uses the version of the key the client got, even when that isn't the latest.
+
+    The key is cached for the client's lifetime, so local operations don't see changes to the key's attributes,
+    for example a disabled key. Get a new client to see them.
+
+    :param key_client: The client to get the key and perform remote operations with
+    :type key_client: ~azure.keyvault.keys.KeyClient
+    :param str name: The name of the key
+    :param str version: (optional) The version of the key. Defaults to the latest version.
+
+    Example:
+        .. code-block:: python
+
+            crypto_client = key_client.get_cryptography_client("key-name")
+            wrapped = crypto_client.wrap_key("RSA-OAEP", key_bytes)  # performed locally
+            unwrapped = crypto_client.unwrap_key("RSA-OAEP", wrapped.value)  # performed by Key Vault
+    """
+
+    # pylint:disable=protected-access
+
+    def __init__(self, key_client, name, version=None):
+        # type: (KeyClient, str, Optional[str]) -> None
+        self._key_client = key_client
+        self._name = name
+        self._version = version or ""
+        self._key = None  # type: Optional[Key]
+        self._provider = None  # type: Optional[_LocalCryptoProvider]
+        self._lock = threading.Lock()
+
+    def get_key(self, **kwargs):
+        # type: (Mapping[str, Any]) -> Key
+        """Gets the client's key, from the vault the first time it's called.
+
+        :rtype: ~azure.keyvault.keys._models.Key
+        """
+        if self._key is None:
+            with self._lock:
+                if self._key is None:
+                    key = self._key_client.get_key(self._name, self._version, **kwargs)
+                    self._provider = _LocalCryptoProvider.from_jwk(key.key_material)
+                    self._key = key
+        return self._key
+
+    def _local_provider(self, key, operation, algorithm):
+        # type: (Key, str, str) -> Optional[_LocalCryptoProvider]
+        if self._provider and self._provider.supports(operation, algorithm) and _is_usable(key):
+            return self._provider
+        return None
+
+    def encrypt(self, algorithm, plaintext, **kwargs):
+        # type: (str, bytes, Mapping[str, Any]) -> KeyOperationResult
+        """Encrypts bytes with the key's public part, locally when possible.
+
+        :param str algorithm: Encryption algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes plaintext: The bytes to encrypt
+        :returns: The encrypted bytes and the ID of the key version which encrypted them
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = self.get_key()
+        provider = self._local_provider(key, "encrypt", algorithm)
+        if provider:
+            return KeyOperationResult(id=key.id, value=provider.encrypt(algorithm, plaintext))
+        bundle = self._key_client._client.encrypt(
+            self._key_client.vault_url, self._name, key.version, algorithm, plaintext, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def decrypt(self, algorithm, ciphertext, **kwargs):
+        # type: (str, bytes, Mapping[str, Any]) -> KeyOperationResult
+        """Decrypts bytes with the key's private part. Key Vault performs this operation.
+
+        :param str algorithm: Encryption algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes ciphertext: The bytes to decrypt
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = self.get_key()
+        bundle = self._key_client._client.decrypt(
+            self._key_client.vault_url, self._name, key.version, algorithm, ciphertext, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def wrap_key(self, algorithm, key, **kwargs):
+        # type: (str, bytes, Mapping[str, Any]) -> KeyOperationResult
+        """Wraps a symmetric key with the key's public part, locally when possible.
+
+        :param str algorithm: Wrapping algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes key: The symmetric key to wrap
+        :returns: The wrapped key and the ID of the key version which wrapped it
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        wrapping_key = self.get_key()
+        provider = self._local_provider(wrapping_key, "wrapKey", algorithm)
+        if provider:
+            return KeyOperationResult(id=wrapping_key.id, value=provider.encrypt(algorithm, key))
+        bundle = self._key_client._client.wrap_key(
+            self._key_client.vault_url, self._name, wrapping_key.version, algorithm, key, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def unwrap_key(self, algorithm, encrypted_key, **kwargs):
+        # type: (str, bytes, Mapping[str, Any]) -> KeyOperationResult
+        """Unwraps a symmetric key with the key's private part. Key Vault performs this operation.
+
+        :param str algorithm: Wrapping algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes encrypted_key: The wrapped key
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = self.get_key()
+        bundle = self._key_client._client.unwrap_key(
+            self._key_client.vault_url, self._name, key.version, algorithm, encrypted_key, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def sign(self, algorithm, digest, **kwargs):
+        # type: (str, bytes, Mapping[str, Any]) -> KeyOperationResult
+        """Signs a digest with the key's private part. Key Vault performs this operation.
+
+        :param str algorithm: Signing algorithm, for example 'RS256' or 'ES256'
+        :param bytes digest: The hashed bytes to sign
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = self.get_key()
+        bundle = self._key_client._client.sign(
+            self._key_client.vault_url, self._name, key.version, algorithm, digest, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def verify(self, algorithm, digest, signature, **kwargs):
+        # type: (str, bytes, bytes, Mapping[str, Any]) -> bool
+        """Verifies a signature with the key's public part, locally when possible.
+
+        :param str algorithm: Signing algorithm, for example 'RS256' or 'ES256'
+        :param bytes digest: The hashed bytes which were signed
+        :param bytes signature: The signature
+        :returns: Whether the signature is valid
+        :rtype: bool
+        """
+        key = self.get_key()
+        provider = self._local_provider(key, "verify", algorithm)
+        if provider:
+            return provider.verify(algorithm, digest, signature)
+        result = self._key_client._client.verify(
+            self._key_client.vault_url, self._name, key.version, algorithm, digest, signature, **kwargs
+        )
+        return result.value
@@ -3,6 +3,7 @@
 # Licensed under the MIT License.
 # ------------------------------------
 from collections import namedtuple
+import threading
 from typing import TYPE_CHECKING
 from azure.core import Configuration
 from azure.core.pipeline import Pipeline
@@ -12,9 +13,10 @@ from ._generated import KeyVaultClient
 
 if TYPE_CHECKING:
     # pylint:disable=unused-import
-    from typing import Any, Mapping, Optional
+    from typing import Any, Callable, Iterator, Mapping, Optional
     from azure.core.credentials import TokenCredential
-    from azure.core.pipeline.transport import HttpTransport
+    from azure.core.paging import Paged
+    from azure.core.pipeline.transport import HttpResponse, HttpTransport
 
 try:
     import urllib.parse as parse
@@ -49,6 +51,45 @@ def _parse_vault_id(url):
     )
 
 
+class _PageFetch(object):
+    """Requests a page in a background thread"""
+
+    def __init__(self, command, next_link):
+        # type: (Callable[[str], HttpResponse], str) -> None
+        self._response = None  # type: Optional[HttpResponse]
+        self._error = None  # type: Optional[Exception]
+        self._thread = threading.Thread(target=self._run, args=(command, next_link))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, command, next_link):
+        try:
+            self._response = command(next_link)
+        except Exception as ex:  # pylint:disable=broad-except
+            self._error = ex
+
+    def result(self):
+        # type: () -> HttpResponse
+        self._thread.join()
+        if self._error:
+            raise self._error  # pylint:disable=raising-bad-type
+        return self._response  # type: ignore
+
+
+def _prefetch_pages(pages):
+    # type: (Paged) -> Iterator[Any]
+    """Iterates the items of an azure.core Paged, requesting each page while the caller consumes the one before"""
+
+    # pylint:disable=protected-access
+    fetch = _PageFetch(pages._get_next, pages.next_link)  # type: Optional[_PageFetch]
+    while fetch:
+        pages._deserializer(pages, fetch.result())
+        page = list(pages.current_page)
+        fetch = _PageFetch(pages._get_next, pages.next_link) if pages.next_link else None
+        for item in page:
+            yield item
+
+
 class _KeyVaultClientBase(object):
     """
     :param credential:  A credential or credential provider which can be used to authenticate to the vault,
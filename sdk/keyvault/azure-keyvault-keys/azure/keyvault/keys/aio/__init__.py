@@ -3,6 +3,7 @@
 # Licensed under the MIT License.
 # ------------------------------------
 from ._client import KeyClient
+from ._crypto import CryptographyClient
 from .._models import Key, KeyBase, DeletedKey, KeyOperationResult
 
-__all__ = ["KeyClient"]
+__all__ = ["CryptographyClient", "KeyClient"]
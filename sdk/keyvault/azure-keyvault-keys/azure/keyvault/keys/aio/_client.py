@@ -8,7 +8,8 @@ from typing import Any, AsyncIterable, Mapping, Optional, Dict, List
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 
 from azure.keyvault.keys._models import Key, DeletedKey, KeyBase, KeyOperationResult
-from ._internal import _AsyncKeyVaultClientBase, AsyncPagingAdapter
+from ._crypto import CryptographyClient
+from ._internal import _AsyncKeyVaultClientBase, AsyncPagingAdapter, AsyncPrefetchingPages
 
 
 class KeyClient(_AsyncKeyVaultClientBase):
@@ -348,7 +349,7 @@ class KeyClient(_AsyncKeyVaultClientBase):
         """
         max_results = kwargs.get("max_page_size")
         pages = self._client.get_keys(self.vault_url, maxresults=max_results, **kwargs)
-        iterable = AsyncPagingAdapter(pages, KeyBase._from_key_item)
+        iterable = AsyncPagingAdapter(AsyncPrefetchingPages(pages), KeyBase._from_key_item)
         return iterable
 
     def list_key_versions(self, name: str, **kwargs: Mapping[str, Any]) -> AsyncIterable[KeyBase]:
@@ -373,7 +374,7 @@ class KeyClient(_AsyncKeyVaultClientBase):
         """
         max_results = kwargs.get("max_page_size")
         pages = self._client.get_key_versions(self.vault_url, name, maxresults=max_results, **kwargs)
-        iterable = AsyncPagingAdapter(pages, KeyBase._from_key_item)
+        iterable = AsyncPagingAdapter(AsyncPrefetchingPages(pages), KeyBase._from_key_item)
         return iterable
 
     async def backup_key(self, name: str, **kwargs: Mapping[str, Any]) -> bytes:
@@ -526,7 +527,7 @@ class KeyClient(_AsyncKeyVaultClientBase):
         """
         max_results = kwargs.get("max_page_size")
         pages = self._client.get_deleted_keys(self.vault_url, maxresults=max_results, **kwargs)
-        iterable = AsyncPagingAdapter(pages, DeletedKey._from_deleted_key_item)
+        iterable = AsyncPagingAdapter(AsyncPrefetchingPages(pages), DeletedKey._from_deleted_key_item)
         return iterable
 
     async def purge_deleted_key(self, name: str, **kwargs: Mapping[str, Any]) -> None:
@@ -693,3 +694,13 @@ class KeyClient(_AsyncKeyVaultClientBase):
             self.vault_url, name, key_version=version, algorithm=algorithm, value=value, **kwargs
         )
         return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    def get_cryptography_client(self, name: str, version: Optional[str] = None) -> CryptographyClient:
+        """Gets a client for cryptographic operations with a key. The client performs public-key operations
+        locally when possible.
+
+        :param str name: The name of the key
+        :param str version: (optional) The version of the key. Defaults to the latest version.
+        :rtype: ~azure.keyvault.keys.aio.CryptographyClient
+        """
+        return CryptographyClient(self, name, version)
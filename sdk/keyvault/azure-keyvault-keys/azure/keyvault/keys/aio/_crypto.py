@@ -0,0 +1,162 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+from typing import Any, Mapping, Optional, TYPE_CHECKING
+
+from .._crypto import _is_usable, _LocalCryptoProvider
+from .._models import Key, KeyOperationResult
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from ._client import KeyClient
+
+
+class CryptographyClient:
+    """Performs cryptographic operations with a Key Vault key.
+
+    The client gets the key from the vault once, then performs operations requiring only the public part of an
+    RSA or EC key locally: encrypting, wrapping keys and verifying signatures. Operations requiring the private
+    key, symmetric keys, and any operation when the `cryptography` package isn't installed, are performed by Key
+    Vault. Every operation uses the version of the key the client got, even when that isn't the latest.
+
+    The key is cached for the client's lifetime, so local operations don't see changes to the key's attributes,
+    for example a disabled key. Get a new client to see them.
+
+    :param key_client: The client to get the key and perform remote operations with
+    :type key_client: ~azure.keyvault.keys.aio.KeyClient
+    :param str name: The name of the key
+    :param str version: (optional) The version of the key. Defaults to the latest version.
+
+    Example:
+        .. code-block:: python
+
+            crypto_client = key_client.get_cryptography_client("key-name")
+            wrapped = await crypto_client.wrap_key("RSA-OAEP", key_bytes)  # performed locally
+            unwrapped = await crypto_client.unwrap_key("RSA-OAEP", wrapped.value)  # performed by Key Vault
+    """
+
+    # pylint:disable=protected-access
+
+    def __init__(self, key_client: "KeyClient", name: str, version: Optional[str] = None) -> None:
+        self._key_client = key_client
+        self._name = name
+        self._version = version or ""
+        self._key = None  # type: Optional[Key]
+        self._provider = None  # type: Optional[_LocalCryptoProvider]
+        self._lock = None  # type: Optional[asyncio.Lock]
+
+    async def get_key(self, **kwargs: Mapping[str, Any]) -> Key:
+        """Gets the client's key, from the vault the first time it's called.
+
+        :rtype: ~azure.keyvault.keys._models.Key
+        """
+        if self._key is None:
+            if self._lock is None:
+                # created here rather than in __init__ to bind it to the running loop
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                if self._key is None:
+                    key = await self._key_client.get_key(self._name, self._version, **kwargs)
+                    self._provider = _LocalCryptoProvider.from_jwk(key.key_material)
+                    self._key = key
+        return self._key
+
+    def _local_provider(self, key: Key, operation: str, algorithm: str) -> Optional[_LocalCryptoProvider]:
+        if self._provider and self._provider.supports(operation, algorithm) and _is_usable(key):
+            return self._provider
+        return None
+
+    async def encrypt(self, algorithm: str, plaintext: bytes, **kwargs: Mapping[str, Any]) -> KeyOperationResult:
+        """Encrypts bytes with the key's public part, locally when possible.
+
+        :param str algorithm: Encryption algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes plaintext: The bytes to encrypt
+        :returns: The encrypted bytes and the ID of the key version which encrypted them
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = await self.get_key()
+        provider = self._local_provider(key, "encrypt", algorithm)
+        if provider:
+            return KeyOperationResult(id=key.id, value=provider.encrypt(algorithm, plaintext))
+        bundle = await self._key_client._client.encrypt(
+            self._key_client.vault_url, self._name, key.version, algorithm, plaintext, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    async def decrypt(self, algorithm: str, ciphertext: bytes, **kwargs: Mapping[str, Any]) -> KeyOperationResult:
+        """Decrypts bytes with the key's private part. Key Vault performs this operation.
+
+        :param str algorithm: Encryption algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes ciphertext: The bytes to decrypt
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = await self.get_key()
+        bundle = await self._key_client._client.decrypt(
+            self._key_client.vault_url, self._name, key.version, algorithm, ciphertext, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    async def wrap_key(self, algorithm: str, key: bytes, **kwargs: Mapping[str, Any]) -> KeyOperationResult:
+        """Wraps a symmetric key with the key's public part, locally when possible.
+
+        :param str algorithm: Wrapping algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes key: The symmetric key to wrap
+        :returns: The wrapped key and the ID of the key version which wrapped it
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        wrapping_key = await self.get_key()
+        provider = self._local_provider(wrapping_key, "wrapKey", algorithm)
+        if provider:
+            return KeyOperationResult(id=wrapping_key.id, value=provider.encrypt(algorithm, key))
+        bundle = await self._key_client._client.wrap_key(
+            self._key_client.vault_url, self._name, wrapping_key.version, algorithm, key, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    async def unwrap_key(
+        self, algorithm: str, encrypted_key: bytes, **kwargs: Mapping[str, Any]
+    ) -> KeyOperationResult:
+        """Unwraps a symmetric key with the key's private part. Key Vault performs this operation.
+
+        :param str algorithm: Wrapping algorithm: 'RSA-OAEP', 'RSA-OAEP-256' or 'RSA1_5'
+        :param bytes encrypted_key: The wrapped key
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = await self.get_key()
+        bundle = await self._key_client._client.unwrap_key(
+            self._key_client.vault_url, self._name, key.version, algorithm, encrypted_key, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    async def sign(self, algorithm: str, digest: bytes, **kwargs: Mapping[str, Any]) -> KeyOperationResult:
+        """Signs a digest with the key's private part. Key Vault performs this operation.
+
+        :param str algorithm: Signing algorithm, for example 'RS256' or 'ES256'
+        :param bytes digest: The hashed bytes to sign
+        :rtype: ~azure.keyvault.keys._models.KeyOperationResult
+        """
+        key = await self.get_key()
+        bundle = await self._key_client._client.sign(
+            self._key_client.vault_url, self._name, key.version, algorithm, digest, **kwargs
+        )
+        return KeyOperationResult(id=bundle.kid, value=bundle.result)
+
+    async def verify(self, algorithm: str, digest: bytes, signature: bytes, **kwargs: Mapping[str, Any]) -> bool:
+        """Verifies a signature with the key's public part, locally when possible.
+
+        :param str algorithm: Signing algorithm, for example 'RS256' or 'ES256'
+        :param bytes digest: The hashed bytes which were signed
+        :param bytes signature: The signature
+        :returns: Whether the signature is valid
+        :rtype: bool
+        """
+        key = await self.get_key()
+        provider = self._local_provider(key, "verify", algorithm)
+        if provider:
+            return provider.verify(algorithm, digest, signature)
+        result = await self._key_client._client.verify(
+            self._key_client.vault_url, self._name, key.version, algorithm, digest, signature, **kwargs
+        )
+        return result.value
@@ -78,5 +78,9 @@ setup(
         ]
     ),
     install_requires=["azure-core<2.0.0,>=1.0.0b1", "azure-common~=1.1", "msrest>=0.5.0"],
-    extras_require={":python_version<'3.0'": ["azure-nspkg"], ":python_version<'3.5'": ["typing"]},
+    extras_require={
+        ":python_version<'3.0'": ["azure-nspkg"],
+        ":python_version<'3.5'": ["typing"],
+        "crypto": ["cryptography>=2.1.4"],
+    },
 )
@@ -0,0 +1,69 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Microbenchmark of CryptographyClient.wrap_key performed locally, against KeyClient.wrap_key.
+
+The local path always runs, with a key generated in-process. The remote path runs when AZURE_KEYVAULT_URL
+is set: it creates an RSA key in that vault, authenticating with DefaultAzureCredential, and deletes it after.
+
+    python tests/crypto_performance.py [ITERATIONS]
+"""
+import os
+import sys
+import timeit
+import uuid
+
+try:
+    from unittest.mock import Mock
+except ImportError:  # python < 3.3
+    from mock import Mock  # type: ignore
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from azure.keyvault.keys import KeyClient
+
+from test_crypto_client import VAULT_URL, rsa_key_bundle
+
+KEY = os.urandom(32)
+
+
+def local_wrap(iterations):
+    private_key = rsa.generate_private_key(65537, 2048, default_backend())
+    generated_client = Mock(get_key=Mock(return_value=rsa_key_bundle(private_key)))
+    crypto_client = KeyClient(VAULT_URL, object(), generated_client=generated_client).get_cryptography_client("key")
+    crypto_client.get_key()
+    return timeit.timeit(lambda: crypto_client.wrap_key("RSA-OAEP", KEY), number=iterations)
+
+
+def remote_wrap(vault_url, iterations):
+    from azure.identity import DefaultAzureCredential
+
+    key_client = KeyClient(vault_url, DefaultAzureCredential())
+    name = "crypto-performance-" + uuid.uuid4().hex[:8]
+    key = key_client.create_rsa_key(name, hsm=False, size=2048)
+    try:
+        key_client.wrap_key(name, "RSA-OAEP", KEY, version=key.version)  # warm up the connection and token
+        return timeit.timeit(
+            lambda: key_client.wrap_key(name, "RSA-OAEP", KEY, version=key.version), number=iterations
+        )
+    finally:
+        key_client.delete_key(name)
+
+
+def main(iterations):
+    local = local_wrap(iterations)
+    print("local wrap_key:     {:10.3f} us".format(local / iterations * 1e6))
+    vault_url = os.environ.get("AZURE_KEYVAULT_URL")
+    if not vault_url:
+        print("remote wrap_key:    set AZURE_KEYVAULT_URL to measure")
+        return
+    remote_iterations = min(iterations, 100)
+    remote = remote_wrap(vault_url, remote_iterations)
+    print("remote wrap_key:    {:10.3f} us".format(remote / remote_iterations * 1e6))
+    print("speedup:            {:10.1f}x".format((remote / remote_iterations) / (local / iterations)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,181 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import binascii
+import hashlib
+import os
+
+try:
+    from unittest.mock import Mock
+except ImportError:  # python < 3.3
+    from mock import Mock  # type: ignore
+
+import pytest
+from azure.keyvault.keys import CryptographyClient, KeyClient
+from azure.keyvault.keys._generated.v7_0.models import (
+    JsonWebKey,
+    KeyAttributes,
+    KeyBundle,
+    KeyOperationResult,
+    KeyVerifyResult,
+)
+
+cryptography = pytest.importorskip("cryptography")
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa, utils
+
+VAULT_URL = "https://vault.vault.azure.net"
+KEY_ID = VAULT_URL + "/keys/key-name/key-version"
+ALL_OPERATIONS = ["encrypt", "decrypt", "sign", "verify", "wrapKey", "unwrapKey"]
+
+
+def int_to_bytes(value, length=None):
+    hex_value = "{:x}".format(value)
+    if length:
+        hex_value = hex_value.rjust(length * 2, "0")
+    elif len(hex_value) % 2:
+        hex_value = "0" + hex_value
+    return binascii.unhexlify(hex_value)
+
+
+def rsa_key_bundle(private_key, key_ops=ALL_OPERATIONS, enabled=True):
+    numbers = private_key.public_key().public_numbers()
+    jwk = JsonWebKey(kid=KEY_ID, kty="RSA", key_ops=key_ops, n=int_to_bytes(numbers.n), e=int_to_bytes(numbers.e))
+    return KeyBundle(key=jwk, attributes=KeyAttributes(enabled=enabled))
+
+
+def ec_key_bundle(private_key, crv):
+    numbers = private_key.public_key().public_numbers()
+    jwk = JsonWebKey(
+        kid=KEY_ID, kty="EC", key_ops=ALL_OPERATIONS, crv=crv, x=int_to_bytes(numbers.x), y=int_to_bytes(numbers.y)
+    )
+    return KeyBundle(key=jwk, attributes=KeyAttributes(enabled=True))
+
+
+def get_crypto_client(key_bundle, **kwargs):
+    generated_client = Mock(get_key=Mock(return_value=key_bundle), **kwargs)
+    key_client = KeyClient(VAULT_URL, object(), generated_client=generated_client)
+    return key_client.get_cryptography_client("key-name"), generated_client
+
+
+@pytest.mark.parametrize("algorithm", ("RSA-OAEP", "RSA-OAEP-256", "RSA1_5"))
+def test_rsa_wrap_locally(algorithm):
+    private_key = rsa.generate_private_key(65537, 2048, default_backend())
+    client, generated = get_crypto_client(rsa_key_bundle(private_key))
+    assert isinstance(client, CryptographyClient)
+
+    key = os.urandom(32)
+    for operation in (client.wrap_key, client.encrypt):
+        result = operation(algorithm, key)
+        assert result.id == KEY_ID
+        if algorithm == "RSA1_5":
+            pad = padding.PKCS1v15()
+        else:
+            hash_algorithm = hashes.SHA256() if algorithm == "RSA-OAEP-256" else hashes.SHA1()
+            pad = padding.OAEP(mgf=padding.MGF1(hash_algorithm), algorithm=hash_algorithm, label=None)
+        assert private_key.decrypt(result.value, pad) == key
+
+    assert generated.get_key.call_count == 1
+    assert not generated.wrap_key.called
+    assert not generated.encrypt.called
+
+
+def test_private_key_operations_are_remote():
+    private_key = rsa.generate_private_key(65537, 2048, default_backend())
+    remote_result = KeyOperationResult()
+    remote_result.kid = KEY_ID
+    remote_result.result = b"result"
+    client, generated = get_crypto_client(
+        rsa_key_bundle(private_key),
+        unwrap_key=Mock(return_value=remote_result),
+        decrypt=Mock(return_value=remote_result),
+        sign=Mock(return_value=remote_result),
+    )
+
+    assert client.unwrap_key("RSA-OAEP", b"wrapped").value == b"result"
+    assert client.decrypt("RSA-OAEP", b"encrypted").value == b"result"
+    assert client.sign("RS256", b"digest").value == b"result"
+    for operation in (generated.unwrap_key, generated.decrypt, generated.sign):
+        args, _ = operation.call_args
+        # operations use the version of the key the client got
+        assert args[:3] == (VAULT_URL, "key-name", "key-version")
+
+
+@pytest.mark.parametrize("algorithm", ("RS256", "RS384", "RS512", "PS256", "PS384", "PS512"))
+def test_rsa_verify_locally(algorithm):
+    private_key = rsa.generate_private_key(65537, 2048, default_backend())
+    client, generated = get_crypto_client(rsa_key_bundle(private_key))
+
+    hash_algorithm = getattr(hashes, "SHA" + algorithm[2:])()
+    digest = hashlib.new(hash_algorithm.name, b"message").digest()
+    if algorithm.startswith("PS"):
+        pad = padding.PSS(mgf=padding.MGF1(hash_algorithm), salt_length=hash_algorithm.digest_size)
+    else:
+        pad = padding.PKCS1v15()
+    signature = private_key.sign(digest, pad, utils.Prehashed(hash_algorithm))
+
+    assert client.verify(algorithm, digest, signature)
+    assert not client.verify(algorithm, digest, b"\0" + signature[1:])
+    assert not generated.verify.called
+
+
+@pytest.mark.parametrize(
+    "algorithm,crv,curve,hash_algorithm",
+    (
+        ("ES256", "P-256", ec.SECP256R1, hashes.SHA256),
+        ("ES384", "P-384", ec.SECP384R1, hashes.SHA384),
+        ("ES512", "P-521", ec.SECP521R1, hashes.SHA512),
+        ("ES256K", "P-256K", ec.SECP256K1, hashes.SHA256),
+    ),
+)
+def test_ec_verify_locally(algorithm, crv, curve, hash_algorithm):
+    private_key = ec.generate_private_key(curve(), default_backend())
+    client, generated = get_crypto_client(ec_key_bundle(private_key, crv))
+
+    digest = hashlib.new(hash_algorithm.name, b"message").digest()
+    der_signature = private_key.sign(digest, ec.ECDSA(utils.Prehashed(hash_algorithm())))
+    r, s = utils.decode_dss_signature(der_signature)
+    # Key Vault's format: R and S concatenated, each as long as the curve's coordinates
+    length = (curve.key_size + 7) // 8
+    signature = int_to_bytes(r, length) + int_to_bytes(s, length)
+
+    assert client.verify(algorithm, digest, signature)
+    assert not client.verify(algorithm, hashlib.new(hash_algorithm.name, b"other").digest(), signature)
+    assert not generated.verify.called
+
+
+def test_remote_when_local_operation_not_permitted():
+    private_key = rsa.generate_private_key(65537, 2048, default_backend())
+    remote_result = KeyOperationResult()
+    remote_result.kid = KEY_ID
+    remote_result.result = b"wrapped"
+    verify_result = KeyVerifyResult()
+    verify_result.value = True
+
+    # the key doesn't permit wrapKey or verify, so Key Vault should get the chance to refuse them
+    client, generated = get_crypto_client(
+        rsa_key_bundle(private_key, key_ops=["unwrapKey"]),
+        wrap_key=Mock(return_value=remote_result),
+        verify=Mock(return_value=verify_result),
+    )
+    assert client.wrap_key("RSA-OAEP", b"key").value == b"wrapped"
+    assert client.verify("RS256", b"digest", b"signature")
+    assert generated.wrap_key.call_count == generated.verify.call_count == 1
+
+    # Key Vault doesn't use disabled keys
+    client, generated = get_crypto_client(
+        rsa_key_bundle(private_key, enabled=False), wrap_key=Mock(return_value=remote_result)
+    )
+    client.wrap_key("RSA-OAEP", b"key")
+    assert generated.wrap_key.call_count == 1
+
+    # RSA keys can't verify ECDSA signatures, and EC keys can't wrap
+    client, generated = get_crypto_client(rsa_key_bundle(private_key), verify=Mock(return_value=verify_result))
+    client.verify("ES256", b"digest", b"signature")
+    assert generated.verify.call_count == 1
+    ec_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+    client, generated = get_crypto_client(ec_key_bundle(ec_key, "P-256"), wrap_key=Mock(return_value=remote_result))
+    client.wrap_key("RSA-OAEP", b"key")
+    assert generated.wrap_key.call_count == 1
@@ -0,0 +1,53 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+import os
+from unittest.mock import Mock
+
+import pytest
+from azure.keyvault.keys.aio import KeyClient
+from azure.keyvault.keys._generated.v7_0.models import KeyOperationResult
+
+from test_crypto_client import KEY_ID, VAULT_URL, rsa_key_bundle
+
+pytest.importorskip("cryptography")
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+
+def async_mock(return_value):
+    async def coroutine(*_, **__):
+        return return_value
+
+    return Mock(wraps=coroutine)
+
+
+@pytest.mark.asyncio
+async def test_wrap_locally_unwrap_remotely():
+    private_key = rsa.generate_private_key(65537, 2048, default_backend())
+    remote_result = KeyOperationResult()
+    remote_result.kid = KEY_ID
+    remote_result.result = b"unwrapped"
+    generated_client = Mock(
+        get_key=async_mock(rsa_key_bundle(private_key)),
+        unwrap_key=async_mock(remote_result),
+        wrap_key=async_mock(None),
+    )
+    client = KeyClient(VAULT_URL, object(), generated_client=generated_client).get_cryptography_client("key-name")
+
+    key = os.urandom(32)
+    results = await asyncio.gather(*[client.wrap_key("RSA-OAEP", key) for _ in range(4)])
+    oaep = padding.OAEP(mgf=padding.MGF1(hashes.SHA1()), algorithm=hashes.SHA1(), label=None)
+    for result in results:
+        assert result.id == KEY_ID
+        assert private_key.decrypt(result.value, oaep) == key
+    # concurrent operations got the key once, and wrapped locally
+    assert generated_client.get_key.call_count == 1
+    assert not generated_client.wrap_key.called
+
+    assert (await client.unwrap_key("RSA-OAEP", results[0].value)).value == b"unwrapped"
+    args, _ = generated_client.unwrap_key.call_args
+    assert args[:3] == (VAULT_URL, "key-name", "key-version")
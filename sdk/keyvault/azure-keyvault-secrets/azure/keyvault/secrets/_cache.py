@@ -0,0 +1,299 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+try:
+    from typing import TYPE_CHECKING
+except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+    from ._models import Secret
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SecretCacheMetrics(object):
+    """A snapshot of a :class:`SecretCache`'s counters."""
+
+    def __init__(self, **kwargs):
+        # type: (Mapping[str, Any]) -> None
+        self._hits = kwargs.get("hits", 0)
+        self._stale_hits = kwargs.get("stale_hits", 0)
+        self._misses = kwargs.get("misses", 0)
+        self._evictions = kwargs.get("evictions", 0)
+        self._refreshes = kwargs.get("refreshes", 0)
+        self._refresh_errors = kwargs.get("refresh_errors", 0)
+        self._refresh_time = kwargs.get("refresh_time", 0.0)
+        self._size = kwargs.get("size", 0)
+
+    def __repr__(self):
+        return (
+            "SecretCacheMetrics(hits={}, stale_hits={}, misses={}, evictions={}, refreshes={}, refresh_errors={}, "
+            "size={})".format(
+                self._hits,
+                self._stale_hits,
+                self._misses,
+                self._evictions,
+                self._refreshes,
+                self._refresh_errors,
+                self._size,
+            )
+        )
+
+    @property
+    def hits(self):
+        # type: () -> int
+        """Lookups answered with a fresh secret
+        :rtype: int"""
+        return self._hits
+
+    @property
+    def stale_hits(self):
+        # type: () -> int
+        """Lookups answered with a stale secret while it was refreshed in the background
+        :rtype: int"""
+        return self._stale_hits
+
+    @property
+    def misses(self):
+        # type: () -> int
+        """Lookups which waited for the secret to be fetched from the vault
+        :rtype: int"""
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        # type: () -> float
+        """The fraction of lookups answered from the cache
+        :rtype: float"""
+        lookups = self._hits + self._stale_hits + self._misses
+        return (self._hits + self._stale_hits) / float(lookups) if lookups else 0.0
+
+    @property
+    def evictions(self):
+        # type: () -> int
+        """Secrets removed to keep the cache within its maximum size
+        :rtype: int"""
+        return self._evictions
+
+    @property
+    def refreshes(self):
+        # type: () -> int
+        """Secrets fetched from the vault, for misses or background refreshes
+        :rtype: int"""
+        return self._refreshes
+
+    @property
+    def refresh_errors(self):
+        # type: () -> int
+        """Fetches from the vault which raised
+        :rtype: int"""
+        return self._refresh_errors
+
+    @property
+    def average_refresh_latency(self):
+        # type: () -> float
+        """The average time in seconds a successful fetch from the vault took
+        :rtype: float"""
+        return self._refresh_time / self._refreshes if self._refreshes else 0.0
+
+    @property
+    def size(self):
+        # type: () -> int
+        """The number of secrets in the cache
+        :rtype: int"""
+        return self._size
+
+
+class _CacheEntry(object):
+    def __init__(self, secret, fresh_until, stale_until):
+        # type: (Secret, float, float) -> None
+        self.secret = secret
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class _PendingFetch(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.secret = None  # type: Optional[Secret]
+        self.error = None  # type: Optional[Exception]
+
+
+class SecretCache(object):
+    """A client-side cache of secret values, for a :class:`~azure.keyvault.secrets.SecretClient` given it as its
+    ``secret_cache`` keyword argument.
+
+    The cache holds up to `max_size` secrets, evicting the least recently used. The latest version of a secret is
+    fresh for `ttl` seconds after it was fetched, then stale for `stale_ttl` more seconds: a stale secret is
+    returned immediately while a new value is fetched in the background. A specific version of a secret never
+    changes, so it stays fresh until evicted. Concurrent lookups of a secret which isn't cached share one request
+    to the vault. Setting, updating, deleting, recovering or restoring a secret through the client removes it from
+    the cache.
+
+    A cache can be shared by any number of clients, synchronous or asynchronous.
+
+    :param int max_size: The maximum number of secrets to hold. Defaults to 256.
+    :param float ttl: How many seconds the latest version of a secret is fresh. Defaults to 300.
+    :param float stale_ttl: How many seconds after `ttl` a stale secret may be returned while it's refreshed.
+        Defaults to 60.
+    """
+
+    def __init__(self, max_size=256, ttl=300, stale_ttl=60):
+        # type: (int, float, float) -> None
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[Tuple[str, str, str], _CacheEntry]
+        self._pending = {}  # type: Dict[Tuple[str, str, str], _PendingFetch]
+        # asyncio tasks of the fetches pending in async clients, by key
+        self._async_pending = {}  # type: Dict[Tuple[str, str, str], Any]
+        self._counters = dict.fromkeys(
+            ("hits", "stale_hits", "misses", "evictions", "refreshes", "refresh_errors"), 0
+        )  # type: Dict[str, Any]
+        self._counters["refresh_time"] = 0.0
+        # incremented by every invalidation, so that fetches started before it don't cache what they get
+        self._generation = 0
+
+    @property
+    def metrics(self):
+        # type: () -> SecretCacheMetrics
+        """A snapshot of the cache's hit, miss and refresh counters.
+
+        :rtype: ~azure.keyvault.secrets.SecretCacheMetrics
+        """
+        with self._lock:
+            return SecretCacheMetrics(size=len(self._entries), **self._counters)
+
+    def clear(self):
+        # type: () -> None
+        """Removes every secret from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _invalidate(self, vault_url, name):
+        # type: (str, str) -> None
+        """Removes every cached version of a secret"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == vault_url and k[1] == name]:
+                del self._entries[key]
+            self._generation += 1
+
+    def _lookup(self, key):
+        # type: (Tuple[str, str, str]) -> Tuple[Optional[Secret], bool]
+        """Returns the cached secret, if any, and whether the caller should refresh it in the background"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stale_until <= now:
+                self._counters["misses"] += 1
+                return None, False
+            self._touch(key)
+            if entry.fresh_until > now:
+                self._counters["hits"] += 1
+                return entry.secret, False
+            self._counters["stale_hits"] += 1
+            refresh = not entry.refreshing
+            entry.refreshing = True
+            return entry.secret, refresh
+
+    def _touch(self, key):
+        # type: (Tuple[str, str, str]) -> None
+        """Marks an entry most recently used. Call with the lock held."""
+        try:
+            self._entries.move_to_end(key)
+        except AttributeError:  # Python 2's OrderedDict has no move_to_end
+            self._entries[key] = self._entries.pop(key)
+
+    def _store(self, key, secret, latency, generation):
+        # type: (Tuple[str, str, str], Secret, float, int) -> None
+        now = time.time()
+        if key[2]:
+            # a specific version's value never changes
+            fresh_until = stale_until = float("inf")
+        else:
+            fresh_until = now + self.ttl
+            stale_until = fresh_until + self.stale_ttl
+        with self._lock:
+            self._counters["refreshes"] += 1
+            self._counters["refresh_time"] += latency
+            if generation != self._generation:
+                # the secret changed while it was fetched
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = _CacheEntry(secret, fresh_until, stale_until)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _fetch_failed(self, key, error):
+        # type: (Tuple[str, str, str], Exception) -> None
+        with self._lock:
+            self._counters["refresh_errors"] += 1
+            entry = self._entries.get(key)
+            if entry:
+                # let a later lookup try again
+                entry.refreshing = False
+        _LOGGER.debug("Failed to fetch secret '%s': %r", key[1], error)
+
+    def _get(self, key, fetch):
+        # type: (Tuple[str, str, str], Callable[[], Secret]) -> Secret
+        secret, refresh = self._lookup(key)
+        if secret is None:
+            return self._fetch(key, fetch)
+        if refresh:
+            thread = threading.Thread(target=self._refresh, args=(key, fetch))
+            thread.daemon = True
+            thread.start()
+        return secret
+
+    def _refresh(self, key, fetch):
+        # type: (Tuple[str, str, str], Callable[[], Secret]) -> None
+        try:
+            self._fetch(key, fetch)
+        except Exception:  # pylint:disable=broad-except
+            # _fetch_failed has recorded it, and the stale secret is kept until it expires
+            pass
+
+    def _fetch(self, key, fetch):
+        # type: (Tuple[str, str, str], Callable[[], Secret]) -> Secret
+        with self._lock:
+            pending = self._pending.get(key)
+            fetcher = pending is None
+            if fetcher:
+                pending = self._pending[key] = _PendingFetch()
+
+        if not fetcher:
+            # another thread is fetching the secret
+            pending.done.wait()
+            if pending.error:
+                raise pending.error  # pylint:disable=raising-bad-type
+            return pending.secret  # type: ignore
+
+        generation = self._generation
+        start = time.time()
+        try:
+            pending.secret = fetch()
+            self._store(key, pending.secret, time.time() - start, generation)
+            return pending.secret
+        except Exception as ex:
+            pending.error = ex
+            self._fetch_failed(key, ex)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
@@ -2,18 +2,33 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
-from typing import Any, Dict, Generator, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Mapping, Optional
 from datetime import datetime
+from multiprocessing.pool import ThreadPool
 
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 
-from ._internal import _KeyVaultClientBase
+from ._internal import _KeyVaultClientBase, _prefetch_pages
 from ._models import Secret, DeletedSecret, SecretAttributes
 
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from azure.core import Configuration
+    from azure.core.credentials import TokenCredential
+    from azure.core.pipeline.transport import HttpTransport
+    from ._cache import SecretCache
+
 
 class SecretClient(_KeyVaultClientBase):
     """SecretClient is a high-level interface for managing a vault's secrets.
 
+    :param str vault_url: URL of the vault the client will access
+    :param credential: An object which can provide an access token for the vault, such as a credential from
+        :mod:`azure.identity`
+    :param secret_cache: (optional) A cache for :func:`get_secret` to return secrets from, which other clients
+        may share
+    :type secret_cache: ~azure.keyvault.secrets.SecretCache
+
     Example:
         .. literalinclude:: ../tests/test_examples_secrets.py
             :start-after: [START create_secret_client]
@@ -25,6 +40,13 @@ class SecretClient(_KeyVaultClientBase):
 
     # pylint:disable=protected-access
 
+    def __init__(self, vault_url, credential, config=None, transport=None, api_version=None, **kwargs):
+        # type: (str, TokenCredential, Configuration, Optional[HttpTransport], Optional[str], **Any) -> None
+        self._secret_cache = kwargs.pop("secret_cache", None)  # type: Optional[SecretCache]
+        super(SecretClient, self).__init__(
+            vault_url, credential, config=config, transport=transport, api_version=api_version, **kwargs
+        )
+
     def get_secret(self, name, version=None, **kwargs):
         # type: (str, str, Mapping[str, Any]) -> Secret
         """Get a specified secret from the vault.
@@ -35,7 +57,7 @@ class SecretClient(_KeyVaultClientBase):
         :param str name: The name of the secret.
         :param str version: The version of the secret. If version is None or the empty string, the latest version of
             the secret is returned
-        :returns: An instance of Secret
+        :returns: An instance of Secret. When the client has a secret cache, this may be a cached value.
         :rtype: ~azure.keyvault.secrets._models.Secret
         :raises: ~azure.core.exceptions.ResourceNotFoundError if the client failed to retrieve the secret
 
@@ -47,11 +69,71 @@ class SecretClient(_KeyVaultClientBase):
                 :caption: Get secret from the key vault
                 :dedent: 8
         """
+        if self._secret_cache is None:
+            return self._get_secret(name, version, **kwargs)
+        return self._secret_cache._get(
+            (self.vault_url, name, version or ""), lambda: self._get_secret(name, version, **kwargs)
+        )
+
+    def _get_secret(self, name, version, **kwargs):
+        # type: (str, Optional[str], Mapping[str, Any]) -> Secret
         bundle = self._client.get_secret(
             self._vault_url, name, version or "", error_map={404: ResourceNotFoundError}, **kwargs
         )
         return Secret._from_secret_bundle(bundle)
 
+    def _invalidate_cached_secret(self, name):
+        # type: (str) -> None
+        if self._secret_cache is not None:
+            self._secret_cache._invalidate(self.vault_url, name)
+
+    def get_secrets(self, names, max_concurrency=8, **kwargs):
+        # type: (Iterable[str], int, Mapping[str, Any]) -> List[Secret]
+        """Get the latest versions of several secrets, requesting up to `max_concurrency` of them at a time.
+
+        This operation requires the secrets/get permission.
+
+        :param names: The names of the secrets
+        :type names: Iterable[str]
+        :param int max_concurrency: The maximum number of concurrent requests. Defaults to 8.
+        :returns: The secrets, in the order of `names`
+        :rtype: list[~azure.keyvault.secrets._models.Secret]
+        :raises: ~azure.core.exceptions.ResourceNotFoundError if a secret doesn't exist. When getting several
+            secrets fails, the error for the first of them in `names` is raised.
+        """
+        names = list(names)
+        if not names:
+            return []
+        pool = ThreadPool(min(max_concurrency, len(names)))
+        try:
+            results = [pool.apply_async(self.get_secret, (name,), kwargs) for name in names]
+            return [result.get() for result in results]
+        finally:
+            pool.terminate()
+
+    def load_all(self, max_concurrency=8, **kwargs):
+        # type: (int, Mapping[str, Any]) -> Dict[str, Secret]
+        """Get the latest version of every enabled secret in the vault.
+
+        Secrets are requested up to `max_concurrency` at a time, while the vault's list of secrets is still being
+        read. This operation requires the secrets/list and secrets/get permissions.
+
+        :param int max_concurrency: The maximum number of concurrent requests for secrets. Defaults to 8.
+        :returns: The secrets, by name
+        :rtype: dict[str, ~azure.keyvault.secrets._models.Secret]
+        """
+        pool = ThreadPool(max_concurrency)
+        try:
+            # secrets are fetched as their names arrive
+            results = [
+                pool.apply_async(self.get_secret, (secret.name,), kwargs)
+                for secret in self.list_secrets()
+                if secret.enabled is not False
+            ]
+            return {secret.name: secret for secret in (result.get() for result in results)}
+        finally:
+            pool.terminate()
+
     def set_secret(
         self, name, value, content_type=None, enabled=None, not_before=None, expires=None, tags=None, **kwargs
     ):
@@ -92,6 +174,7 @@ class SecretClient(_KeyVaultClientBase):
         bundle = self._client.set_secret(
             self.vault_url, name, value, secret_attributes=attributes, content_type=content_type, tags=tags, **kwargs
         )
+        self._invalidate_cached_secret(name)
         return Secret._from_secret_bundle(bundle)
 
     def update_secret(
@@ -142,6 +225,7 @@ class SecretClient(_KeyVaultClientBase):
             error_map={404: ResourceNotFoundError},
             **kwargs
         )
+        self._invalidate_cached_secret(name)
         return SecretAttributes._from_secret_bundle(bundle)  # pylint: disable=protected-access
 
     def list_secrets(self, **kwargs):
@@ -168,7 +252,7 @@ class SecretClient(_KeyVaultClientBase):
         """
         max_page_size = kwargs.get("max_page_size", None)
         pages = self._client.get_secrets(self._vault_url, maxresults=max_page_size, **kwargs)
-        return (SecretAttributes._from_secret_item(item) for item in pages)
+        return (SecretAttributes._from_secret_item(item) for item in _prefetch_pages(pages))
 
     def list_secret_versions(self, name, **kwargs):
         # type: (str, Mapping[str, Any]) -> Generator[SecretAttributes]
@@ -194,7 +278,7 @@ class SecretClient(_KeyVaultClientBase):
         """
         max_page_size = kwargs.get("max_page_size", None)
         pages = self._client.get_secret_versions(self._vault_url, name, maxresults=max_page_size, **kwargs)
-        return (SecretAttributes._from_secret_item(item) for item in pages)
+        return (SecretAttributes._from_secret_item(item) for item in _prefetch_pages(pages))
 
     def backup_secret(self, name, **kwargs):
         # type: (str, Mapping[str, Any]) -> bytes
@@ -245,7 +329,9 @@ class SecretClient(_KeyVaultClientBase):
 
         """
         bundle = self._client.restore_secret(self.vault_url, backup, error_map={409: ResourceExistsError}, **kwargs)
-        return SecretAttributes._from_secret_bundle(bundle)
+        attributes = SecretAttributes._from_secret_bundle(bundle)
+        self._invalidate_cached_secret(attributes.name)
+        return attributes
 
     def delete_secret(self, name, **kwargs):
         # type: (str, Mapping[str, Any]) -> DeletedSecret
@@ -270,6 +356,7 @@ class SecretClient(_KeyVaultClientBase):
 
         """
         bundle = self._client.delete_secret(self.vault_url, name, error_map={404: ResourceNotFoundError}, **kwargs)
+        self._invalidate_cached_secret(name)
         return DeletedSecret._from_deleted_secret_bundle(bundle)
 
     def get_deleted_secret(self, name, **kwargs):
@@ -319,7 +406,7 @@ class SecretClient(_KeyVaultClientBase):
         """
         max_page_size = kwargs.get("max_page_size", None)
         pages = self._client.get_deleted_secrets(self._vault_url, maxresults=max_page_size, **kwargs)
-        return (DeletedSecret._from_deleted_secret_item(item) for item in pages)
+        return (DeletedSecret._from_deleted_secret_item(item) for item in _prefetch_pages(pages))
 
     def purge_deleted_secret(self, name, **kwargs):
         # type: (str, Mapping[str, Any]) -> None
@@ -366,4 +453,5 @@ class SecretClient(_KeyVaultClientBase):
 
         """
         bundle = self._client.recover_deleted_secret(self.vault_url, name, **kwargs)
+        self._invalidate_cached_secret(name)
         return SecretAttributes._from_secret_bundle(bundle)
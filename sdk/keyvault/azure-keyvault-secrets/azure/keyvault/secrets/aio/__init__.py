@@ -2,7 +2,8 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+from .._cache import SecretCache, SecretCacheMetrics
 from ._client import SecretClient
 from .._models import Secret, SecretAttributes, DeletedSecret
 
-__all__ = ["SecretClient"]
+__all__ = ["SecretCache", "SecretCacheMetrics", "SecretClient"]
@@ -0,0 +1,66 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Drives a SecretCache from coroutines. Misses and refreshes are coalesced by asyncio tasks rather than threads."""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from .._cache import SecretCache
+    from .._models import Secret
+
+# pylint:disable=protected-access
+
+
+async def get_cached_secret(
+    cache: "SecretCache", key: Tuple[str, str, str], fetch: Callable[[], Awaitable["Secret"]]
+) -> "Secret":
+    secret, refresh = cache._lookup(key)
+    if secret is None:
+        return await _fetch(cache, key, fetch)
+    if refresh:
+        asyncio.ensure_future(_refresh(cache, key, fetch))
+    return secret
+
+
+async def _refresh(cache: "SecretCache", key: Tuple[str, str, str], fetch: Callable[[], Awaitable["Secret"]]) -> None:
+    try:
+        await _fetch(cache, key, fetch)
+    except Exception:  # pylint:disable=broad-except
+        # _fetch_failed has recorded it, and the stale secret is kept until it expires
+        pass
+
+
+async def _fetch(cache: "SecretCache", key: Tuple[str, str, str], fetch: Callable[[], Awaitable["Secret"]]) -> "Secret":
+    with cache._lock:
+        task = cache._async_pending.get(key)
+        if task is None:
+            task = cache._async_pending[key] = asyncio.ensure_future(_send(cache, key, fetch))
+            task.add_done_callback(_retrieve_exception)
+
+    # a caller cancelling its lookup doesn't cancel the fetch other callers are waiting for
+    return await asyncio.shield(task)
+
+
+async def _send(cache: "SecretCache", key: Tuple[str, str, str], fetch: Callable[[], Awaitable["Secret"]]) -> "Secret":
+    generation = cache._generation
+    start = time.time()
+    try:
+        secret = await fetch()
+    except Exception as ex:
+        cache._fetch_failed(key, ex)
+        raise
+    finally:
+        with cache._lock:
+            del cache._async_pending[key]
+    cache._store(key, secret, time.time() - start, generation)
+    return secret
+
+
+def _retrieve_exception(task: Any) -> None:
+    """Prevents asyncio logging an error for a fetch which failed after every caller stopped waiting"""
+    if not task.cancelled():
+        task.exception()
@@ -2,18 +2,34 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
 from datetime import datetime
-from typing import Any, AsyncIterable, Mapping, Optional, Dict
+from typing import Any, AsyncIterable, Awaitable, Mapping, Optional, Dict, Iterable, List, TYPE_CHECKING
 
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 
 from azure.keyvault.secrets._models import Secret, DeletedSecret, SecretAttributes
-from ._internal import _AsyncKeyVaultClientBase, AsyncPagingAdapter
+from ._cache import get_cached_secret
+from ._internal import _AsyncKeyVaultClientBase, AsyncPagingAdapter, AsyncPrefetchingPages
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from azure.core.configuration import Configuration
+    from azure.core.credentials import TokenCredential
+    from azure.core.pipeline.transport import HttpTransport
+    from azure.keyvault.secrets._cache import SecretCache
 
 
 class SecretClient(_AsyncKeyVaultClientBase):
     """SecretClient is a high-level interface for managing a vault's secrets.
 
+    :param str vault_url: URL of the vault the client will access
+    :param credential: An object which can provide an access token for the vault, such as a credential from
+        :mod:`azure.identity.aio`
+    :param secret_cache: (optional) A cache for :func:`get_secret` to return secrets from, which other clients
+        may share
+    :type secret_cache: ~azure.keyvault.secrets.SecretCache
+
     Example:
         .. literalinclude:: ../tests/test_examples_secrets_async.py
             :start-after: [START create_secret_client]
@@ -25,6 +41,18 @@ class SecretClient(_AsyncKeyVaultClientBase):
 
     # pylint:disable=protected-access
 
+    def __init__(
+        self,
+        vault_url: str,
+        credential: "TokenCredential",
+        config: "Configuration" = None,
+        transport: "HttpTransport" = None,
+        api_version: str = None,
+        **kwargs: Any
+    ) -> None:
+        self._secret_cache = kwargs.pop("secret_cache", None)  # type: Optional[SecretCache]
+        super().__init__(vault_url, credential, config=config, transport=transport, api_version=api_version, **kwargs)
+
     async def get_secret(self, name: str, version: Optional[str] = None, **kwargs: Mapping[str, Any]) -> Secret:
         """Get a specified secret from the vault.
 
@@ -34,7 +62,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
         :param str name: The name of the secret.
         :param str version: The version of the secret. If version is None or an empty string, the latest version of
             the secret is returned.
-        :returns: An instance of Secret
+        :returns: An instance of Secret. When the client has a secret cache, this may be a cached value.
         :rtype: ~azure.keyvault.secrets._models.Secret
         :raises: ~azure.core.exceptions.ResourceNotFoundError if client failed to retrieve the secret
 
@@ -46,11 +74,68 @@ class SecretClient(_AsyncKeyVaultClientBase):
                 :caption: Get secret from the key vault
                 :dedent: 8
         """
+        if self._secret_cache is None:
+            return await self._get_secret(name, version, **kwargs)
+        return await get_cached_secret(
+            self._secret_cache, (self.vault_url, name, version or ""), lambda: self._get_secret(name, version, **kwargs)
+        )
+
+    async def _get_secret(self, name: str, version: Optional[str], **kwargs: Mapping[str, Any]) -> Secret:
         bundle = await self._client.get_secret(
             self.vault_url, name, version or "", error_map={404: ResourceNotFoundError}, **kwargs
         )
         return Secret._from_secret_bundle(bundle)
 
+    def _invalidate_cached_secret(self, name: str) -> None:
+        if self._secret_cache is not None:
+            self._secret_cache._invalidate(self.vault_url, name)
+
+    async def get_secrets(
+        self, names: Iterable[str], max_concurrency: int = 8, **kwargs: Mapping[str, Any]
+    ) -> List[Secret]:
+        """Get the latest versions of several secrets, requesting up to `max_concurrency` of them at a time.
+
+        This operation requires the secrets/get permission.
+
+        :param names: The names of the secrets
+        :type names: Iterable[str]
+        :param int max_concurrency: The maximum number of concurrent requests. Defaults to 8.
+        :returns: The secrets, in the order of `names`
+        :rtype: list[~azure.keyvault.secrets._models.Secret]
+        :raises: ~azure.core.exceptions.ResourceNotFoundError if a secret doesn't exist. When getting a secret
+            fails, requests for the others are cancelled.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await _gather([self._get_secret_bounded(semaphore, name, **kwargs) for name in names])
+
+    async def load_all(self, max_concurrency: int = 8, **kwargs: Mapping[str, Any]) -> Dict[str, Secret]:
+        """Get the latest version of every enabled secret in the vault.
+
+        Secrets are requested up to `max_concurrency` at a time, while the vault's list of secrets is still being
+        read. This operation requires the secrets/list and secrets/get permissions.
+
+        :param int max_concurrency: The maximum number of concurrent requests for secrets. Defaults to 8.
+        :returns: The secrets, by name
+        :rtype: dict[str, ~azure.keyvault.secrets._models.Secret]
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = []
+        try:
+            async for secret in self.list_secrets():
+                if secret.enabled is not False:
+                    tasks.append(asyncio.ensure_future(self._get_secret_bounded(semaphore, secret.name, **kwargs)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return {secret.name: secret for secret in await _gather(tasks)}
+
+    async def _get_secret_bounded(
+        self, semaphore: asyncio.Semaphore, name: str, **kwargs: Mapping[str, Any]
+    ) -> Secret:
+        async with semaphore:
+            return await self.get_secret(name, **kwargs)
+
     async def set_secret(
         self,
         name: str,
@@ -97,6 +182,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
         bundle = await self._client.set_secret(
             self.vault_url, name, value, secret_attributes=attributes, content_type=content_type, tags=tags, **kwargs
         )
+        self._invalidate_cached_secret(name)
         return Secret._from_secret_bundle(bundle)
 
     async def update_secret(
@@ -153,6 +239,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
             error_map={404: ResourceNotFoundError},
             **kwargs
         )
+        self._invalidate_cached_secret(name)
         return SecretAttributes._from_secret_bundle(bundle)  # pylint: disable=protected-access
 
     def list_secrets(self, **kwargs: Mapping[str, Any]) -> AsyncIterable[SecretAttributes]:
@@ -177,7 +264,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
         """
         max_results = kwargs.get("max_page_size")
         pages = self._client.get_secrets(self.vault_url, maxresults=max_results)
-        iterable = AsyncPagingAdapter(pages, SecretAttributes._from_secret_item)
+        iterable = AsyncPagingAdapter(AsyncPrefetchingPages(pages), SecretAttributes._from_secret_item)
         return iterable
 
     def list_secret_versions(self, name: str, **kwargs: Mapping[str, Any]) -> AsyncIterable[SecretAttributes]:
@@ -202,7 +289,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
         """
         max_results = kwargs.get("max_page_size")
         pages = self._client.get_secret_versions(self.vault_url, name, maxresults=max_results)
-        iterable = AsyncPagingAdapter(pages, SecretAttributes._from_secret_item)
+        iterable = AsyncPagingAdapter(AsyncPrefetchingPages(pages), SecretAttributes._from_secret_item)
         return iterable
 
     async def backup_secret(self, name: str, **kwargs: Mapping[str, Any]) -> bytes:
@@ -252,7 +339,9 @@ class SecretClient(_AsyncKeyVaultClientBase):
         bundle = await self._client.restore_secret(
             self.vault_url, backup, error_map={409: ResourceExistsError}, **kwargs
         )
-        return SecretAttributes._from_secret_bundle(bundle)
+        attributes = SecretAttributes._from_secret_bundle(bundle)
+        self._invalidate_cached_secret(attributes.name)
+        return attributes
 
     async def delete_secret(self, name: str, **kwargs: Mapping[str, Any]) -> DeletedSecret:
         """Deletes a secret from the vault.
@@ -277,6 +366,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
         bundle = await self._client.delete_secret(
             self.vault_url, name, error_map={404: ResourceNotFoundError}, **kwargs
         )
+        self._invalidate_cached_secret(name)
         return DeletedSecret._from_deleted_secret_bundle(bundle)
 
     async def get_deleted_secret(self, name: str, **kwargs: Mapping[str, Any]) -> DeletedSecret:
@@ -324,7 +414,7 @@ class SecretClient(_AsyncKeyVaultClientBase):
         """
         max_results = kwargs.get("max_page_size")
         pages = self._client.get_deleted_secrets(self.vault_url, maxresults=max_results, **kwargs)
-        iterable = AsyncPagingAdapter(pages, DeletedSecret._from_deleted_secret_item)
+        iterable = AsyncPagingAdapter(AsyncPrefetchingPages(pages), DeletedSecret._from_deleted_secret_item)
         return iterable
 
     async def purge_deleted_secret(self, name: str, **kwargs: Mapping[str, Any]) -> None:
@@ -367,4 +457,16 @@ class SecretClient(_AsyncKeyVaultClientBase):
                 :dedent: 8
         """
         bundle = await self._client.recover_deleted_secret(self.vault_url, name, **kwargs)
+        self._invalidate_cached_secret(name)
         return SecretAttributes._from_secret_bundle(bundle)
+
+
+async def _gather(awaitables: Iterable[Awaitable[Any]]) -> List[Any]:
+    """Like asyncio.gather, but cancels the others when one raises"""
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
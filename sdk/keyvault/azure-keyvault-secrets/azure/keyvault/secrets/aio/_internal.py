@@ -2,7 +2,8 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
-from typing import Any, Callable, Mapping, TYPE_CHECKING
+import asyncio
+from typing import Any, Callable, Iterator, Mapping, Optional, TYPE_CHECKING
 from azure.core.async_paging import AsyncPagedMixin
 from azure.core.configuration import Configuration
 from azure.core.pipeline import AsyncPipeline
@@ -41,6 +42,42 @@ class AsyncPagingAdapter:
         # TODO: expected type Model got Coroutine instead?
 
 
+class AsyncPrefetchingPages:
+    """Iterates the items of an azure.core paged object, requesting each page while the caller consumes the one
+    before. Its items can be adapted with AsyncPagingAdapter."""
+
+    # pylint:disable=protected-access
+
+    def __init__(self, pages: AsyncPagedMixin) -> None:
+        self._pages = pages
+        self._items = iter(())  # type: Iterator[Model]
+        self._fetch = None  # type: Optional[asyncio.Future]
+        self._started = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Model:
+        while True:
+            for item in self._items:
+                return item
+            if not self._fetch:
+                if self._started:
+                    raise StopAsyncIteration
+                self._started = True
+                self._fetch = self._start_fetch()
+            response = await self._fetch
+            self._pages._deserializer(self._pages, response)
+            self._items = iter(list(self._pages.current_page))
+            self._fetch = self._start_fetch() if self._pages.next_link else None
+
+    def _start_fetch(self) -> asyncio.Future:
+        fetch = asyncio.ensure_future(self._pages._async_get_next(self._pages.next_link))
+        # the caller may stop iterating before awaiting it
+        fetch.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return fetch
+
+
 class _AsyncKeyVaultClientBase:
     """
     :param credential:  A credential or credential provider which can be used to authenticate to the vault,
@@ -0,0 +1,114 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import threading
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:  # python < 3.3
+    from mock import Mock  # type: ignore
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.paging import Paged
+from azure.keyvault.secrets import SecretClient
+from azure.keyvault.secrets._generated.v7_0.models import SecretAttributes, SecretBundle, SecretItem
+
+VAULT_URL = "https://vault.vault.azure.net"
+
+
+def secret_item(name, enabled=True):
+    return SecretItem(id="{}/secrets/{}".format(VAULT_URL, name), attributes=SecretAttributes(enabled=enabled))
+
+
+def deserialize(paged_object, response):
+    paged_object.current_page, paged_object.next_link = response
+
+
+def paged(pages):
+    """A Paged over `pages`, a dict of next_link -> (items, next_link of the following page)"""
+    return Paged(Mock(side_effect=lambda next_link: pages[next_link]), deserialize)
+
+
+def get_secret(_, name, version, **__):
+    if name == "missing":
+        raise ResourceNotFoundError("not found")
+    return SecretBundle(value=name + " value", id="{}/secrets/{}/version".format(VAULT_URL, name))
+
+
+def test_list_prefetches_next_page():
+    second_page_requested = threading.Event()
+
+    def command(next_link):
+        if next_link == "second":
+            second_page_requested.set()
+            return [secret_item("c")], None
+        return [secret_item("a"), secret_item("b")], "second"
+
+    pages = Paged(command, deserialize)
+    client = SecretClient(VAULT_URL, object(), generated_client=Mock(get_secrets=Mock(return_value=pages)))
+
+    secrets = client.list_secrets()
+    assert next(secrets).name == "a"
+    # the second page is requested while the caller consumes the first
+    assert second_page_requested.wait(5)
+    assert [secret.name for secret in secrets] == ["b", "c"]
+
+
+def test_list_page_error():
+    def command(next_link):
+        if next_link == "second":
+            raise ResourceNotFoundError("not found")
+        return [secret_item("a")], "second"
+
+    pages = Paged(command, deserialize)
+    client = SecretClient(VAULT_URL, object(), generated_client=Mock(get_secrets=Mock(return_value=pages)))
+
+    secrets = client.list_secrets()
+    assert next(secrets).name == "a"
+    with pytest.raises(ResourceNotFoundError):
+        next(secrets)
+
+
+def test_get_secrets():
+    in_flight = [0]
+    max_in_flight = [0]
+    lock = threading.Lock()
+
+    def get_secret_slowly(*args, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return get_secret(*args, **kwargs)
+
+    client = SecretClient(VAULT_URL, object(), generated_client=Mock(get_secret=Mock(side_effect=get_secret_slowly)))
+    names = ["secret-{}".format(i) for i in range(20)]
+
+    secrets = client.get_secrets(names, max_concurrency=4)
+    assert [secret.value for secret in secrets] == [name + " value" for name in names]
+    assert 1 < max_in_flight[0] <= 4
+    assert client.get_secrets([]) == []
+
+    with pytest.raises(ResourceNotFoundError):
+        client.get_secrets(["a", "missing", "b"])
+
+
+def test_load_all():
+    pages = paged(
+        {
+            "": ([secret_item("a"), secret_item("disabled", enabled=False)], "second"),
+            "second": ([secret_item("b")], None),
+        }
+    )
+    generated_client = Mock(get_secrets=Mock(return_value=pages), get_secret=Mock(side_effect=get_secret))
+    client = SecretClient(VAULT_URL, object(), generated_client=generated_client)
+
+    secrets = client.load_all(max_concurrency=2)
+    assert {name: secret.value for name, secret in secrets.items()} == {"a": "a value", "b": "b value"}
+    # disabled secrets can't be gotten
+    assert generated_client.get_secret.call_count == 2
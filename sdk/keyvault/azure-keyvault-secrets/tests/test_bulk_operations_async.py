@@ -0,0 +1,83 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.paging import Paged
+from azure.keyvault.secrets.aio import SecretClient
+
+from test_bulk_operations import VAULT_URL, deserialize, get_secret, secret_item
+
+
+def async_paged(pages, requested):
+    async def command(next_link):
+        requested.append(next_link)
+        await asyncio.sleep(0)
+        return pages[next_link]
+
+    return Paged(None, deserialize, async_command=command)
+
+
+@pytest.mark.asyncio
+async def test_list_prefetches_next_page():
+    requested = []
+    pages = async_paged(
+        {"": ([secret_item("a"), secret_item("b")], "second"), "second": ([secret_item("c")], None)}, requested
+    )
+    client = SecretClient(VAULT_URL, object(), generated_client=Mock(get_secrets=Mock(return_value=pages)))
+
+    secrets = client.list_secrets()
+    assert (await secrets.__anext__()).name == "a"
+    await asyncio.sleep(0.01)
+    # the second page is requested while the caller consumes the first
+    assert requested == ["", "second"]
+    assert [secret.name async for secret in secrets] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_get_secrets():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_secret_async(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return get_secret(*args, **kwargs)
+
+    client = SecretClient(VAULT_URL, object(), generated_client=Mock(get_secret=get_secret_async))
+    names = ["secret-{}".format(i) for i in range(20)]
+
+    secrets = await client.get_secrets(names, max_concurrency=4)
+    assert [secret.value for secret in secrets] == [name + " value" for name in names]
+    assert max_in_flight == 4
+
+    with pytest.raises(ResourceNotFoundError):
+        await client.get_secrets(["a", "missing", "b"])
+
+
+@pytest.mark.asyncio
+async def test_load_all():
+    pages = async_paged(
+        {
+            "": ([secret_item("a"), secret_item("disabled", enabled=False)], "second"),
+            "second": ([secret_item("b")], None),
+        },
+        [],
+    )
+
+    async def get_secret_async(*args, **kwargs):
+        return get_secret(*args, **kwargs)
+
+    generated_client = Mock(get_secrets=Mock(return_value=pages), get_secret=Mock(wraps=get_secret_async))
+    client = SecretClient(VAULT_URL, object(), generated_client=generated_client)
+
+    secrets = await client.load_all(max_concurrency=2)
+    assert {name: secret.value for name, secret in secrets.items()} == {"a": "a value", "b": "b value"}
+    assert generated_client.get_secret.call_count == 2
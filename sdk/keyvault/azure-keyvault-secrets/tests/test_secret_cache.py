@@ -0,0 +1,162 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import threading
+import time
+
+try:
+    from unittest.mock import Mock, patch
+except ImportError:  # python < 3.3
+    from mock import Mock, patch  # type: ignore
+
+import pytest
+from azure.keyvault.secrets import SecretCache, SecretClient
+from azure.keyvault.secrets._generated.v7_0.models import DeletedSecretBundle, SecretBundle
+
+VAULT_URL = "https://vault.vault.azure.net"
+
+
+def secret_bundle(name, value, version="version"):
+    return SecretBundle(value=value, id="{}/secrets/{}/{}".format(VAULT_URL, name, version))
+
+
+def get_client(cache, **kwargs):
+    generated_client = Mock(**kwargs)
+    return SecretClient(VAULT_URL, object(), generated_client=generated_client, secret_cache=cache), generated_client
+
+
+def test_hit():
+    cache = SecretCache()
+    client, generated = get_client(cache, get_secret=Mock(return_value=secret_bundle("name", "value")))
+
+    for _ in range(3):
+        assert client.get_secret("name").value == "value"
+    assert generated.get_secret.call_count == 1
+
+    metrics = cache.metrics
+    assert (metrics.hits, metrics.misses, metrics.refreshes, metrics.size) == (2, 1, 1, 1)
+    assert metrics.hit_rate == pytest.approx(2 / 3.0)
+
+
+def test_no_cache():
+    generated_client = Mock(get_secret=Mock(return_value=secret_bundle("name", "value")))
+    client = SecretClient(VAULT_URL, object(), generated_client=generated_client)
+    client.get_secret("name")
+    client.get_secret("name")
+    assert client._client.get_secret.call_count == 2
+
+
+def test_versions():
+    bundles = {"": secret_bundle("name", "latest"), "v1": secret_bundle("name", "old", "v1")}
+    cache = SecretCache(ttl=0, stale_ttl=0)
+    client, generated = get_client(cache, get_secret=Mock(side_effect=lambda _, __, version, **___: bundles[version]))
+
+    assert client.get_secret("name").value == "latest"
+    assert client.get_secret("name", "v1").value == "old"
+    assert generated.get_secret.call_count == 2
+
+    # the latest version expired immediately, a specific version never expires
+    assert client.get_secret("name", "v1").value == "old"
+    assert generated.get_secret.call_count == 2
+    assert client.get_secret("name").value == "latest"
+    assert generated.get_secret.call_count == 3
+
+
+def test_eviction():
+    cache = SecretCache(max_size=2)
+    client, generated = get_client(
+        cache, get_secret=Mock(side_effect=lambda _, name, __, **___: secret_bundle(name, name))
+    )
+
+    client.get_secret("a")
+    client.get_secret("b")
+    client.get_secret("a")  # b is now the least recently used
+    client.get_secret("c")
+    assert generated.get_secret.call_count == 3
+
+    client.get_secret("a")
+    assert generated.get_secret.call_count == 3
+    client.get_secret("b")
+    assert generated.get_secret.call_count == 4
+    assert cache.metrics.evictions == 2
+    assert cache.metrics.size == 2
+
+
+def test_stale_while_revalidate():
+    values = iter(("first", "second"))
+    fetched = threading.Event()
+
+    def get_secret(*_, **__):
+        bundle = secret_bundle("name", next(values))
+        fetched.set()
+        return bundle
+
+    cache = SecretCache(ttl=60, stale_ttl=60)
+    client, generated = get_client(cache, get_secret=Mock(side_effect=get_secret))
+    assert client.get_secret("name").value == "first"
+    fetched.clear()
+
+    now = time.time()
+    with patch("azure.keyvault.secrets._cache.time.time", lambda: now + 90):
+        # the stale secret is returned while it's refreshed
+        assert client.get_secret("name").value == "first"
+        assert fetched.wait(5)
+        for _ in range(50):
+            if cache.metrics.refreshes == 2:
+                break
+            time.sleep(0.01)
+        assert client.get_secret("name").value == "second"
+
+    assert generated.get_secret.call_count == 2
+    assert cache.metrics.stale_hits == 1
+
+
+def test_invalidation():
+    cache = SecretCache()
+    client, generated = get_client(
+        cache,
+        get_secret=Mock(return_value=secret_bundle("name", "value")),
+        set_secret=Mock(return_value=secret_bundle("name", "new value")),
+        delete_secret=Mock(return_value=DeletedSecretBundle(id="{}/secrets/name/version".format(VAULT_URL))),
+    )
+
+    client.get_secret("name")
+    client.get_secret("name", "version")
+    client.set_secret("name", "new value")
+    assert cache.metrics.size == 0
+    client.get_secret("name")
+    assert generated.get_secret.call_count == 3
+
+    client.delete_secret("name")
+    assert cache.metrics.size == 0
+
+
+def test_concurrent_misses():
+    """concurrent lookups of a secret should send one request"""
+
+    def get_secret(*_, **__):
+        time.sleep(0.1)
+        return secret_bundle("name", "value")
+
+    cache = SecretCache()
+    client, generated = get_client(cache, get_secret=Mock(side_effect=get_secret))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_secret("name").value)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 8
+    assert generated.get_secret.call_count == 1
+
+
+def test_errors_not_cached():
+    cache = SecretCache()
+    client, generated = get_client(cache, get_secret=Mock(side_effect=[ValueError(), secret_bundle("name", "value")]))
+
+    with pytest.raises(ValueError):
+        client.get_secret("name")
+    assert client.get_secret("name").value == "value"
+    assert cache.metrics.refresh_errors == 1
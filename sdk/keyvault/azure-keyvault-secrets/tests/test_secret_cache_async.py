@@ -0,0 +1,99 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from azure.keyvault.secrets.aio import SecretCache, SecretClient
+from azure.keyvault.secrets._generated.v7_0.models import SecretBundle
+
+VAULT_URL = "https://vault.vault.azure.net"
+
+
+def secret_bundle(name, value, version="version"):
+    return SecretBundle(value=value, id="{}/secrets/{}/{}".format(VAULT_URL, name, version))
+
+
+def get_client(cache, get_secret):
+    generated_client = Mock(get_secret=Mock(wraps=get_secret))
+    return SecretClient(VAULT_URL, object(), generated_client=generated_client, secret_cache=cache), generated_client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses():
+    """concurrent lookups of a secret should send one request"""
+
+    async def get_secret(*_, **__):
+        await asyncio.sleep(0.05)
+        return secret_bundle("name", "value")
+
+    cache = SecretCache()
+    client, generated = get_client(cache, get_secret)
+
+    secrets = await asyncio.gather(*[client.get_secret("name") for _ in range(8)])
+    assert [secret.value for secret in secrets] == ["value"] * 8
+    assert generated.get_secret.call_count == 1
+
+    assert (await client.get_secret("name")).value == "value"
+    assert generated.get_secret.call_count == 1
+    assert cache.metrics.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_lookup():
+    """cancelling one lookup shouldn't cancel the fetch another is waiting for"""
+
+    async def get_secret(*_, **__):
+        await asyncio.sleep(0.05)
+        return secret_bundle("name", "value")
+
+    client, generated = get_client(SecretCache(), get_secret)
+    first = asyncio.ensure_future(client.get_secret("name"))
+    second = asyncio.ensure_future(client.get_secret("name"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second).value == "value"
+    assert generated.get_secret.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate():
+    values = iter(("first", "second"))
+
+    async def get_secret(*_, **__):
+        return secret_bundle("name", next(values))
+
+    cache = SecretCache(ttl=60, stale_ttl=60)
+    client, generated = get_client(cache, get_secret)
+    assert (await client.get_secret("name")).value == "first"
+
+    now = time.time()
+    with patch("azure.keyvault.secrets._cache.time.time", lambda: now + 90):
+        assert (await client.get_secret("name")).value == "first"
+        await asyncio.sleep(0.01)
+        assert (await client.get_secret("name")).value == "second"
+
+    assert generated.get_secret.call_count == 2
+    assert cache.metrics.stale_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_not_cached():
+    responses = [ValueError(), secret_bundle("name", "value")]
+
+    async def get_secret(*_, **__):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    cache = SecretCache()
+    client, _ = get_client(cache, get_secret)
+    with pytest.raises(ValueError):
+        await client.get_secret("name")
+    assert (await client.get_secret("name")).value == "value"
+    assert cache.metrics.refresh_errors == 1
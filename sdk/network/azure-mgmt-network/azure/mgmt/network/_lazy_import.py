@@ -0,0 +1,68 @@
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Lazy loading of the models modules.
+
+Each API version has hundreds of model classes, and importing all of them for every
+version takes seconds. On Python 3.7 and above, the models modules use a module
+level __getattr__ (PEP 562) to import a class only when it is first accessed, and
+then keep it in the module globals. On older versions everything is imported upfront.
+"""
+import importlib
+import sys
+
+_MODULE_GETATTR = sys.version_info >= (3, 7)
+
+
+def _import_module(module_name, package):
+    try:
+        return importlib.import_module(module_name, package)
+    except (SyntaxError, ImportError):
+        if not module_name.endswith('_py3'):
+            raise
+        # Python 2 uses the models without type annotations
+        return importlib.import_module(module_name[:-len('_py3')], package)
+
+
+def install_lazy_import(module_globals, names_by_module):
+    """Makes the names defined by each submodule attributes of the module,
+    imported when first accessed.
+
+    :param dict module_globals: The globals() of the module.
+    :param dict names_by_module: The names to import from each relative module name.
+    """
+    this_module = module_globals['__name__']
+    package = module_globals['__package__']
+    index = {name: module_name for module_name, names in names_by_module.items() for name in names}
+    modules = {}
+
+    def load(name):
+        module_name = index[name]
+        module = modules.get(module_name)
+        if module is None:
+            module = modules[module_name] = _import_module(module_name, package)
+        value = module_globals[name] = getattr(module, name)
+        return value
+
+    if not _MODULE_GETATTR:
+        for name in index:
+            load(name)
+        return
+
+    def __getattr__(name):
+        if name not in index:
+            raise AttributeError("module {!r} has no attribute {!r}".format(this_module, name))
+        return load(name)
+
+    def __dir__():
+        return sorted(set(module_globals) | set(index))
+
+    # star imports look up __all__ first, and would otherwise only see the loaded names
+    module_globals.setdefault('__all__', sorted(index))
+
+    module_globals['__getattr__'] = __getattr__
+    module_globals['__dir__'] = __dir__
+
@@ -10,10 +10,9 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import SDKClient
-from msrest import Serializer, Deserializer
 
 from azure.profiles import KnownProfiles, ProfileDefinition
-from azure.profiles.multiapiclient import MultiApiClientMixin
+from azure.profiles.multiapiclient import MultiApiClientMixin, cached_operation_group
 from .version import VERSION
 from ._configuration import NetworkManagementClientConfiguration
 from ._operations_mixin import NetworkManagementClientOperationsMixin
@@ -69,7 +68,8 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
 
     @classmethod
     def _models_dict(cls, api_version):
-        return {k: v for k, v in cls.models(api_version).__dict__.items() if isinstance(v, type)}
+        models = cls.models(api_version)
+        return {k: getattr(models, k) for k in models.__all__}
 
     @classmethod
     def models(cls, api_version=DEFAULT_API_VERSION):
@@ -159,6 +159,7 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
         raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
     @property
+    @cached_operation_group
     def application_gateways(self):
         """Instance depends on the API version:
 
@@ -226,9 +227,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ApplicationGatewaysOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def application_security_groups(self):
         """Instance depends on the API version:
 
@@ -278,9 +280,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ApplicationSecurityGroupsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def available_delegations(self):
         """Instance depends on the API version:
 
@@ -306,9 +309,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AvailableDelegationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def available_endpoint_services(self):
         """Instance depends on the API version:
 
@@ -364,9 +368,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AvailableEndpointServicesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def available_private_endpoint_types(self):
         """Instance depends on the API version:
 
@@ -377,9 +382,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AvailablePrivateEndpointTypesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def available_resource_group_delegations(self):
         """Instance depends on the API version:
 
@@ -405,9 +411,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AvailableResourceGroupDelegationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def available_resource_group_private_endpoint_types(self):
         """Instance depends on the API version:
 
@@ -418,9 +425,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AvailableResourceGroupPrivateEndpointTypesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def azure_firewall_fqdn_tags(self):
         """Instance depends on the API version:
 
@@ -446,9 +454,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AzureFirewallFqdnTagsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def azure_firewalls(self):
         """Instance depends on the API version:
 
@@ -483,9 +492,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import AzureFirewallsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def bastion_hosts(self):
         """Instance depends on the API version:
 
@@ -496,9 +506,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import BastionHostsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def bgp_service_communities(self):
         """Instance depends on the API version:
 
@@ -560,9 +571,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import BgpServiceCommunitiesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def connection_monitors(self):
         """Instance depends on the API version:
 
@@ -609,9 +621,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ConnectionMonitorsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def ddos_custom_policies(self):
         """Instance depends on the API version:
 
@@ -631,9 +644,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import DdosCustomPoliciesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def ddos_protection_plans(self):
         """Instance depends on the API version:
 
@@ -671,9 +685,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import DdosProtectionPlansOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def default_security_rules(self):
         """Instance depends on the API version:
 
@@ -729,9 +744,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import DefaultSecurityRulesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_circuit_authorizations(self):
         """Instance depends on the API version:
 
@@ -799,9 +815,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteCircuitAuthorizationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_circuit_connections(self):
         """Instance depends on the API version:
 
@@ -839,9 +856,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteCircuitConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_circuit_peerings(self):
         """Instance depends on the API version:
 
@@ -909,9 +927,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteCircuitPeeringsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_circuits(self):
         """Instance depends on the API version:
 
@@ -979,9 +998,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteCircuitsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_connections(self):
         """Instance depends on the API version:
 
@@ -1007,9 +1027,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_cross_connection_peerings(self):
         """Instance depends on the API version:
 
@@ -1047,9 +1068,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteCrossConnectionPeeringsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_cross_connections(self):
         """Instance depends on the API version:
 
@@ -1087,9 +1109,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteCrossConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_gateways(self):
         """Instance depends on the API version:
 
@@ -1115,9 +1138,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteGatewaysOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_links(self):
         """Instance depends on the API version:
 
@@ -1143,9 +1167,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteLinksOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_ports(self):
         """Instance depends on the API version:
 
@@ -1171,9 +1196,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRoutePortsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_ports_locations(self):
         """Instance depends on the API version:
 
@@ -1199,9 +1225,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRoutePortsLocationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def express_route_service_providers(self):
         """Instance depends on the API version:
 
@@ -1269,9 +1296,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ExpressRouteServiceProvidersOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def hub_virtual_network_connections(self):
         """Instance depends on the API version:
 
@@ -1306,9 +1334,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import HubVirtualNetworkConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def inbound_nat_rules(self):
         """Instance depends on the API version:
 
@@ -1364,9 +1393,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import InboundNatRulesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def interface_endpoints(self):
         """Instance depends on the API version:
 
@@ -1389,9 +1419,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_02_01.operations import InterfaceEndpointsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancer_backend_address_pools(self):
         """Instance depends on the API version:
 
@@ -1447,9 +1478,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancerBackendAddressPoolsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancer_frontend_ip_configurations(self):
         """Instance depends on the API version:
 
@@ -1505,9 +1537,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancerFrontendIPConfigurationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancer_load_balancing_rules(self):
         """Instance depends on the API version:
 
@@ -1563,9 +1596,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancerLoadBalancingRulesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancer_network_interfaces(self):
         """Instance depends on the API version:
 
@@ -1621,9 +1655,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancerNetworkInterfacesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancer_outbound_rules(self):
         """Instance depends on the API version:
 
@@ -1649,9 +1684,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancerOutboundRulesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancer_probes(self):
         """Instance depends on the API version:
 
@@ -1707,9 +1743,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancerProbesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def load_balancers(self):
         """Instance depends on the API version:
 
@@ -1777,9 +1814,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LoadBalancersOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def local_network_gateways(self):
         """Instance depends on the API version:
 
@@ -1847,9 +1885,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import LocalNetworkGatewaysOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def nat_gateways(self):
         """Instance depends on the API version:
 
@@ -1863,9 +1902,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NatGatewaysOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_interface_ip_configurations(self):
         """Instance depends on the API version:
 
@@ -1921,9 +1961,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkInterfaceIPConfigurationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_interface_load_balancers(self):
         """Instance depends on the API version:
 
@@ -1979,9 +2020,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkInterfaceLoadBalancersOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_interface_tap_configurations(self):
         """Instance depends on the API version:
 
@@ -2007,9 +2049,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkInterfaceTapConfigurationsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_interfaces(self):
         """Instance depends on the API version:
 
@@ -2077,9 +2120,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkInterfacesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_profiles(self):
         """Instance depends on the API version:
 
@@ -2105,9 +2149,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkProfilesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_security_groups(self):
         """Instance depends on the API version:
 
@@ -2175,9 +2220,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkSecurityGroupsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def network_watchers(self):
         """Instance depends on the API version:
 
@@ -2242,9 +2288,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import NetworkWatchersOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def operations(self):
         """Instance depends on the API version:
 
@@ -2294,9 +2341,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import Operations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def packet_captures(self):
         """Instance depends on the API version:
 
@@ -2361,9 +2409,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import PacketCapturesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def peer_express_route_circuit_connections(self):
         """Instance depends on the API version:
 
@@ -2380,9 +2429,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import PeerExpressRouteCircuitConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def private_endpoints(self):
         """Instance depends on the API version:
 
@@ -2393,9 +2443,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import PrivateEndpointsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def private_link_services(self):
         """Instance depends on the API version:
 
@@ -2406,9 +2457,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import PrivateLinkServicesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def public_ip_addresses(self):
         """Instance depends on the API version:
 
@@ -2476,9 +2528,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import PublicIPAddressesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def public_ip_prefixes(self):
         """Instance depends on the API version:
 
@@ -2507,9 +2560,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import PublicIPPrefixesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def resource_navigation_links(self):
         """Instance depends on the API version:
 
@@ -2523,9 +2577,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ResourceNavigationLinksOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def route_filter_rules(self):
         """Instance depends on the API version:
 
@@ -2587,9 +2642,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import RouteFilterRulesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def route_filters(self):
         """Instance depends on the API version:
 
@@ -2651,9 +2707,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import RouteFiltersOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def route_tables(self):
         """Instance depends on the API version:
 
@@ -2721,9 +2778,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import RouteTablesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def routes(self):
         """Instance depends on the API version:
 
@@ -2791,9 +2849,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import RoutesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def security_rules(self):
         """Instance depends on the API version:
 
@@ -2861,9 +2920,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import SecurityRulesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def service_association_links(self):
         """Instance depends on the API version:
 
@@ -2877,9 +2937,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ServiceAssociationLinksOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def service_endpoint_policies(self):
         """Instance depends on the API version:
 
@@ -2908,9 +2969,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ServiceEndpointPoliciesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def service_endpoint_policy_definitions(self):
         """Instance depends on the API version:
 
@@ -2939,9 +3001,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ServiceEndpointPolicyDefinitionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def service_tags(self):
         """Instance depends on the API version:
 
@@ -2952,9 +3015,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import ServiceTagsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def subnets(self):
         """Instance depends on the API version:
 
@@ -3022,9 +3086,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import SubnetsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def usages(self):
         """Instance depends on the API version:
 
@@ -3092,9 +3157,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import UsagesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_hubs(self):
         """Instance depends on the API version:
 
@@ -3129,9 +3195,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualHubsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_network_gateway_connections(self):
         """Instance depends on the API version:
 
@@ -3199,9 +3266,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualNetworkGatewayConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_network_gateways(self):
         """Instance depends on the API version:
 
@@ -3269,9 +3337,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualNetworkGatewaysOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_network_peerings(self):
         """Instance depends on the API version:
 
@@ -3336,9 +3405,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualNetworkPeeringsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_network_taps(self):
         """Instance depends on the API version:
 
@@ -3364,9 +3434,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualNetworkTapsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_networks(self):
         """Instance depends on the API version:
 
@@ -3434,9 +3505,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualNetworksOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_wa_ns(self):
         """Instance depends on the API version:
 
@@ -3453,9 +3525,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2018_07_01.operations import VirtualWANsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def virtual_wans(self):
         """Instance depends on the API version:
 
@@ -3481,9 +3554,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VirtualWansOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def vpn_connections(self):
         """Instance depends on the API version:
 
@@ -3518,9 +3592,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VpnConnectionsOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def vpn_gateways(self):
         """Instance depends on the API version:
 
@@ -3555,9 +3630,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VpnGatewaysOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def vpn_sites(self):
         """Instance depends on the API version:
 
@@ -3592,9 +3668,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VpnSitesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def vpn_sites_configuration(self):
         """Instance depends on the API version:
 
@@ -3629,9 +3706,10 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import VpnSitesConfigurationOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
 
     @property
+    @cached_operation_group
     def web_application_firewall_policies(self):
         """Instance depends on the API version:
 
@@ -3648,4 +3726,4 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, MultiApiCl
             from .v2019_04_01.operations import WebApplicationFirewallPoliciesOperations as OperationClass
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
-        return OperationClass(self._client, self.config, Serializer(self._models_dict(api_version)), Deserializer(self._models_dict(api_version)))
+        return OperationClass(self._client, self.config, *self._get_serializers(api_version))
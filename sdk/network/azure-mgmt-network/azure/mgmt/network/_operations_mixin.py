@@ -8,7 +8,6 @@
 # Changes may cause incorrect behavior and will be lost if the code is
 # regenerated.
 # --------------------------------------------------------------------------
-from msrest import Serializer, Deserializer
 
 
 class NetworkManagementClientOperationsMixin(object):
@@ -82,8 +81,7 @@ class NetworkManagementClientOperationsMixin(object):
         mixin_instance = OperationClass()
         mixin_instance._client = self._client
         mixin_instance.config = self.config
-        mixin_instance._serialize = Serializer(self._models_dict(api_version))
-        mixin_instance._deserialize = Deserializer(self._models_dict(api_version))
+        mixin_instance._serialize, mixin_instance._deserialize = self._get_serializers(api_version)
         return mixin_instance.check_dns_name_availability(location, domain_name_label, custom_headers, raw, **operation_config)
 
     def supported_security_providers(self, resource_group_name, virtual_wan_name, custom_headers=None, raw=False, **operation_config):
@@ -125,6 +123,5 @@ class NetworkManagementClientOperationsMixin(object):
         mixin_instance = OperationClass()
         mixin_instance._client = self._client
         mixin_instance.config = self.config
-        mixin_instance._serialize = Serializer(self._models_dict(api_version))
-        mixin_instance._deserialize = Deserializer(self._models_dict(api_version))
+        mixin_instance._serialize, mixin_instance._deserialize = self._get_serializers(api_version)
         return mixin_instance.supported_security_providers(resource_group_name, virtual_wan_name, custom_headers, raw, **operation_config)
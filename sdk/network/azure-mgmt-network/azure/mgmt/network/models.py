@@ -4,23 +4,526 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-from .v2015_06_15.models import *
-from .v2016_09_01.models import *
-from .v2016_12_01.models import *
-from .v2017_03_01.models import *
-from .v2017_06_01.models import *
-from .v2017_08_01.models import *
-from .v2017_09_01.models import *
-from .v2017_10_01.models import *
-from .v2017_11_01.models import *
-from .v2018_01_01.models import *
-from .v2018_02_01.models import *
-from .v2018_04_01.models import *
-from .v2018_06_01.models import *
-from .v2018_07_01.models import *
-from .v2018_08_01.models import *
-from .v2018_10_01.models import *
-from .v2018_11_01.models import *
-from .v2018_12_01.models import *
-from .v2019_02_01.models import *
-from .v2019_04_01.models import *
+from . import _lazy_import
+
+# the API version each name is taken from: the latest one defining it
+_lazy_import.install_lazy_import(globals(), {
+    '.v2019_04_01.models': [
+        'Access',
+        'AddressSpace',
+        'ApplicationGateway',
+        'ApplicationGatewayAuthenticationCertificate',
+        'ApplicationGatewayAutoscaleConfiguration',
+        'ApplicationGatewayAvailableSslOptions',
+        'ApplicationGatewayAvailableWafRuleSetsResult',
+        'ApplicationGatewayBackendAddress',
+        'ApplicationGatewayBackendAddressPool',
+        'ApplicationGatewayBackendHealth',
+        'ApplicationGatewayBackendHealthHttpSettings',
+        'ApplicationGatewayBackendHealthOnDemand',
+        'ApplicationGatewayBackendHealthPool',
+        'ApplicationGatewayBackendHealthServer',
+        'ApplicationGatewayBackendHealthServerHealth',
+        'ApplicationGatewayBackendHttpSettings',
+        'ApplicationGatewayConnectionDraining',
+        'ApplicationGatewayCookieBasedAffinity',
+        'ApplicationGatewayCustomError',
+        'ApplicationGatewayCustomErrorStatusCode',
+        'ApplicationGatewayFirewallDisabledRuleGroup',
+        'ApplicationGatewayFirewallExclusion',
+        'ApplicationGatewayFirewallMode',
+        'ApplicationGatewayFirewallRule',
+        'ApplicationGatewayFirewallRuleGroup',
+        'ApplicationGatewayFirewallRuleSet',
+        'ApplicationGatewayFrontendIPConfiguration',
+        'ApplicationGatewayFrontendPort',
+        'ApplicationGatewayHeaderConfiguration',
+        'ApplicationGatewayHttpListener',
+        'ApplicationGatewayIPConfiguration',
+        'ApplicationGatewayOnDemandProbe',
+        'ApplicationGatewayOperationalState',
+        'ApplicationGatewayPaged',
+        'ApplicationGatewayPathRule',
+        'ApplicationGatewayProbe',
+        'ApplicationGatewayProbeHealthResponseMatch',
+        'ApplicationGatewayProtocol',
+        'ApplicationGatewayRedirectConfiguration',
+        'ApplicationGatewayRedirectType',
+        'ApplicationGatewayRequestRoutingRule',
+        'ApplicationGatewayRequestRoutingRuleType',
+        'ApplicationGatewayRewriteRule',
+        'ApplicationGatewayRewriteRuleActionSet',
+        'ApplicationGatewayRewriteRuleCondition',
+        'ApplicationGatewayRewriteRuleSet',
+        'ApplicationGatewaySku',
+        'ApplicationGatewaySkuName',
+        'ApplicationGatewaySslCertificate',
+        'ApplicationGatewaySslCipherSuite',
+        'ApplicationGatewaySslPolicy',
+        'ApplicationGatewaySslPolicyName',
+        'ApplicationGatewaySslPolicyType',
+        'ApplicationGatewaySslPredefinedPolicy',
+        'ApplicationGatewaySslPredefinedPolicyPaged',
+        'ApplicationGatewaySslProtocol',
+        'ApplicationGatewayTier',
+        'ApplicationGatewayTrustedRootCertificate',
+        'ApplicationGatewayUrlPathMap',
+        'ApplicationGatewayWebApplicationFirewallConfiguration',
+        'ApplicationSecurityGroup',
+        'ApplicationSecurityGroupPaged',
+        'AssociationType',
+        'AuthenticationMethod',
+        'AuthorizationUseStatus',
+        'Availability',
+        'AvailableDelegation',
+        'AvailableDelegationPaged',
+        'AvailablePrivateEndpointType',
+        'AvailablePrivateEndpointTypePaged',
+        'AvailableProvidersList',
+        'AvailableProvidersListCity',
+        'AvailableProvidersListCountry',
+        'AvailableProvidersListParameters',
+        'AvailableProvidersListState',
+        'AzureAsyncOperationResult',
+        'AzureFirewall',
+        'AzureFirewallApplicationRule',
+        'AzureFirewallApplicationRuleCollection',
+        'AzureFirewallApplicationRuleProtocol',
+        'AzureFirewallApplicationRuleProtocolType',
+        'AzureFirewallFqdnTag',
+        'AzureFirewallFqdnTagPaged',
+        'AzureFirewallIPConfiguration',
+        'AzureFirewallNatRCAction',
+        'AzureFirewallNatRCActionType',
+        'AzureFirewallNatRule',
+        'AzureFirewallNatRuleCollection',
+        'AzureFirewallNetworkRule',
+        'AzureFirewallNetworkRuleCollection',
+        'AzureFirewallNetworkRuleProtocol',
+        'AzureFirewallPaged',
+        'AzureFirewallRCAction',
+        'AzureFirewallRCActionType',
+        'AzureFirewallThreatIntelMode',
+        'AzureReachabilityReport',
+        'AzureReachabilityReportItem',
+        'AzureReachabilityReportLatencyInfo',
+        'AzureReachabilityReportLocation',
+        'AzureReachabilityReportParameters',
+        'BGPCommunity',
+        'BackendAddressPool',
+        'BackendAddressPoolPaged',
+        'BastionHost',
+        'BastionHostIPConfiguration',
+        'BastionHostPaged',
+        'BgpPeerState',
+        'BgpPeerStatus',
+        'BgpPeerStatusListResult',
+        'BgpServiceCommunity',
+        'BgpServiceCommunityPaged',
+        'BgpSettings',
+        'CircuitConnectionStatus',
+        'ConnectionMonitor',
+        'ConnectionMonitorDestination',
+        'ConnectionMonitorParameters',
+        'ConnectionMonitorQueryResult',
+        'ConnectionMonitorResult',
+        'ConnectionMonitorResultPaged',
+        'ConnectionMonitorSource',
+        'ConnectionMonitorSourceStatus',
+        'ConnectionResetSharedKey',
+        'ConnectionSharedKey',
+        'ConnectionState',
+        'ConnectionStateSnapshot',
+        'ConnectionStatus',
+        'ConnectivityDestination',
+        'ConnectivityHop',
+        'ConnectivityInformation',
+        'ConnectivityIssue',
+        'ConnectivityParameters',
+        'ConnectivitySource',
+        'Container',
+        'ContainerNetworkInterface',
+        'ContainerNetworkInterfaceConfiguration',
+        'ContainerNetworkInterfaceIpConfiguration',
+        'DdosCustomPolicy',
+        'DdosCustomPolicyProtocol',
+        'DdosCustomPolicyTriggerSensitivityOverride',
+        'DdosProtectionPlan',
+        'DdosProtectionPlanPaged',
+        'DdosSettings',
+        'DdosSettingsProtectionCoverage',
+        'Delegation',
+        'DeviceProperties',
+        'DhGroup',
+        'DhcpOptions',
+        'Dimension',
+        'Direction',
+        'DnsNameAvailabilityResult',
+        'EffectiveNetworkSecurityGroup',
+        'EffectiveNetworkSecurityGroupAssociation',
+        'EffectiveNetworkSecurityGroupListResult',
+        'EffectiveNetworkSecurityRule',
+        'EffectiveRoute',
+        'EffectiveRouteListResult',
+        'EffectiveRouteSource',
+        'EffectiveRouteState',
+        'EffectiveSecurityRuleProtocol',
+        'EndpointServiceResult',
+        'EndpointServiceResultPaged',
+        'Error',
+        'ErrorDetails',
+        'ErrorException',
+        'ErrorResponse',
+        'ErrorResponseException',
+        'EvaluatedNetworkSecurityGroup',
+        'EvaluationState',
+        'ExpressRouteCircuit',
+        'ExpressRouteCircuitArpTable',
+        'ExpressRouteCircuitAuthorization',
+        'ExpressRouteCircuitAuthorizationPaged',
+        'ExpressRouteCircuitConnection',
+        'ExpressRouteCircuitConnectionPaged',
+        'ExpressRouteCircuitPaged',
+        'ExpressRouteCircuitPeering',
+        'ExpressRouteCircuitPeeringAdvertisedPublicPrefixState',
+        'ExpressRouteCircuitPeeringConfig',
+        'ExpressRouteCircuitPeeringId',
+        'ExpressRouteCircuitPeeringPaged',
+        'ExpressRouteCircuitPeeringState',
+        'ExpressRouteCircuitReference',
+        'ExpressRouteCircuitRoutesTable',
+        'ExpressRouteCircuitRoutesTableSummary',
+        'ExpressRouteCircuitServiceProviderProperties',
+        'ExpressRouteCircuitSku',
+        'ExpressRouteCircuitSkuFamily',
+        'ExpressRouteCircuitSkuTier',
+        'ExpressRouteCircuitStats',
+        'ExpressRouteCircuitsArpTableListResult',
+        'ExpressRouteCircuitsRoutesTableListResult',
+        'ExpressRouteCircuitsRoutesTableSummaryListResult',
+        'ExpressRouteConnection',
+        'ExpressRouteConnectionId',
+        'ExpressRouteConnectionList',
+        'ExpressRouteCrossConnection',
+        'ExpressRouteCrossConnectionPaged',
+        'ExpressRouteCrossConnectionPeering',
+        'ExpressRouteCrossConnectionPeeringPaged',
+        'ExpressRouteCrossConnectionRoutesTableSummary',
+        'ExpressRouteCrossConnectionsRoutesTableSummaryListResult',
+        'ExpressRouteGateway',
+        'ExpressRouteGatewayList',
+        'ExpressRouteGatewayPropertiesAutoScaleConfiguration',
+        'ExpressRouteGatewayPropertiesAutoScaleConfigurationBounds',
+        'ExpressRouteLink',
+        'ExpressRouteLinkAdminState',
+        'ExpressRouteLinkConnectorType',
+        'ExpressRouteLinkPaged',
+        'ExpressRoutePeeringState',
+        'ExpressRoutePeeringType',
+        'ExpressRoutePort',
+        'ExpressRoutePortPaged',
+        'ExpressRoutePortsEncapsulation',
+        'ExpressRoutePortsLocation',
+        'ExpressRoutePortsLocationBandwidths',
+        'ExpressRoutePortsLocationPaged',
+        'ExpressRouteServiceProvider',
+        'ExpressRouteServiceProviderBandwidthsOffered',
+        'ExpressRouteServiceProviderPaged',
+        'FlowLogFormatParameters',
+        'FlowLogFormatType',
+        'FlowLogInformation',
+        'FlowLogStatusParameters',
+        'FrontendIPConfiguration',
+        'FrontendIPConfigurationPaged',
+        'GatewayRoute',
+        'GatewayRouteListResult',
+        'GetVpnSitesConfigurationRequest',
+        'HTTPConfiguration',
+        'HTTPHeader',
+        'HTTPMethod',
+        'HubVirtualNetworkConnection',
+        'HubVirtualNetworkConnectionPaged',
+        'HubVirtualNetworkConnectionStatus',
+        'IPAddressAvailabilityResult',
+        'IPAllocationMethod',
+        'IPConfiguration',
+        'IPConfigurationProfile',
+        'IPVersion',
+        'IkeEncryption',
+        'IkeIntegrity',
+        'InboundNatPool',
+        'InboundNatRule',
+        'InboundNatRulePaged',
+        'IpFlowProtocol',
+        'IpTag',
+        'IpsecEncryption',
+        'IpsecIntegrity',
+        'IpsecPolicy',
+        'Ipv6ExpressRouteCircuitPeeringConfig',
+        'IssueType',
+        'LoadBalancer',
+        'LoadBalancerOutboundRuleProtocol',
+        'LoadBalancerPaged',
+        'LoadBalancerSku',
+        'LoadBalancerSkuName',
+        'LoadBalancingRule',
+        'LoadBalancingRulePaged',
+        'LoadDistribution',
+        'LocalNetworkGateway',
+        'LocalNetworkGatewayPaged',
+        'LogSpecification',
+        'ManagedServiceIdentity',
+        'ManagedServiceIdentityUserAssignedIdentitiesValue',
+        'MatchCondition',
+        'MatchVariable',
+        'MatchedRule',
+        'MetricSpecification',
+        'NatGateway',
+        'NatGatewayPaged',
+        'NatGatewaySku',
+        'NatGatewaySkuName',
+        'NetworkConfigurationDiagnosticParameters',
+        'NetworkConfigurationDiagnosticProfile',
+        'NetworkConfigurationDiagnosticResponse',
+        'NetworkConfigurationDiagnosticResult',
+        'NetworkIntentPolicy',
+        'NetworkIntentPolicyConfiguration',
+        'NetworkInterface',
+        'NetworkInterfaceAssociation',
+        'NetworkInterfaceDnsSettings',
+        'NetworkInterfaceIPConfiguration',
+        'NetworkInterfaceIPConfigurationPaged',
+        'NetworkInterfacePaged',
+        'NetworkInterfaceTapConfiguration',
+        'NetworkInterfaceTapConfigurationPaged',
+        'NetworkOperationStatus',
+        'NetworkProfile',
+        'NetworkProfilePaged',
+        'NetworkSecurityGroup',
+        'NetworkSecurityGroupPaged',
+        'NetworkSecurityGroupResult',
+        'NetworkSecurityRulesEvaluationResult',
+        'NetworkWatcher',
+        'NetworkWatcherPaged',
+        'NextHopParameters',
+        'NextHopResult',
+        'NextHopType',
+        'OfficeTrafficCategory',
+        'Operation',
+        'OperationDisplay',
+        'OperationPaged',
+        'OperationPropertiesFormatServiceSpecification',
+        'Origin',
+        'OutboundRule',
+        'OutboundRulePaged',
+        'P2SVpnGateway',
+        'P2SVpnGatewayPaged',
+        'P2SVpnProfileParameters',
+        'P2SVpnServerConfigRadiusClientRootCertificate',
+        'P2SVpnServerConfigRadiusServerRootCertificate',
+        'P2SVpnServerConfigVpnClientRevokedCertificate',
+        'P2SVpnServerConfigVpnClientRootCertificate',
+        'P2SVpnServerConfiguration',
+        'P2SVpnServerConfigurationPaged',
+        'PacketCapture',
+        'PacketCaptureFilter',
+        'PacketCaptureParameters',
+        'PacketCaptureQueryStatusResult',
+        'PacketCaptureResult',
+        'PacketCaptureResultPaged',
+        'PacketCaptureStorageLocation',
+        'PatchRouteFilter',
+        'PatchRouteFilterRule',
+        'PcError',
+        'PcProtocol',
+        'PcStatus',
+        'PeerExpressRouteCircuitConnection',
+        'PeerExpressRouteCircuitConnectionPaged',
+        'PfsGroup',
+        'PolicySettings',
+        'PrepareNetworkPoliciesRequest',
+        'PrivateEndpoint',
+        'PrivateEndpointConnection',
+        'PrivateEndpointPaged',
+        'PrivateLinkService',
+        'PrivateLinkServiceConnection',
+        'PrivateLinkServiceConnectionState',
+        'PrivateLinkServiceIpConfiguration',
+        'PrivateLinkServicePaged',
+        'PrivateLinkServicePropertiesAutoApproval',
+        'PrivateLinkServicePropertiesVisibility',
+        'Probe',
+        'ProbePaged',
+        'ProbeProtocol',
+        'ProcessorArchitecture',
+        'Protocol',
+        'ProtocolConfiguration',
+        'ProtocolCustomSettingsFormat',
+        'ProvisioningState',
+        'PublicIPAddress',
+        'PublicIPAddressDnsSettings',
+        'PublicIPAddressPaged',
+        'PublicIPAddressSku',
+        'PublicIPAddressSkuName',
+        'PublicIPPrefix',
+        'PublicIPPrefixPaged',
+        'PublicIPPrefixSku',
+        'PublicIPPrefixSkuName',
+        'QueryTroubleshootingParameters',
+        'ReferencedPublicIpAddress',
+        'Resource',
+        'ResourceIdentityType',
+        'ResourceNavigationLink',
+        'ResourceNavigationLinksListResult',
+        'ResourceSet',
+        'RetentionPolicyParameters',
+        'Route',
+        'RouteFilter',
+        'RouteFilterPaged',
+        'RouteFilterRule',
+        'RouteFilterRulePaged',
+        'RouteNextHopType',
+        'RoutePaged',
+        'RouteTable',
+        'RouteTablePaged',
+        'SecurityGroupNetworkInterface',
+        'SecurityGroupViewParameters',
+        'SecurityGroupViewResult',
+        'SecurityRule',
+        'SecurityRuleAccess',
+        'SecurityRuleAssociations',
+        'SecurityRuleDirection',
+        'SecurityRulePaged',
+        'SecurityRuleProtocol',
+        'ServiceAssociationLink',
+        'ServiceAssociationLinksListResult',
+        'ServiceEndpointPolicy',
+        'ServiceEndpointPolicyDefinition',
+        'ServiceEndpointPolicyDefinitionPaged',
+        'ServiceEndpointPolicyPaged',
+        'ServiceEndpointPropertiesFormat',
+        'ServiceProviderProvisioningState',
+        'ServiceTagInformation',
+        'ServiceTagInformationPropertiesFormat',
+        'ServiceTagsListResult',
+        'Severity',
+        'SubResource',
+        'Subnet',
+        'SubnetAssociation',
+        'SubnetPaged',
+        'TagsObject',
+        'Topology',
+        'TopologyAssociation',
+        'TopologyParameters',
+        'TopologyResource',
+        'TrafficAnalyticsConfigurationProperties',
+        'TrafficAnalyticsProperties',
+        'TransportProtocol',
+        'TroubleshootingDetails',
+        'TroubleshootingParameters',
+        'TroubleshootingRecommendedActions',
+        'TroubleshootingResult',
+        'TunnelConnectionHealth',
+        'TunnelConnectionStatus',
+        'Usage',
+        'UsageName',
+        'UsagePaged',
+        'VerbosityLevel',
+        'VerificationIPFlowParameters',
+        'VerificationIPFlowResult',
+        'VirtualHub',
+        'VirtualHubId',
+        'VirtualHubPaged',
+        'VirtualHubRoute',
+        'VirtualHubRouteTable',
+        'VirtualNetwork',
+        'VirtualNetworkConnectionGatewayReference',
+        'VirtualNetworkGateway',
+        'VirtualNetworkGatewayConnection',
+        'VirtualNetworkGatewayConnectionListEntity',
+        'VirtualNetworkGatewayConnectionListEntityPaged',
+        'VirtualNetworkGatewayConnectionPaged',
+        'VirtualNetworkGatewayConnectionProtocol',
+        'VirtualNetworkGatewayConnectionStatus',
+        'VirtualNetworkGatewayConnectionType',
+        'VirtualNetworkGatewayIPConfiguration',
+        'VirtualNetworkGatewayPaged',
+        'VirtualNetworkGatewaySku',
+        'VirtualNetworkGatewaySkuName',
+        'VirtualNetworkGatewaySkuTier',
+        'VirtualNetworkGatewayType',
+        'VirtualNetworkPaged',
+        'VirtualNetworkPeering',
+        'VirtualNetworkPeeringPaged',
+        'VirtualNetworkPeeringState',
+        'VirtualNetworkTap',
+        'VirtualNetworkTapPaged',
+        'VirtualNetworkUsage',
+        'VirtualNetworkUsageName',
+        'VirtualNetworkUsagePaged',
+        'VirtualWAN',
+        'VirtualWANPaged',
+        'VirtualWanSecurityProvider',
+        'VirtualWanSecurityProviderType',
+        'VirtualWanSecurityProviders',
+        'VpnClientConfiguration',
+        'VpnClientConnectionHealth',
+        'VpnClientConnectionHealthDetail',
+        'VpnClientConnectionHealthDetailListResult',
+        'VpnClientIPsecParameters',
+        'VpnClientParameters',
+        'VpnClientProtocol',
+        'VpnClientRevokedCertificate',
+        'VpnClientRootCertificate',
+        'VpnConnection',
+        'VpnConnectionPaged',
+        'VpnConnectionStatus',
+        'VpnDeviceScriptParameters',
+        'VpnGateway',
+        'VpnGatewayPaged',
+        'VpnGatewayTunnelingProtocol',
+        'VpnProfileResponse',
+        'VpnSite',
+        'VpnSiteId',
+        'VpnSitePaged',
+        'VpnType',
+        'WebApplicationFirewallAction',
+        'WebApplicationFirewallCustomRule',
+        'WebApplicationFirewallEnabledState',
+        'WebApplicationFirewallMatchVariable',
+        'WebApplicationFirewallMode',
+        'WebApplicationFirewallOperator',
+        'WebApplicationFirewallPolicy',
+        'WebApplicationFirewallPolicyPaged',
+        'WebApplicationFirewallPolicyResourceState',
+        'WebApplicationFirewallRuleType',
+        'WebApplicationFirewallTransform',
+    ],
+    '.v2019_02_01.models': [
+        'EndpointService',
+        'InterfaceEndpoint',
+        'InterfaceEndpointPaged',
+    ],
+    '.v2018_11_01.models': [
+        'ApplicationGatewayAvailableRequestHeadersResult',
+        'ApplicationGatewayAvailableResponseHeadersResult',
+        'ApplicationGatewayAvailableServerVariablesResult',
+    ],
+    '.v2018_07_01.models': [
+        'ApplicationGatewayAutoscaleBounds',
+        'Policies',
+        'TrafficQuery',
+    ],
+    '.v2018_06_01.models': [
+        'OutboundNatRule',
+    ],
+    '.v2018_01_01.models': [
+        'ExpressRouteCircuitPeeringType',
+    ],
+    '.v2015_06_15.models': [
+        'ConnectionSharedKeyResult',
+        'ExpressRouteCircuitArpTablePaged',
+        'ExpressRouteCircuitRoutesTablePaged',
+        'ExpressRouteCircuitStatsPaged',
+    ],
+})
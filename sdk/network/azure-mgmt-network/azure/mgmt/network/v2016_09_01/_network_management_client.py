@@ -103,7 +103,7 @@ class NetworkManagementClient(NetworkManagementClientOperationsMixin, SDKClient)
         self.config = NetworkManagementClientConfiguration(credentials, subscription_id, base_url)
         super(NetworkManagementClient, self).__init__(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+        client_models = {k: getattr(models, k) for k in models.__all__}
         self.api_version = '2016-09-01'
         self._serialize = Serializer(client_models)
         self._deserialize = Deserializer(client_models)
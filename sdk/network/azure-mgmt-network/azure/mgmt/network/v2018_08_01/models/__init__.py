@@ -9,705 +9,7 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-try:
-    from ._models_py3 import AddressSpace
-    from ._models_py3 import ApplicationGateway
-    from ._models_py3 import ApplicationGatewayAuthenticationCertificate
-    from ._models_py3 import ApplicationGatewayAutoscaleConfiguration
-    from ._models_py3 import ApplicationGatewayAvailableSslOptions
-    from ._models_py3 import ApplicationGatewayAvailableWafRuleSetsResult
-    from ._models_py3 import ApplicationGatewayBackendAddress
-    from ._models_py3 import ApplicationGatewayBackendAddressPool
-    from ._models_py3 import ApplicationGatewayBackendHealth
-    from ._models_py3 import ApplicationGatewayBackendHealthHttpSettings
-    from ._models_py3 import ApplicationGatewayBackendHealthPool
-    from ._models_py3 import ApplicationGatewayBackendHealthServer
-    from ._models_py3 import ApplicationGatewayBackendHttpSettings
-    from ._models_py3 import ApplicationGatewayConnectionDraining
-    from ._models_py3 import ApplicationGatewayCustomError
-    from ._models_py3 import ApplicationGatewayFirewallDisabledRuleGroup
-    from ._models_py3 import ApplicationGatewayFirewallExclusion
-    from ._models_py3 import ApplicationGatewayFirewallRule
-    from ._models_py3 import ApplicationGatewayFirewallRuleGroup
-    from ._models_py3 import ApplicationGatewayFirewallRuleSet
-    from ._models_py3 import ApplicationGatewayFrontendIPConfiguration
-    from ._models_py3 import ApplicationGatewayFrontendPort
-    from ._models_py3 import ApplicationGatewayHttpListener
-    from ._models_py3 import ApplicationGatewayIPConfiguration
-    from ._models_py3 import ApplicationGatewayPathRule
-    from ._models_py3 import ApplicationGatewayProbe
-    from ._models_py3 import ApplicationGatewayProbeHealthResponseMatch
-    from ._models_py3 import ApplicationGatewayRedirectConfiguration
-    from ._models_py3 import ApplicationGatewayRequestRoutingRule
-    from ._models_py3 import ApplicationGatewaySku
-    from ._models_py3 import ApplicationGatewaySslCertificate
-    from ._models_py3 import ApplicationGatewaySslPolicy
-    from ._models_py3 import ApplicationGatewaySslPredefinedPolicy
-    from ._models_py3 import ApplicationGatewayTrustedRootCertificate
-    from ._models_py3 import ApplicationGatewayUrlPathMap
-    from ._models_py3 import ApplicationGatewayWebApplicationFirewallConfiguration
-    from ._models_py3 import ApplicationSecurityGroup
-    from ._models_py3 import Availability
-    from ._models_py3 import AvailableDelegation
-    from ._models_py3 import AvailableProvidersList
-    from ._models_py3 import AvailableProvidersListCity
-    from ._models_py3 import AvailableProvidersListCountry
-    from ._models_py3 import AvailableProvidersListParameters
-    from ._models_py3 import AvailableProvidersListState
-    from ._models_py3 import AzureAsyncOperationResult
-    from ._models_py3 import AzureFirewall
-    from ._models_py3 import AzureFirewallApplicationRule
-    from ._models_py3 import AzureFirewallApplicationRuleCollection
-    from ._models_py3 import AzureFirewallApplicationRuleProtocol
-    from ._models_py3 import AzureFirewallFqdnTag
-    from ._models_py3 import AzureFirewallIPConfiguration
-    from ._models_py3 import AzureFirewallNatRCAction
-    from ._models_py3 import AzureFirewallNatRule
-    from ._models_py3 import AzureFirewallNatRuleCollection
-    from ._models_py3 import AzureFirewallNetworkRule
-    from ._models_py3 import AzureFirewallNetworkRuleCollection
-    from ._models_py3 import AzureFirewallRCAction
-    from ._models_py3 import AzureReachabilityReport
-    from ._models_py3 import AzureReachabilityReportItem
-    from ._models_py3 import AzureReachabilityReportLatencyInfo
-    from ._models_py3 import AzureReachabilityReportLocation
-    from ._models_py3 import AzureReachabilityReportParameters
-    from ._models_py3 import BackendAddressPool
-    from ._models_py3 import BGPCommunity
-    from ._models_py3 import BgpPeerStatus
-    from ._models_py3 import BgpPeerStatusListResult
-    from ._models_py3 import BgpServiceCommunity
-    from ._models_py3 import BgpSettings
-    from ._models_py3 import ConnectionMonitor
-    from ._models_py3 import ConnectionMonitorDestination
-    from ._models_py3 import ConnectionMonitorParameters
-    from ._models_py3 import ConnectionMonitorQueryResult
-    from ._models_py3 import ConnectionMonitorResult
-    from ._models_py3 import ConnectionMonitorSource
-    from ._models_py3 import ConnectionResetSharedKey
-    from ._models_py3 import ConnectionSharedKey
-    from ._models_py3 import ConnectionStateSnapshot
-    from ._models_py3 import ConnectivityDestination
-    from ._models_py3 import ConnectivityHop
-    from ._models_py3 import ConnectivityInformation
-    from ._models_py3 import ConnectivityIssue
-    from ._models_py3 import ConnectivityParameters
-    from ._models_py3 import ConnectivitySource
-    from ._models_py3 import Container
-    from ._models_py3 import ContainerNetworkInterface
-    from ._models_py3 import ContainerNetworkInterfaceConfiguration
-    from ._models_py3 import ContainerNetworkInterfaceIpConfiguration
-    from ._models_py3 import DdosProtectionPlan
-    from ._models_py3 import Delegation
-    from ._models_py3 import DeviceProperties
-    from ._models_py3 import DhcpOptions
-    from ._models_py3 import Dimension
-    from ._models_py3 import DnsNameAvailabilityResult
-    from ._models_py3 import EffectiveNetworkSecurityGroup
-    from ._models_py3 import EffectiveNetworkSecurityGroupAssociation
-    from ._models_py3 import EffectiveNetworkSecurityGroupListResult
-    from ._models_py3 import EffectiveNetworkSecurityRule
-    from ._models_py3 import EffectiveRoute
-    from ._models_py3 import EffectiveRouteListResult
-    from ._models_py3 import EndpointService
-    from ._models_py3 import EndpointServiceResult
-    from ._models_py3 import Error, ErrorException
-    from ._models_py3 import ErrorDetails
-    from ._models_py3 import ErrorResponse, ErrorResponseException
-    from ._models_py3 import EvaluatedNetworkSecurityGroup
-    from ._models_py3 import ExpressRouteCircuit
-    from ._models_py3 import ExpressRouteCircuitArpTable
-    from ._models_py3 import ExpressRouteCircuitAuthorization
-    from ._models_py3 import ExpressRouteCircuitConnection
-    from ._models_py3 import ExpressRouteCircuitPeering
-    from ._models_py3 import ExpressRouteCircuitPeeringConfig
-    from ._models_py3 import ExpressRouteCircuitPeeringId
-    from ._models_py3 import ExpressRouteCircuitReference
-    from ._models_py3 import ExpressRouteCircuitRoutesTable
-    from ._models_py3 import ExpressRouteCircuitRoutesTableSummary
-    from ._models_py3 import ExpressRouteCircuitsArpTableListResult
-    from ._models_py3 import ExpressRouteCircuitServiceProviderProperties
-    from ._models_py3 import ExpressRouteCircuitSku
-    from ._models_py3 import ExpressRouteCircuitsRoutesTableListResult
-    from ._models_py3 import ExpressRouteCircuitsRoutesTableSummaryListResult
-    from ._models_py3 import ExpressRouteCircuitStats
-    from ._models_py3 import ExpressRouteConnection
-    from ._models_py3 import ExpressRouteConnectionId
-    from ._models_py3 import ExpressRouteConnectionList
-    from ._models_py3 import ExpressRouteCrossConnection
-    from ._models_py3 import ExpressRouteCrossConnectionPeering
-    from ._models_py3 import ExpressRouteCrossConnectionRoutesTableSummary
-    from ._models_py3 import ExpressRouteCrossConnectionsRoutesTableSummaryListResult
-    from ._models_py3 import ExpressRouteGateway
-    from ._models_py3 import ExpressRouteGatewayList
-    from ._models_py3 import ExpressRouteGatewayPropertiesAutoScaleConfiguration
-    from ._models_py3 import ExpressRouteGatewayPropertiesAutoScaleConfigurationBounds
-    from ._models_py3 import ExpressRouteLink
-    from ._models_py3 import ExpressRoutePort
-    from ._models_py3 import ExpressRoutePortsLocation
-    from ._models_py3 import ExpressRoutePortsLocationBandwidths
-    from ._models_py3 import ExpressRouteServiceProvider
-    from ._models_py3 import ExpressRouteServiceProviderBandwidthsOffered
-    from ._models_py3 import FlowLogInformation
-    from ._models_py3 import FlowLogStatusParameters
-    from ._models_py3 import FrontendIPConfiguration
-    from ._models_py3 import GatewayRoute
-    from ._models_py3 import GatewayRouteListResult
-    from ._models_py3 import GetVpnSitesConfigurationRequest
-    from ._models_py3 import HTTPConfiguration
-    from ._models_py3 import HTTPHeader
-    from ._models_py3 import HubVirtualNetworkConnection
-    from ._models_py3 import InboundNatPool
-    from ._models_py3 import InboundNatRule
-    from ._models_py3 import InterfaceEndpoint
-    from ._models_py3 import IPAddressAvailabilityResult
-    from ._models_py3 import IPConfiguration
-    from ._models_py3 import IPConfigurationProfile
-    from ._models_py3 import IpsecPolicy
-    from ._models_py3 import IpTag
-    from ._models_py3 import Ipv6ExpressRouteCircuitPeeringConfig
-    from ._models_py3 import LoadBalancer
-    from ._models_py3 import LoadBalancerSku
-    from ._models_py3 import LoadBalancingRule
-    from ._models_py3 import LocalNetworkGateway
-    from ._models_py3 import LogSpecification
-    from ._models_py3 import MatchedRule
-    from ._models_py3 import MetricSpecification
-    from ._models_py3 import NetworkConfigurationDiagnosticParameters
-    from ._models_py3 import NetworkConfigurationDiagnosticProfile
-    from ._models_py3 import NetworkConfigurationDiagnosticResponse
-    from ._models_py3 import NetworkConfigurationDiagnosticResult
-    from ._models_py3 import NetworkInterface
-    from ._models_py3 import NetworkInterfaceAssociation
-    from ._models_py3 import NetworkInterfaceDnsSettings
-    from ._models_py3 import NetworkInterfaceIPConfiguration
-    from ._models_py3 import NetworkInterfaceTapConfiguration
-    from ._models_py3 import NetworkProfile
-    from ._models_py3 import NetworkSecurityGroup
-    from ._models_py3 import NetworkSecurityGroupResult
-    from ._models_py3 import NetworkSecurityRulesEvaluationResult
-    from ._models_py3 import NetworkWatcher
-    from ._models_py3 import NextHopParameters
-    from ._models_py3 import NextHopResult
-    from ._models_py3 import Operation
-    from ._models_py3 import OperationDisplay
-    from ._models_py3 import OperationPropertiesFormatServiceSpecification
-    from ._models_py3 import OutboundRule
-    from ._models_py3 import P2SVpnGateway
-    from ._models_py3 import P2SVpnProfileParameters
-    from ._models_py3 import P2SVpnServerConfigRadiusClientRootCertificate
-    from ._models_py3 import P2SVpnServerConfigRadiusServerRootCertificate
-    from ._models_py3 import P2SVpnServerConfiguration
-    from ._models_py3 import P2SVpnServerConfigVpnClientRevokedCertificate
-    from ._models_py3 import P2SVpnServerConfigVpnClientRootCertificate
-    from ._models_py3 import PacketCapture
-    from ._models_py3 import PacketCaptureFilter
-    from ._models_py3 import PacketCaptureParameters
-    from ._models_py3 import PacketCaptureQueryStatusResult
-    from ._models_py3 import PacketCaptureResult
-    from ._models_py3 import PacketCaptureStorageLocation
-    from ._models_py3 import PatchRouteFilter
-    from ._models_py3 import PatchRouteFilterRule
-    from ._models_py3 import Probe
-    from ._models_py3 import ProtocolConfiguration
-    from ._models_py3 import PublicIPAddress
-    from ._models_py3 import PublicIPAddressDnsSettings
-    from ._models_py3 import PublicIPAddressSku
-    from ._models_py3 import PublicIPPrefix
-    from ._models_py3 import PublicIPPrefixSku
-    from ._models_py3 import QueryTroubleshootingParameters
-    from ._models_py3 import ReferencedPublicIpAddress
-    from ._models_py3 import Resource
-    from ._models_py3 import ResourceNavigationLink
-    from ._models_py3 import RetentionPolicyParameters
-    from ._models_py3 import Route
-    from ._models_py3 import RouteFilter
-    from ._models_py3 import RouteFilterRule
-    from ._models_py3 import RouteTable
-    from ._models_py3 import SecurityGroupNetworkInterface
-    from ._models_py3 import SecurityGroupViewParameters
-    from ._models_py3 import SecurityGroupViewResult
-    from ._models_py3 import SecurityRule
-    from ._models_py3 import SecurityRuleAssociations
-    from ._models_py3 import ServiceAssociationLink
-    from ._models_py3 import ServiceEndpointPolicy
-    from ._models_py3 import ServiceEndpointPolicyDefinition
-    from ._models_py3 import ServiceEndpointPropertiesFormat
-    from ._models_py3 import Subnet
-    from ._models_py3 import SubnetAssociation
-    from ._models_py3 import SubResource
-    from ._models_py3 import TagsObject
-    from ._models_py3 import Topology
-    from ._models_py3 import TopologyAssociation
-    from ._models_py3 import TopologyParameters
-    from ._models_py3 import TopologyResource
-    from ._models_py3 import TrafficAnalyticsConfigurationProperties
-    from ._models_py3 import TrafficAnalyticsProperties
-    from ._models_py3 import TroubleshootingDetails
-    from ._models_py3 import TroubleshootingParameters
-    from ._models_py3 import TroubleshootingRecommendedActions
-    from ._models_py3 import TroubleshootingResult
-    from ._models_py3 import TunnelConnectionHealth
-    from ._models_py3 import Usage
-    from ._models_py3 import UsageName
-    from ._models_py3 import VerificationIPFlowParameters
-    from ._models_py3 import VerificationIPFlowResult
-    from ._models_py3 import VirtualHub
-    from ._models_py3 import VirtualHubId
-    from ._models_py3 import VirtualHubRoute
-    from ._models_py3 import VirtualHubRouteTable
-    from ._models_py3 import VirtualNetwork
-    from ._models_py3 import VirtualNetworkConnectionGatewayReference
-    from ._models_py3 import VirtualNetworkGateway
-    from ._models_py3 import VirtualNetworkGatewayConnection
-    from ._models_py3 import VirtualNetworkGatewayConnectionListEntity
-    from ._models_py3 import VirtualNetworkGatewayIPConfiguration
-    from ._models_py3 import VirtualNetworkGatewaySku
-    from ._models_py3 import VirtualNetworkPeering
-    from ._models_py3 import VirtualNetworkTap
-    from ._models_py3 import VirtualNetworkUsage
-    from ._models_py3 import VirtualNetworkUsageName
-    from ._models_py3 import VirtualWAN
-    from ._models_py3 import VirtualWanSecurityProvider
-    from ._models_py3 import VirtualWanSecurityProviders
-    from ._models_py3 import VpnClientConfiguration
-    from ._models_py3 import VpnClientConnectionHealth
-    from ._models_py3 import VpnClientIPsecParameters
-    from ._models_py3 import VpnClientParameters
-    from ._models_py3 import VpnClientRevokedCertificate
-    from ._models_py3 import VpnClientRootCertificate
-    from ._models_py3 import VpnConnection
-    from ._models_py3 import VpnDeviceScriptParameters
-    from ._models_py3 import VpnGateway
-    from ._models_py3 import VpnProfileResponse
-    from ._models_py3 import VpnSite
-    from ._models_py3 import VpnSiteId
-except (SyntaxError, ImportError):
-    from ._models import AddressSpace
-    from ._models import ApplicationGateway
-    from ._models import ApplicationGatewayAuthenticationCertificate
-    from ._models import ApplicationGatewayAutoscaleConfiguration
-    from ._models import ApplicationGatewayAvailableSslOptions
-    from ._models import ApplicationGatewayAvailableWafRuleSetsResult
-    from ._models import ApplicationGatewayBackendAddress
-    from ._models import ApplicationGatewayBackendAddressPool
-    from ._models import ApplicationGatewayBackendHealth
-    from ._models import ApplicationGatewayBackendHealthHttpSettings
-    from ._models import ApplicationGatewayBackendHealthPool
-    from ._models import ApplicationGatewayBackendHealthServer
-    from ._models import ApplicationGatewayBackendHttpSettings
-    from ._models import ApplicationGatewayConnectionDraining
-    from ._models import ApplicationGatewayCustomError
-    from ._models import ApplicationGatewayFirewallDisabledRuleGroup
-    from ._models import ApplicationGatewayFirewallExclusion
-    from ._models import ApplicationGatewayFirewallRule
-    from ._models import ApplicationGatewayFirewallRuleGroup
-    from ._models import ApplicationGatewayFirewallRuleSet
-    from ._models import ApplicationGatewayFrontendIPConfiguration
-    from ._models import ApplicationGatewayFrontendPort
-    from ._models import ApplicationGatewayHttpListener
-    from ._models import ApplicationGatewayIPConfiguration
-    from ._models import ApplicationGatewayPathRule
-    from ._models import ApplicationGatewayProbe
-    from ._models import ApplicationGatewayProbeHealthResponseMatch
-    from ._models import ApplicationGatewayRedirectConfiguration
-    from ._models import ApplicationGatewayRequestRoutingRule
-    from ._models import ApplicationGatewaySku
-    from ._models import ApplicationGatewaySslCertificate
-    from ._models import ApplicationGatewaySslPolicy
-    from ._models import ApplicationGatewaySslPredefinedPolicy
-    from ._models import ApplicationGatewayTrustedRootCertificate
-    from ._models import ApplicationGatewayUrlPathMap
-    from ._models import ApplicationGatewayWebApplicationFirewallConfiguration
-    from ._models import ApplicationSecurityGroup
-    from ._models import Availability
-    from ._models import AvailableDelegation
-    from ._models import AvailableProvidersList
-    from ._models import AvailableProvidersListCity
-    from ._models import AvailableProvidersListCountry
-    from ._models import AvailableProvidersListParameters
-    from ._models import AvailableProvidersListState
-    from ._models import AzureAsyncOperationResult
-    from ._models import AzureFirewall
-    from ._models import AzureFirewallApplicationRule
-    from ._models import AzureFirewallApplicationRuleCollection
-    from ._models import AzureFirewallApplicationRuleProtocol
-    from ._models import AzureFirewallFqdnTag
-    from ._models import AzureFirewallIPConfiguration
-    from ._models import AzureFirewallNatRCAction
-    from ._models import AzureFirewallNatRule
-    from ._models import AzureFirewallNatRuleCollection
-    from ._models import AzureFirewallNetworkRule
-    from ._models import AzureFirewallNetworkRuleCollection
-    from ._models import AzureFirewallRCAction
-    from ._models import AzureReachabilityReport
-    from ._models import AzureReachabilityReportItem
-    from ._models import AzureReachabilityReportLatencyInfo
-    from ._models import AzureReachabilityReportLocation
-    from ._models import AzureReachabilityReportParameters
-    from ._models import BackendAddressPool
-    from ._models import BGPCommunity
-    from ._models import BgpPeerStatus
-    from ._models import BgpPeerStatusListResult
-    from ._models import BgpServiceCommunity
-    from ._models import BgpSettings
-    from ._models import ConnectionMonitor
-    from ._models import ConnectionMonitorDestination
-    from ._models import ConnectionMonitorParameters
-    from ._models import ConnectionMonitorQueryResult
-    from ._models import ConnectionMonitorResult
-    from ._models import ConnectionMonitorSource
-    from ._models import ConnectionResetSharedKey
-    from ._models import ConnectionSharedKey
-    from ._models import ConnectionStateSnapshot
-    from ._models import ConnectivityDestination
-    from ._models import ConnectivityHop
-    from ._models import ConnectivityInformation
-    from ._models import ConnectivityIssue
-    from ._models import ConnectivityParameters
-    from ._models import ConnectivitySource
-    from ._models import Container
-    from ._models import ContainerNetworkInterface
-    from ._models import ContainerNetworkInterfaceConfiguration
-    from ._models import ContainerNetworkInterfaceIpConfiguration
-    from ._models import DdosProtectionPlan
-    from ._models import Delegation
-    from ._models import DeviceProperties
-    from ._models import DhcpOptions
-    from ._models import Dimension
-    from ._models import DnsNameAvailabilityResult
-    from ._models import EffectiveNetworkSecurityGroup
-    from ._models import EffectiveNetworkSecurityGroupAssociation
-    from ._models import EffectiveNetworkSecurityGroupListResult
-    from ._models import EffectiveNetworkSecurityRule
-    from ._models import EffectiveRoute
-    from ._models import EffectiveRouteListResult
-    from ._models import EndpointService
-    from ._models import EndpointServiceResult
-    from ._models import Error, ErrorException
-    from ._models import ErrorDetails
-    from ._models import ErrorResponse, ErrorResponseException
-    from ._models import EvaluatedNetworkSecurityGroup
-    from ._models import ExpressRouteCircuit
-    from ._models import ExpressRouteCircuitArpTable
-    from ._models import ExpressRouteCircuitAuthorization
-    from ._models import ExpressRouteCircuitConnection
-    from ._models import ExpressRouteCircuitPeering
-    from ._models import ExpressRouteCircuitPeeringConfig
-    from ._models import ExpressRouteCircuitPeeringId
-    from ._models import ExpressRouteCircuitReference
-    from ._models import ExpressRouteCircuitRoutesTable
-    from ._models import ExpressRouteCircuitRoutesTableSummary
-    from ._models import ExpressRouteCircuitsArpTableListResult
-    from ._models import ExpressRouteCircuitServiceProviderProperties
-    from ._models import ExpressRouteCircuitSku
-    from ._models import ExpressRouteCircuitsRoutesTableListResult
-    from ._models import ExpressRouteCircuitsRoutesTableSummaryListResult
-    from ._models import ExpressRouteCircuitStats
-    from ._models import ExpressRouteConnection
-    from ._models import ExpressRouteConnectionId
-    from ._models import ExpressRouteConnectionList
-    from ._models import ExpressRouteCrossConnection
-    from ._models import ExpressRouteCrossConnectionPeering
-    from ._models import ExpressRouteCrossConnectionRoutesTableSummary
-    from ._models import ExpressRouteCrossConnectionsRoutesTableSummaryListResult
-    from ._models import ExpressRouteGateway
-    from ._models import ExpressRouteGatewayList
-    from ._models import ExpressRouteGatewayPropertiesAutoScaleConfiguration
-    from ._models import ExpressRouteGatewayPropertiesAutoScaleConfigurationBounds
-    from ._models import ExpressRouteLink
-    from ._models import ExpressRoutePort
-    from ._models import ExpressRoutePortsLocation
-    from ._models import ExpressRoutePortsLocationBandwidths
-    from ._models import ExpressRouteServiceProvider
-    from ._models import ExpressRouteServiceProviderBandwidthsOffered
-    from ._models import FlowLogInformation
-    from ._models import FlowLogStatusParameters
-    from ._models import FrontendIPConfiguration
-    from ._models import GatewayRoute
-    from ._models import GatewayRouteListResult
-    from ._models import GetVpnSitesConfigurationRequest
-    from ._models import HTTPConfiguration
-    from ._models import HTTPHeader
-    from ._models import HubVirtualNetworkConnection
-    from ._models import InboundNatPool
-    from ._models import InboundNatRule
-    from ._models import InterfaceEndpoint
-    from ._models import IPAddressAvailabilityResult
-    from ._models import IPConfiguration
-    from ._models import IPConfigurationProfile
-    from ._models import IpsecPolicy
-    from ._models import IpTag
-    from ._models import Ipv6ExpressRouteCircuitPeeringConfig
-    from ._models import LoadBalancer
-    from ._models import LoadBalancerSku
-    from ._models import LoadBalancingRule
-    from ._models import LocalNetworkGateway
-    from ._models import LogSpecification
-    from ._models import MatchedRule
-    from ._models import MetricSpecification
-    from ._models import NetworkConfigurationDiagnosticParameters
-    from ._models import NetworkConfigurationDiagnosticProfile
-    from ._models import NetworkConfigurationDiagnosticResponse
-    from ._models import NetworkConfigurationDiagnosticResult
-    from ._models import NetworkInterface
-    from ._models import NetworkInterfaceAssociation
-    from ._models import NetworkInterfaceDnsSettings
-    from ._models import NetworkInterfaceIPConfiguration
-    from ._models import NetworkInterfaceTapConfiguration
-    from ._models import NetworkProfile
-    from ._models import NetworkSecurityGroup
-    from ._models import NetworkSecurityGroupResult
-    from ._models import NetworkSecurityRulesEvaluationResult
-    from ._models import NetworkWatcher
-    from ._models import NextHopParameters
-    from ._models import NextHopResult
-    from ._models import Operation
-    from ._models import OperationDisplay
-    from ._models import OperationPropertiesFormatServiceSpecification
-    from ._models import OutboundRule
-    from ._models import P2SVpnGateway
-    from ._models import P2SVpnProfileParameters
-    from ._models import P2SVpnServerConfigRadiusClientRootCertificate
-    from ._models import P2SVpnServerConfigRadiusServerRootCertificate
-    from ._models import P2SVpnServerConfiguration
-    from ._models import P2SVpnServerConfigVpnClientRevokedCertificate
-    from ._models import P2SVpnServerConfigVpnClientRootCertificate
-    from ._models import PacketCapture
-    from ._models import PacketCaptureFilter
-    from ._models import PacketCaptureParameters
-    from ._models import PacketCaptureQueryStatusResult
-    from ._models import PacketCaptureResult
-    from ._models import PacketCaptureStorageLocation
-    from ._models import PatchRouteFilter
-    from ._models import PatchRouteFilterRule
-    from ._models import Probe
-    from ._models import ProtocolConfiguration
-    from ._models import PublicIPAddress
-    from ._models import PublicIPAddressDnsSettings
-    from ._models import PublicIPAddressSku
-    from ._models import PublicIPPrefix
-    from ._models import PublicIPPrefixSku
-    from ._models import QueryTroubleshootingParameters
-    from ._models import ReferencedPublicIpAddress
-    from ._models import Resource
-    from ._models import ResourceNavigationLink
-    from ._models import RetentionPolicyParameters
-    from ._models import Route
-    from ._models import RouteFilter
-    from ._models import RouteFilterRule
-    from ._models import RouteTable
-    from ._models import SecurityGroupNetworkInterface
-    from ._models import SecurityGroupViewParameters
-    from ._models import SecurityGroupViewResult
-    from ._models import SecurityRule
-    from ._models import SecurityRuleAssociations
-    from ._models import ServiceAssociationLink
-    from ._models import ServiceEndpointPolicy
-    from ._models import ServiceEndpointPolicyDefinition
-    from ._models import ServiceEndpointPropertiesFormat
-    from ._models import Subnet
-    from ._models import SubnetAssociation
-    from ._models import SubResource
-    from ._models import TagsObject
-    from ._models import Topology
-    from ._models import TopologyAssociation
-    from ._models import TopologyParameters
-    from ._models import TopologyResource
-    from ._models import TrafficAnalyticsConfigurationProperties
-    from ._models import TrafficAnalyticsProperties
-    from ._models import TroubleshootingDetails
-    from ._models import TroubleshootingParameters
-    from ._models import TroubleshootingRecommendedActions
-    from ._models import TroubleshootingResult
-    from ._models import TunnelConnectionHealth
-    from ._models import Usage
-    from ._models import UsageName
-    from ._models import VerificationIPFlowParameters
-    from ._models import VerificationIPFlowResult
-    from ._models import VirtualHub
-    from ._models import VirtualHubId
-    from ._models import VirtualHubRoute
-    from ._models import VirtualHubRouteTable
-    from ._models import VirtualNetwork
-    from ._models import VirtualNetworkConnectionGatewayReference
-    from ._models import VirtualNetworkGateway
-    from ._models import VirtualNetworkGatewayConnection
-    from ._models import VirtualNetworkGatewayConnectionListEntity
-    from ._models import VirtualNetworkGatewayIPConfiguration
-    from ._models import VirtualNetworkGatewaySku
-    from ._models import VirtualNetworkPeering
-    from ._models import VirtualNetworkTap
-    from ._models import VirtualNetworkUsage
-    from ._models import VirtualNetworkUsageName
-    from ._models import VirtualWAN
-    from ._models import VirtualWanSecurityProvider
-    from ._models import VirtualWanSecurityProviders
-    from ._models import VpnClientConfiguration
-    from ._models import VpnClientConnectionHealth
-    from ._models import VpnClientIPsecParameters
-    from ._models import VpnClientParameters
-    from ._models import VpnClientRevokedCertificate
-    from ._models import VpnClientRootCertificate
-    from ._models import VpnConnection
-    from ._models import VpnDeviceScriptParameters
-    from ._models import VpnGateway
-    from ._models import VpnProfileResponse
-    from ._models import VpnSite
-    from ._models import VpnSiteId
-from ._paged_models import ApplicationGatewayPaged
-from ._paged_models import ApplicationGatewaySslPredefinedPolicyPaged
-from ._paged_models import ApplicationSecurityGroupPaged
-from ._paged_models import AvailableDelegationPaged
-from ._paged_models import AzureFirewallFqdnTagPaged
-from ._paged_models import AzureFirewallPaged
-from ._paged_models import BackendAddressPoolPaged
-from ._paged_models import BgpServiceCommunityPaged
-from ._paged_models import ConnectionMonitorResultPaged
-from ._paged_models import DdosProtectionPlanPaged
-from ._paged_models import EndpointServiceResultPaged
-from ._paged_models import ExpressRouteCircuitAuthorizationPaged
-from ._paged_models import ExpressRouteCircuitPaged
-from ._paged_models import ExpressRouteCircuitPeeringPaged
-from ._paged_models import ExpressRouteCrossConnectionPaged
-from ._paged_models import ExpressRouteCrossConnectionPeeringPaged
-from ._paged_models import ExpressRouteLinkPaged
-from ._paged_models import ExpressRoutePortPaged
-from ._paged_models import ExpressRoutePortsLocationPaged
-from ._paged_models import ExpressRouteServiceProviderPaged
-from ._paged_models import FrontendIPConfigurationPaged
-from ._paged_models import HubVirtualNetworkConnectionPaged
-from ._paged_models import InboundNatRulePaged
-from ._paged_models import InterfaceEndpointPaged
-from ._paged_models import LoadBalancerPaged
-from ._paged_models import LoadBalancingRulePaged
-from ._paged_models import LocalNetworkGatewayPaged
-from ._paged_models import NetworkInterfaceIPConfigurationPaged
-from ._paged_models import NetworkInterfacePaged
-from ._paged_models import NetworkInterfaceTapConfigurationPaged
-from ._paged_models import NetworkProfilePaged
-from ._paged_models import NetworkSecurityGroupPaged
-from ._paged_models import NetworkWatcherPaged
-from ._paged_models import OperationPaged
-from ._paged_models import OutboundRulePaged
-from ._paged_models import P2SVpnGatewayPaged
-from ._paged_models import P2SVpnServerConfigurationPaged
-from ._paged_models import PacketCaptureResultPaged
-from ._paged_models import ProbePaged
-from ._paged_models import PublicIPAddressPaged
-from ._paged_models import PublicIPPrefixPaged
-from ._paged_models import RouteFilterPaged
-from ._paged_models import RouteFilterRulePaged
-from ._paged_models import RoutePaged
-from ._paged_models import RouteTablePaged
-from ._paged_models import SecurityRulePaged
-from ._paged_models import ServiceEndpointPolicyDefinitionPaged
-from ._paged_models import ServiceEndpointPolicyPaged
-from ._paged_models import SubnetPaged
-from ._paged_models import UsagePaged
-from ._paged_models import VirtualHubPaged
-from ._paged_models import VirtualNetworkGatewayConnectionListEntityPaged
-from ._paged_models import VirtualNetworkGatewayConnectionPaged
-from ._paged_models import VirtualNetworkGatewayPaged
-from ._paged_models import VirtualNetworkPaged
-from ._paged_models import VirtualNetworkPeeringPaged
-from ._paged_models import VirtualNetworkTapPaged
-from ._paged_models import VirtualNetworkUsagePaged
-from ._paged_models import VirtualWANPaged
-from ._paged_models import VpnConnectionPaged
-from ._paged_models import VpnGatewayPaged
-from ._paged_models import VpnSitePaged
-from ._network_management_client_enums import (
-    IPAllocationMethod,
-    SecurityRuleProtocol,
-    SecurityRuleAccess,
-    SecurityRuleDirection,
-    RouteNextHopType,
-    PublicIPAddressSkuName,
-    IPVersion,
-    TransportProtocol,
-    ApplicationGatewayProtocol,
-    ApplicationGatewayCookieBasedAffinity,
-    ApplicationGatewayBackendHealthServerHealth,
-    ApplicationGatewaySkuName,
-    ApplicationGatewayTier,
-    ApplicationGatewaySslProtocol,
-    ApplicationGatewaySslPolicyType,
-    ApplicationGatewaySslPolicyName,
-    ApplicationGatewaySslCipherSuite,
-    ApplicationGatewayCustomErrorStatusCode,
-    ApplicationGatewayRequestRoutingRuleType,
-    ApplicationGatewayRedirectType,
-    ApplicationGatewayOperationalState,
-    ApplicationGatewayFirewallMode,
-    ProvisioningState,
-    AzureFirewallRCActionType,
-    AzureFirewallApplicationRuleProtocolType,
-    AzureFirewallNatRCActionType,
-    AzureFirewallNetworkRuleProtocol,
-    AuthorizationUseStatus,
-    ExpressRouteCircuitPeeringAdvertisedPublicPrefixState,
-    Access,
-    ExpressRoutePeeringType,
-    ExpressRoutePeeringState,
-    CircuitConnectionStatus,
-    ExpressRouteCircuitPeeringState,
-    ExpressRouteCircuitSkuTier,
-    ExpressRouteCircuitSkuFamily,
-    ServiceProviderProvisioningState,
-    ExpressRouteLinkConnectorType,
-    ExpressRouteLinkAdminState,
-    ExpressRoutePortsEncapsulation,
-    LoadBalancerSkuName,
-    LoadDistribution,
-    ProbeProtocol,
-    NetworkOperationStatus,
-    EffectiveSecurityRuleProtocol,
-    EffectiveRouteSource,
-    EffectiveRouteState,
-    AssociationType,
-    Direction,
-    IpFlowProtocol,
-    NextHopType,
-    PcProtocol,
-    PcStatus,
-    PcError,
-    Protocol,
-    HTTPMethod,
-    Origin,
-    Severity,
-    IssueType,
-    ConnectionStatus,
-    ConnectionMonitorSourceStatus,
-    ConnectionState,
-    EvaluationState,
-    VerbosityLevel,
-    PublicIPPrefixSkuName,
-    VirtualNetworkPeeringState,
-    VirtualNetworkGatewayType,
-    VpnType,
-    VirtualNetworkGatewaySkuName,
-    VirtualNetworkGatewaySkuTier,
-    VpnClientProtocol,
-    IpsecEncryption,
-    IpsecIntegrity,
-    IkeEncryption,
-    IkeIntegrity,
-    DhGroup,
-    PfsGroup,
-    BgpPeerState,
-    ProcessorArchitecture,
-    AuthenticationMethod,
-    VirtualNetworkGatewayConnectionStatus,
-    VirtualNetworkGatewayConnectionType,
-    VirtualNetworkGatewayConnectionProtocol,
-    OfficeTrafficCategory,
-    VpnGatewayTunnelingProtocol,
-    VpnConnectionStatus,
-    VirtualWanSecurityProviderType,
-    TunnelConnectionStatus,
-    HubVirtualNetworkConnectionStatus,
-)
+from ... import _lazy_import
 
 __all__ = [
     'AddressSpace',
@@ -1134,3 +436,437 @@ __all__ = [
     'TunnelConnectionStatus',
     'HubVirtualNetworkConnectionStatus',
 ]
+
+_lazy_import.install_lazy_import(globals(), {
+    '._models_py3': [
+        'AddressSpace',
+        'ApplicationGateway',
+        'ApplicationGatewayAuthenticationCertificate',
+        'ApplicationGatewayAutoscaleConfiguration',
+        'ApplicationGatewayAvailableSslOptions',
+        'ApplicationGatewayAvailableWafRuleSetsResult',
+        'ApplicationGatewayBackendAddress',
+        'ApplicationGatewayBackendAddressPool',
+        'ApplicationGatewayBackendHealth',
+        'ApplicationGatewayBackendHealthHttpSettings',
+        'ApplicationGatewayBackendHealthPool',
+        'ApplicationGatewayBackendHealthServer',
+        'ApplicationGatewayBackendHttpSettings',
+        'ApplicationGatewayConnectionDraining',
+        'ApplicationGatewayCustomError',
+        'ApplicationGatewayFirewallDisabledRuleGroup',
+        'ApplicationGatewayFirewallExclusion',
+        'ApplicationGatewayFirewallRule',
+        'ApplicationGatewayFirewallRuleGroup',
+        'ApplicationGatewayFirewallRuleSet',
+        'ApplicationGatewayFrontendIPConfiguration',
+        'ApplicationGatewayFrontendPort',
+        'ApplicationGatewayHttpListener',
+        'ApplicationGatewayIPConfiguration',
+        'ApplicationGatewayPathRule',
+        'ApplicationGatewayProbe',
+        'ApplicationGatewayProbeHealthResponseMatch',
+        'ApplicationGatewayRedirectConfiguration',
+        'ApplicationGatewayRequestRoutingRule',
+        'ApplicationGatewaySku',
+        'ApplicationGatewaySslCertificate',
+        'ApplicationGatewaySslPolicy',
+        'ApplicationGatewaySslPredefinedPolicy',
+        'ApplicationGatewayTrustedRootCertificate',
+        'ApplicationGatewayUrlPathMap',
+        'ApplicationGatewayWebApplicationFirewallConfiguration',
+        'ApplicationSecurityGroup',
+        'Availability',
+        'AvailableDelegation',
+        'AvailableProvidersList',
+        'AvailableProvidersListCity',
+        'AvailableProvidersListCountry',
+        'AvailableProvidersListParameters',
+        'AvailableProvidersListState',
+        'AzureAsyncOperationResult',
+        'AzureFirewall',
+        'AzureFirewallApplicationRule',
+        'AzureFirewallApplicationRuleCollection',
+        'AzureFirewallApplicationRuleProtocol',
+        'AzureFirewallFqdnTag',
+        'AzureFirewallIPConfiguration',
+        'AzureFirewallNatRCAction',
+        'AzureFirewallNatRule',
+        'AzureFirewallNatRuleCollection',
+        'AzureFirewallNetworkRule',
+        'AzureFirewallNetworkRuleCollection',
+        'AzureFirewallRCAction',
+        'AzureReachabilityReport',
+        'AzureReachabilityReportItem',
+        'AzureReachabilityReportLatencyInfo',
+        'AzureReachabilityReportLocation',
+        'AzureReachabilityReportParameters',
+        'BackendAddressPool',
+        'BGPCommunity',
+        'BgpPeerStatus',
+        'BgpPeerStatusListResult',
+        'BgpServiceCommunity',
+        'BgpSettings',
+        'ConnectionMonitor',
+        'ConnectionMonitorDestination',
+        'ConnectionMonitorParameters',
+        'ConnectionMonitorQueryResult',
+        'ConnectionMonitorResult',
+        'ConnectionMonitorSource',
+        'ConnectionResetSharedKey',
+        'ConnectionSharedKey',
+        'ConnectionStateSnapshot',
+        'ConnectivityDestination',
+        'ConnectivityHop',
+        'ConnectivityInformation',
+        'ConnectivityIssue',
+        'ConnectivityParameters',
+        'ConnectivitySource',
+        'Container',
+        'ContainerNetworkInterface',
+        'ContainerNetworkInterfaceConfiguration',
+        'ContainerNetworkInterfaceIpConfiguration',
+        'DdosProtectionPlan',
+        'Delegation',
+        'DeviceProperties',
+        'DhcpOptions',
+        'Dimension',
+        'DnsNameAvailabilityResult',
+        'EffectiveNetworkSecurityGroup',
+        'EffectiveNetworkSecurityGroupAssociation',
+        'EffectiveNetworkSecurityGroupListResult',
+        'EffectiveNetworkSecurityRule',
+        'EffectiveRoute',
+        'EffectiveRouteListResult',
+        'EndpointService',
+        'EndpointServiceResult',
+        'Error',
+        'ErrorException',
+        'ErrorDetails',
+        'ErrorResponse',
+        'ErrorResponseException',
+        'EvaluatedNetworkSecurityGroup',
+        'ExpressRouteCircuit',
+        'ExpressRouteCircuitArpTable',
+        'ExpressRouteCircuitAuthorization',
+        'ExpressRouteCircuitConnection',
+        'ExpressRouteCircuitPeering',
+        'ExpressRouteCircuitPeeringConfig',
+        'ExpressRouteCircuitPeeringId',
+        'ExpressRouteCircuitReference',
+        'ExpressRouteCircuitRoutesTable',
+        'ExpressRouteCircuitRoutesTableSummary',
+        'ExpressRouteCircuitsArpTableListResult',
+        'ExpressRouteCircuitServiceProviderProperties',
+        'ExpressRouteCircuitSku',
+        'ExpressRouteCircuitsRoutesTableListResult',
+        'ExpressRouteCircuitsRoutesTableSummaryListResult',
+        'ExpressRouteCircuitStats',
+        'ExpressRouteConnection',
+        'ExpressRouteConnectionId',
+        'ExpressRouteConnectionList',
+        'ExpressRouteCrossConnection',
+        'ExpressRouteCrossConnectionPeering',
+        'ExpressRouteCrossConnectionRoutesTableSummary',
+        'ExpressRouteCrossConnectionsRoutesTableSummaryListResult',
+        'ExpressRouteGateway',
+        'ExpressRouteGatewayList',
+        'ExpressRouteGatewayPropertiesAutoScaleConfiguration',
+        'ExpressRouteGatewayPropertiesAutoScaleConfigurationBounds',
+        'ExpressRouteLink',
+        'ExpressRoutePort',
+        'ExpressRoutePortsLocation',
+        'ExpressRoutePortsLocationBandwidths',
+        'ExpressRouteServiceProvider',
+        'ExpressRouteServiceProviderBandwidthsOffered',
+        'FlowLogInformation',
+        'FlowLogStatusParameters',
+        'FrontendIPConfiguration',
+        'GatewayRoute',
+        'GatewayRouteListResult',
+        'GetVpnSitesConfigurationRequest',
+        'HTTPConfiguration',
+        'HTTPHeader',
+        'HubVirtualNetworkConnection',
+        'InboundNatPool',
+        'InboundNatRule',
+        'InterfaceEndpoint',
+        'IPAddressAvailabilityResult',
+        'IPConfiguration',
+        'IPConfigurationProfile',
+        'IpsecPolicy',
+        'IpTag',
+        'Ipv6ExpressRouteCircuitPeeringConfig',
+        'LoadBalancer',
+        'LoadBalancerSku',
+        'LoadBalancingRule',
+        'LocalNetworkGateway',
+        'LogSpecification',
+        'MatchedRule',
+        'MetricSpecification',
+        'NetworkConfigurationDiagnosticParameters',
+        'NetworkConfigurationDiagnosticProfile',
+        'NetworkConfigurationDiagnosticResponse',
+        'NetworkConfigurationDiagnosticResult',
+        'NetworkInterface',
+        'NetworkInterfaceAssociation',
+        'NetworkInterfaceDnsSettings',
+        'NetworkInterfaceIPConfiguration',
+        'NetworkInterfaceTapConfiguration',
+        'NetworkProfile',
+        'NetworkSecurityGroup',
+        'NetworkSecurityGroupResult',
+        'NetworkSecurityRulesEvaluationResult',
+        'NetworkWatcher',
+        'NextHopParameters',
+        'NextHopResult',
+        'Operation',
+        'OperationDisplay',
+        'OperationPropertiesFormatServiceSpecification',
+        'OutboundRule',
+        'P2SVpnGateway',
+        'P2SVpnProfileParameters',
+        'P2SVpnServerConfigRadiusClientRootCertificate',
+        'P2SVpnServerConfigRadiusServerRootCertificate',
+        'P2SVpnServerConfiguration',
+        'P2SVpnServerConfigVpnClientRevokedCertificate',
+        'P2SVpnServerConfigVpnClientRootCertificate',
+        'PacketCapture',
+        'PacketCaptureFilter',
+        'PacketCaptureParameters',
+        'PacketCaptureQueryStatusResult',
+        'PacketCaptureResult',
+        'PacketCaptureStorageLocation',
+        'PatchRouteFilter',
+        'PatchRouteFilterRule',
+        'Probe',
+        'ProtocolConfiguration',
+        'PublicIPAddress',
+        'PublicIPAddressDnsSettings',
+        'PublicIPAddressSku',
+        'PublicIPPrefix',
+        'PublicIPPrefixSku',
+        'QueryTroubleshootingParameters',
+        'ReferencedPublicIpAddress',
+        'Resource',
+        'ResourceNavigationLink',
+        'RetentionPolicyParameters',
+        'Route',
+        'RouteFilter',
+        'RouteFilterRule',
+        'RouteTable',
+        'SecurityGroupNetworkInterface',
+        'SecurityGroupViewParameters',
+        'SecurityGroupViewResult',
+        'SecurityRule',
+        'SecurityRuleAssociations',
+        'ServiceAssociationLink',
+        'ServiceEndpointPolicy',
+        'ServiceEndpointPolicyDefinition',
+        'ServiceEndpointPropertiesFormat',
+        'Subnet',
+        'SubnetAssociation',
+        'SubResource',
+        'TagsObject',
+        'Topology',
+        'TopologyAssociation',
+        'TopologyParameters',
+        'TopologyResource',
+        'TrafficAnalyticsConfigurationProperties',
+        'TrafficAnalyticsProperties',
+        'TroubleshootingDetails',
+        'TroubleshootingParameters',
+        'TroubleshootingRecommendedActions',
+        'TroubleshootingResult',
+        'TunnelConnectionHealth',
+        'Usage',
+        'UsageName',
+        'VerificationIPFlowParameters',
+        'VerificationIPFlowResult',
+        'VirtualHub',
+        'VirtualHubId',
+        'VirtualHubRoute',
+        'VirtualHubRouteTable',
+        'VirtualNetwork',
+        'VirtualNetworkConnectionGatewayReference',
+        'VirtualNetworkGateway',
+        'VirtualNetworkGatewayConnection',
+        'VirtualNetworkGatewayConnectionListEntity',
+        'VirtualNetworkGatewayIPConfiguration',
+        'VirtualNetworkGatewaySku',
+        'VirtualNetworkPeering',
+        'VirtualNetworkTap',
+        'VirtualNetworkUsage',
+        'VirtualNetworkUsageName',
+        'VirtualWAN',
+        'VirtualWanSecurityProvider',
+        'VirtualWanSecurityProviders',
+        'VpnClientConfiguration',
+        'VpnClientConnectionHealth',
+        'VpnClientIPsecParameters',
+        'VpnClientParameters',
+        'VpnClientRevokedCertificate',
+        'VpnClientRootCertificate',
+        'VpnConnection',
+        'VpnDeviceScriptParameters',
+        'VpnGateway',
+        'VpnProfileResponse',
+        'VpnSite',
+        'VpnSiteId',
+    ],
+    '._paged_models': [
+        'ApplicationGatewayPaged',
+        'ApplicationGatewaySslPredefinedPolicyPaged',
+        'ApplicationSecurityGroupPaged',
+        'AvailableDelegationPaged',
+        'AzureFirewallFqdnTagPaged',
+        'AzureFirewallPaged',
+        'BackendAddressPoolPaged',
+        'BgpServiceCommunityPaged',
+        'ConnectionMonitorResultPaged',
+        'DdosProtectionPlanPaged',
+        'EndpointServiceResultPaged',
+        'ExpressRouteCircuitAuthorizationPaged',
+        'ExpressRouteCircuitPaged',
+        'ExpressRouteCircuitPeeringPaged',
+        'ExpressRouteCrossConnectionPaged',
+        'ExpressRouteCrossConnectionPeeringPaged',
+        'ExpressRouteLinkPaged',
+        'ExpressRoutePortPaged',
+        'ExpressRoutePortsLocationPaged',
+        'ExpressRouteServiceProviderPaged',
+        'FrontendIPConfigurationPaged',
+        'HubVirtualNetworkConnectionPaged',
+        'InboundNatRulePaged',
+        'InterfaceEndpointPaged',
+        'LoadBalancerPaged',
+        'LoadBalancingRulePaged',
+        'LocalNetworkGatewayPaged',
+        'NetworkInterfaceIPConfigurationPaged',
+        'NetworkInterfacePaged',
+        'NetworkInterfaceTapConfigurationPaged',
+        'NetworkProfilePaged',
+        'NetworkSecurityGroupPaged',
+        'NetworkWatcherPaged',
+        'OperationPaged',
+        'OutboundRulePaged',
+        'P2SVpnGatewayPaged',
+        'P2SVpnServerConfigurationPaged',
+        'PacketCaptureResultPaged',
+        'ProbePaged',
+        'PublicIPAddressPaged',
+        'PublicIPPrefixPaged',
+        'RouteFilterPaged',
+        'RouteFilterRulePaged',
+        'RoutePaged',
+        'RouteTablePaged',
+        'SecurityRulePaged',
+        'ServiceEndpointPolicyDefinitionPaged',
+        'ServiceEndpointPolicyPaged',
+        'SubnetPaged',
+        'UsagePaged',
+        'VirtualHubPaged',
+        'VirtualNetworkGatewayConnectionListEntityPaged',
+        'VirtualNetworkGatewayConnectionPaged',
+        'VirtualNetworkGatewayPaged',
+        'VirtualNetworkPaged',
+        'VirtualNetworkPeeringPaged',
+        'VirtualNetworkTapPaged',
+        'VirtualNetworkUsagePaged',
+        'VirtualWANPaged',
+        'VpnConnectionPaged',
+        'VpnGatewayPaged',
+        'VpnSitePaged',
+    ],
+    '._network_management_client_enums': [
+        'IPAllocationMethod',
+        'SecurityRuleProtocol',
+        'SecurityRuleAccess',
+        'SecurityRuleDirection',
+        'RouteNextHopType',
+        'PublicIPAddressSkuName',
+        'IPVersion',
+        'TransportProtocol',
+        'ApplicationGatewayProtocol',
+        'ApplicationGatewayCookieBasedAffinity',
+        'ApplicationGatewayBackendHealthServerHealth',
+        'ApplicationGatewaySkuName',
+        'ApplicationGatewayTier',
+        'ApplicationGatewaySslProtocol',
+        'ApplicationGatewaySslPolicyType',
+        'ApplicationGatewaySslPolicyName',
+        'ApplicationGatewaySslCipherSuite',
+        'ApplicationGatewayCustomErrorStatusCode',
+        'ApplicationGatewayRequestRoutingRuleType',
+        'ApplicationGatewayRedirectType',
+        'ApplicationGatewayOperationalState',
+        'ApplicationGatewayFirewallMode',
+        'ProvisioningState',
+        'AzureFirewallRCActionType',
+        'AzureFirewallApplicationRuleProtocolType',
+        'AzureFirewallNatRCActionType',
+        'AzureFirewallNetworkRuleProtocol',
+        'AuthorizationUseStatus',
+        'ExpressRouteCircuitPeeringAdvertisedPublicPrefixState',
+        'Access',
+        'ExpressRoutePeeringType',
+        'ExpressRoutePeeringState',
+        'CircuitConnectionStatus',
+        'ExpressRouteCircuitPeeringState',
+        'ExpressRouteCircuitSkuTier',
+        'ExpressRouteCircuitSkuFamily',
+        'ServiceProviderProvisioningState',
+        'ExpressRouteLinkConnectorType',
+        'ExpressRouteLinkAdminState',
+        'ExpressRoutePortsEncapsulation',
+        'LoadBalancerSkuName',
+        'LoadDistribution',
+        'ProbeProtocol',
+        'NetworkOperationStatus',
+        'EffectiveSecurityRuleProtocol',
+        'EffectiveRouteSource',
+        'EffectiveRouteState',
+        'AssociationType',
+        'Direction',
+        'IpFlowProtocol',
+        'NextHopType',
+        'PcProtocol',
+        'PcStatus',
+        'PcError',
+        'Protocol',
+        'HTTPMethod',
+        'Origin',
+        'Severity',
+        'IssueType',
+        'ConnectionStatus',
+        'ConnectionMonitorSourceStatus',
+        'ConnectionState',
+        'EvaluationState',
+        'VerbosityLevel',
+        'PublicIPPrefixSkuName',
+        'VirtualNetworkPeeringState',
+        'VirtualNetworkGatewayType',
+        'VpnType',
+        'VirtualNetworkGatewaySkuName',
+        'VirtualNetworkGatewaySkuTier',
+        'VpnClientProtocol',
+        'IpsecEncryption',
+        'IpsecIntegrity',
+        'IkeEncryption',
+        'IkeIntegrity',
+        'DhGroup',
+        'PfsGroup',
+        'BgpPeerState',
+        'ProcessorArchitecture',
+        'AuthenticationMethod',
+        'VirtualNetworkGatewayConnectionStatus',
+        'VirtualNetworkGatewayConnectionType',
+        'VirtualNetworkGatewayConnectionProtocol',
+        'OfficeTrafficCategory',
+        'VpnGatewayTunnelingProtocol',
+        'VpnConnectionStatus',
+        'VirtualWanSecurityProviderType',
+        'TunnelConnectionStatus',
+        'HubVirtualNetworkConnectionStatus',
+    ],
+})
@@ -80,7 +80,7 @@ setup(
     install_requires=[
         'msrest>=0.5.0',
         'msrestazure>=0.4.32,<2.0.0',
-        'azure-common~=1.1',
+        'azure-common~=1.1,>=1.1.24',
     ],
     extras_require={
         ":python_version<'3.0'": ['azure-mgmt-nspkg'],
@@ -0,0 +1,43 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Microbenchmark of the operation group properties of the multi-api NetworkManagementClient.
+
+No request is sent: this measures the cost of `client.virtual_networks` before an operation
+is called, on first access and on repeated access, and of creating new clients.
+
+    python tests/operation_group_performance.py [ITERATIONS]
+"""
+import sys
+import timeit
+
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.mgmt.network import NetworkManagementClient
+
+CREDENTIALS = BasicTokenAuthentication({'access_token': 'fake-token'})
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+def new_client():
+    return NetworkManagementClient(CREDENTIALS, SUBSCRIPTION_ID)
+
+
+def main(iterations):
+    client = new_client()
+    first_access = timeit.timeit(lambda: client.virtual_networks, number=1)
+    repeated_access = timeit.timeit(lambda: client.virtual_networks, number=iterations)
+    other_groups = timeit.timeit(
+        lambda: (client.subnets, client.network_interfaces, client.public_ip_addresses), number=iterations)
+    new_clients = timeit.timeit(lambda: new_client().virtual_networks, number=iterations)
+
+    print("first access:           {:10.3f} ms".format(first_access * 1000))
+    print("repeated access:        {:10.3f} us".format(repeated_access / iterations * 1e6))
+    print("3 other groups:         {:10.3f} us".format(other_groups / iterations * 1e6))
+    print("new client + access:    {:10.3f} us".format(new_clients / iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
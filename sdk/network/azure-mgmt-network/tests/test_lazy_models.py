@@ -0,0 +1,71 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import importlib
+import subprocess
+import sys
+import unittest
+
+import azure.mgmt.network.models
+from azure.mgmt.network import NetworkManagementClient
+
+
+API_VERSIONS = [
+    'v2015_06_15', 'v2016_09_01', 'v2016_12_01', 'v2017_03_01', 'v2017_06_01',
+    'v2017_08_01', 'v2017_09_01', 'v2017_10_01', 'v2017_11_01', 'v2018_01_01',
+    'v2018_02_01', 'v2018_04_01', 'v2018_06_01', 'v2018_07_01', 'v2018_08_01',
+    'v2018_10_01', 'v2018_11_01', 'v2018_12_01', 'v2019_02_01', 'v2019_04_01',
+]
+
+
+class LazyModelsTest(unittest.TestCase):
+
+    def test_models_are_the_latest_version_defining_them(self):
+        expected = {}
+        for api_version in API_VERSIONS:
+            models = importlib.import_module('azure.mgmt.network.{}.models'.format(api_version))
+            for name in models.__all__:
+                expected[name] = models.__name__
+
+        namespace = {}
+        exec('from azure.mgmt.network.models import *', namespace)
+        namespace.pop('__builtins__')
+
+        self.assertEqual(set(namespace), set(expected))
+        for name, value in namespace.items():
+            self.assertTrue(value.__module__.startswith(expected[name]), name)
+            self.assertIs(getattr(azure.mgmt.network.models, name), value)
+
+    def test_models_are_imported_on_first_access(self):
+        if sys.version_info < (3, 7):
+            raise unittest.SkipTest("Module __getattr__ requires Python 3.7")
+        script = (
+            "import sys\n"
+            "import azure.mgmt.network.models as models\n"
+            "assert not [m for m in sys.modules if m.endswith('._models_py3')]\n"
+            "models.VirtualNetwork\n"
+            "assert [m for m in sys.modules if m.endswith('._models_py3')] == "
+            "['azure.mgmt.network.v2019_04_01.models._models_py3']\n"
+        )
+        subprocess.check_call([sys.executable, '-c', script])
+
+    def test_unknown_model(self):
+        with self.assertRaises(AttributeError):
+            azure.mgmt.network.models.NotAModel
+        with self.assertRaises(ImportError):
+            exec('from azure.mgmt.network.v2019_04_01.models import NotAModel', {})
+
+    def test_client_models_dict(self):
+        models_dict = NetworkManagementClient._models_dict('2019-04-01')
+        from azure.mgmt.network.v2019_04_01 import models
+        self.assertEqual(set(models_dict), set(models.__all__))
+        self.assertIs(models_dict['VirtualNetwork'], models.VirtualNetwork)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
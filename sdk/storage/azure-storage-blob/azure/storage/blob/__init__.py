@@ -14,6 +14,8 @@ from .blob_service_client import BlobServiceClient
 from .lease import LeaseClient
 from .polling import CopyStatusPoller
 from ._shared.policies import ExponentialRetry, LinearRetry, NoRetry
+from ._shared.transfer_executor import TransferExecutor
+from ._shared.adaptive_transfer import AdaptiveTransfer, TransferStats
 from ._shared.models import(
     LocationMode,
     ResourceTypes,
@@ -21,6 +23,7 @@ from ._shared.models import(
     StorageErrorCode
 )
 from ._blob_utils import StorageStreamDownloader
+from .transfer_manager import BlobTransferManager, TransferSummary
 from .models import (
     BlobType,
     BlockState,
@@ -61,6 +64,9 @@ __all__ = [
     'ExponentialRetry',
     'LinearRetry',
     'NoRetry',
+    'TransferExecutor',
+    'AdaptiveTransfer',
+    'TransferStats',
     'LocationMode',
     'BlockState',
     'StandardBlobTier',
@@ -89,6 +95,8 @@ __all__ = [
     'AccountPermissions',
     'CopyStatusPoller',
     'StorageStreamDownloader',
+    'BlobTransferManager',
+    'TransferSummary',
 ]
 
 
@@ -5,7 +5,10 @@
 # --------------------------------------------------------------------------
 # pylint: disable=no-self-use
 
+import json
+import os
 import sys
+import threading
 from io import BytesIO, SEEK_SET, UnsupportedOperation
 from typing import Optional, Union, Any, TypeVar, TYPE_CHECKING # pylint: disable=unused-import
 
@@ -22,15 +25,18 @@ from ._shared.upload_chunking import (
     upload_blob_chunks,
     upload_blob_substream_blocks,
     BlockBlobChunkUploader,
+    ResumableBlockBlobChunkUploader,
     PageBlobChunkUploader,
     AppendBlobChunkUploader)
 from ._shared.download_chunking import (
     process_content,
     process_range_and_offset,
+    BufferBlobChunkDownloader,
     ParallelBlobChunkDownloader,
     SequentialBlobChunkDownloader
 )
 from ._shared.encryption import _generate_blob_encryption_data, _encrypt_blob
+from ._shared.transfer_executor import run_parallel
 from ._generated.models import (
     StorageErrorException,
     BlockLookupList,
@@ -45,6 +51,8 @@ if TYPE_CHECKING:
     LeaseClient = TypeVar("LeaseClient")
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
+# The service only provides transactional MD5s for ranges of up to 4MB
+_MAX_VALIDATED_CHUNK_GET_SIZE = 4 * 1024 * 1024
 _ERROR_VALUE_SHOULD_BE_SEEKABLE_STREAM = '{0} should be a seekable file-like/io.IOBase type stream object.'
 
 
@@ -102,6 +110,114 @@ def get_modification_conditions(
     return None
 
 
+class _BlockUploadCheckpoint(object):
+    """The blocks staged by a resumable block blob upload, kept in a local file.
+
+    The first line of the file records the size of the upload and its block size, and
+    each following line the offset and ID of a staged block, as JSON. A checkpoint
+    written for a different size or block size is discarded.
+    """
+
+    def __init__(self, path, size, block_size):
+        self.path = path
+        self.header = {'size': size, 'block_size': block_size}
+        self.blocks = {}
+        self._lock = threading.Lock()
+        self._file = None
+        if not os.path.isfile(path):
+            return
+        with open(path, 'r') as checkpoint:
+            lines = checkpoint.read().splitlines()
+        try:
+            if not lines or json.loads(lines[0]) != self.header:
+                return
+            for line in lines[1:]:
+                record = json.loads(line)
+                self.blocks[record['offset']] = record['block_id']
+        except (ValueError, KeyError):
+            # the last line was only partially written when the upload was interrupted
+            pass
+
+    def reconcile(self, uncommitted_blocks):
+        """Forgets the blocks which are not staged on the service with the expected size,
+        e.g. because they were garbage collected or the blob was committed since.
+        """
+        staged = {block.name: block.size for block in uncommitted_blocks or []}
+        block_size, size = self.header['block_size'], self.header['size']
+        self.blocks = {
+            offset: block_id for offset, block_id in self.blocks.items()
+            if staged.get(block_id) == min(block_size, size - offset)}
+
+    def open(self):
+        # rewrite the file with the blocks which are still staged
+        self._file = open(self.path, 'w')
+        self._file.write(json.dumps(self.header) + '\n')
+        for offset, block_id in sorted(self.blocks.items()):
+            self._file.write(json.dumps({'offset': offset, 'block_id': block_id}) + '\n')
+        self._file.flush()
+
+    def record(self, offset, block_id):
+        with self._lock:
+            if self._file is None:
+                # staged after the upload failed, it is staged again when resuming
+                return
+            self._file.write(json.dumps({'offset': offset, 'block_id': block_id}) + '\n')
+            self._file.flush()
+
+    def close(self, remove=False):
+        # blocks may still be recorded by the threads staging them
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if remove and os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+def _upload_resumable_blocks(
+        client, stream, length, checkpoint_path, validate_content, access_conditions,
+        timeout, max_connections, blob_settings, **kwargs):
+    """Stages the blocks of the stream which are not already staged according to the
+    checkpoint file and returns the block list to commit.
+    """
+    if length is None or not hasattr(stream, 'seek') or \
+            hasattr(stream, 'seekable') and not stream.seekable():
+        raise ValueError("Resumable uploads require a seekable stream of known length.")
+    checkpoint = _BlockUploadCheckpoint(checkpoint_path, length, blob_settings.max_block_size)
+    if checkpoint.blocks:
+        try:
+            block_list = client.get_block_list(
+                list_type='uncommitted',
+                lease_access_conditions=access_conditions,
+                timeout=timeout,
+                **kwargs)
+            checkpoint.reconcile(block_list.uncommitted_blocks)
+        except StorageErrorException as error:
+            if error.response.status_code != 404:
+                raise
+            # the blob and its uncommitted blocks are gone
+            checkpoint.reconcile(None)
+    checkpoint.open()
+    try:
+        upload_blob_chunks(
+            blob_service=client,
+            blob_size=length,
+            block_size=blob_settings.max_block_size,
+            stream=stream,
+            max_connections=max_connections,
+            transfer_executor=blob_settings.transfer_executor,
+            validate_content=validate_content,
+            access_conditions=access_conditions,
+            uploader_class=ResumableBlockBlobChunkUploader,
+            timeout=timeout,
+            staged_blocks=checkpoint.blocks,
+            block_staged_callback=checkpoint.record,
+            **kwargs)
+    finally:
+        checkpoint.close()
+    return checkpoint, [checkpoint.blocks[offset] for offset in sorted(checkpoint.blocks)]
+
+
 def upload_block_blob(  # pylint: disable=too-many-locals
         client,
         data,
@@ -118,6 +234,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
         blob_settings,
         require_encryption,
         key_encryption_key,
+        checkpoint_path=None,
         **kwargs):
     try:
         overwrite_mod_conditions = None
@@ -152,14 +269,23 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 upload_stream_current=0,
                 **kwargs)
 
+        checkpoint = None
         cek, iv, encryption_data = None, None, None
+        # the substream blocks are laid out up front, so adaptive transfers tune the chunked upload
         use_original_upload_path = blob_settings.use_byte_buffer or \
+            blob_settings.adaptive_transfer is not None and max_connections > 1 or \
             validate_content or require_encryption or \
             blob_settings.max_block_size < blob_settings.min_large_block_upload_threshold or \
             hasattr(stream, 'seekable') and not stream.seekable() or \
             not hasattr(stream, 'seek') or not hasattr(stream, 'tell')
 
-        if use_original_upload_path:
+        if checkpoint_path:
+            if require_encryption or key_encryption_key:
+                raise ValueError("Resumable uploads do not support client side encryption.")
+            checkpoint, block_ids = _upload_resumable_blocks(
+                client, stream, length, checkpoint_path, validate_content, access_conditions,
+                timeout, max_connections, blob_settings, **kwargs)
+        elif use_original_upload_path:
             if key_encryption_key:
                 cek, iv, encryption_data = _generate_blob_encryption_data(key_encryption_key)
                 headers['x-ms-meta-encryptiondata'] = encryption_data
@@ -169,6 +295,8 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 block_size=blob_settings.max_block_size,
                 stream=stream,
                 max_connections=max_connections,
+                transfer_executor=blob_settings.transfer_executor,
+                adaptive_transfer=blob_settings.adaptive_transfer,
                 validate_content=validate_content,
                 access_conditions=access_conditions,
                 uploader_class=BlockBlobChunkUploader,
@@ -184,6 +312,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 block_size=blob_settings.max_block_size,
                 stream=stream,
                 max_connections=max_connections,
+                transfer_executor=blob_settings.transfer_executor,
                 validate_content=validate_content,
                 access_conditions=access_conditions,
                 uploader_class=BlockBlobChunkUploader,
@@ -193,7 +322,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
 
         block_lookup = BlockLookupList(committed=[], uncommitted=[], latest=[])
         block_lookup.latest = block_ids
-        return client.commit_block_list(
+        response = client.commit_block_list(
             block_lookup,
             blob_http_headers=blob_headers,
             lease_access_conditions=access_conditions,
@@ -203,6 +332,9 @@ def upload_block_blob(  # pylint: disable=too-many-locals
             validate_content=validate_content,
             headers=headers,
             **kwargs)
+        if checkpoint:
+            checkpoint.close(remove=True)
+        return response
     except StorageErrorException as error:
         try:
             process_storage_error(error)
@@ -267,6 +399,7 @@ def upload_page_blob(
             block_size=blob_settings.max_page_size,
             stream=stream,
             max_connections=max_connections,
+            transfer_executor=blob_settings.transfer_executor,
             validate_content=validate_content,
             access_conditions=access_conditions,
             uploader_class=PageBlobChunkUploader,
@@ -343,6 +476,7 @@ def upload_append_blob(
                 stream=stream,
                 append_conditions=append_conditions,
                 max_connections=max_connections,
+                transfer_executor=blob_settings.transfer_executor,
                 validate_content=validate_content,
                 access_conditions=access_conditions,
                 uploader_class=AppendBlobChunkUploader,
@@ -375,6 +509,7 @@ def upload_append_blob(
                 stream=stream,
                 append_conditions=append_conditions,
                 max_connections=max_connections,
+                transfer_executor=blob_settings.transfer_executor,
                 validate_content=validate_content,
                 access_conditions=access_conditions,
                 uploader_class=AppendBlobChunkUploader,
@@ -486,6 +621,23 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         return self.download_size
 
     def __iter__(self):
+        return self.chunks()
+
+    def chunks(self, max_connections=1, read_ahead=None):
+        """Iterate over the contents of this blob in chunks.
+
+        With more than one connection the next chunks are downloaded in parallel
+        while the current chunk is consumed, and are still yielded in order.
+        The destination therefore does not need to be seekable.
+
+        :param int max_connections:
+            The number of parallel connections with which to download.
+        :param int read_ahead:
+            The maximum number of chunks downloaded ahead of the consumer. This
+            bounds the memory used to read_ahead times the max_chunk_get_size setting.
+            Defaults to twice max_connections.
+        :returns: An iterator of bytes.
+        """
         if self.download_size == 0:
             content = b""
         else:
@@ -526,8 +678,17 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             cls=deserialize_blob_stream,
             **self.request_options)
 
-        for chunk in downloader.get_chunk_offsets():
-            yield downloader.yield_chunk(chunk)
+        if max_connections > 1:
+            if read_ahead is None:
+                read_ahead = 2 * max_connections
+            if read_ahead < 1:
+                raise ValueError("read_ahead must be at least 1.")
+            for chunk in downloader.yield_chunks_read_ahead(
+                    max_connections, read_ahead, transfer_executor=self.config.transfer_executor):
+                yield chunk
+        else:
+            for chunk in downloader.get_chunk_offsets():
+                yield downloader.yield_chunk(chunk)
 
     def _initial_request(self):
         range_header, range_validation = validate_and_format_range_headers(
@@ -628,6 +789,17 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         content = self.content_as_bytes(max_connections=max_connections)
         return content.decode(encoding)
 
+    def _download_chunks_parallel(self, downloader, max_connections):
+        if self.config.adaptive_transfer is not None:
+            self.config.adaptive_transfer.run(
+                self.config.transfer_executor, 'download', downloader.process_chunk, downloader.get_next_chunk,
+                self.config.max_chunk_get_size, max_connections,
+                max_chunk_size=_MAX_VALIDATED_CHUNK_GET_SIZE if self.validate_content else None)
+        else:
+            run_parallel(
+                self.config.transfer_executor, downloader.process_chunk, downloader.get_chunk_offsets(),
+                max_connections, self.config.max_chunk_get_size)
+
     def download_to_stream(self, stream, max_connections=1):
         """Download the contents of this blob to a stream.
 
@@ -692,11 +864,86 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             **self.request_options)
 
         if max_connections > 1:
-            import concurrent.futures
-            executor = concurrent.futures.ThreadPoolExecutor(max_connections)
-            list(executor.map(downloader.process_chunk, downloader.get_chunk_offsets()))
+            self._download_chunks_parallel(downloader, max_connections)
         else:
             for chunk in downloader.get_chunk_offsets():
                 downloader.process_chunk(chunk)
 
         return self.properties
+
+    def download_into(self, buffer, max_connections=1):
+        """Download the contents of this blob into a preallocated buffer.
+
+        Each chunk is written directly into its own slice of the buffer, so parallel
+        connections neither share a lock nor need a seekable stream.
+
+        :param buffer:
+            A writable object supporting the buffer protocol, such as a bytearray,
+            a memoryview or an mmap, of at least the download size.
+        :param int max_connections:
+            The number of parallel connections with which to download.
+        :returns: The properties of the downloaded blob.
+        :rtype: ~azure.storage.blob.models.BlobProperties
+        """
+        views = [memoryview(buffer)]
+        try:
+            if views[0].readonly:
+                raise ValueError("Target buffer must be writable.")
+            if sys.version_info >= (3,) and views[0].format != 'B':
+                views.append(views[0].cast('B'))
+            if len(views[-1]) < self.download_size:
+                raise ValueError("Target buffer is smaller than the download size {0}.".format(self.download_size))
+
+            if self.download_size == 0:
+                content = b""
+            else:
+                content = process_content(
+                    self.blob,
+                    self.initial_offset[0],
+                    self.initial_offset[1],
+                    self.require_encryption,
+                    self.key_encryption_key,
+                    self.key_resolver_function)
+            if content is not None:
+                views[-1][:len(content)] = content
+            if self._download_complete:
+                return self.properties
+
+            end_blob = self.blob_size
+            if self.length is not None:
+                # Use the length unless it is over the end of the blob
+                end_blob = min(self.blob_size, self.length + 1)
+
+            # the chunk downloader writes after the initial content
+            views.append(views[-1][len(content):self.download_size])
+            downloader = BufferBlobChunkDownloader(
+                blob_service=self.service,
+                download_size=self.download_size,
+                chunk_size=self.config.max_chunk_get_size,
+                progress=self.first_get_size,
+                start_range=self.initial_range[1] + 1,  # start where the first download ended
+                end_range=end_blob,
+                stream=views[-1],
+                validate_content=self.validate_content,
+                access_conditions=self.access_conditions,
+                mod_conditions=self.mod_conditions,
+                timeout=self.timeout,
+                require_encryption=self.require_encryption,
+                key_encryption_key=self.key_encryption_key,
+                key_resolver_function=self.key_resolver_function,
+                use_location=self.location_mode,
+                cls=deserialize_blob_stream,
+                **self.request_options)
+
+            if max_connections > 1:
+                self._download_chunks_parallel(downloader, max_connections)
+            else:
+                for chunk in downloader.get_chunk_offsets():
+                    downloader.process_chunk(chunk)
+
+            return self.properties
+        finally:
+            # release the exports so that the caller can resize or close the buffer
+            for view in reversed(views):
+                if hasattr(view, 'release'):
+                    view.release()
@@ -0,0 +1,205 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import threading
+import time
+
+from .transfer_executor import TransferExecutor
+
+# The most blocks a block blob can have
+_MAX_BLOCKS = 50000
+
+
+class TransferStats(object):
+    """The state of an adaptive transfer, passed to the stats callback after each chunk.
+
+    :ivar str direction: Either "upload" or "download".
+    :ivar int chunk_size: The size of the next chunks, in bytes.
+    :ivar int connections: The number of chunks transferred at the same time.
+    :ivar float chunk_latency: The number of seconds the last chunk took.
+    :ivar float throughput: The bytes per second of the last measurement window.
+    :ivar int bytes_transferred: The number of bytes transferred so far by this call.
+    :ivar int chunks_transferred: The number of chunks transferred so far by this call.
+    """
+
+    def __init__(self, direction, chunk_size, connections):
+        self.direction = direction
+        self.chunk_size = chunk_size
+        self.connections = connections
+        self.chunk_latency = None
+        self.throughput = None
+        self.bytes_transferred = 0
+        self.chunks_transferred = 0
+
+
+class AdaptiveTransfer(object):
+    """Tunes the chunk size and the number of connections of parallel transfers as they run.
+
+    Passed to a client as the `adaptive_transfer` keyword argument, it applies to the parallel
+    block blob uploads and parallel downloads of the client, that is those with max_connections
+    greater than 1. The chunk size starts at the max_block_size or max_chunk_get_size setting,
+    and the connections at the max_connections of the call, unless an earlier transfer in the
+    same direction has already tuned them, in which case they start from its final values.
+
+    Like TCP congestion control, the number of connections is increased by one for every
+    window of chunks whose throughput improved on the previous window, decreased by one when
+    it dropped, and halved when a chunk fails. The chunk size is doubled when chunks complete
+    in less than half the target latency, so that per-request overhead is amortized on fast
+    links, and halved when they take more than twice as long, so that slow links are not held
+    up by a few large chunks.
+
+    :param int min_chunk_size: The smallest chunk size, in bytes. The default is 1MB.
+    :param int max_chunk_size:
+        The largest chunk size, in bytes. The default is 100MB, the largest block size supported
+        by the service.
+    :param int min_connections: The fewest chunks transferred at the same time. The default is 1.
+    :param int max_connections: The most chunks transferred at the same time. The default is 16.
+    :param float target_chunk_latency:
+        The number of seconds each chunk should take. The default is 2 seconds.
+    :param callable stats_callback:
+        Called with a :class:`TransferStats` after each chunk completes. Calls of the same
+        transfer are not concurrent.
+    """
+
+    def __init__(
+            self, min_chunk_size=1024 * 1024,
+            max_chunk_size=100 * 1024 * 1024,
+            min_connections=1,
+            max_connections=16,
+            target_chunk_latency=2.0,
+            stats_callback=None):
+        if not 0 < min_chunk_size <= max_chunk_size:
+            raise ValueError("Chunk size bounds must satisfy 0 < min_chunk_size <= max_chunk_size.")
+        if not 0 < min_connections <= max_connections:
+            raise ValueError("Connection bounds must satisfy 0 < min_connections <= max_connections.")
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.target_chunk_latency = target_chunk_latency
+        self.stats_callback = stats_callback
+        self._tuned = {}
+        self._lock = threading.Lock()
+
+    def _start(self, direction, chunk_size, connections, max_chunk_size=None):
+        with self._lock:
+            chunk_size, connections = self._tuned.get(direction, (chunk_size, connections))
+        return TransferStats(
+            direction,
+            min(max(chunk_size, self.min_chunk_size), max_chunk_size or self.max_chunk_size),
+            min(max(connections, self.min_connections), self.max_connections))
+
+    def _finish(self, stats):
+        with self._lock:
+            self._tuned[stats.direction] = (stats.chunk_size, stats.connections)
+
+    def _chunk_done(self, stats, window, size, latency, max_chunk_size):
+        # called with the lock of the transfer held
+        stats.bytes_transferred += size
+        stats.chunks_transferred += 1
+        stats.chunk_latency = latency
+        if latency < self.target_chunk_latency / 2:
+            stats.chunk_size = min(stats.chunk_size * 2, max_chunk_size)
+        elif latency > self.target_chunk_latency * 2:
+            stats.chunk_size = max(min(stats.chunk_size // 2, max_chunk_size), self.min_chunk_size)
+
+        window['bytes'] += size
+        window['chunks'] += 1
+        if window['chunks'] >= stats.connections:
+            now = time.time()
+            throughput = window['bytes'] / max(now - window['start'], 1e-6)
+            if stats.throughput is None or throughput > stats.throughput * 1.1:
+                stats.connections = min(stats.connections + 1, self.max_connections)
+            elif throughput < stats.throughput * 0.9:
+                stats.connections = max(stats.connections - 1, self.min_connections)
+            stats.throughput = throughput
+            window.update(bytes=0, chunks=0, start=now)
+        if self.stats_callback:
+            self.stats_callback(stats)
+
+    def run(self, transfer_executor, direction, fn, next_task, chunk_size, connections, total_size=None,
+            max_chunk_size=None):
+        """Runs fn on each task on up to stats.connections threads and returns the results in order.
+
+        :param transfer_executor:
+            The shared executor to run on. If not set, a pool of max_connections workers
+            is used for this call only.
+        :param str direction: Either "upload" or "download".
+        :param callable fn: The function to call with the arguments of each task.
+        :param callable next_task:
+            Called with the current chunk size to get the next task as a tuple of the
+            arguments for fn and the number of bytes transferred, or None at the end.
+        :param int chunk_size: The initial chunk size, unless tuned by an earlier transfer.
+        :param int connections: The initial connections, unless tuned by an earlier transfer.
+        :param int total_size:
+            The number of bytes of a block blob upload. The chunk size is kept large enough for the
+            rest of the upload to fit in the blocks left of the 50,000 a blob may have.
+        :param int max_chunk_size:
+            The largest chunk size of this transfer, if lower than the max_chunk_size of the
+            AdaptiveTransfer, such as the 4MB of downloads with a transactional MD5.
+        :rtype: list
+        """
+        max_chunk_size = min(max_chunk_size or self.max_chunk_size, self.max_chunk_size)
+        stats = self._start(direction, chunk_size, connections, max_chunk_size)
+        submitted = 0
+        executor = transfer_executor or TransferExecutor(self.max_connections)
+        window = dict(bytes=0, chunks=0, start=time.time())
+        slots = threading.Condition(threading.Lock())
+        running = [0]
+        errors = []
+
+        def timed(args, size):
+            start = time.time()
+            result = fn(*args)
+            latency = time.time() - start
+            with slots:
+                self._chunk_done(stats, window, size, latency, max_chunk_size)
+            return result
+
+        def task_done(future):
+            with slots:
+                running[0] -= 1
+                if not future.cancelled() and future.exception() is not None:
+                    errors.append(future.exception())
+                    stats.connections = max(stats.connections // 2, self.min_connections)
+                slots.notify_all()
+
+        futures = []
+        try:
+            while True:
+                with slots:
+                    while not errors and running[0] >= stats.connections:
+                        slots.wait()
+                    if errors:
+                        break
+                    if total_size is not None:
+                        blocks_left = max(_MAX_BLOCKS - len(futures), 1)
+                        remaining = max(total_size - submitted, 0)
+                        stats.chunk_size = max(stats.chunk_size, -(-remaining // blocks_left))
+                    chunk_size = stats.chunk_size
+                task = next_task(chunk_size)
+                if task is None:
+                    break
+                args, size = task
+                submitted += size
+                with slots:
+                    running[0] += 1
+                future = executor.submit(size, timed, args, size)
+                future.add_done_callback(task_done)
+                futures.append(future)
+            if errors:
+                for future in futures:
+                    future.cancel()
+                raise errors[0]
+            return [f.result() for f in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            self._finish(stats)
+            if executor is not transfer_executor:
+                executor.shutdown(wait=False)
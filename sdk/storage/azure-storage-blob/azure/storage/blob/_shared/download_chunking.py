@@ -4,12 +4,15 @@
 # license information.
 # --------------------------------------------------------------------------
 import threading
+from collections import deque
+from itertools import islice
 
 from azure.core.exceptions import HttpResponseError
 
 from .models import ModifiedAccessConditions
 from .utils import validate_and_format_range_headers, process_storage_error
 from .encryption import _decrypt_blob
+from .transfer_executor import TransferExecutor
 
 
 def process_range_and_offset(start_range, end_range, length, key_encryption_key, key_resolver_function):
@@ -68,6 +71,7 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         self.download_size = download_size
         self.start_index = start_range
         self.blob_end = end_range
+        self.next_chunk_start = start_range
 
         # the destination that we will write to
         self.stream = stream
@@ -87,11 +91,12 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         self.mod_conditions = mod_conditions
         self.request_options = kwargs
 
-    def _calculate_range(self, chunk_start):
-        if chunk_start + self.chunk_size > self.blob_end:
+    def _calculate_range(self, chunk_start, chunk_size=None):
+        chunk_size = chunk_size or self.chunk_size
+        if chunk_start + chunk_size > self.blob_end:
             chunk_end = self.blob_end
         else:
-            chunk_end = chunk_start + self.chunk_size
+            chunk_end = chunk_start + chunk_size
         return chunk_start, chunk_end
 
     def get_chunk_offsets(self):
@@ -100,8 +105,21 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
             yield index
             index += self.chunk_size
 
-    def process_chunk(self, chunk_start):
-        chunk_start, chunk_end = self._calculate_range(chunk_start)
+    def get_next_chunk(self, chunk_size):
+        """Returns the arguments of process_chunk for the next chunk of chunk_size bytes
+        and the length of the chunk, or None once the end is reached.
+
+        Unlike get_chunk_offsets, every chunk carries its own size so that the size
+        can change during the download.
+        """
+        if self.next_chunk_start >= self.blob_end:
+            return None
+        chunk_start, chunk_end = self._calculate_range(self.next_chunk_start, chunk_size)
+        self.next_chunk_start = chunk_end
+        return (chunk_start, chunk_size), chunk_end - chunk_start
+
+    def process_chunk(self, chunk_start, chunk_size=None):
+        chunk_start, chunk_end = self._calculate_range(chunk_start, chunk_size)
         chunk_data = self._download_chunk(chunk_start, chunk_end)
         length = chunk_end - chunk_start
         if length > 0:
@@ -121,6 +139,16 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         pass
 
     def _download_chunk(self, chunk_start, chunk_end):
+        response, offset = self._request_chunk(chunk_start, chunk_end)
+        return process_content(
+            response,
+            offset[0],
+            offset[1],
+            self.require_encryption,
+            self.key_encryption_key,
+            self.key_resolver_function)
+
+    def _request_chunk(self, chunk_start, chunk_end):
         download_range, offset = process_range_and_offset(
             chunk_start,
             chunk_end,
@@ -147,20 +175,46 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         except HttpResponseError as error:
             process_storage_error(error)
 
-        chunk_data = process_content(
-            response,
-            offset[0],
-            offset[1],
-            self.require_encryption,
-            self.key_encryption_key,
-            self.key_resolver_function)
-
         # This makes sure that if_match is set so that we can validate
         # that subsequent downloads are to an unmodified blob
         if not self.mod_conditions:
             self.mod_conditions = ModifiedAccessConditions()
         self.mod_conditions.if_match = response.properties.etag
-        return chunk_data
+        return response, offset
+
+    def yield_chunks_read_ahead(self, max_connections, read_ahead, transfer_executor=None):
+        """Downloads the chunks on parallel connections and yields them in order.
+
+        Up to read_ahead chunks are downloading or waiting to be yielded at any time,
+        which bounds the memory used to read_ahead chunks plus the chunk being consumed.
+
+        :param int max_connections:
+            The number of parallel connections with which to download.
+        :param int read_ahead:
+            The number of chunks to download ahead of the consumer.
+        :param transfer_executor:
+            The shared executor to download on. If not set, a pool of max_connections
+            workers is used for this download only.
+        :type transfer_executor: ~azure.storage.blob._shared.transfer_executor.TransferExecutor
+        """
+        executor = transfer_executor or TransferExecutor(max_connections)
+        offsets = self.get_chunk_offsets()
+        pending = deque()
+        try:
+            for offset in islice(offsets, read_ahead):
+                pending.append(executor.submit(self.chunk_size, self.yield_chunk, offset))
+            while pending:
+                chunk_data = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(self.chunk_size, self.yield_chunk, next_offset))
+                yield chunk_data
+        finally:
+            # the consumer stopped early or a chunk failed, don't start the queued downloads
+            for future in pending:
+                future.cancel()
+            if executor is not transfer_executor:
+                executor.shutdown(wait=False)
 
 
 class ParallelBlobChunkDownloader(_BlobChunkDownloader):
@@ -193,6 +247,55 @@ class ParallelBlobChunkDownloader(_BlobChunkDownloader):
             self.stream.write(chunk_data)
 
 
+class BufferBlobChunkDownloader(_BlobChunkDownloader):
+    """Downloads the chunks straight into a writable memoryview.
+
+    Every chunk owns a distinct slice of the destination, so parallel workers write
+    without a lock and the response body is copied into place as it is read
+    instead of being joined into an intermediate bytes object first.
+    """
+    def __init__(
+            self, blob_service, download_size, chunk_size, progress, start_range, end_range,
+            stream, validate_content, access_conditions, mod_conditions, timeout,
+            require_encryption, key_encryption_key, key_resolver_function, **kwargs):
+
+        super(BufferBlobChunkDownloader, self).__init__(
+            blob_service, download_size, chunk_size, progress, start_range, end_range,
+            stream, validate_content, access_conditions, mod_conditions, timeout,
+            require_encryption, key_encryption_key, key_resolver_function, **kwargs)
+
+        self.progress_lock = threading.Lock()
+
+    def process_chunk(self, chunk_start, chunk_size=None):
+        chunk_start, chunk_end = self._calculate_range(chunk_start, chunk_size)
+        length = chunk_end - chunk_start
+        if length > 0:
+            response, offset = self._request_chunk(chunk_start, chunk_end)
+            if self.key_encryption_key is not None or self.key_resolver_function is not None:
+                # decryption needs the whole chunk
+                self._write_to_stream(process_content(
+                    response,
+                    offset[0],
+                    offset[1],
+                    self.require_encryption,
+                    self.key_encryption_key,
+                    self.key_resolver_function), chunk_start)
+            else:
+                position = chunk_start
+                for data in response:
+                    self._write_to_stream(data, position)
+                    position += len(data)
+            self._update_progress(length)
+
+    def _update_progress(self, length):
+        with self.progress_lock:
+            self.progress_total += length
+
+    def _write_to_stream(self, chunk_data, chunk_start):
+        position = chunk_start - self.start_index
+        self.stream[position:position + len(chunk_data)] = chunk_data
+
+
 class SequentialBlobChunkDownloader(_BlobChunkDownloader):
 
     def _update_progress(self, length):
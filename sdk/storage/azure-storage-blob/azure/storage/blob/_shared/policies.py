@@ -37,7 +37,13 @@ from azure.core.pipeline.policies import (
     NetworkTraceLoggingPolicy,
     HTTPPolicy)
 from azure.core.pipeline.policies.base import RequestHistory
-from azure.core.exceptions import AzureError, ServiceRequestError, ServiceResponseError
+from azure.core.exceptions import (
+    AzureError,
+    CircuitBreakerOpenError,
+    RetryBudgetExhaustedError,
+    ServiceRequestError,
+    ServiceResponseError
+)
 
 from ..version import VERSION
 from .models import LocationMode
@@ -122,6 +128,10 @@ class StorageBlobSettings(object):
         self.max_single_get_size = kwargs.get('max_single_get_size', 32 * 1024 * 1024)
         self.max_chunk_get_size = kwargs.get('max_chunk_get_size', 4 * 1024 * 1024)
 
+        # Parallel uploads and downloads
+        self.transfer_executor = kwargs.get('transfer_executor')
+        self.adaptive_transfer = kwargs.get('adaptive_transfer')
+
 
 class StorageHeadersPolicy(HeadersPolicy):
 
@@ -527,6 +537,9 @@ class StorageRetryPolicy(HTTPPolicy):
 
                         continue
                 break
+            except (CircuitBreakerOpenError, RetryBudgetExhaustedError):
+                # a circuit breaker rejected the request to spare a failing host, retrying would defeat it
+                raise
             except AzureError as err:
                 retries_remaining = self.increment(
                     retry_settings, request=request.http_request, error=err)
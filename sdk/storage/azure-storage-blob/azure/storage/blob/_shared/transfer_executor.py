@@ -0,0 +1,164 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import functools
+import threading
+
+import concurrent.futures
+
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class TransferExecutor(object):
+    """A thread pool shared by the parallel chunk transfers of one or more clients.
+
+    Passing the same executor to a client as the `transfer_executor` keyword argument
+    makes every parallel upload and download started from that client, and from the
+    container and blob clients retrieved from it, run on the same worker threads.
+    This avoids creating a thread pool per call and bounds the concurrency and
+    memory used by all transfers together. The `max_connections` of each call
+    still limits the number of chunks that the call transfers at once.
+
+    :param int max_concurrency:
+        The maximum number of chunks transferred at the same time across all
+        transfers using this executor. The default is 8.
+    :param int max_in_flight_bytes:
+        The maximum number of bytes buffered by chunks that are being read, uploaded
+        or downloaded at the same time across all transfers using this executor.
+        A chunk larger than this limit is transferred alone. The default is no limit.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, max_in_flight_bytes=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if max_in_flight_bytes is not None and max_in_flight_bytes < 1:
+            raise ValueError("max_in_flight_bytes must be at least 1.")
+        self.max_concurrency = max_concurrency
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_concurrency)
+        self._in_flight_bytes = 0
+        self._bytes_released = threading.Condition(threading.Lock())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    @property
+    def in_flight_bytes(self):
+        """The number of bytes currently reserved by chunk transfers.
+
+        :rtype: int
+        """
+        return self._in_flight_bytes
+
+    def _reserve(self, size):
+        with self._bytes_released:
+            if self.max_in_flight_bytes is not None:
+                # let an oversized chunk through once nothing else is in flight
+                while self._in_flight_bytes and self._in_flight_bytes + size > self.max_in_flight_bytes:
+                    self._bytes_released.wait()
+            self._in_flight_bytes += size
+
+    def _release(self, size, *_):
+        with self._bytes_released:
+            self._in_flight_bytes -= size
+            self._bytes_released.notify_all()
+
+    def submit(self, size, fn, *args):
+        """Reserves size bytes of the in-flight limit and schedules fn(*args).
+
+        The reservation is released when the returned future completes.
+
+        :param int size: The number of bytes buffered by the task.
+        :returns: A concurrent.futures.Future.
+        """
+        self._reserve(size)
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release(size)
+            raise
+        future.add_done_callback(functools.partial(self._release, size))
+        return future
+
+    def map(self, fn, tasks, max_connections, task_size=0):
+        """Runs fn on each of the tasks and returns the results in order.
+
+        No more than max_connections tasks of this call are scheduled at a time, and the next
+        task is only pulled from the tasks iterable once its bytes are reserved, so chunks
+        are not buffered ahead of the workers. The first error raised by a task is raised
+        once it is noticed and the tasks which have not started yet are cancelled.
+
+        :param callable fn: The function to call with each task.
+        :param tasks: An iterable of task arguments.
+        :param int max_connections: The maximum number of tasks of this call run at once.
+        :param int task_size: The number of bytes reserved for each task.
+        :rtype: list
+        """
+        throttle = threading.BoundedSemaphore(max_connections)
+        errors = []
+
+        def task_done(future):
+            throttle.release()
+            if not future.cancelled() and future.exception() is not None:
+                errors.append(future.exception())
+
+        futures = []
+        tasks = iter(tasks)
+        try:
+            while not errors:
+                throttle.acquire()
+                self._reserve(task_size)
+                try:
+                    task = next(tasks)
+                except BaseException:
+                    self._release(task_size)
+                    throttle.release()
+                    raise
+                try:
+                    future = self._executor.submit(fn, task)
+                except BaseException:
+                    self._release(task_size)
+                    throttle.release()
+                    raise
+                future.add_done_callback(functools.partial(self._release, task_size))
+                future.add_done_callback(task_done)
+                futures.append(future)
+        except StopIteration:
+            pass
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        if errors:
+            for future in futures:
+                future.cancel()
+            raise errors[0]
+        # result() waits for the remaining tasks and raises the first error in order
+        return [f.result() for f in futures]
+
+    def shutdown(self, wait=True):
+        """Stops the worker threads once the scheduled tasks have completed.
+
+        :param bool wait: Whether to block until the scheduled tasks have completed.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+def run_parallel(transfer_executor, fn, tasks, max_connections, task_size=0):
+    """Runs fn on each task on the shared executor, or on a pool of max_connections
+    workers which only lives for this call when no executor is shared.
+    """
+    if transfer_executor is not None:
+        return transfer_executor.map(fn, tasks, max_connections, task_size)
+    executor = TransferExecutor(max_connections)
+    try:
+        return executor.map(fn, tasks, max_connections, task_size)
+    finally:
+        executor.shutdown(wait=False)
@@ -19,6 +19,7 @@ from .utils import (
     get_length,
     return_response_headers)
 from .encryption import _get_blob_encryptor_and_padder
+from .transfer_executor import run_parallel
 
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
@@ -27,7 +28,8 @@ _ERROR_VALUE_SHOULD_BE_SEEKABLE_STREAM = '{0} should be a seekable file-like/io.
 
 def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connections, validate_content,  # pylint: disable=too-many-locals
                        access_conditions, uploader_class, append_conditions=None, modified_access_conditions=None,
-                       timeout=None, content_encryption_key=None, initialization_vector=None, **kwargs):
+                       timeout=None, content_encryption_key=None, initialization_vector=None,
+                       transfer_executor=None, adaptive_transfer=None, **kwargs):
 
     encryptor, padder = _get_blob_encryptor_and_padder(
         content_encryption_key,
@@ -55,39 +57,23 @@ def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connecti
     else:
         uploader.modified_access_conditions = modified_access_conditions
 
-    if max_connections > 1:
-        import concurrent.futures
-        from threading import BoundedSemaphore
-
-        # Ensures we bound the chunking so we only buffer and submit 'max_connections'
-        # amount of work items to the executor. This is necessary as the executor queue will keep
-        # accepting submitted work items, which results in buffering all the blocks if
-        # the max_connections + 1 ensures the next chunk is already buffered and ready for when
-        # the worker thread is available.
-        chunk_throttler = BoundedSemaphore(max_connections + 1)
-
-        executor = concurrent.futures.ThreadPoolExecutor(max_connections)
-        futures = []
-        running_futures = []
-
-        # Check for exceptions and fail fast.
-        for chunk in uploader.get_chunk_streams():
-            for f in running_futures:
-                if f.done():
-                    if f.exception():
-                        raise f.exception()
-                    running_futures.remove(f)
-
-            chunk_throttler.acquire()
-            future = executor.submit(uploader.process_chunk, chunk)
-
-            # Calls callback upon completion (even if the callback was added after the Future task is done).
-            future.add_done_callback(lambda x: chunk_throttler.release())
-            futures.append(future)
-            running_futures.append(future)
-
-        # result() will wait until completion and also raise any exceptions that may have been set.
-        range_ids = [f.result() for f in futures]
+    if max_connections > 1 and adaptive_transfer is not None and uploader_class is BlockBlobChunkUploader:
+        # Block blobs may have blocks of different sizes, so the block size is tuned as the chunks are read.
+        chunks = uploader.get_chunk_streams()
+
+        def next_chunk(chunk_size):
+            uploader.chunk_size = chunk_size
+            chunk = next(chunks, None)
+            return None if chunk is None else ((chunk,), len(chunk[1]))
+
+        range_ids = adaptive_transfer.run(
+            transfer_executor, 'upload', uploader.process_chunk, next_chunk, block_size, max_connections,
+            total_size=blob_size)
+    elif max_connections > 1:
+        # Chunks are only read from the stream once a connection and the in-flight bytes
+        # for them are available, so at most 'max_connections' blocks are buffered.
+        range_ids = run_parallel(
+            transfer_executor, uploader.process_chunk, uploader.get_chunk_streams(), max_connections, block_size)
     else:
         range_ids = [uploader.process_chunk(result) for result in uploader.get_chunk_streams()]
 
@@ -98,7 +84,8 @@ def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connecti
 
 def upload_blob_substream_blocks(blob_service, blob_size, block_size, stream, max_connections,
                                  validate_content, access_conditions, uploader_class,
-                                 append_conditions=None, modified_access_conditions=None, timeout=None, **kwargs):
+                                 append_conditions=None, modified_access_conditions=None, timeout=None,
+                                 transfer_executor=None, **kwargs):
 
     uploader = uploader_class(
         blob_service,
@@ -122,9 +109,9 @@ def upload_blob_substream_blocks(blob_service, blob_size, block_size, stream, ma
         uploader.modified_access_conditions = modified_access_conditions
 
     if max_connections > 1:
-        import concurrent.futures
-        executor = concurrent.futures.ThreadPoolExecutor(max_connections)
-        range_ids = list(executor.map(uploader.process_substream_block, uploader.get_substream_blocks()))
+        range_ids = run_parallel(
+            transfer_executor, uploader.process_substream_block, uploader.get_substream_blocks(),
+            max_connections, block_size)
     else:
         range_ids = [uploader.process_substream_block(result) for result in uploader.get_substream_blocks()]
 
@@ -279,6 +266,46 @@ class BlockBlobChunkUploader(_BlobChunkUploader):
         return block_id
 
 
+class ResumableBlockBlobChunkUploader(BlockBlobChunkUploader):
+    """Stages the blocks of a block blob upload which were not staged by an earlier attempt.
+
+    The staged_blocks dict maps the offset of each block already staged to its block ID.
+    Those blocks are seeked over instead of being read and staged again, and every block
+    staged is added to the dict and passed to block_staged_callback, if set, so that the
+    caller can record it. Once the upload completes, staged_blocks holds the whole block list.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.staged_blocks = kwargs.pop('staged_blocks')
+        self.block_staged_callback = kwargs.pop('block_staged_callback', None)
+        super(ResumableBlockBlobChunkUploader, self).__init__(*args, **kwargs)
+        if self.encryptor or self.padder:
+            raise ValueError("Resumable uploads do not support client side encryption.")
+
+    def get_chunk_streams(self):
+        for offset in range(0, self.blob_size, self.chunk_size):
+            length = min(self.chunk_size, self.blob_size - offset)
+            if offset in self.staged_blocks:
+                self.stream.seek(length, SEEK_CUR)
+                continue
+            data = b''
+            while len(data) < length:
+                temp = self.stream.read(length - len(data))
+                if not isinstance(temp, six.binary_type):
+                    raise TypeError('Blob data should be of type bytes.')
+                if not temp:
+                    raise ValueError("The stream ended before the length of the upload was read.")
+                data += temp
+            yield offset, data
+
+    def _upload_chunk(self, chunk_offset, chunk_data):
+        block_id = super(ResumableBlockBlobChunkUploader, self)._upload_chunk(chunk_offset, chunk_data)
+        self.staged_blocks[chunk_offset] = block_id
+        if self.block_staged_callback:
+            self.block_staged_callback(chunk_offset, block_id)
+        return block_id
+
+
 class PageBlobChunkUploader(_BlobChunkUploader):  # pylint: disable=abstract-method
 
     def _is_chunk_empty(self, chunk_data):
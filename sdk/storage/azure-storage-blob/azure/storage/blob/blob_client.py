@@ -106,6 +106,15 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         account URL already has a SAS token. The value can be a SAS token string, and account
         shared access key, or an instance of a TokenCredentials class from azure.identity.
         If the URL already has a SAS token, specifying an explicit credential will take priority.
+    :param transfer_executor:
+        An optional executor shared by the parallel uploads and downloads of this client, bounding
+        their total concurrency and in-flight bytes. Clients retrieved from a BlobServiceClient
+        or ContainerClient use the executor of that client. If not set, every parallel transfer uses its own threads.
+    :type transfer_executor: ~azure.storage.blob.TransferExecutor
+    :param adaptive_transfer:
+        An optional controller which tunes the chunk size and the number of connections of the
+        parallel block blob uploads and parallel downloads of this client as they run.
+    :type adaptive_transfer: ~azure.storage.blob.AdaptiveTransfer
 
     Example:
         .. literalinclude:: ../tests/test_blob_samples_authentication.py
@@ -423,6 +432,14 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             64MB.
         :param str encoding:
             Defaults to UTF-8.
+        :param str checkpoint_path:
+            Makes the upload of a block blob larger than max_single_put_size resumable.
+            The IDs and offsets of the staged blocks are recorded in the local file at this
+            path. If the upload is interrupted, calling upload_blob again with the same data
+            and checkpoint path only stages the blocks which are not still staged on the service,
+            as reported by get_block_list, before committing the block list. The file is removed
+            once the blob is committed. The data must be a seekable stream of known length, and
+            client side encryption is not supported.
         :returns: Blob-updated property dict (Etag and last modified)
         :rtype: dict[str, Any]
 
@@ -457,6 +474,9 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         else:
             raise TypeError("Unsupported data type: {}".format(type(data)))
 
+        checkpoint_path = kwargs.pop('checkpoint_path', None)
+        if checkpoint_path and blob_type != BlobType.BlockBlob:
+            raise ValueError("Resumable uploads are only supported for block blobs.")
         headers = kwargs.pop('headers', {})
         headers.update(add_metadata_headers(metadata))
         blob_headers = None
@@ -489,6 +509,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
                 self._config.blob_settings,
                 self.require_encryption,
                 self.key_encryption_key,
+                checkpoint_path=checkpoint_path,
                 **kwargs)
         if blob_type == BlobType.PageBlob:
             return upload_page_blob(
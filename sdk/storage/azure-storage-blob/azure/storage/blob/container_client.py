@@ -92,6 +92,15 @@ class ContainerClient(StorageAccountHostsMixin):
         account URL already has a SAS token. The value can be a SAS token string, and account
         shared access key, or an instance of a TokenCredentials class from azure.identity.
         If the URL already has a SAS token, specifying an explicit credential will take priority.
+    :param transfer_executor:
+        An optional executor shared by the parallel uploads and downloads of this client, bounding
+        their total concurrency and in-flight bytes. Clients retrieved from a BlobServiceClient
+        or ContainerClient use the executor of that client. If not set, every parallel transfer uses its own threads.
+    :type transfer_executor: ~azure.storage.blob.TransferExecutor
+    :param adaptive_transfer:
+        An optional controller which tunes the chunk size and the number of connections of the
+        parallel block blob uploads and parallel downloads of this client as they run.
+    :type adaptive_transfer: ~azure.storage.blob.AdaptiveTransfer
 
     Example:
         .. literalinclude:: ../tests/test_blob_samples_containers.py
@@ -0,0 +1,459 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (  # pylint: disable=unused-import
+    Any, Callable, Dict, List, Optional, TYPE_CHECKING
+)
+
+from azure.core.exceptions import HttpResponseError
+
+from ._shared.models import StorageErrorCode
+from ._shared.upload_chunking import upload_blob_chunks, ResumableBlockBlobChunkUploader
+from ._shared.utils import add_metadata_headers, process_storage_error, return_response_headers
+from ._generated.models import BlobHTTPHeaders, BlockLookupList, StorageErrorException
+from .models import BlobType
+
+if TYPE_CHECKING:
+    from .container_client import ContainerClient  # pylint: disable=unused-import
+    from .models import BlobProperties  # pylint: disable=unused-import
+
+
+_HASH_READ_SIZE = 4 * 1024 * 1024
+
+
+def _local_md5(path):
+    md5 = hashlib.md5()
+    with open(path, 'rb') as stream:
+        for data in iter(lambda: stream.read(_HASH_READ_SIZE), b''):
+            md5.update(data)
+    return bytearray(md5.digest())
+
+
+def _file_state(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+
+class TransferSummary(object):
+    """The aggregate result of a directory transfer, updated as each file completes.
+
+    :ivar list transferred: The names of the blobs that were uploaded or downloaded.
+    :ivar list skipped: The names of the blobs that were unchanged and skipped.
+    :ivar dict failed: The errors of the blobs that failed, by blob name.
+    :ivar int bytes_transferred: The number of bytes uploaded or downloaded.
+    :ivar float elapsed: The number of seconds since the transfer started.
+    """
+
+    def __init__(self):
+        self.transferred = []  # type: List[str]
+        self.skipped = []  # type: List[str]
+        self.failed = {}  # type: Dict[str, Exception]
+        self.bytes_transferred = 0
+        self.elapsed = 0.0
+        self._started = time.time()
+
+    @property
+    def throughput(self):
+        """The average number of bytes transferred per second.
+
+        :rtype: float
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_transferred / self.elapsed
+
+    def _update(self, name, size=None, skipped=False, error=None):
+        if error is not None:
+            self.failed[name] = error
+        elif skipped:
+            self.skipped.append(name)
+        else:
+            self.transferred.append(name)
+            self.bytes_transferred += size
+        self.elapsed = time.time() - self._started
+
+
+class _TransferJournal(object):
+    """An append only log of the completed blobs and staged blocks of directory transfers.
+
+    Each line is a JSON record. A blob record describes the local file and the blob
+    etag after the last completed transfer, and a block record describes a block staged
+    for a large upload which has not been committed yet.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._blobs = {}  # type: Dict[str, Dict[str, Any]]
+        self._blocks = {}  # type: Dict[str, Dict[str, Any]]
+        self._lock = threading.Lock()
+        self._file = None
+        if path is None:
+            return
+        if os.path.isfile(path):
+            with open(path, 'r') as journal:
+                for line in journal:
+                    try:
+                        self._apply(json.loads(line))
+                    except ValueError:
+                        # a partially written last line from an interrupted run
+                        continue
+        self._file = open(path, 'a')
+
+    def _apply(self, record):
+        name = record['blob']
+        if 'block_id' in record:
+            blocks = self._blocks.get(name)
+            if blocks is None or (blocks['size'], blocks['mtime'], blocks['block_size']) != \
+                    (record['size'], record['mtime'], record['block_size']):
+                # the file or the block size changed since the earlier blocks were staged
+                blocks = self._blocks[name] = dict(
+                    size=record['size'], mtime=record['mtime'], block_size=record['block_size'], ids={})
+            blocks['ids'][record['offset']] = record['block_id']
+        elif record.get('etag') is None:
+            self._blobs.pop(name, None)
+            self._blocks.pop(name, None)
+        else:
+            self._blobs[name] = record
+            self._blocks.pop(name, None)
+
+    def _write(self, record):
+        with self._lock:
+            self._apply(record)
+            if self._file is not None:
+                self._file.write(json.dumps(record) + '\n')
+                self._file.flush()
+
+    def get_blob(self, name):
+        return self._blobs.get(name)
+
+    def record_blob(self, name, size, mtime, etag):
+        self._write(dict(blob=name, size=size, mtime=mtime, etag=etag))
+
+    def get_blocks(self, name, size, mtime, block_size):
+        blocks = self._blocks.get(name)
+        if blocks is None or (blocks['size'], blocks['mtime'], blocks['block_size']) != (size, mtime, block_size):
+            return {}
+        return dict(blocks['ids'])
+
+    def record_block(self, name, size, mtime, block_size, offset, block_id):
+        self._write(dict(blob=name, size=size, mtime=mtime, block_size=block_size, offset=offset, block_id=block_id))
+
+    def clear(self, name):
+        self._write(dict(blob=name, etag=None))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BlobTransferManager(object):
+    """Uploads a local directory tree to the blobs under a name prefix of a container,
+    and downloads them back.
+
+    Files up to the max_single_put_size setting of the container client for uploads, or
+    the max_single_get_size setting for downloads, are transferred concurrently, one file
+    per connection. Larger files are transferred one at a time with max_concurrency
+    connections each, the blocks of large uploads being staged
+    with the chunked block blob uploader.
+
+    With a journal, the transfer manager records every completed blob, and every staged
+    block of a large upload, to a local file. A transfer which is interrupted and started
+    again with the same journal skips the completed files and only stages the missing
+    blocks of the file it stopped in.
+
+    :param container_client:
+        The container to transfer to or from. The blob clients it returns are used for
+        every transfer, so its configuration and transfer executor apply.
+    :type container_client: ~azure.storage.blob.container_client.ContainerClient
+    :param int max_concurrency:
+        The number of files transferred at the same time, and the number of
+        connections used for each large file. The default is 8.
+    :param str journal_path:
+        The path of the file to keep the transfer journal in. It is created if it
+        does not exist. If not set, the transfers cannot be resumed.
+    :param callable progress_callback:
+        Called with the :class:`TransferSummary` of the current transfer after each file
+        completes, is skipped or fails, e.g. to report the aggregate throughput.
+        Calls are not concurrent.
+    """
+
+    def __init__(
+            self, container_client,  # type: ContainerClient
+            max_concurrency=8,  # type: int
+            journal_path=None,  # type: Optional[str]
+            progress_callback=None,  # type: Optional[Callable[[TransferSummary], None]]
+        ):
+        # type: (...) -> None
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.container_client = container_client
+        self.max_concurrency = max_concurrency
+        self.progress_callback = progress_callback
+        self._journal = _TransferJournal(journal_path)
+        self._progress_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes the journal file."""
+        self._journal.close()
+
+    @property
+    def _blob_settings(self):
+        return self.container_client._config.blob_settings  # pylint: disable=protected-access
+
+    def _report(self, summary, name, size=None, skipped=False, error=None):
+        with self._progress_lock:
+            summary._update(name, size=size, skipped=skipped, error=error)  # pylint: disable=protected-access
+            if self.progress_callback:
+                self.progress_callback(summary)
+
+    def _is_unchanged(self, path, blob):
+        """Whether the local file and the blob have the same content.
+
+        The journal is checked first, so that files whose size, modification time and
+        blob etag have not changed since the last transfer are not read. Otherwise the
+        file is unchanged if its size and MD5 hash match those of the blob.
+        """
+        size, mtime = _file_state(path)
+        entry = self._journal.get_blob(blob.name)
+        if entry and entry['etag'] == blob.etag and (entry['size'], entry['mtime']) == (size, mtime):
+            return True
+        remote_md5 = blob.content_settings.content_md5
+        if size != blob.size or not remote_md5:
+            return False
+        if _local_md5(path) != bytearray(remote_md5):
+            return False
+        self._journal.record_blob(blob.name, size, mtime, blob.etag)
+        return True
+
+    def _run(self, tasks, transfer, summary, max_single_size):
+        """Transfers the files up to max_single_size on a pool of max_concurrency threads
+        and the larger files on the calling thread.
+        """
+        def run(name, *args):
+            try:
+                size = transfer(name, *args)
+            except Exception as error:  # pylint: disable=broad-except
+                self._report(summary, name, error=error)
+            else:
+                self._report(summary, name, size=size)
+
+        large = []
+        with ThreadPoolExecutor(self.max_concurrency) as executor:
+            for task in tasks:
+                if task[-1] > max_single_size:
+                    large.append(task)
+                else:
+                    executor.submit(run, *task)
+            for task in large:
+                run(*task)
+        return summary
+
+    def _upload_file(self, name, path, size, metadata, timeout, **kwargs):
+        blob_client = self.container_client.get_blob_client(name)
+        if size <= self._blob_settings.max_single_put_size:
+            _, mtime = _file_state(path)
+            with open(path, 'rb') as data:
+                response = blob_client.upload_blob(
+                    data, length=size, overwrite=True, metadata=metadata, timeout=timeout, **kwargs)
+            self._journal.record_blob(name, size, mtime, response['etag'])
+            return size
+        if blob_client.require_encryption or blob_client.key_encryption_key is not None:
+            # encrypted uploads use a new key on every attempt, so their blocks are not journaled
+            with open(path, 'rb') as data:
+                response = blob_client.upload_blob(
+                    data, length=size, overwrite=True, metadata=metadata, timeout=timeout,
+                    max_connections=self.max_concurrency, **kwargs)
+            self._journal.record_blob(name, size, _file_state(path)[1], response['etag'])
+            return size
+        try:
+            return self._upload_blocks(blob_client, name, path, size, metadata, timeout, **kwargs)
+        except HttpResponseError as error:
+            if error.error_code != StorageErrorCode.invalid_block_list:
+                raise
+            # the journaled blocks were discarded by the service, stage them all again
+            self._journal.clear(name)
+            return self._upload_blocks(blob_client, name, path, size, metadata, timeout, **kwargs)
+
+    def _upload_blocks(self, blob_client, name, path, size, metadata, timeout, **kwargs):
+        _, mtime = _file_state(path)
+        block_size = self._blob_settings.max_block_size
+        journal_entry = (name, size, mtime, block_size)
+        headers = kwargs.pop('headers', {})
+        headers.update(add_metadata_headers(metadata))
+        staged_blocks = self._journal.get_blocks(*journal_entry)
+
+        def block_staged(offset, block_id):
+            self._journal.record_block(*(journal_entry + (offset, block_id)))
+
+        try:
+            with open(path, 'rb') as stream:
+                upload_blob_chunks(
+                    blob_service=blob_client._client.block_blob,  # pylint: disable=protected-access
+                    blob_size=size,
+                    block_size=block_size,
+                    stream=stream,
+                    max_connections=self.max_concurrency,
+                    transfer_executor=self._blob_settings.transfer_executor,
+                    validate_content=False,
+                    access_conditions=None,
+                    uploader_class=ResumableBlockBlobChunkUploader,
+                    timeout=timeout,
+                    staged_blocks=staged_blocks,
+                    block_staged_callback=block_staged,
+                    **kwargs)
+            block_ids = [staged_blocks[offset] for offset in sorted(staged_blocks)]
+            # the committed blob gets the MD5 of the whole file so that it can be skipped later
+            response = blob_client._client.block_blob.commit_block_list(  # pylint: disable=protected-access
+                BlockLookupList(committed=[], uncommitted=[], latest=block_ids),
+                blob_http_headers=BlobHTTPHeaders(blob_content_md5=_local_md5(path)),
+                timeout=timeout,
+                headers=headers,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        self._journal.record_blob(name, size, mtime, response['etag'])
+        return size
+
+    def upload_directory(
+            self, source,  # type: str
+            name_prefix="",  # type: str
+            skip_unchanged=True,  # type: bool
+            metadata=None,  # type: Optional[Dict[str, str]]
+            timeout=None,  # type: Optional[int]
+            **kwargs
+        ):
+        # type: (...) -> TransferSummary
+        """Uploads the files under a local directory to block blobs.
+
+        Existing blobs are overwritten. A file failing to upload does not stop the other
+        files from being uploaded, its error is reported in the returned summary.
+
+        :param str source:
+            The local directory to upload.
+        :param str name_prefix:
+            The prefix prepended to the path of each file relative to the source,
+            with '/' separators, to form its blob name, e.g. "backups/".
+        :param bool skip_unchanged:
+            Whether to skip the files whose blob already has the same content, as
+            recorded in the journal or by having the same size and MD5 hash.
+        :param metadata:
+            Name-value pairs set as metadata on every uploaded blob.
+        :type metadata: dict(str, str)
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: The summary of the transfer.
+        :rtype: ~azure.storage.blob.transfer_manager.TransferSummary
+        """
+        if not os.path.isdir(source):
+            raise ValueError("The source '{}' is not a directory.".format(source))
+        summary = TransferSummary()
+        remote = {}  # type: Dict[str, BlobProperties]
+        if skip_unchanged:
+            remote = {b.name: b for b in self.container_client.list_blobs(
+                name_starts_with=name_prefix or None, timeout=timeout)}
+
+        def tasks():
+            for root, _, files in os.walk(source):
+                for file_name in sorted(files):
+                    path = os.path.join(root, file_name)
+                    name = name_prefix + os.path.relpath(path, source).replace(os.sep, '/')
+                    try:
+                        if name in remote and self._is_unchanged(path, remote[name]):
+                            self._report(summary, name, skipped=True)
+                            continue
+                        size = os.path.getsize(path)
+                    except EnvironmentError as error:
+                        self._report(summary, name, error=error)
+                        continue
+                    yield name, path, size
+
+        def transfer(name, path, size):
+            return self._upload_file(name, path, size, metadata, timeout, **kwargs)
+
+        return self._run(tasks(), transfer, summary, self._blob_settings.max_single_put_size)
+
+    def _download_file(self, name, path, size, timeout, **kwargs):
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except EnvironmentError:
+                # created by a concurrent download
+                if not os.path.isdir(directory):
+                    raise
+        blob_client = self.container_client.get_blob_client(name)
+        downloader = blob_client.download_blob(timeout=timeout, **kwargs)
+        with open(path, 'wb') as stream:
+            downloader.download_to_stream(
+                stream, max_connections=self.max_concurrency if size > self._blob_settings.max_single_get_size else 1)
+        self._journal.record_blob(name, size, _file_state(path)[1], downloader.properties.etag)
+        return size
+
+    def download_directory(
+            self, destination,  # type: str
+            name_starts_with="",  # type: str
+            skip_unchanged=True,  # type: bool
+            timeout=None,  # type: Optional[int]
+            **kwargs
+        ):
+        # type: (...) -> TransferSummary
+        """Downloads the block blobs under a name prefix to a local directory.
+
+        Existing files are overwritten. A blob failing to download does not stop the other
+        blobs from being downloaded, its error is reported in the returned summary.
+
+        :param str destination:
+            The local directory to download to. It is created if it does not exist.
+        :param str name_starts_with:
+            The prefix of the blobs to download. It is removed from the blob names
+            to form the paths of the files relative to the destination.
+        :param bool skip_unchanged:
+            Whether to skip the blobs whose file already has the same content, as
+            recorded in the journal or by having the same size and MD5 hash.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: The summary of the transfer.
+        :rtype: ~azure.storage.blob.transfer_manager.TransferSummary
+        """
+        summary = TransferSummary()
+        root = os.path.abspath(destination)
+
+        def tasks():
+            for blob in self.container_client.list_blobs(name_starts_with=name_starts_with or None, timeout=timeout):
+                if blob.blob_type != BlobType.BlockBlob or blob.name.endswith('/'):
+                    continue
+                path = os.path.abspath(os.path.join(root, *blob.name[len(name_starts_with):].split('/')))
+                if not path.startswith(os.path.join(root, '')):
+                    self._report(summary, blob.name, error=ValueError(
+                        "The blob '{}' would be downloaded outside of the destination.".format(blob.name)))
+                    continue
+                try:
+                    if skip_unchanged and os.path.isfile(path) and self._is_unchanged(path, blob):
+                        self._report(summary, blob.name, skipped=True)
+                        continue
+                except EnvironmentError as error:
+                    self._report(summary, blob.name, error=error)
+                    continue
+                yield blob.name, path, blob.size
+
+        def transfer(name, path, size):
+            return self._download_file(name, path, size, timeout, **kwargs)
+
+        return self._run(tasks(), transfer, summary, self._blob_settings.max_single_get_size)
@@ -0,0 +1,192 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.storage.blob import AdaptiveTransfer
+from azure.storage.blob._blob_utils import StorageStreamDownloader
+from azure.storage.blob._shared.download_chunking import (
+    BufferBlobChunkDownloader,
+    SequentialBlobChunkDownloader)
+
+from testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+
+class _FakeDownloadResponse(object):
+
+    class _Properties(object):
+        etag = '"0x8D6"'
+
+    def __init__(self, data):
+        self.data = data
+        self.properties = _FakeDownloadResponse._Properties()
+
+    def __iter__(self):
+        return iter([self.data])
+
+
+class _FakeBlobService(object):
+    """Serves ranges of the given data, with the first chunks being the slowest."""
+
+    def __init__(self, data, chunk_size):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def download(self, range=None, **kwargs):  # pylint: disable=redefined-builtin
+        start, end = [int(i) for i in range[len('bytes='):].split('-')]
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # complete the chunks out of order
+        time.sleep(0.01 * (len(self.data) - start) / self.chunk_size)
+        with self.lock:
+            self.in_flight -= 1
+        return None, _FakeDownloadResponse(self.data[start:end + 1])
+
+
+class _FakeConfig(object):
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class StorageBlobDownloadChunkingTest(StorageTestCase):
+
+    def _get_downloader(self, service, chunk_size, downloader_class=SequentialBlobChunkDownloader, stream=None,
+                        start_range=0, validate_content=False):
+        return downloader_class(
+            blob_service=service,
+            download_size=len(service.data),
+            chunk_size=chunk_size,
+            progress=0,
+            start_range=start_range,
+            end_range=len(service.data),
+            stream=stream,
+            validate_content=validate_content,
+            access_conditions=None,
+            mod_conditions=None,
+            timeout=None,
+            require_encryption=False,
+            key_encryption_key=None,
+            key_resolver_function=None)
+
+    # white box test that makes sure the read ahead chunks are yielded in order
+    def test_yield_chunks_read_ahead_in_order(self):
+        data = os.urandom(10 * 1024 + 7)
+        service = _FakeBlobService(data, 1024)
+        downloader = self._get_downloader(service, 1024)
+
+        chunks = list(downloader.yield_chunks_read_ahead(max_connections=4, read_ahead=6))
+
+        self.assertEqual(len(chunks), 11)
+        self.assertEqual(b"".join(chunks), data)
+        self.assertTrue(1 < service.max_in_flight <= 4)
+
+    def test_yield_chunks_read_ahead_bounded_window(self):
+        data = os.urandom(10 * 1024)
+        service = _FakeBlobService(data, 1024)
+        downloader = self._get_downloader(service, 1024)
+
+        requested = []
+        original_yield_chunk = downloader.yield_chunk
+
+        def yield_chunk(chunk_start):
+            requested.append(chunk_start)
+            return original_yield_chunk(chunk_start)
+        downloader.yield_chunk = yield_chunk
+
+        chunks = downloader.yield_chunks_read_ahead(max_connections=2, read_ahead=3)
+        first = next(chunks)
+        self.assertEqual(first, data[:1024])
+        # give the queued downloads time to start, nothing more should be requested
+        time.sleep(0.5)
+        # the 3 chunks of the window plus the one replacing the consumed chunk
+        self.assertEqual(len(requested), 4)
+        chunks.close()
+
+    def test_buffer_downloader_writes_chunks_in_place(self):
+        data = os.urandom(10 * 1024 + 7)
+        service = _FakeBlobService(data, 1024)
+        # the first 100 bytes are already downloaded, the rest goes to the slice after them
+        buffer = bytearray(len(data))
+        buffer[:100] = data[:100]
+        downloader = self._get_downloader(
+            service, 1024, BufferBlobChunkDownloader, stream=memoryview(buffer)[100:], start_range=100)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(downloader.process_chunk, downloader.get_chunk_offsets()))
+
+        self.assertEqual(bytes(buffer), data)
+        self.assertEqual(downloader.progress_total, len(data) - 100)
+        self.assertTrue(service.max_in_flight > 1)
+
+    def test_buffer_downloader_rejects_overflow(self):
+        data = os.urandom(4 * 1024)
+        service = _FakeBlobService(data, 1024)
+        buffer = bytearray(len(data) - 1)
+        downloader = self._get_downloader(service, 1024, BufferBlobChunkDownloader, stream=memoryview(buffer))
+
+        with self.assertRaises(ValueError):
+            for chunk_start in downloader.get_chunk_offsets():
+                downloader.process_chunk(chunk_start)
+
+    def test_adaptive_download_grows_chunks(self):
+        data = os.urandom(20 * 1024 + 7)
+        service = _FakeBlobService(data, 1024 * 1024)
+        buffer = bytearray(len(data))
+        downloader = self._get_downloader(service, 1024, BufferBlobChunkDownloader, stream=memoryview(buffer))
+        stats = []
+        adaptive = AdaptiveTransfer(
+            min_chunk_size=1024, max_chunk_size=4096, max_connections=4, target_chunk_latency=10,
+            stats_callback=lambda s: stats.append((s.chunk_size, s.connections, s.bytes_transferred)))
+
+        adaptive.run(None, 'download', downloader.process_chunk, downloader.get_next_chunk, 1024, 2)
+
+        self.assertEqual(bytes(buffer), data)
+        # the fast chunks double the chunk size up to the bound
+        self.assertEqual([size for size, _, _ in stats][:2], [2048, 4096])
+        self.assertEqual(stats[-1][0], 4096)
+        self.assertEqual(stats[-1][2], len(data))
+        self.assertTrue(all(1 <= connections <= 4 for _, connections, _ in stats))
+
+        # the next download starts from the tuned values
+        self.assertEqual(adaptive._start('download', 1024, 1).chunk_size, 4096)
+        self.assertEqual(adaptive._start('upload', 1024, 1).chunk_size, 1024)
+
+    def test_adaptive_download_validate_content_keeps_chunks_within_4mb(self):
+        data = os.urandom(24 * 1024 * 1024 + 7)
+        service = _FakeBlobService(data, 4 * 1024 * 1024)
+        buffer = bytearray(len(data))
+        downloader = self._get_downloader(
+            service, 1024 * 1024, BufferBlobChunkDownloader, stream=memoryview(buffer), validate_content=True)
+        chunk_sizes = []
+        adaptive = AdaptiveTransfer(
+            max_chunk_size=16 * 1024 * 1024, max_connections=4, target_chunk_latency=10,
+            stats_callback=lambda s: chunk_sizes.append(s.chunk_size))
+
+        stream_downloader = StorageStreamDownloader.__new__(StorageStreamDownloader)
+        stream_downloader.config = _FakeConfig(
+            adaptive_transfer=adaptive, transfer_executor=None, max_chunk_get_size=1024 * 1024)
+        stream_downloader.validate_content = True
+        stream_downloader._download_chunks_parallel(downloader, 2)
+
+        # larger chunks would fail to get a transactional MD5
+        self.assertEqual(bytes(buffer), data)
+        self.assertEqual(max(chunk_sizes), 4 * 1024 * 1024)
+
+# ------------------------------------------------------------------------------
@@ -7,11 +7,15 @@ import unittest
 import pytest
 
 from azure.core.exceptions import (
+    CircuitBreakerOpenError,
     HttpResponseError,
     ResourceExistsError,
     ServiceResponseError,
     ClientAuthenticationError
 )
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import CircuitBreakerPolicy, CircuitBreakerState
+from azure.core.pipeline.transport import HttpRequest, HttpTransport
 
 from azure.storage.blob import (
     BlobServiceClient,
@@ -440,6 +444,38 @@ class StorageRetryTest(StorageTestCase):
         self.assertEqual(retry_counter.count, 0)
 
 
+    def test_retry_does_not_retry_open_circuit(self):
+        # Arrange
+        class FailingTransport(HttpTransport):
+            def __init__(self):
+                self.sent = 0
+            def __exit__(self, *args):
+                pass
+            def open(self):
+                pass
+            def close(self):
+                pass
+            def sleep(self, duration):
+                pass
+            def send(self, request, **kwargs):
+                self.sent += 1
+                raise ServiceResponseError("connection reset")
+
+        transport = FailingTransport()
+        retry = ExponentialRetry(initial_backoff=0, random_jitter_range=0, retry_total=10)
+        state = CircuitBreakerState(failure_threshold=2)
+        pipeline = Pipeline(transport, policies=[retry, CircuitBreakerPolicy(state)])
+
+        # Act
+        with self.assertRaises(CircuitBreakerOpenError):
+            pipeline.run(HttpRequest('GET', 'https://account.blob.core.windows.net/container'))
+
+        # Assert
+        # the retry policy gives up as soon as the circuit opens, rather than retrying the rejection
+        self.assertEqual(transport.sent, 2)
+        stats = state.get_stats()['account.blob.core.windows.net']
+        self.assertEqual(stats.rejected_requests, 1)
+
 # ------------------------------------------------------------------------------
 if __name__ == '__main__':
     unittest.main()
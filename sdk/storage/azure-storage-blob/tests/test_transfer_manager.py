@@ -0,0 +1,222 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+from azure.storage.blob import BlobTransferManager, BlobType
+from azure.storage.blob.models import BlobProperties
+from azure.storage.blob._shared.policies import StorageBlobSettings
+
+from testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+
+class _FakeConfiguration(object):
+
+    def __init__(self, **kwargs):
+        self.blob_settings = StorageBlobSettings(**kwargs)
+
+
+class _FakeBlockBlobOperations(object):
+
+    def __init__(self, container, name):
+        self.container = container
+        self.name = name
+
+    def stage_block(self, block_id, length, data, **kwargs):
+        with self.container.lock:
+            if self.container.fail_after is not None:
+                if self.container.fail_after == 0:
+                    raise IOError("connection reset")
+                self.container.fail_after -= 1
+            self.container.staged.setdefault(self.name, {})[block_id] = data
+            self.container.requests.append(('stage_block', self.name, block_id))
+
+    def commit_block_list(self, blocks, blob_http_headers=None, **kwargs):
+        staged = self.container.staged.pop(self.name)
+        data = b''.join(staged[block_id] for block_id in blocks.latest)
+        self.container.requests.append(('commit_block_list', self.name))
+        return self.container.store(self.name, data, blob_http_headers.blob_content_md5)
+
+
+class _FakeBlobClient(object):
+
+    def __init__(self, container, name):
+        self.container = container
+        self.name = name
+        self.require_encryption = False
+        self.key_encryption_key = None
+
+    @property
+    def _client(self):
+        client = type('_FakeGenerated', (object,), {})()
+        client.block_blob = _FakeBlockBlobOperations(self.container, self.name)
+        return client
+
+    def upload_blob(self, data, length=None, overwrite=False, **kwargs):
+        self.container.requests.append(('upload_blob', self.name))
+        data = data.read()
+        return self.container.store(self.name, data, bytearray(hashlib.md5(data).digest()))
+
+    def download_blob(self, **kwargs):
+        self.container.requests.append(('download_blob', self.name))
+        data, properties = self.container.blobs[self.name]
+
+        class _Downloader(object):
+            def __init__(self):
+                self.properties = properties
+
+            def download_to_stream(self, stream, max_connections=1):
+                stream.write(data)
+                return properties
+
+        return _Downloader()
+
+
+class _FakeContainerClient(object):
+    """Stores the blobs in memory like the service would."""
+
+    def __init__(self, **kwargs):
+        self._config = _FakeConfiguration(**kwargs)
+        self.blobs = {}
+        self.staged = {}
+        self.requests = []
+        self.fail_after = None
+        self.lock = threading.Lock()
+        self._etag = 0
+
+    def store(self, name, data, content_md5):
+        with self.lock:
+            self._etag += 1
+            properties = BlobProperties(name=name, ETag='"{}"'.format(self._etag), **{'Content-Length': len(data)})
+            properties.blob_type = BlobType.BlockBlob
+            properties.content_settings.content_md5 = content_md5
+            self.blobs[name] = (data, properties)
+            return {'etag': properties.etag}
+
+    def list_blobs(self, name_starts_with=None, **kwargs):
+        return [p for n, (_, p) in sorted(self.blobs.items()) if n.startswith(name_starts_with or '')]
+
+    def get_blob_client(self, name):
+        return _FakeBlobClient(self, name)
+
+
+class StorageBlobTransferManagerTest(StorageTestCase):
+
+    def setUp(self):
+        super(StorageBlobTransferManagerTest, self).setUp()
+        self.work_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.work_dir, 'source')
+        self.journal_path = os.path.join(self.work_dir, 'journal')
+        self.files = {
+            'a.txt': os.urandom(100),
+            'sub/b.txt': os.urandom(200),
+            'sub/deeper/c.bin': os.urandom(5 * 1024),
+        }
+        for name, data in self.files.items():
+            path = os.path.join(self.source, *name.split('/'))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as stream:
+                stream.write(data)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+        super(StorageBlobTransferManagerTest, self).tearDown()
+
+    def _container(self):
+        return _FakeContainerClient(max_single_put_size=1024, max_block_size=1024, max_single_get_size=1024)
+
+    def test_upload_directory(self):
+        container = self._container()
+        reports = []
+        with BlobTransferManager(
+                container, max_concurrency=2, progress_callback=lambda s: reports.append(s.throughput)) as manager:
+            summary = manager.upload_directory(self.source, name_prefix='backup/')
+
+        self.assertEqual(sorted(summary.transferred), sorted('backup/' + n for n in self.files))
+        self.assertEqual(summary.failed, {})
+        self.assertEqual(summary.bytes_transferred, sum(len(d) for d in self.files.values()))
+        self.assertEqual(len(reports), 3)
+        for name, data in self.files.items():
+            self.assertEqual(container.blobs['backup/' + name][0], data)
+        # the large file is staged in blocks with the MD5 of the whole file
+        self.assertIn(('commit_block_list', 'backup/sub/deeper/c.bin'), container.requests)
+        self.assertEqual(
+            container.blobs['backup/sub/deeper/c.bin'][1].content_settings.content_md5,
+            bytearray(hashlib.md5(self.files['sub/deeper/c.bin']).digest()))
+
+    def test_upload_directory_skips_unchanged_files(self):
+        container = self._container()
+        with BlobTransferManager(container, journal_path=self.journal_path) as manager:
+            manager.upload_directory(self.source)
+
+        with open(os.path.join(self.source, 'a.txt'), 'wb') as stream:
+            stream.write(b'changed')
+        del container.requests[:]
+
+        # the journal is reloaded, and the MD5 is used for files missing from it
+        os.remove(self.journal_path)
+        with BlobTransferManager(container, journal_path=self.journal_path) as manager:
+            summary = manager.upload_directory(self.source)
+        self.assertEqual(summary.transferred, ['a.txt'])
+        self.assertEqual(sorted(summary.skipped), ['sub/b.txt', 'sub/deeper/c.bin'])
+        self.assertEqual(container.requests, [('upload_blob', 'a.txt')])
+
+        with BlobTransferManager(container, journal_path=self.journal_path) as manager:
+            summary = manager.upload_directory(self.source)
+        self.assertEqual(summary.transferred, [])
+        self.assertEqual(len(summary.skipped), 3)
+
+    def test_upload_directory_resumes_staged_blocks(self):
+        container = self._container()
+        container.fail_after = 2
+        with BlobTransferManager(container, max_concurrency=1, journal_path=self.journal_path) as manager:
+            summary = manager.upload_directory(self.source)
+        self.assertEqual(list(summary.failed), ['sub/deeper/c.bin'])
+        self.assertNotIn('sub/deeper/c.bin', container.blobs)
+
+        container.fail_after = None
+        del container.requests[:]
+        with BlobTransferManager(container, max_concurrency=1, journal_path=self.journal_path) as manager:
+            summary = manager.upload_directory(self.source)
+
+        self.assertEqual(summary.transferred, ['sub/deeper/c.bin'])
+        self.assertEqual(container.blobs['sub/deeper/c.bin'][0], self.files['sub/deeper/c.bin'])
+        # only the three blocks which were not staged before are uploaded
+        staged = [r for r in container.requests if r[0] == 'stage_block']
+        self.assertEqual(len(staged), 3)
+
+    def test_download_directory(self):
+        container = self._container()
+        with BlobTransferManager(container) as manager:
+            manager.upload_directory(self.source, name_prefix='backup/')
+            container.store('backup/../escape.txt', b'data', None)
+            destination = os.path.join(self.work_dir, 'destination')
+            summary = manager.download_directory(destination, name_starts_with='backup/')
+
+            self.assertEqual(sorted(summary.transferred), sorted('backup/' + n for n in self.files))
+            self.assertEqual(list(summary.failed), ['backup/../escape.txt'])
+            self.assertFalse(os.path.exists(os.path.join(self.work_dir, 'escape.txt')))
+            for name, data in self.files.items():
+                with open(os.path.join(destination, *name.split('/')), 'rb') as stream:
+                    self.assertEqual(stream.read(), data)
+
+            # the files now match the MD5 of the blobs
+            summary = manager.download_directory(destination, name_starts_with='backup/')
+            self.assertEqual(summary.transferred, [])
+            self.assertEqual(len(summary.skipped), 3)
+
+# ------------------------------------------------------------------------------
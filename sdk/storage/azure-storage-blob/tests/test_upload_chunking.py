@@ -8,9 +8,22 @@
 
 import pytest
 
+import json
 import os
+import shutil
+import tempfile
+import threading
+import time
 
-from azure.storage.blob._shared.upload_chunking import _SubStream
+from azure.storage.blob import AdaptiveTransfer, BlobServiceClient, TransferExecutor
+from azure.storage.blob._blob_utils import upload_block_blob
+from azure.storage.blob._generated.models import Block, BlockList
+from azure.storage.blob._shared import adaptive_transfer
+from azure.storage.blob._shared.policies import StorageBlobSettings
+from azure.storage.blob._shared.upload_chunking import (
+    _SubStream,
+    upload_blob_chunks,
+    BlockBlobChunkUploader)
 from threading import Lock
 from io import (BytesIO, SEEK_SET)
 
@@ -21,6 +34,53 @@ from testcase import (
 # ------------------------------------------------------------------------------
 
 
+class _FakeBlockBlobService(object):
+    """Records the blocks staged and the number of blocks staged at the same time."""
+
+    def __init__(self, executor=None, fail_at=None):
+        self.executor = executor
+        self.fail_at = fail_at
+        self.blocks = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.max_in_flight_bytes = 0
+        self.lock = threading.Lock()
+
+    def stage_block(self, block_id, length, data, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.executor is not None:
+                self.max_in_flight_bytes = max(self.max_in_flight_bytes, self.executor.in_flight_bytes)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+            if self.fail_at is not None and len(self.blocks) == self.fail_at:
+                raise ValueError("stage_block failed")
+            self.blocks[block_id] = data
+
+
+class _FakeResumableBlockBlobService(_FakeBlockBlobService):
+    """Also keeps the uncommitted blocks and commits block lists."""
+
+    def __init__(self, fail_at=None):
+        super(_FakeResumableBlockBlobService, self).__init__(fail_at=fail_at)
+        self.staged = []
+        self.committed = None
+
+    def stage_block(self, block_id, length, data, **kwargs):
+        super(_FakeResumableBlockBlobService, self).stage_block(block_id, length, data, **kwargs)
+        self.staged.append(block_id)
+
+    def get_block_list(self, list_type=None, **kwargs):
+        assert list_type == 'uncommitted'
+        return BlockList(uncommitted_blocks=[Block(name=n, size=len(d)) for n, d in self.blocks.items()])
+
+    def commit_block_list(self, blocks, **kwargs):
+        self.committed = b''.join(self.blocks[block_id] for block_id in blocks.latest)
+        return {'etag': '"0x1"'}
+
+
 class StorageBlobUploadChunkingTest(StorageTestCase):
 
     # this is a white box test that's designed to make sure _Substream behaves properly
@@ -112,3 +172,199 @@ class StorageBlobUploadChunkingTest(StorageTestCase):
         finally:
             wrapped_stream.close()
             substream.close()
+
+    def _upload(self, service, data, max_connections, executor=None):
+        return upload_blob_chunks(
+            blob_service=service,
+            blob_size=len(data),
+            block_size=1024,
+            stream=BytesIO(data),
+            max_connections=max_connections,
+            validate_content=False,
+            access_conditions=None,
+            uploader_class=BlockBlobChunkUploader,
+            transfer_executor=executor)
+
+    def test_upload_chunks_without_transfer_executor(self):
+        data = os.urandom(10 * 1024)
+        service = _FakeBlockBlobService()
+
+        block_ids = self._upload(service, data, max_connections=3)
+
+        self.assertEqual(b''.join(service.blocks[b] for b in block_ids), data)
+        self.assertTrue(1 < service.max_in_flight <= 3)
+
+    def test_upload_chunks_share_transfer_executor_limits(self):
+        data = os.urandom(10 * 1024)
+        with TransferExecutor(max_concurrency=4, max_in_flight_bytes=2 * 1024) as executor:
+            service = _FakeBlockBlobService(executor)
+            results = []
+            uploads = [
+                threading.Thread(target=lambda: results.append(self._upload(service, data, 4, executor)))
+                for _ in range(3)]
+            for upload in uploads:
+                upload.start()
+            for upload in uploads:
+                upload.join()
+
+            # the uploads together never buffered more than two blocks
+            self.assertEqual(len(results), 3)
+            self.assertEqual(len(service.blocks), 10)
+            self.assertTrue(service.max_in_flight <= 2)
+            self.assertTrue(service.max_in_flight_bytes <= 2 * 1024)
+            self.assertEqual(executor.in_flight_bytes, 0)
+            for block_ids in results:
+                self.assertEqual(b''.join(service.blocks[b] for b in block_ids), data)
+
+    def test_upload_chunks_transfer_executor_raises_first_error(self):
+        data = os.urandom(10 * 1024)
+        with TransferExecutor(max_concurrency=2) as executor:
+            service = _FakeBlockBlobService(executor, fail_at=3)
+
+            with self.assertRaises(ValueError):
+                self._upload(service, data, 2, executor)
+            executor.shutdown()
+
+            # the upload stopped reading blocks and released its reservations
+            self.assertTrue(len(service.blocks) < 10)
+            self.assertEqual(executor.in_flight_bytes, 0)
+
+    def test_transfer_executor_inherited_by_clients(self):
+        executor = TransferExecutor(max_concurrency=2)
+        try:
+            service = BlobServiceClient("https://account.blob.core.windows.net", transfer_executor=executor)
+            container = service.get_container_client("container")
+            blob = container.get_blob_client("blob")
+
+            self.assertIs(service._config.blob_settings.transfer_executor, executor)
+            self.assertIs(container._config.blob_settings.transfer_executor, executor)
+            self.assertIs(blob._config.blob_settings.transfer_executor, executor)
+            self.assertIsNone(
+                BlobServiceClient("https://account.blob.core.windows.net")._config.blob_settings.transfer_executor)
+        finally:
+            executor.shutdown()
+
+    def _upload_resumable(self, service, data, checkpoint_path):
+        return upload_block_blob(
+            service, None, BytesIO(data), len(data), True, {}, None, None, None, False, None, 2,
+            StorageBlobSettings(max_single_put_size=1024, max_block_size=1024),
+            False, None, checkpoint_path=checkpoint_path)
+
+    def test_resumable_upload_stages_missing_blocks(self):
+        data = os.urandom(10 * 1024)
+        work_dir = tempfile.mkdtemp()
+        checkpoint_path = os.path.join(work_dir, 'checkpoint')
+        try:
+            service = _FakeResumableBlockBlobService(fail_at=4)
+            with self.assertRaises(ValueError):
+                self._upload_resumable(service, data, checkpoint_path)
+            # let the blocks still in flight when the upload failed complete
+            time.sleep(0.1)
+            with open(checkpoint_path) as checkpoint:
+                staged = set(json.loads(line)['block_id'] for line in checkpoint.read().splitlines()[1:])
+            self.assertTrue(staged)
+
+            # the service garbage collected one of the staged blocks
+            service.blocks.pop(sorted(staged)[0])
+            service.fail_at = None
+            del service.staged[:]
+            self._upload_resumable(service, data, checkpoint_path)
+
+            self.assertEqual(service.committed, data)
+            self.assertEqual(len(service.staged), 10 - len(staged) + 1)
+            self.assertFalse(set(service.staged) & (staged - {sorted(staged)[0]}))
+            self.assertFalse(os.path.exists(checkpoint_path))
+        finally:
+            shutil.rmtree(work_dir)
+
+    def test_resumable_upload_discards_checkpoint_of_other_upload(self):
+        work_dir = tempfile.mkdtemp()
+        checkpoint_path = os.path.join(work_dir, 'checkpoint')
+        try:
+            service = _FakeResumableBlockBlobService(fail_at=2)
+            with self.assertRaises(ValueError):
+                self._upload_resumable(service, os.urandom(10 * 1024), checkpoint_path)
+            time.sleep(0.1)
+
+            # a checkpoint for a different size is not used
+            data = os.urandom(8 * 1024)
+            service.fail_at = None
+            del service.staged[:]
+            self._upload_resumable(service, data, checkpoint_path)
+            self.assertEqual(service.committed, data)
+            self.assertEqual(len(service.staged), 8)
+        finally:
+            shutil.rmtree(work_dir)
+
+    def test_adaptive_upload_shrinks_slow_blocks(self):
+        data = os.urandom(10 * 1024)
+        service = _FakeBlockBlobService()
+        stats = []
+        adaptive = AdaptiveTransfer(
+            min_chunk_size=512, max_chunk_size=4096, max_connections=4, target_chunk_latency=0.001,
+            stats_callback=lambda s: stats.append(s.chunk_size))
+
+        block_ids = upload_blob_chunks(
+            blob_service=service,
+            blob_size=len(data),
+            block_size=2048,
+            stream=BytesIO(data),
+            max_connections=2,
+            validate_content=False,
+            access_conditions=None,
+            uploader_class=BlockBlobChunkUploader,
+            adaptive_transfer=adaptive)
+
+        self.assertEqual(b''.join(service.blocks[b] for b in block_ids), data)
+        # every block is slower than the target, so the blocks shrink to the smallest size
+        self.assertEqual(stats[-1], 512)
+        self.assertEqual(len(service.blocks[block_ids[0]]), 2048)
+        self.assertEqual(len(service.blocks[block_ids[-1]]), 512)
+
+    def test_adaptive_upload_keeps_blocks_within_block_limit(self):
+        data = os.urandom(16 * 1024)
+        service = _FakeBlockBlobService()
+        adaptive = AdaptiveTransfer(
+            min_chunk_size=512, max_chunk_size=4096, max_connections=4, target_chunk_latency=0.001)
+
+        # a blob with this many blocks at most, standing for the service's 50,000
+        max_blocks = adaptive_transfer._MAX_BLOCKS
+        adaptive_transfer._MAX_BLOCKS = 8
+        try:
+            block_ids = upload_blob_chunks(
+                blob_service=service,
+                blob_size=len(data),
+                block_size=1024,
+                stream=BytesIO(data),
+                max_connections=2,
+                validate_content=False,
+                access_conditions=None,
+                uploader_class=BlockBlobChunkUploader,
+                adaptive_transfer=adaptive)
+        finally:
+            adaptive_transfer._MAX_BLOCKS = max_blocks
+
+        # the blocks are slower than the target, but shrinking them would exceed the block limit
+        self.assertEqual(b''.join(service.blocks[b] for b in block_ids), data)
+        self.assertEqual(len(block_ids), 8)
+        self.assertEqual([len(service.blocks[b]) for b in block_ids], [2048] * 8)
+
+    def test_adaptive_upload_halves_connections_on_error(self):
+        data = os.urandom(10 * 1024)
+        service = _FakeBlockBlobService(fail_at=3)
+        adaptive = AdaptiveTransfer(min_chunk_size=1024, max_chunk_size=1024, max_connections=4)
+
+        with self.assertRaises(ValueError):
+            upload_blob_chunks(
+                blob_service=service,
+                blob_size=len(data),
+                block_size=1024,
+                stream=BytesIO(data),
+                max_connections=4,
+                validate_content=False,
+                access_conditions=None,
+                uploader_class=BlockBlobChunkUploader,
+                adaptive_transfer=adaptive)
+        self.assertTrue(adaptive._start('upload', 1024, 4).connections <= 2)
+
+# ------------------------------------------------------------------------------
@@ -15,6 +15,7 @@ from ._shared.download_chunking import (
     validate_and_format_range_headers,
     process_range_and_offset,
     process_content,
+    BufferFileChunkDownloader,
     ParallelFileChunkDownloader,
     SequentialFileChunkDownloader)
 
@@ -350,3 +351,75 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
                 downloader.process_chunk(chunk)
 
         return self.properties
+
+    def download_into(self, buffer, max_connections=1):
+        """Download the contents of this file into a preallocated buffer.
+
+        Each chunk is written directly into its own slice of the buffer, so parallel
+        connections neither share a lock nor need a seekable stream.
+
+        :param buffer:
+            A writable object supporting the buffer protocol, such as a bytearray,
+            a memoryview or an mmap, of at least the download size.
+        :param int max_connections:
+            The number of parallel connections with which to download.
+        :returns: The properties of the downloaded file.
+        :rtype: ~azure.storage.file.models.FileProperties
+        """
+        views = [memoryview(buffer)]
+        try:
+            if views[0].readonly:
+                raise ValueError("Target buffer must be writable.")
+            if sys.version_info >= (3,) and views[0].format != 'B':
+                views.append(views[0].cast('B'))
+            if len(views[-1]) < self.download_size:
+                raise ValueError("Target buffer is smaller than the download size {0}.".format(self.download_size))
+
+            if self.download_size == 0:
+                content = b""
+            else:
+                content = process_content(
+                    self.file,
+                    self.initial_offset[0],
+                    self.initial_offset[1],
+                    False, None, None)
+            if content is not None:
+                views[-1][:len(content)] = content
+            if self._download_complete:
+                return self.properties
+
+            end_file = self.file_size
+            if self.length is not None:
+                # Use the length unless it is over the end of the file
+                end_file = min(self.file_size, self.length + 1)
+
+            # the chunk downloader writes after the initial content
+            views.append(views[-1][len(content):self.download_size])
+            downloader = BufferFileChunkDownloader(
+                file_service=self.service,
+                download_size=self.download_size,
+                chunk_size=self.config.max_chunk_get_size,
+                progress=self.first_get_size,
+                start_range=self.initial_range[1] + 1,  # start where the first download ended
+                end_range=end_file,
+                stream=views[-1],
+                validate_content=self.validate_content,
+                timeout=self.timeout,
+                use_location=self.location_mode,
+                cls=deserialize_file_stream,
+                **self.request_options)
+
+            if max_connections > 1:
+                import concurrent.futures
+                with concurrent.futures.ThreadPoolExecutor(max_connections) as executor:
+                    list(executor.map(downloader.process_chunk, downloader.get_chunk_offsets()))
+            else:
+                for chunk in downloader.get_chunk_offsets():
+                    downloader.process_chunk(chunk)
+
+            return self.properties
+        finally:
+            # release the exports so that the caller can resize or close the buffer
+            for view in reversed(views):
+                if hasattr(view, 'release'):
+                    view.release()
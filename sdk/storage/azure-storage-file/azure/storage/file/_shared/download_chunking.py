@@ -260,6 +260,11 @@ class _FileChunkDownloader(object):
         pass
 
     def _download_chunk(self, chunk_start, chunk_end):
+        response, offset = self._request_chunk(chunk_start, chunk_end)
+        chunk_data = process_content(response, offset[0], offset[1], False, None, None)
+        return chunk_data
+
+    def _request_chunk(self, chunk_start, chunk_end):
         download_range, offset = process_range_and_offset(
             chunk_start,
             chunk_end,
@@ -282,9 +287,7 @@ class _FileChunkDownloader(object):
                 **self.request_options)
         except HttpResponseError as error:
             process_storage_error(error)
-
-        chunk_data = process_content(response, offset[0], offset[1], False, None, None)
-        return chunk_data
+        return response, offset
 
 
 class ParallelFileChunkDownloader(_FileChunkDownloader):
@@ -314,6 +317,42 @@ class ParallelFileChunkDownloader(_FileChunkDownloader):
             self.stream.write(chunk_data)
 
 
+class BufferFileChunkDownloader(_FileChunkDownloader):
+    """Downloads the chunks straight into a writable memoryview.
+
+    Every chunk owns a distinct slice of the destination, so parallel workers write
+    without a lock and the response body is copied into place as it is read
+    instead of being joined into an intermediate bytes object first.
+    """
+    def __init__(
+            self, file_service, download_size, chunk_size, progress,
+            start_range, end_range, stream, validate_content, timeout, **kwargs):
+        super(BufferFileChunkDownloader, self).__init__(
+            file_service, download_size, chunk_size, progress, start_range, end_range,
+            stream, validate_content, timeout, **kwargs)
+
+        self.progress_lock = threading.Lock()
+
+    def process_chunk(self, chunk_start):
+        chunk_start, chunk_end = self._calculate_range(chunk_start)
+        length = chunk_end - chunk_start
+        if length > 0:
+            response, _ = self._request_chunk(chunk_start, chunk_end)
+            position = chunk_start
+            for data in response:
+                self._write_to_stream(data, position)
+                position += len(data)
+            self._update_progress(length)
+
+    def _update_progress(self, length):
+        with self.progress_lock:
+            self.progress_total += length
+
+    def _write_to_stream(self, chunk_data, chunk_start):
+        position = chunk_start - self.start_index
+        self.stream[position:position + len(chunk_data)] = chunk_data
+
+
 class SequentialFileChunkDownloader(_FileChunkDownloader):
 
     def _update_progress(self, length):
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.storage.file._share_utils import StorageStreamDownloader
+from azure.storage.file._shared.download_chunking import BufferFileChunkDownloader
+
+from filetestcase import (
+    FileTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+
+class _FakeFileProperties(object):
+
+    def __init__(self, size, content_range):
+        self.size = size
+        self.content_range = content_range
+
+
+class _FakeDownloadResponse(object):
+
+    def __init__(self, data, start, file_size):
+        self.data = data
+        self.properties = _FakeFileProperties(
+            len(data), 'bytes {0}-{1}/{2}'.format(start, start + len(data) - 1, file_size))
+
+    def __iter__(self):
+        # the body arrives in several parts
+        return iter([self.data[i:i + 100] for i in range(0, len(self.data), 100)])
+
+
+class _FakeFileService(object):
+    """Serves ranges of the given data, with the first chunks being the slowest."""
+
+    def __init__(self, data, chunk_size):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def download(self, range=None, **kwargs):  # pylint: disable=redefined-builtin
+        start, end = [int(i) for i in range[len('bytes='):].split('-')]
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # complete the chunks out of order
+        time.sleep(0.01 * (len(self.data) - start) / self.chunk_size)
+        with self.lock:
+            self.in_flight -= 1
+        return None, _FakeDownloadResponse(self.data[start:end + 1], start, len(self.data))
+
+
+class _FakeConfig(object):
+    max_single_get_size = 1024
+    max_chunk_get_size = 512
+
+
+class StorageFileDownloadChunkingTest(FileTestCase):
+
+    def _get_stream_downloader(self, service):
+        return StorageStreamDownloader(
+            'share', 'file', 'dir/file', service, _FakeConfig(), None, None, False, None)
+
+    def test_buffer_downloader_writes_chunks_in_place(self):
+        data = os.urandom(10 * 1024 + 7)
+        service = _FakeFileService(data, 1024)
+        # the first 100 bytes are already downloaded, the rest goes to the slice after them
+        buffer = bytearray(len(data))
+        buffer[:100] = data[:100]
+        downloader = BufferFileChunkDownloader(
+            file_service=service,
+            download_size=len(data),
+            chunk_size=1024,
+            progress=0,
+            start_range=100,
+            end_range=len(data),
+            stream=memoryview(buffer)[100:],
+            validate_content=False,
+            timeout=None)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(downloader.process_chunk, downloader.get_chunk_offsets()))
+
+        self.assertEqual(bytes(buffer), data)
+        self.assertEqual(downloader.progress_total, len(data) - 100)
+        self.assertTrue(service.max_in_flight > 1)
+
+    def test_download_into_parallel(self):
+        data = os.urandom(5 * 1024 + 3)
+        service = _FakeFileService(data, 512)
+        buffer = bytearray(len(data) + 10)
+
+        properties = self._get_stream_downloader(service).download_into(buffer, max_connections=4)
+
+        self.assertEqual(bytes(buffer[:len(data)]), data)
+        self.assertEqual(properties.size, len(data))
+        self.assertTrue(service.max_in_flight > 1)
+        # the buffer is released, so it can be resized
+        buffer.extend(b'end')
+
+    def test_download_into_sequential(self):
+        data = os.urandom(3 * 1024)
+        service = _FakeFileService(data, 512)
+        buffer = bytearray(len(data))
+
+        self._get_stream_downloader(service).download_into(memoryview(buffer), max_connections=1)
+
+        self.assertEqual(bytes(buffer), data)
+        self.assertEqual(service.max_in_flight, 1)
+
+    def test_download_into_small_file(self):
+        data = os.urandom(100)
+        buffer = bytearray(len(data))
+
+        self._get_stream_downloader(_FakeFileService(data, 512)).download_into(buffer, max_connections=4)
+
+        self.assertEqual(bytes(buffer), data)
+
+    def test_download_into_rejects_invalid_buffers(self):
+        data = os.urandom(2 * 1024)
+        downloader = self._get_stream_downloader(_FakeFileService(data, 512))
+
+        with self.assertRaises(ValueError):
+            downloader.download_into(bytearray(len(data) - 1))
+        with self.assertRaises(ValueError):
+            downloader.download_into(bytes(len(data)))
+
+# ------------------------------------------------------------------------------
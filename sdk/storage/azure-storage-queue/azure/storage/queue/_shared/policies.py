@@ -37,7 +37,13 @@ from azure.core.pipeline.policies import (
     NetworkTraceLoggingPolicy,
     HTTPPolicy)
 from azure.core.pipeline.policies.base import RequestHistory
-from azure.core.exceptions import AzureError, ServiceRequestError, ServiceResponseError
+from azure.core.exceptions import (
+    AzureError,
+    CircuitBreakerOpenError,
+    RetryBudgetExhaustedError,
+    ServiceRequestError,
+    ServiceResponseError
+)
 
 from ..version import VERSION
 from .models import LocationMode
@@ -525,6 +531,9 @@ class StorageRetryPolicy(HTTPPolicy):
 
                         continue
                 break
+            except (CircuitBreakerOpenError, RetryBudgetExhaustedError):
+                # a circuit breaker rejected the request to spare a failing host, retrying would defeat it
+                raise
             except AzureError as err:
                 retries_remaining = self.increment(
                     retry_settings, request=request.http_request, error=err)